@@ -1,5 +1,7 @@
+import json
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from functools import singledispatchmethod
 from typing import Generic, TypeVar
 
@@ -36,19 +38,28 @@ from pylon_client._internal.pylon_commons.v1.requests import (
     GetCommitmentRequest,
     GetCommitmentsRequest,
     GetExtrinsicRequest,
+    GetExtrinsicsRangeRequest,
+    GetExtrinsicsRequest,
     GetLatestBlockInfoRequest,
     GetLatestNeuronsRequest,
     GetLatestValidatorsRequest,
+    GetNeuronsAtTimeRequest,
     GetNeuronsRequest,
     GetOwnCommitmentRequest,
+    GetRecentCertificatesRequest,
+    GetRecentCommitmentsRequest,
+    GetRecentHyperparamsRequest,
     GetRecentNeuronsRequest,
+    GetRecentSubnetStateRequest,
+    GetRecentValidatorsRequest,
+    GetValidatorsAtTimeRequest,
     GetValidatorsRequest,
     IdentityLoginRequest,
     PylonRequest,
     SetCommitmentRequest,
     SetWeightsRequest,
 )
-from pylon_client._internal.pylon_commons.v1.responses import PylonResponse
+from pylon_client._internal.pylon_commons.v1.responses import GetExtrinsicsRangeResponse, PylonResponse
 
 RawRequestT = TypeVar("RawRequestT")
 RawResponseT = TypeVar("RawResponseT")
@@ -169,11 +180,16 @@ class AbstractAsyncCommunicator(Generic[RawRequestT, RawResponseT], ABC):
 class AsyncHttpCommunicator(AbstractAsyncCommunicator[Request, Response]):
     """
     Communicates with Pylon API through HTTP.
+
+    The last GET responses that carry an entity tag are kept, up to `revalidation_cache_size` of them. When the same
+    URL is requested again, the request is made conditional (If-None-Match) and the kept response is reused if
+    the server answers with 304 Not Modified, so the unchanged payloads are not downloaded again.
     """
 
     def __init__(self, config: AsyncConfig):
         super().__init__(config)
         self._raw_client: AsyncClient | None = None
+        self._revalidated_responses: OrderedDict[str, Response] = OrderedDict()
 
     async def _open(self) -> None:
         logger.debug(f"Opening communicator for the server {self.config.address}")
@@ -194,6 +210,7 @@ class AsyncHttpCommunicator(AbstractAsyncCommunicator[Request, Response]):
         if self._raw_client is not None:
             await self._raw_client.aclose()
         self._raw_client = None
+        self._revalidated_responses.clear()
 
     def _build_url(self, endpoint: Endpoint, request: PylonRequest) -> str:
         if isinstance(request, AuthenticatedPylonRequest):
@@ -224,6 +241,12 @@ class AsyncHttpCommunicator(AbstractAsyncCommunicator[Request, Response]):
         url = self._build_url(EndpointV1.NEURONS, request)
         return self._raw_client.build_request(method=EndpointV1.NEURONS.method, url=url)
 
+    @_translate_request.register
+    async def _(self, request: GetNeuronsAtTimeRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.NEURONS_AT_TIME, request)
+        return self._raw_client.build_request(method=EndpointV1.NEURONS_AT_TIME.method, url=url)
+
     @_translate_request.register
     async def _(self, request: GetLatestNeuronsRequest) -> Request:
         assert self._raw_client is not None
@@ -236,12 +259,48 @@ class AsyncHttpCommunicator(AbstractAsyncCommunicator[Request, Response]):
         url = self._build_url(EndpointV1.RECENT_NEURONS, request)
         return self._raw_client.build_request(method=EndpointV1.RECENT_NEURONS.method, url=url)
 
+    @_translate_request.register
+    async def _(self, request: GetRecentValidatorsRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.RECENT_VALIDATORS, request)
+        return self._raw_client.build_request(method=EndpointV1.RECENT_VALIDATORS.method, url=url)
+
+    @_translate_request.register
+    async def _(self, request: GetRecentCommitmentsRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.RECENT_COMMITMENTS, request)
+        return self._raw_client.build_request(method=EndpointV1.RECENT_COMMITMENTS.method, url=url)
+
+    @_translate_request.register
+    async def _(self, request: GetRecentCertificatesRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.RECENT_CERTIFICATES, request)
+        return self._raw_client.build_request(method=EndpointV1.RECENT_CERTIFICATES.method, url=url)
+
+    @_translate_request.register
+    async def _(self, request: GetRecentHyperparamsRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.RECENT_HYPERPARAMS, request)
+        return self._raw_client.build_request(method=EndpointV1.RECENT_HYPERPARAMS.method, url=url)
+
+    @_translate_request.register
+    async def _(self, request: GetRecentSubnetStateRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.RECENT_SUBNET_STATE, request)
+        return self._raw_client.build_request(method=EndpointV1.RECENT_SUBNET_STATE.method, url=url)
+
     @_translate_request.register
     async def _(self, request: GetValidatorsRequest) -> Request:
         assert self._raw_client is not None
         url = self._build_url(EndpointV1.VALIDATORS, request)
         return self._raw_client.build_request(method=EndpointV1.VALIDATORS.method, url=url)
 
+    @_translate_request.register
+    async def _(self, request: GetValidatorsAtTimeRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.VALIDATORS_AT_TIME, request)
+        return self._raw_client.build_request(method=EndpointV1.VALIDATORS_AT_TIME.method, url=url)
+
     @_translate_request.register
     async def _(self, request: GetLatestValidatorsRequest) -> Request:
         assert self._raw_client is not None
@@ -296,15 +355,42 @@ class AsyncHttpCommunicator(AbstractAsyncCommunicator[Request, Response]):
         url = self._build_url(EndpointV1.EXTRINSIC, request)
         return self._raw_client.build_request(method=EndpointV1.EXTRINSIC.method, url=url)
 
-    async def _translate_response(
+    @_translate_request.register
+    async def _(self, request: GetExtrinsicsRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.EXTRINSICS, request)
+        return self._raw_client.build_request(
+            method=EndpointV1.EXTRINSICS.method,
+            url=url,
+            params=request.model_dump(include={"call_module", "call_function", "address"}, exclude_none=True),
+        )
+
+    @_translate_request.register
+    async def _(self, request: GetExtrinsicsRangeRequest) -> Request:
+        assert self._raw_client is not None
+        url = self._build_url(EndpointV1.EXTRINSICS_RANGE, request)
+        return self._raw_client.build_request(
+            method=EndpointV1.EXTRINSICS_RANGE.method,
+            url=url,
+            params=request.model_dump(include={"call_module", "call_function", "address"}, exclude_none=True),
+        )
+
+    @singledispatchmethod
+    async def _translate_response(  # type: ignore
         self, pylon_request: PylonRequest[PylonResponseT], response: Response
     ) -> PylonResponseT:
         return pylon_request.response_cls(**response.json())
 
+    @_translate_response.register
+    async def _(self, pylon_request: GetExtrinsicsRangeRequest, response: Response) -> GetExtrinsicsRangeResponse:
+        # The range endpoint streams NDJSON, one block with its extrinsics per line.
+        return GetExtrinsicsRangeResponse(blocks=[json.loads(line) for line in response.text.splitlines() if line])
+
     async def _request(self, request: Request) -> Response:
         assert self._raw_client and not self._raw_client.is_closed, (
             "Communicator is not open, use context manager or open() method before making a request."
         )
+        kept_response = self._prepare_revalidation(request)
         try:
             logger.debug(f"Performing request to {request.url}")
             response = await self._raw_client.send(request)
@@ -312,12 +398,39 @@ class AsyncHttpCommunicator(AbstractAsyncCommunicator[Request, Response]):
             return await self._handle_timeout_error(e)
         except RequestError as e:
             return await self._handle_request_error(e)
+        if kept_response is not None and response.status_code == 304:
+            logger.debug(f"Reusing the unmodified response for {request.url}")
+            return kept_response
         try:
             response.raise_for_status()
         except HTTPStatusError as e:
             return await self._handle_status_error(e)
+        self._keep_for_revalidation(request, response)
         return response
 
+    def _prepare_revalidation(self, request: Request) -> Response | None:
+        """
+        Makes a GET request conditional if a response for its URL is kept and returns that response.
+        """
+        if request.method != "GET":
+            return None
+        kept_response = self._revalidated_responses.get(str(request.url))
+        if kept_response is not None:
+            request.headers["If-None-Match"] = kept_response.headers["etag"]
+        return kept_response
+
+    def _keep_for_revalidation(self, request: Request, response: Response) -> None:
+        url = str(request.url)
+        if request.method != "GET" or "etag" not in response.headers:
+            self._revalidated_responses.pop(url, None)
+            return
+        if self.config.revalidation_cache_size <= 0:
+            return
+        self._revalidated_responses[url] = response
+        self._revalidated_responses.move_to_end(url)
+        while len(self._revalidated_responses) > self.config.revalidation_cache_size:
+            self._revalidated_responses.popitem(last=False)
+
     async def _handle_timeout_error(self, exc: TimeoutException) -> Response:
         timeout = self.config.timeout
         if isinstance(exc, ConnectTimeout):
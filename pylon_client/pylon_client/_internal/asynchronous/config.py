@@ -20,6 +20,8 @@ class AsyncConfig(BaseConfig[AsyncRetrying]):
         identity_token: Token to use for authentication into chosen identity.
         open_access_token: Token to use for authentication into open access api.
         retry: Configuration of retrying in case of a failed request.
+        revalidation_cache_size: Number of the last GET responses kept to be revalidated with the server
+            instead of being downloaded again when they did not change; 0 disables the revalidation.
     """
 
     retry: AsyncRetrying = ASYNC_DEFAULT_RETRIES.copy()
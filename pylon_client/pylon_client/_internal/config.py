@@ -20,6 +20,8 @@ class BaseConfig(BaseModel, Generic[RetryT]):
         open_access_token: Token to use for authentication into open access api.
         retry: Configuration of retrying in case of a failed request.
         timeout: Timeout configuration for requests.
+        revalidation_cache_size: Number of the last GET responses kept to be revalidated with the server
+            instead of being downloaded again when they did not change; 0 disables the revalidation.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -30,6 +32,7 @@ class BaseConfig(BaseModel, Generic[RetryT]):
     open_access_token: PylonAuthToken | None = None
     retry: RetryT
     timeout: PylonTimeout = PylonTimeout()
+    revalidation_cache_size: int = 64
 
     def model_post_init(self, context) -> None:
         self.retry.reraise = True
@@ -10,6 +10,7 @@ from pylon_client._internal.pylon_commons.exceptions import (
     PylonMisconfigured,
     PylonUnauthorized,
 )
+from pylon_client._internal.pylon_commons.models import ExtrinsicsFilter
 from pylon_client._internal.pylon_commons.types import (
     BlockNumber,
     CommitmentDataBytes,
@@ -17,18 +18,28 @@ from pylon_client._internal.pylon_commons.types import (
     ExtrinsicIndex,
     Hotkey,
     NetUid,
+    Timestamp,
     Weight,
 )
 from pylon_client._internal.pylon_commons.v1.requests import (
     GetCommitmentRequest,
     GetCommitmentsRequest,
     GetExtrinsicRequest,
+    GetExtrinsicsRangeRequest,
+    GetExtrinsicsRequest,
     GetLatestBlockInfoRequest,
     GetLatestNeuronsRequest,
     GetLatestValidatorsRequest,
+    GetNeuronsAtTimeRequest,
     GetNeuronsRequest,
     GetOwnCommitmentRequest,
+    GetRecentCertificatesRequest,
+    GetRecentCommitmentsRequest,
+    GetRecentHyperparamsRequest,
     GetRecentNeuronsRequest,
+    GetRecentSubnetStateRequest,
+    GetRecentValidatorsRequest,
+    GetValidatorsAtTimeRequest,
     GetValidatorsRequest,
     IdentityLoginRequest,
     PylonRequest,
@@ -36,11 +47,16 @@ from pylon_client._internal.pylon_commons.v1.requests import (
     SetWeightsRequest,
 )
 from pylon_client._internal.pylon_commons.v1.responses import (
+    GetCertificatesResponse,
     GetCommitmentResponse,
     GetCommitmentsResponse,
     GetExtrinsicResponse,
+    GetExtrinsicsRangeResponse,
+    GetExtrinsicsResponse,
+    GetHyperparamsResponse,
     GetLatestBlockInfoResponse,
     GetNeuronsResponse,
+    GetSubnetStateResponse,
     GetValidatorsResponse,
     IdentityLoginResponse,
     LoginResponse,
@@ -183,6 +199,108 @@ class AbstractOpenAccessApi(AbstractApi[LoginResponseT], ABC):
         """
         return self._send_authenticated_request(partial(self._get_recent_neurons_request, netuid))
 
+    def get_recent_validators(self, netuid: NetUid) -> GetValidatorsResponse:
+        """
+        Retrieves recent validators for a specific subnet.
+
+        This method returns validators from the Pylon service's cache, like `get_recent_neurons`.
+
+        Args:
+            netuid: The unique identifier of the subnet.
+
+        Returns:
+            GetValidatorsResponse: containing the cached block information and a list of validator Neuron objects.
+
+        Raises:
+            PylonResponseException:
+                - The Pylon service cache doesn't have fresh enough data.
+                - The requested subnet is not of one of the configured identities or is not configured
+                  for caching recent data via `PYLON_RECENT_OBJECTS_NETUIDS` config variable.
+        """
+        return self._send_authenticated_request(partial(self._get_recent_validators_request, netuid))
+
+    def get_recent_commitments(self, netuid: NetUid) -> GetCommitmentsResponse:
+        """
+        Retrieves recent commitments for a specific subnet.
+
+        This method returns commitments from the Pylon service's cache, like `get_recent_neurons`.
+
+        Args:
+            netuid: The unique identifier of the subnet.
+
+        Returns:
+            GetCommitmentsResponse: containing the cached block information and commitments data mapping hotkeys to
+            commitment data.
+
+        Raises:
+            PylonResponseException:
+                - The Pylon service cache doesn't have fresh enough data.
+                - The requested subnet is not of one of the configured identities or is not configured
+                  for caching recent data via `PYLON_RECENT_OBJECTS_NETUIDS` config variable.
+        """
+        return self._send_authenticated_request(partial(self._get_recent_commitments_request, netuid))
+
+    def get_recent_certificates(self, netuid: NetUid) -> GetCertificatesResponse:
+        """
+        Retrieves recent certificates for a specific subnet.
+
+        This method returns certificates from the Pylon service's cache, like `get_recent_neurons`.
+
+        Args:
+            netuid: The unique identifier of the subnet.
+
+        Returns:
+            GetCertificatesResponse: containing the cached block information and certificates mapping hotkeys to
+            NeuronCertificate objects.
+
+        Raises:
+            PylonResponseException:
+                - The Pylon service cache doesn't have fresh enough data.
+                - The requested subnet is not of one of the configured identities or is not configured
+                  for caching recent data via `PYLON_RECENT_OBJECTS_NETUIDS` config variable.
+        """
+        return self._send_authenticated_request(partial(self._get_recent_certificates_request, netuid))
+
+    def get_recent_hyperparams(self, netuid: NetUid) -> GetHyperparamsResponse:
+        """
+        Retrieves recent hyperparameters for a specific subnet.
+
+        This method returns hyperparameters from the Pylon service's cache, like `get_recent_neurons`.
+
+        Args:
+            netuid: The unique identifier of the subnet.
+
+        Returns:
+            GetHyperparamsResponse: containing the cached block information and the subnet hyperparameters.
+
+        Raises:
+            PylonResponseException:
+                - The Pylon service cache doesn't have fresh enough data.
+                - The requested subnet is not of one of the configured identities or is not configured
+                  for caching recent data via `PYLON_RECENT_OBJECTS_NETUIDS` config variable.
+        """
+        return self._send_authenticated_request(partial(self._get_recent_hyperparams_request, netuid))
+
+    def get_recent_subnet_state(self, netuid: NetUid) -> GetSubnetStateResponse:
+        """
+        Retrieves recent subnet state for a specific subnet.
+
+        This method returns subnet state from the Pylon service's cache, like `get_recent_neurons`.
+
+        Args:
+            netuid: The unique identifier of the subnet.
+
+        Returns:
+            GetSubnetStateResponse: containing the cached block information and the subnet state.
+
+        Raises:
+            PylonResponseException:
+                - The Pylon service cache doesn't have fresh enough data.
+                - The requested subnet is not of one of the configured identities or is not configured
+                  for caching recent data via `PYLON_RECENT_OBJECTS_NETUIDS` config variable.
+        """
+        return self._send_authenticated_request(partial(self._get_recent_subnet_state_request, netuid))
+
     def get_commitments(self, netuid: NetUid) -> GetCommitmentsResponse:
         """
         Retrieves all commitments for a specific subnet at the latest available block.
@@ -223,6 +341,35 @@ class AbstractOpenAccessApi(AbstractApi[LoginResponseT], ABC):
         """
         return self._send_authenticated_request(partial(self._get_validators_request, netuid, block_number))
 
+    def get_neurons_at_time(self, netuid: NetUid, timestamp: Timestamp) -> GetNeuronsResponse:
+        """
+        Retrieves neurons for a specific subnet at a point in time, i.e. at the last block produced at or before it.
+
+        Args:
+            netuid: The unique identifier of the subnet.
+            timestamp: The unix timestamp in seconds to query neurons at.
+
+        Returns:
+            GetNeuronsResponse: containing the block information and a dictionary mapping hotkeys to Neuron objects.
+        """
+        return self._send_authenticated_request(partial(self._get_neurons_at_time_request, netuid, timestamp))
+
+    def get_validators_at_time(self, netuid: NetUid, timestamp: Timestamp) -> GetValidatorsResponse:
+        """
+        Retrieves validators for a specific subnet at a point in time, i.e. at the last block produced at or
+        before it.
+
+        Validators are neurons with validator_permit=True, sorted by total stake in descending order.
+
+        Args:
+            netuid: The unique identifier of the subnet.
+            timestamp: The unix timestamp in seconds to query validators at.
+
+        Returns:
+            GetValidatorsResponse: containing the block information and a list of validator Neuron objects.
+        """
+        return self._send_authenticated_request(partial(self._get_validators_at_time_request, netuid, timestamp))
+
     def get_latest_validators(self, netuid: NetUid) -> GetValidatorsResponse:
         """
         Retrieves validators for a specific subnet at the latest available block.
@@ -263,6 +410,61 @@ class AbstractOpenAccessApi(AbstractApi[LoginResponseT], ABC):
         """
         return self._send_authenticated_request(partial(self._get_extrinsic_request, block_number, extrinsic_index))
 
+    def get_extrinsics(
+        self,
+        block_number: BlockNumber,
+        call_module: str | None = None,
+        call_function: str | None = None,
+        address: str | None = None,
+    ) -> GetExtrinsicsResponse:
+        """
+        Retrieves all the decoded extrinsics from a specific block.
+
+        This is a block-level query that does not require subnet context.
+        The extrinsics may be narrowed down with the filters; only the extrinsics matching all the given filters
+        are returned.
+
+        Args:
+            block_number: The blockchain block number to query.
+            call_module: Only return the extrinsics calling this module.
+            call_function: Only return the extrinsics calling this function.
+            address: Only return the extrinsics signed by this address.
+
+        Returns:
+            GetExtrinsicsResponse: containing the block and its extrinsics in the block order.
+        """
+        extrinsics_filter = ExtrinsicsFilter(call_module=call_module, call_function=call_function, address=address)
+        return self._send_authenticated_request(partial(self._get_extrinsics_request, block_number, extrinsics_filter))
+
+    def get_extrinsics_range(
+        self,
+        start_block_number: BlockNumber,
+        end_block_number: BlockNumber,
+        call_module: str | None = None,
+        call_function: str | None = None,
+        address: str | None = None,
+    ) -> GetExtrinsicsRangeResponse:
+        """
+        Retrieves the decoded extrinsics from a range of blocks, both ends inclusive.
+
+        This is a block-level query that does not require subnet context.
+        The Pylon service limits the length of the range; the filters work like in `get_extrinsics`.
+
+        Args:
+            start_block_number: The first block of the range.
+            end_block_number: The last block of the range.
+            call_module: Only return the extrinsics calling this module.
+            call_function: Only return the extrinsics calling this function.
+            address: Only return the extrinsics signed by this address.
+
+        Returns:
+            GetExtrinsicsRangeResponse: containing the extrinsics of every block of the range, in the block order.
+        """
+        extrinsics_filter = ExtrinsicsFilter(call_module=call_module, call_function=call_function, address=address)
+        return self._send_authenticated_request(
+            partial(self._get_extrinsics_range_request, start_block_number, end_block_number, extrinsics_filter)
+        )
+
     # Private API
 
     @abstractmethod
@@ -274,9 +476,30 @@ class AbstractOpenAccessApi(AbstractApi[LoginResponseT], ABC):
     @abstractmethod
     def _get_recent_neurons_request(self, netuid: NetUid) -> GetRecentNeuronsRequest: ...
 
+    @abstractmethod
+    def _get_recent_validators_request(self, netuid: NetUid) -> GetRecentValidatorsRequest: ...
+
+    @abstractmethod
+    def _get_recent_commitments_request(self, netuid: NetUid) -> GetRecentCommitmentsRequest: ...
+
+    @abstractmethod
+    def _get_recent_certificates_request(self, netuid: NetUid) -> GetRecentCertificatesRequest: ...
+
+    @abstractmethod
+    def _get_recent_hyperparams_request(self, netuid: NetUid) -> GetRecentHyperparamsRequest: ...
+
+    @abstractmethod
+    def _get_recent_subnet_state_request(self, netuid: NetUid) -> GetRecentSubnetStateRequest: ...
+
     @abstractmethod
     def _get_validators_request(self, netuid: NetUid, block_number: BlockNumber) -> GetValidatorsRequest: ...
 
+    @abstractmethod
+    def _get_neurons_at_time_request(self, netuid: NetUid, timestamp: Timestamp) -> GetNeuronsAtTimeRequest: ...
+
+    @abstractmethod
+    def _get_validators_at_time_request(self, netuid: NetUid, timestamp: Timestamp) -> GetValidatorsAtTimeRequest: ...
+
     @abstractmethod
     def _get_latest_validators_request(self, netuid: NetUid) -> GetLatestValidatorsRequest: ...
 
@@ -294,6 +517,16 @@ class AbstractOpenAccessApi(AbstractApi[LoginResponseT], ABC):
         self, block_number: BlockNumber, extrinsic_index: ExtrinsicIndex
     ) -> GetExtrinsicRequest: ...
 
+    @abstractmethod
+    def _get_extrinsics_request(
+        self, block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRequest: ...
+
+    @abstractmethod
+    def _get_extrinsics_range_request(
+        self, start_block_number: BlockNumber, end_block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRangeRequest: ...
+
 
 class AbstractIdentityApi(AbstractApi[LoginResponseT], ABC):
     """
@@ -355,6 +588,78 @@ class AbstractIdentityApi(AbstractApi[LoginResponseT], ABC):
         """
         return self._send_authenticated_request(self._get_recent_neurons_request)
 
+    def get_recent_validators(self) -> GetValidatorsResponse:
+        """
+        Retrieves recent validators for the authenticated identity's subnet.
+
+        This method returns validators from the Pylon service's cache, like `get_recent_neurons`.
+
+        Returns:
+            GetValidatorsResponse: containing the cached block information and a list of validator Neuron objects.
+
+        Raises:
+            PylonResponseException: When the Pylon service cache doesn't have fresh enough data.
+        """
+        return self._send_authenticated_request(self._get_recent_validators_request)
+
+    def get_recent_commitments(self) -> GetCommitmentsResponse:
+        """
+        Retrieves recent commitments for the authenticated identity's subnet.
+
+        This method returns commitments from the Pylon service's cache, like `get_recent_neurons`.
+
+        Returns:
+            GetCommitmentsResponse: containing the cached block information and commitments data mapping hotkeys to
+            commitment data.
+
+        Raises:
+            PylonResponseException: When the Pylon service cache doesn't have fresh enough data.
+        """
+        return self._send_authenticated_request(self._get_recent_commitments_request)
+
+    def get_recent_certificates(self) -> GetCertificatesResponse:
+        """
+        Retrieves recent certificates for the authenticated identity's subnet.
+
+        This method returns certificates from the Pylon service's cache, like `get_recent_neurons`.
+
+        Returns:
+            GetCertificatesResponse: containing the cached block information and certificates mapping hotkeys to
+            NeuronCertificate objects.
+
+        Raises:
+            PylonResponseException: When the Pylon service cache doesn't have fresh enough data.
+        """
+        return self._send_authenticated_request(self._get_recent_certificates_request)
+
+    def get_recent_hyperparams(self) -> GetHyperparamsResponse:
+        """
+        Retrieves recent hyperparameters for the authenticated identity's subnet.
+
+        This method returns hyperparameters from the Pylon service's cache, like `get_recent_neurons`.
+
+        Returns:
+            GetHyperparamsResponse: containing the cached block information and the subnet hyperparameters.
+
+        Raises:
+            PylonResponseException: When the Pylon service cache doesn't have fresh enough data.
+        """
+        return self._send_authenticated_request(self._get_recent_hyperparams_request)
+
+    def get_recent_subnet_state(self) -> GetSubnetStateResponse:
+        """
+        Retrieves recent subnet state for the authenticated identity's subnet.
+
+        This method returns subnet state from the Pylon service's cache, like `get_recent_neurons`.
+
+        Returns:
+            GetSubnetStateResponse: containing the cached block information and the subnet state.
+
+        Raises:
+            PylonResponseException: When the Pylon service cache doesn't have fresh enough data.
+        """
+        return self._send_authenticated_request(self._get_recent_subnet_state_request)
+
     def put_weights(self, weights: dict[Hotkey, Weight]) -> SetWeightsResponse:
         """
         Submits weights for neurons in the authenticated identity's subnet.
@@ -431,6 +736,34 @@ class AbstractIdentityApi(AbstractApi[LoginResponseT], ABC):
         """
         return self._send_authenticated_request(partial(self._get_validators_request, block_number))
 
+    def get_neurons_at_time(self, timestamp: Timestamp) -> GetNeuronsResponse:
+        """
+        Retrieves neurons for the authenticated identity's subnet at a point in time, i.e. at the last block
+        produced at or before it.
+
+        Args:
+            timestamp: The unix timestamp in seconds to query neurons at.
+
+        Returns:
+            GetNeuronsResponse containing the block information and a dictionary mapping hotkeys to Neuron objects.
+        """
+        return self._send_authenticated_request(partial(self._get_neurons_at_time_request, timestamp))
+
+    def get_validators_at_time(self, timestamp: Timestamp) -> GetValidatorsResponse:
+        """
+        Retrieves validators for the authenticated identity's subnet at a point in time, i.e. at the last block
+        produced at or before it.
+
+        Validators are neurons with validator_permit=True, sorted by total stake in descending order.
+
+        Args:
+            timestamp: The unix timestamp in seconds to query validators at.
+
+        Returns:
+            GetValidatorsResponse: containing the block information and a list of validator Neuron objects.
+        """
+        return self._send_authenticated_request(partial(self._get_validators_at_time_request, timestamp))
+
     def get_latest_validators(self) -> GetValidatorsResponse:
         """
         Retrieves validators for the authenticated identity's subnet at the latest available block.
@@ -468,6 +801,61 @@ class AbstractIdentityApi(AbstractApi[LoginResponseT], ABC):
         """
         return self._send_authenticated_request(partial(self._get_extrinsic_request, block_number, extrinsic_index))
 
+    def get_extrinsics(
+        self,
+        block_number: BlockNumber,
+        call_module: str | None = None,
+        call_function: str | None = None,
+        address: str | None = None,
+    ) -> GetExtrinsicsResponse:
+        """
+        Retrieves all the decoded extrinsics from a specific block.
+
+        This is a block-level query that does not require subnet context.
+        The extrinsics may be narrowed down with the filters; only the extrinsics matching all the given filters
+        are returned.
+
+        Args:
+            block_number: The blockchain block number to query.
+            call_module: Only return the extrinsics calling this module.
+            call_function: Only return the extrinsics calling this function.
+            address: Only return the extrinsics signed by this address.
+
+        Returns:
+            GetExtrinsicsResponse: containing the block and its extrinsics in the block order.
+        """
+        extrinsics_filter = ExtrinsicsFilter(call_module=call_module, call_function=call_function, address=address)
+        return self._send_authenticated_request(partial(self._get_extrinsics_request, block_number, extrinsics_filter))
+
+    def get_extrinsics_range(
+        self,
+        start_block_number: BlockNumber,
+        end_block_number: BlockNumber,
+        call_module: str | None = None,
+        call_function: str | None = None,
+        address: str | None = None,
+    ) -> GetExtrinsicsRangeResponse:
+        """
+        Retrieves the decoded extrinsics from a range of blocks, both ends inclusive.
+
+        This is a block-level query that does not require subnet context.
+        The Pylon service limits the length of the range; the filters work like in `get_extrinsics`.
+
+        Args:
+            start_block_number: The first block of the range.
+            end_block_number: The last block of the range.
+            call_module: Only return the extrinsics calling this module.
+            call_function: Only return the extrinsics calling this function.
+            address: Only return the extrinsics signed by this address.
+
+        Returns:
+            GetExtrinsicsRangeResponse: containing the extrinsics of every block of the range, in the block order.
+        """
+        extrinsics_filter = ExtrinsicsFilter(call_module=call_module, call_function=call_function, address=address)
+        return self._send_authenticated_request(
+            partial(self._get_extrinsics_range_request, start_block_number, end_block_number, extrinsics_filter)
+        )
+
     # Private API
 
     @abstractmethod
@@ -479,6 +867,21 @@ class AbstractIdentityApi(AbstractApi[LoginResponseT], ABC):
     @abstractmethod
     def _get_recent_neurons_request(self) -> GetRecentNeuronsRequest: ...
 
+    @abstractmethod
+    def _get_recent_validators_request(self) -> GetRecentValidatorsRequest: ...
+
+    @abstractmethod
+    def _get_recent_commitments_request(self) -> GetRecentCommitmentsRequest: ...
+
+    @abstractmethod
+    def _get_recent_certificates_request(self) -> GetRecentCertificatesRequest: ...
+
+    @abstractmethod
+    def _get_recent_hyperparams_request(self) -> GetRecentHyperparamsRequest: ...
+
+    @abstractmethod
+    def _get_recent_subnet_state_request(self) -> GetRecentSubnetStateRequest: ...
+
     @abstractmethod
     def _put_weights_request(self, weights: dict[Hotkey, Weight]) -> SetWeightsRequest: ...
 
@@ -497,6 +900,12 @@ class AbstractIdentityApi(AbstractApi[LoginResponseT], ABC):
     @abstractmethod
     def _get_validators_request(self, block_number: BlockNumber) -> GetValidatorsRequest: ...
 
+    @abstractmethod
+    def _get_neurons_at_time_request(self, timestamp: Timestamp) -> GetNeuronsAtTimeRequest: ...
+
+    @abstractmethod
+    def _get_validators_at_time_request(self, timestamp: Timestamp) -> GetValidatorsAtTimeRequest: ...
+
     @abstractmethod
     def _get_latest_validators_request(self) -> GetLatestValidatorsRequest: ...
 
@@ -508,6 +917,16 @@ class AbstractIdentityApi(AbstractApi[LoginResponseT], ABC):
         self, block_number: BlockNumber, extrinsic_index: ExtrinsicIndex
     ) -> GetExtrinsicRequest: ...
 
+    @abstractmethod
+    def _get_extrinsics_request(
+        self, block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRequest: ...
+
+    @abstractmethod
+    def _get_extrinsics_range_request(
+        self, start_block_number: BlockNumber, end_block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRangeRequest: ...
+
 
 class OpenAccessApi(AbstractOpenAccessApi[OpenAccessLoginResponse]):
     def _login(self) -> OpenAccessLoginResponse:
@@ -527,6 +946,21 @@ class OpenAccessApi(AbstractOpenAccessApi[OpenAccessLoginResponse]):
     def _get_recent_neurons_request(self, netuid: NetUid) -> GetRecentNeuronsRequest:
         return GetRecentNeuronsRequest(netuid=netuid)
 
+    def _get_recent_validators_request(self, netuid: NetUid) -> GetRecentValidatorsRequest:
+        return GetRecentValidatorsRequest(netuid=netuid)
+
+    def _get_recent_commitments_request(self, netuid: NetUid) -> GetRecentCommitmentsRequest:
+        return GetRecentCommitmentsRequest(netuid=netuid)
+
+    def _get_recent_certificates_request(self, netuid: NetUid) -> GetRecentCertificatesRequest:
+        return GetRecentCertificatesRequest(netuid=netuid)
+
+    def _get_recent_hyperparams_request(self, netuid: NetUid) -> GetRecentHyperparamsRequest:
+        return GetRecentHyperparamsRequest(netuid=netuid)
+
+    def _get_recent_subnet_state_request(self, netuid: NetUid) -> GetRecentSubnetStateRequest:
+        return GetRecentSubnetStateRequest(netuid=netuid)
+
     def _get_commitments_request(self, netuid: NetUid) -> GetCommitmentsRequest:
         return GetCommitmentsRequest(netuid=netuid)
 
@@ -536,6 +970,12 @@ class OpenAccessApi(AbstractOpenAccessApi[OpenAccessLoginResponse]):
     def _get_validators_request(self, netuid: NetUid, block_number: BlockNumber) -> GetValidatorsRequest:
         return GetValidatorsRequest(netuid=netuid, block_number=block_number)
 
+    def _get_neurons_at_time_request(self, netuid: NetUid, timestamp: Timestamp) -> GetNeuronsAtTimeRequest:
+        return GetNeuronsAtTimeRequest(netuid=netuid, timestamp=timestamp)
+
+    def _get_validators_at_time_request(self, netuid: NetUid, timestamp: Timestamp) -> GetValidatorsAtTimeRequest:
+        return GetValidatorsAtTimeRequest(netuid=netuid, timestamp=timestamp)
+
     def _get_latest_validators_request(self, netuid: NetUid) -> GetLatestValidatorsRequest:
         return GetLatestValidatorsRequest(netuid=netuid)
 
@@ -545,6 +985,20 @@ class OpenAccessApi(AbstractOpenAccessApi[OpenAccessLoginResponse]):
     def _get_extrinsic_request(self, block_number: BlockNumber, extrinsic_index: ExtrinsicIndex) -> GetExtrinsicRequest:
         return GetExtrinsicRequest(block_number=block_number, extrinsic_index=extrinsic_index)
 
+    def _get_extrinsics_request(
+        self, block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRequest:
+        return GetExtrinsicsRequest(block_number=block_number, **extrinsics_filter.model_dump())
+
+    def _get_extrinsics_range_request(
+        self, start_block_number: BlockNumber, end_block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRangeRequest:
+        return GetExtrinsicsRangeRequest(
+            start_block_number=start_block_number,
+            end_block_number=end_block_number,
+            **extrinsics_filter.model_dump(),
+        )
+
 
 class IdentityApi(AbstractIdentityApi[IdentityLoginResponse]):
     def _login(self) -> IdentityLoginResponse:
@@ -578,6 +1032,41 @@ class IdentityApi(AbstractIdentityApi[IdentityLoginResponse]):
             identity_name=self._login_response.identity_name,
         )
 
+    def _get_recent_validators_request(self) -> GetRecentValidatorsRequest:
+        assert self._login_response, "Attempted api request without authentication."
+        return GetRecentValidatorsRequest(
+            netuid=self._login_response.netuid,
+            identity_name=self._login_response.identity_name,
+        )
+
+    def _get_recent_commitments_request(self) -> GetRecentCommitmentsRequest:
+        assert self._login_response, "Attempted api request without authentication."
+        return GetRecentCommitmentsRequest(
+            netuid=self._login_response.netuid,
+            identity_name=self._login_response.identity_name,
+        )
+
+    def _get_recent_certificates_request(self) -> GetRecentCertificatesRequest:
+        assert self._login_response, "Attempted api request without authentication."
+        return GetRecentCertificatesRequest(
+            netuid=self._login_response.netuid,
+            identity_name=self._login_response.identity_name,
+        )
+
+    def _get_recent_hyperparams_request(self) -> GetRecentHyperparamsRequest:
+        assert self._login_response, "Attempted api request without authentication."
+        return GetRecentHyperparamsRequest(
+            netuid=self._login_response.netuid,
+            identity_name=self._login_response.identity_name,
+        )
+
+    def _get_recent_subnet_state_request(self) -> GetRecentSubnetStateRequest:
+        assert self._login_response, "Attempted api request without authentication."
+        return GetRecentSubnetStateRequest(
+            netuid=self._login_response.netuid,
+            identity_name=self._login_response.identity_name,
+        )
+
     def _put_weights_request(self, weights: dict[Hotkey, Weight]) -> SetWeightsRequest:
         assert self._login_response, "Attempted api request without authentication."
         return SetWeightsRequest(
@@ -624,6 +1113,22 @@ class IdentityApi(AbstractIdentityApi[IdentityLoginResponse]):
             block_number=block_number,
         )
 
+    def _get_neurons_at_time_request(self, timestamp: Timestamp) -> GetNeuronsAtTimeRequest:
+        assert self._login_response, "Attempted api request without authentication."
+        return GetNeuronsAtTimeRequest(
+            netuid=self._login_response.netuid,
+            identity_name=self._login_response.identity_name,
+            timestamp=timestamp,
+        )
+
+    def _get_validators_at_time_request(self, timestamp: Timestamp) -> GetValidatorsAtTimeRequest:
+        assert self._login_response, "Attempted api request without authentication."
+        return GetValidatorsAtTimeRequest(
+            netuid=self._login_response.netuid,
+            identity_name=self._login_response.identity_name,
+            timestamp=timestamp,
+        )
+
     def _get_latest_validators_request(self) -> GetLatestValidatorsRequest:
         assert self._login_response, "Attempted api request without authentication."
         return GetLatestValidatorsRequest(
@@ -636,3 +1141,17 @@ class IdentityApi(AbstractIdentityApi[IdentityLoginResponse]):
 
     def _get_extrinsic_request(self, block_number: BlockNumber, extrinsic_index: ExtrinsicIndex) -> GetExtrinsicRequest:
         return GetExtrinsicRequest(block_number=block_number, extrinsic_index=extrinsic_index)
+
+    def _get_extrinsics_request(
+        self, block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRequest:
+        return GetExtrinsicsRequest(block_number=block_number, **extrinsics_filter.model_dump())
+
+    def _get_extrinsics_range_request(
+        self, start_block_number: BlockNumber, end_block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+    ) -> GetExtrinsicsRangeRequest:
+        return GetExtrinsicsRangeRequest(
+            start_block_number=start_block_number,
+            end_block_number=end_block_number,
+            **extrinsics_filter.model_dump(),
+        )
@@ -19,19 +19,27 @@ from pylon_client._internal.pylon_commons.models import (
     CommitReveal,
     BittensorModel,
     Block,
+    BlockSubnetHyperparams,
+    BlockSubnetState,
     AxonProtocol,
     AxonInfo,
     Stakes,
     Neuron,
     NeuronCertificate,
     NeuronCertificateKeypair,
+    SubnetCertificates,
+    SubnetHyperparams,
     SubnetNeurons,
+    SubnetState,
     SubnetValidators,
 )
 from pylon_client._internal.pylon_commons.v1.responses import (
+    GetCertificatesResponse,
     GetCommitmentResponse,
     GetCommitmentsResponse,
+    GetHyperparamsResponse,
     GetNeuronsResponse,
+    GetSubnetStateResponse,
     GetValidatorsResponse,
     PylonResponse,
     SetCommitmentResponse,
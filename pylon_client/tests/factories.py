@@ -4,7 +4,7 @@ from typing import Any, Generic, cast
 from polyfactory.factories.pydantic_factory import ModelFactory, T
 
 from pylon_client._internal.pylon_commons.currency import Currency, Token
-from pylon_client._internal.pylon_commons.models import Block, Neuron
+from pylon_client._internal.pylon_commons.models import Block, Neuron, SubnetState
 
 
 class PylonModelFactory(Generic[T], ModelFactory[T]):
@@ -28,3 +28,7 @@ class BlockFactory(PylonModelFactory[Block]):
 
 class NeuronFactory(PylonModelFactory[Neuron]):
     __check_model__ = True
+
+
+class SubnetStateFactory(PylonModelFactory[SubnetState]):
+    __check_model__ = True
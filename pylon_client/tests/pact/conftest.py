@@ -7,6 +7,7 @@ from tests.pact.matchers import (
     commitment_response_matcher,
     commitments_response_matcher,
     extrinsic_response_matcher,
+    extrinsics_response_matcher,
     latest_block_info_response_matcher,
     neurons_response_matcher,
     set_commitment_response_matcher,
@@ -48,6 +49,11 @@ def get_extrinsic_response_matcher() -> dict:
     return extrinsic_response_matcher()
 
 
+@pytest.fixture
+def get_extrinsics_response_matcher() -> dict:
+    return extrinsics_response_matcher()
+
+
 @pytest.fixture
 def put_weights_response_matcher() -> dict:
     return set_weights_response_matcher()
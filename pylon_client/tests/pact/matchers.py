@@ -118,6 +118,13 @@ def extrinsic_response_matcher() -> dict:
     }
 
 
+def extrinsics_response_matcher() -> dict:
+    return {
+        "block": block_matcher(),
+        "extrinsics": match.each_like(extrinsic_response_matcher()),
+    }
+
+
 def set_weights_response_matcher() -> dict:
     return {}
 
@@ -0,0 +1,24 @@
+from httpx import codes
+from pact import Pact
+
+from pylon_client._internal.pylon_commons.types import BlockNumber
+from pylon_client._internal.pylon_commons.v1.responses import GetExtrinsicsResponse
+from tests.pact.builders import build_block, build_extrinsic
+from tests.pact.constants import BLOCK_NUMBER
+
+
+def test_get_extrinsics_success(pact: Pact, get_extrinsics_response_matcher: dict, pylon_client_factory):
+    (
+        pact.upon_receiving("a request for all extrinsics of a block")
+        .given("extrinsics exist", block_number=BLOCK_NUMBER)
+        .with_request("GET", f"/api/v1/block/{BLOCK_NUMBER}/extrinsics")
+        .will_respond_with(codes.OK)
+        .with_body(get_extrinsics_response_matcher, content_type="application/json")
+    )
+
+    with pact.serve() as srv:
+        client = pylon_client_factory(str(srv.url))
+        with client:
+            response = client.open_access.get_extrinsics(block_number=BlockNumber(BLOCK_NUMBER))
+
+    assert response == GetExtrinsicsResponse(block=build_block(), extrinsics=[build_extrinsic()])
@@ -0,0 +1,107 @@
+from http import HTTPMethod
+
+import pytest
+
+from pylon_client._internal.pylon_commons.models import (
+    Block,
+    CertificateAlgorithm,
+    NeuronCertificate,
+    SubnetHyperparams,
+)
+from pylon_client._internal.pylon_commons.types import (
+    BlockHash,
+    BlockNumber,
+    CommitmentDataHex,
+    Hotkey,
+    MaxWeightsLimit,
+    PublicKey,
+)
+from pylon_client._internal.pylon_commons.v1.endpoints import Endpoint as EndpointV1
+from pylon_client._internal.pylon_commons.v1.responses import (
+    GetCertificatesResponse,
+    GetCommitmentsResponse,
+    GetHyperparamsResponse,
+    GetSubnetStateResponse,
+    GetValidatorsResponse,
+)
+from tests.factories import NeuronFactory, SubnetStateFactory
+from tests.unit.asynchronous.base_test import IdentityEndpointTest
+
+
+@pytest.fixture
+def block() -> Block:
+    return Block(number=BlockNumber(1000), hash=BlockHash("0x123"))
+
+
+class TestIdentityGetRecentValidators(IdentityEndpointTest):
+    endpoint = EndpointV1.RECENT_VALIDATORS
+    route_params = {"identity_name": "sn1", "netuid": 1}
+    http_method = HTTPMethod.GET
+
+    async def make_endpoint_call(self, client):
+        return await client.identity.get_recent_validators()
+
+    @pytest.fixture
+    def success_response(self, block: Block, neuron_factory: NeuronFactory) -> GetValidatorsResponse:
+        return GetValidatorsResponse(block=block, validators=neuron_factory.batch(2))
+
+
+class TestIdentityGetRecentCommitments(IdentityEndpointTest):
+    endpoint = EndpointV1.RECENT_COMMITMENTS
+    route_params = {"identity_name": "sn1", "netuid": 1}
+    http_method = HTTPMethod.GET
+
+    async def make_endpoint_call(self, client):
+        return await client.identity.get_recent_commitments()
+
+    @pytest.fixture
+    def success_response(self, block: Block) -> GetCommitmentsResponse:
+        return GetCommitmentsResponse(block=block, commitments={Hotkey("hotkey1"): CommitmentDataHex("0x01")})
+
+
+class TestIdentityGetRecentCertificates(IdentityEndpointTest):
+    endpoint = EndpointV1.RECENT_CERTIFICATES
+    route_params = {"identity_name": "sn1", "netuid": 1}
+    http_method = HTTPMethod.GET
+
+    async def make_endpoint_call(self, client):
+        return await client.identity.get_recent_certificates()
+
+    @pytest.fixture
+    def success_response(self, block: Block) -> GetCertificatesResponse:
+        return GetCertificatesResponse(
+            block=block,
+            certificates={
+                Hotkey("hotkey1"): NeuronCertificate(
+                    algorithm=CertificateAlgorithm.ED25519, public_key=PublicKey("0xabc")
+                )
+            },
+        )
+
+
+class TestIdentityGetRecentHyperparams(IdentityEndpointTest):
+    endpoint = EndpointV1.RECENT_HYPERPARAMS
+    route_params = {"identity_name": "sn1", "netuid": 1}
+    http_method = HTTPMethod.GET
+
+    async def make_endpoint_call(self, client):
+        return await client.identity.get_recent_hyperparams()
+
+    @pytest.fixture
+    def success_response(self, block: Block) -> GetHyperparamsResponse:
+        return GetHyperparamsResponse(
+            block=block, hyperparams=SubnetHyperparams(max_weights_limit=MaxWeightsLimit(100))
+        )
+
+
+class TestIdentityGetRecentSubnetState(IdentityEndpointTest):
+    endpoint = EndpointV1.RECENT_SUBNET_STATE
+    route_params = {"identity_name": "sn1", "netuid": 1}
+    http_method = HTTPMethod.GET
+
+    async def make_endpoint_call(self, client):
+        return await client.identity.get_recent_subnet_state()
+
+    @pytest.fixture
+    def success_response(self, block: Block) -> GetSubnetStateResponse:
+        return GetSubnetStateResponse(block=block, state=SubnetStateFactory.build())
@@ -0,0 +1,105 @@
+"""
+Tests for the revalidation of the kept responses in the async communicator.
+"""
+
+import pytest
+from httpx import Response, codes
+
+from pylon_client._internal.asynchronous.client import AsyncPylonClient
+from pylon_client._internal.asynchronous.config import AsyncConfig
+from pylon_client._internal.pylon_commons.models import Block
+from pylon_client._internal.pylon_commons.types import BlockHash, BlockNumber, NetUid, PylonAuthToken
+from pylon_client._internal.pylon_commons.v1.endpoints import Endpoint as EndpointV1
+from pylon_client._internal.pylon_commons.v1.responses import GetNeuronsResponse
+
+ETAG = '"abc"'
+
+
+@pytest.fixture
+def latest_neurons_url():
+    return EndpointV1.LATEST_NEURONS.absolute_url(netuid_=NetUid(1))
+
+
+@pytest.fixture
+def neurons_response(neuron_factory) -> GetNeuronsResponse:
+    return GetNeuronsResponse(
+        block=Block(number=BlockNumber(1000), hash=BlockHash("0x123")),
+        neurons={n.hotkey: n for n in neuron_factory.batch(2)},
+    )
+
+
+@pytest.mark.asyncio
+async def test_unmodified_response_is_reused(
+    open_access_client: AsyncPylonClient, service_mock, latest_neurons_url, neurons_response
+):
+    route = service_mock.get(latest_neurons_url).mock(
+        side_effect=[
+            Response(status_code=codes.OK, json=neurons_response.model_dump(mode="json"), headers={"ETag": ETAG}),
+            Response(status_code=codes.NOT_MODIFIED, headers={"ETag": ETAG}),
+        ]
+    )
+
+    async with open_access_client:
+        first = await open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        second = await open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert first == second == neurons_response
+    assert "if-none-match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["if-none-match"] == ETAG
+
+
+@pytest.mark.asyncio
+async def test_modified_response_replaces_kept_one(
+    open_access_client: AsyncPylonClient, service_mock, latest_neurons_url, neurons_response
+):
+    updated_response = neurons_response.model_copy(
+        update={"block": Block(number=BlockNumber(1001), hash=BlockHash("0x124"))}
+    )
+    route = service_mock.get(latest_neurons_url).mock(
+        side_effect=[
+            Response(status_code=codes.OK, json=neurons_response.model_dump(mode="json"), headers={"ETag": ETAG}),
+            Response(status_code=codes.OK, json=updated_response.model_dump(mode="json"), headers={"ETag": '"def"'}),
+            Response(status_code=codes.NOT_MODIFIED, headers={"ETag": '"def"'}),
+        ]
+    )
+
+    async with open_access_client:
+        await open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        second = await open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        third = await open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert second == third == updated_response
+    assert route.calls[2].request.headers["if-none-match"] == '"def"'
+
+
+@pytest.mark.asyncio
+async def test_responses_without_etag_are_not_revalidated(
+    open_access_client: AsyncPylonClient, service_mock, latest_neurons_url, neurons_response
+):
+    route = service_mock.get(latest_neurons_url).mock(
+        return_value=Response(status_code=codes.OK, json=neurons_response.model_dump(mode="json"))
+    )
+
+    async with open_access_client:
+        await open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        await open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert "if-none-match" not in route.calls[1].request.headers
+
+
+@pytest.mark.asyncio
+async def test_revalidation_disabled(test_url, service_mock, latest_neurons_url, neurons_response):
+    client = AsyncPylonClient(
+        AsyncConfig(address=test_url, open_access_token=PylonAuthToken("open_access_token"), revalidation_cache_size=0)
+    )
+    route = service_mock.get(latest_neurons_url).mock(
+        return_value=Response(
+            status_code=codes.OK, json=neurons_response.model_dump(mode="json"), headers={"ETag": ETAG}
+        )
+    )
+
+    async with client:
+        await client.open_access.get_latest_neurons(netuid=NetUid(1))
+        await client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert "if-none-match" not in route.calls[1].request.headers
@@ -0,0 +1,42 @@
+from http import HTTPMethod
+
+import pytest
+
+from pylon_client._internal.pylon_commons.models import Block
+from pylon_client._internal.pylon_commons.types import BlockHash, BlockNumber, Timestamp
+from pylon_client._internal.pylon_commons.v1.endpoints import Endpoint as EndpointV1
+from pylon_client._internal.pylon_commons.v1.responses import GetNeuronsResponse, GetValidatorsResponse
+from tests.factories import NeuronFactory
+from tests.unit.synchronous.base_test import IdentityEndpointTest
+
+
+@pytest.fixture
+def block() -> Block:
+    return Block(number=BlockNumber(1000), hash=BlockHash("0x123"))
+
+
+class TestSyncIdentityGetNeuronsAtTime(IdentityEndpointTest):
+    endpoint = EndpointV1.NEURONS_AT_TIME
+    route_params = {"identity_name": "sn1", "netuid": 1, "timestamp": 1700000000}
+    http_method = HTTPMethod.GET
+
+    def make_endpoint_call(self, client):
+        return client.identity.get_neurons_at_time(timestamp=Timestamp(1700000000))
+
+    @pytest.fixture
+    def success_response(self, block: Block, neuron_factory: NeuronFactory) -> GetNeuronsResponse:
+        neurons = neuron_factory.batch(2)
+        return GetNeuronsResponse(block=block, neurons={neuron.hotkey: neuron for neuron in neurons})
+
+
+class TestSyncIdentityGetValidatorsAtTime(IdentityEndpointTest):
+    endpoint = EndpointV1.VALIDATORS_AT_TIME
+    route_params = {"identity_name": "sn1", "netuid": 1, "timestamp": 1700000000}
+    http_method = HTTPMethod.GET
+
+    def make_endpoint_call(self, client):
+        return client.identity.get_validators_at_time(timestamp=Timestamp(1700000000))
+
+    @pytest.fixture
+    def success_response(self, block: Block, neuron_factory: NeuronFactory) -> GetValidatorsResponse:
+        return GetValidatorsResponse(block=block, validators=neuron_factory.batch(2))
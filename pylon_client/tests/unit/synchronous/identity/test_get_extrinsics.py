@@ -0,0 +1,114 @@
+from http import HTTPMethod
+
+import pytest
+from httpx import ConnectError, Response, codes
+
+from pylon_client._internal.pylon_commons.models import Block, BlockExtrinsics, Extrinsic, ExtrinsicCall
+from pylon_client._internal.pylon_commons.types import (
+    BlockHash,
+    BlockNumber,
+    ExtrinsicHash,
+    ExtrinsicIndex,
+    ExtrinsicLength,
+)
+from pylon_client._internal.pylon_commons.v1.endpoints import Endpoint as EndpointV1
+from pylon_client._internal.pylon_commons.v1.responses import GetExtrinsicsRangeResponse, GetExtrinsicsResponse
+from tests.unit.synchronous.base_test import IdentityEndpointTest
+
+
+def make_block_extrinsics(block_number: int) -> BlockExtrinsics:
+    return BlockExtrinsics(
+        block=Block(number=BlockNumber(block_number), hash=BlockHash(f"0x{block_number}")),
+        extrinsics=[
+            Extrinsic(
+                block_number=BlockNumber(block_number),
+                extrinsic_index=ExtrinsicIndex(0),
+                extrinsic_hash=ExtrinsicHash(f"0x{block_number}hash0"),
+                extrinsic_length=ExtrinsicLength(100),
+                address="5FHneW46xGXgs5mUiveU4sbTyGBzmstUspZC92UhjJM694ty",
+                call=ExtrinsicCall(call_module="SubtensorModule", call_function="set_weights", call_args=[]),
+            )
+        ],
+    )
+
+
+class TestSyncIdentityGetExtrinsics(IdentityEndpointTest):
+    endpoint = EndpointV1.EXTRINSICS
+    route_params = {"block_number": 1000}
+    http_method = HTTPMethod.GET
+
+    def make_endpoint_call(self, client):
+        return client.identity.get_extrinsics(block_number=BlockNumber(1000))
+
+    @pytest.fixture
+    def success_response(self) -> GetExtrinsicsResponse:
+        return GetExtrinsicsResponse(**make_block_extrinsics(1000).model_dump())
+
+    def test_filters_are_sent_as_query_params(self, pylon_client, service_mock, route_mock, success_response):
+        self._setup_login_mock(service_mock)
+        route_mock.mock(return_value=Response(status_code=codes.OK, json=success_response.model_dump(mode="json")))
+
+        with pylon_client:
+            response = pylon_client.identity.get_extrinsics(
+                block_number=BlockNumber(1000), call_module="SubtensorModule", call_function="set_weights"
+            )
+
+        assert response == success_response
+        assert dict(route_mock.calls.last.request.url.params) == {
+            "call_module": "SubtensorModule",
+            "call_function": "set_weights",
+        }
+
+
+class TestSyncIdentityGetExtrinsicsRange(IdentityEndpointTest):
+    endpoint = EndpointV1.EXTRINSICS_RANGE
+    route_params = {"start_block_number": 1000, "end_block_number": 1001}
+    http_method = HTTPMethod.GET
+
+    def make_endpoint_call(self, client):
+        return client.identity.get_extrinsics_range(
+            start_block_number=BlockNumber(1000), end_block_number=BlockNumber(1001)
+        )
+
+    @pytest.fixture
+    def success_response(self) -> GetExtrinsicsRangeResponse:
+        return GetExtrinsicsRangeResponse(blocks=[make_block_extrinsics(1000), make_block_extrinsics(1001)])
+
+    @staticmethod
+    def ndjson_response(response: GetExtrinsicsRangeResponse) -> Response:
+        content = "".join(f"{block_extrinsics.model_dump_json()}\n" for block_extrinsics in response.blocks)
+        return Response(status_code=codes.OK, content=content, headers={"content-type": "application/x-ndjson"})
+
+    def test_retries(self, service_mock, route_mock, pylon_client, success_response):
+        assert pylon_client.config.retry.stop.max_attempt_number == 3
+        self._setup_login_mock(service_mock)
+        route_mock.mock(
+            side_effect=[
+                ConnectError("Connection failed"),
+                ConnectError("Connection failed"),
+                self.ndjson_response(success_response),
+            ]
+        )
+        with pylon_client:
+            self.make_endpoint_call(pylon_client)
+
+    def test_ndjson_response_is_parsed(self, pylon_client, service_mock, route_mock, success_response):
+        self._setup_login_mock(service_mock)
+        route_mock.mock(return_value=self.ndjson_response(success_response))
+
+        with pylon_client:
+            response = pylon_client.identity.get_extrinsics_range(
+                start_block_number=BlockNumber(1000), end_block_number=BlockNumber(1001), address="5other"
+            )
+
+        assert response == success_response
+        assert dict(route_mock.calls.last.request.url.params) == {"address": "5other"}
+
+    def test_empty_range_response(self, pylon_client, service_mock, route_mock):
+        self._setup_login_mock(service_mock)
+        route_mock.mock(return_value=Response(status_code=codes.OK, content=b""))
+
+        with pylon_client:
+            response = self.make_endpoint_call(pylon_client)
+
+        assert response == GetExtrinsicsRangeResponse(blocks=[])
@@ -0,0 +1,101 @@
+"""
+Tests for the revalidation of the kept responses in the sync communicator.
+"""
+
+import pytest
+from httpx import Response, codes
+
+from pylon_client._internal.pylon_commons.models import Block
+from pylon_client._internal.pylon_commons.types import BlockHash, BlockNumber, NetUid, PylonAuthToken
+from pylon_client._internal.pylon_commons.v1.endpoints import Endpoint as EndpointV1
+from pylon_client._internal.pylon_commons.v1.responses import GetNeuronsResponse
+from pylon_client._internal.sync.client import PylonClient
+from pylon_client._internal.sync.config import Config
+
+ETAG = '"abc"'
+
+
+@pytest.fixture
+def latest_neurons_url():
+    return EndpointV1.LATEST_NEURONS.absolute_url(netuid_=NetUid(1))
+
+
+@pytest.fixture
+def neurons_response(neuron_factory) -> GetNeuronsResponse:
+    return GetNeuronsResponse(
+        block=Block(number=BlockNumber(1000), hash=BlockHash("0x123")),
+        neurons={n.hotkey: n for n in neuron_factory.batch(2)},
+    )
+
+
+def test_unmodified_response_is_reused(
+    sync_open_access_client: PylonClient, service_mock, latest_neurons_url, neurons_response
+):
+    route = service_mock.get(latest_neurons_url).mock(
+        side_effect=[
+            Response(status_code=codes.OK, json=neurons_response.model_dump(mode="json"), headers={"ETag": ETAG}),
+            Response(status_code=codes.NOT_MODIFIED, headers={"ETag": ETAG}),
+        ]
+    )
+
+    with sync_open_access_client:
+        first = sync_open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        second = sync_open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert first == second == neurons_response
+    assert "if-none-match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["if-none-match"] == ETAG
+
+
+def test_modified_response_replaces_kept_one(
+    sync_open_access_client: PylonClient, service_mock, latest_neurons_url, neurons_response
+):
+    updated_response = neurons_response.model_copy(
+        update={"block": Block(number=BlockNumber(1001), hash=BlockHash("0x124"))}
+    )
+    route = service_mock.get(latest_neurons_url).mock(
+        side_effect=[
+            Response(status_code=codes.OK, json=neurons_response.model_dump(mode="json"), headers={"ETag": ETAG}),
+            Response(status_code=codes.OK, json=updated_response.model_dump(mode="json"), headers={"ETag": '"def"'}),
+            Response(status_code=codes.NOT_MODIFIED, headers={"ETag": '"def"'}),
+        ]
+    )
+
+    with sync_open_access_client:
+        sync_open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        second = sync_open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        third = sync_open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert second == third == updated_response
+    assert route.calls[2].request.headers["if-none-match"] == '"def"'
+
+
+def test_responses_without_etag_are_not_revalidated(
+    sync_open_access_client: PylonClient, service_mock, latest_neurons_url, neurons_response
+):
+    route = service_mock.get(latest_neurons_url).mock(
+        return_value=Response(status_code=codes.OK, json=neurons_response.model_dump(mode="json"))
+    )
+
+    with sync_open_access_client:
+        sync_open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+        sync_open_access_client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert "if-none-match" not in route.calls[1].request.headers
+
+
+def test_revalidation_disabled(test_url, service_mock, latest_neurons_url, neurons_response):
+    client = PylonClient(
+        Config(address=test_url, open_access_token=PylonAuthToken("open_access_token"), revalidation_cache_size=0)
+    )
+    route = service_mock.get(latest_neurons_url).mock(
+        return_value=Response(
+            status_code=codes.OK, json=neurons_response.model_dump(mode="json"), headers={"ETag": ETAG}
+        )
+    )
+
+    with client:
+        client.open_access.get_latest_neurons(netuid=NetUid(1))
+        client.open_access.get_latest_neurons(netuid=NetUid(1))
+
+    assert "if-none-match" not in route.calls[1].request.headers
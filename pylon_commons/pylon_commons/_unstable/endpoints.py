@@ -26,6 +26,12 @@ class Endpoint(BaseEndpoint):
     CERTIFICATES_SELF = (HTTPMethod.GET, "/block/latest/certificates/self", "certificates_self")
     COMMITMENTS = (HTTPMethod.POST, "/commitments", "commitments")
     EXTRINSIC = (HTTPMethod.GET, "/block/{block_number:int}/extrinsic/{extrinsic_index:int}", "extrinsic")
+    EXTRINSICS = (HTTPMethod.GET, "/block/{block_number:int}/extrinsics", "extrinsics")
+    EXTRINSICS_RANGE = (
+        HTTPMethod.GET,
+        "/block/range/{start_block_number:int}/{end_block_number:int}/extrinsics",
+        "extrinsics_range",
+    )
     IDENTITY_LOGIN = (HTTPMethod.POST, "/login/identity/{identity_name:str}", "identity_login")
     LATEST_BLOCK_INFO = (HTTPMethod.GET, "/block/latest", "latest_block_info")
     LATEST_COMMITMENTS = (HTTPMethod.GET, "/block/latest/commitments", "latest_commitments")
@@ -34,6 +40,13 @@ class Endpoint(BaseEndpoint):
     LATEST_NEURONS = (HTTPMethod.GET, "/block/latest/neurons", "latest_neurons")
     LATEST_VALIDATORS = (HTTPMethod.GET, "/block/latest/validators", "latest_validators")
     NEURONS = (HTTPMethod.GET, "/block/{block_number:int}/neurons", "neurons")
+    NEURONS_AT_TIME = (HTTPMethod.GET, "/time/{timestamp:int}/neurons", "neurons_at_time")
+    RECENT_CERTIFICATES = (HTTPMethod.GET, "/block/recent/certificates", "recent_certificates")
+    RECENT_COMMITMENTS = (HTTPMethod.GET, "/block/recent/commitments", "recent_commitments")
+    RECENT_HYPERPARAMS = (HTTPMethod.GET, "/block/recent/hyperparams", "recent_hyperparams")
     RECENT_NEURONS = (HTTPMethod.GET, "/block/recent/neurons", "recent_neurons")
+    RECENT_SUBNET_STATE = (HTTPMethod.GET, "/block/recent/state", "recent_subnet_state")
+    RECENT_VALIDATORS = (HTTPMethod.GET, "/block/recent/validators", "recent_validators")
     SUBNET_WEIGHTS = (HTTPMethod.PUT, "/weights", "subnet_weights")
     VALIDATORS = (HTTPMethod.GET, "/block/{block_number:int}/validators", "validators")
+    VALIDATORS_AT_TIME = (HTTPMethod.GET, "/time/{timestamp:int}/validators", "validators_at_time")
@@ -2,15 +2,20 @@ import typing
 
 from pydantic import BaseModel, field_validator
 
-from ..models import CertificateAlgorithm
-from ..types import BlockNumber, ExtrinsicIndex, Hotkey, IdentityName, NetUid
+from ..models import CertificateAlgorithm, ExtrinsicsFilter
+from ..types import BlockNumber, ExtrinsicIndex, Hotkey, IdentityName, NetUid, Timestamp
 from .bodies import LoginBody, SetCommitmentBody, SetWeightsBody
 from .responses import (
+    GetCertificatesResponse,
     GetCommitmentResponse,
     GetCommitmentsResponse,
     GetExtrinsicResponse,
+    GetExtrinsicsRangeResponse,
+    GetExtrinsicsResponse,
+    GetHyperparamsResponse,
     GetLatestBlockInfoResponse,
     GetNeuronsResponse,
+    GetSubnetStateResponse,
     GetValidatorsResponse,
     IdentityLoginResponse,
     LoginResponse,
@@ -73,6 +78,16 @@ class GetNeuronsRequest(AuthenticatedPylonRequest[GetNeuronsResponse]):
     block_number: BlockNumber
 
 
+class GetNeuronsAtTimeRequest(AuthenticatedPylonRequest[GetNeuronsResponse]):
+    """
+    Class used to fetch the neurons at a point in time by the Pylon client.
+    """
+
+    response_cls = GetNeuronsResponse
+
+    timestamp: Timestamp
+
+
 class GetLatestNeuronsRequest(AuthenticatedPylonRequest[GetNeuronsResponse]):
     """
     Class used to fetch the latest neurons by the Pylon client.
@@ -99,6 +114,16 @@ class GetValidatorsRequest(AuthenticatedPylonRequest[GetValidatorsResponse]):
     block_number: BlockNumber
 
 
+class GetValidatorsAtTimeRequest(AuthenticatedPylonRequest[GetValidatorsResponse]):
+    """
+    Class used to fetch the validators at a point in time by the Pylon client.
+    """
+
+    response_cls = GetValidatorsResponse
+
+    timestamp: Timestamp
+
+
 class GetLatestValidatorsRequest(AuthenticatedPylonRequest[GetValidatorsResponse]):
     """
     Class used to fetch the latest validators by the Pylon client.
@@ -107,6 +132,14 @@ class GetLatestValidatorsRequest(AuthenticatedPylonRequest[GetValidatorsResponse
     response_cls = GetValidatorsResponse
 
 
+class GetRecentValidatorsRequest(AuthenticatedPylonRequest[GetValidatorsResponse]):
+    """
+    Class used to fetch the cached validators by the Pylon client.
+    """
+
+    response_cls = GetValidatorsResponse
+
+
 class GetCommitmentRequest(AuthenticatedPylonRequest[GetCommitmentResponse]):
     """
     Class used to fetch a commitment for a specific hotkey by the Pylon client.
@@ -125,6 +158,38 @@ class GetCommitmentsRequest(AuthenticatedPylonRequest[GetCommitmentsResponse]):
     response_cls = GetCommitmentsResponse
 
 
+class GetRecentCommitmentsRequest(AuthenticatedPylonRequest[GetCommitmentsResponse]):
+    """
+    Class used to fetch the cached commitments for the subnet by the Pylon client.
+    """
+
+    response_cls = GetCommitmentsResponse
+
+
+class GetRecentCertificatesRequest(AuthenticatedPylonRequest[GetCertificatesResponse]):
+    """
+    Class used to fetch the cached certificates for the subnet by the Pylon client.
+    """
+
+    response_cls = GetCertificatesResponse
+
+
+class GetRecentHyperparamsRequest(AuthenticatedPylonRequest[GetHyperparamsResponse]):
+    """
+    Class used to fetch the cached hyperparameters of the subnet by the Pylon client.
+    """
+
+    response_cls = GetHyperparamsResponse
+
+
+class GetRecentSubnetStateRequest(AuthenticatedPylonRequest[GetSubnetStateResponse]):
+    """
+    Class used to fetch the cached state of the subnet by the Pylon client.
+    """
+
+    response_cls = GetSubnetStateResponse
+
+
 class GetLatestBlockInfoRequest(PylonRequest[GetLatestBlockInfoResponse]):
     """
     Class used to fetch latest block info by the Pylon client.
@@ -148,6 +213,30 @@ class GetExtrinsicRequest(PylonRequest[GetExtrinsicResponse]):
     extrinsic_index: ExtrinsicIndex
 
 
+class GetExtrinsicsRequest(ExtrinsicsFilter, PylonRequest[GetExtrinsicsResponse]):
+    """
+    Class used to fetch all the extrinsics from a specific block by the Pylon client.
+
+    The extrinsics may be narrowed down with the filter fields; only the extrinsics matching all the given
+    filters are returned.
+    """
+
+    response_cls = GetExtrinsicsResponse
+
+    block_number: BlockNumber
+
+
+class GetExtrinsicsRangeRequest(ExtrinsicsFilter, PylonRequest[GetExtrinsicsRangeResponse]):
+    """
+    Class used to fetch the extrinsics from a range of blocks (both ends inclusive) by the Pylon client.
+    """
+
+    response_cls = GetExtrinsicsRangeResponse
+
+    start_block_number: BlockNumber
+    end_block_number: BlockNumber
+
+
 # Request classes that require identity authentication.
 
 
@@ -2,9 +2,13 @@ from pydantic import BaseModel
 
 from ..models import (
     Block,
+    BlockExtrinsics,
     BlockInfoBag,
+    BlockSubnetHyperparams,
+    BlockSubnetState,
     Commitment,
     Extrinsic,
+    SubnetCertificates,
     SubnetCommitments,
     SubnetNeurons,
     SubnetValidators,
@@ -98,6 +102,30 @@ class GetCommitmentsResponse(PylonResponse, SubnetCommitments):
     pass
 
 
+class GetCertificatesResponse(PylonResponse, SubnetCertificates):
+    """
+    Response class that is returned for the GetRecentCertificatesRequest.
+    """
+
+    pass
+
+
+class GetHyperparamsResponse(PylonResponse, BlockSubnetHyperparams):
+    """
+    Response class that is returned for the GetRecentHyperparamsRequest.
+    """
+
+    pass
+
+
+class GetSubnetStateResponse(PylonResponse, BlockSubnetState):
+    """
+    Response class that is returned for the GetRecentSubnetStateRequest.
+    """
+
+    pass
+
+
 class GetLatestBlockInfoResponse(PylonResponse, BlockInfoBag):
     """
     Response class that is returned for the GetLatestBlockInfoRequest.
@@ -112,3 +140,21 @@ class GetExtrinsicResponse(PylonResponse, Extrinsic):
     """
 
     pass
+
+
+class GetExtrinsicsResponse(PylonResponse, BlockExtrinsics):
+    """
+    Response class that is returned for the GetExtrinsicsRequest.
+    """
+
+    pass
+
+
+class GetExtrinsicsRangeResponse(PylonResponse):
+    """
+    Response class that is returned for the GetExtrinsicsRangeRequest.
+
+    Contains the extrinsics of every block of the range, in the block order.
+    """
+
+    blocks: list[BlockExtrinsics]
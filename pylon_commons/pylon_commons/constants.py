@@ -2,3 +2,5 @@
 LATEST_BLOCK_MARK = -1
 # Time it takes for a block to be processed in the blockchain.
 BLOCK_PROCESSING_TIME = 12  # seconds
+# Response header with the number of blocks the served recent object is behind the chain head.
+AGE_BLOCKS_HEADER = "X-Pylon-Age-Blocks"
@@ -34,6 +34,7 @@ from .types import (
     SubnetActive,
     TaoStake,
     TaoStakeRao,
+    Tempo,
     Timestamp,
     TotalStake,
     TotalStakeRao,
@@ -140,6 +141,7 @@ class SubnetValidators(BittensorModel):
 class SubnetHyperparams(BittensorModel):
     max_weights_limit: MaxWeightsLimit | None = None
     commit_reveal_weights_enabled: CommitReveal | None = None
+    tempo: Tempo | None = None
     # Add more parameters as needed.
 
 
@@ -156,6 +158,11 @@ class NeuronCertificateKeypair(NeuronCertificate):
     private_key: PrivateKey
 
 
+class SubnetCertificates(BittensorModel):
+    block: Block
+    certificates: dict[Hotkey, NeuronCertificate]
+
+
 class SubnetState(BittensorModel):
     netuid: NetUid
     hotkeys: list[Hotkey]
@@ -188,6 +195,16 @@ class SubnetState(BittensorModel):
         }
 
 
+class BlockSubnetHyperparams(BittensorModel):
+    block: Block
+    hyperparams: SubnetHyperparams
+
+
+class BlockSubnetState(BittensorModel):
+    block: Block
+    state: SubnetState
+
+
 class Commitment(BittensorModel):
     commitment_block_number: BlockNumber
     hotkey: Hotkey
@@ -247,3 +264,29 @@ class Extrinsic(BittensorModel):
 
     # Call information
     call: ExtrinsicCall
+
+
+class BlockExtrinsics(BittensorModel):
+    """
+    Represents the decoded extrinsics of a block.
+    """
+
+    block: Block
+    extrinsics: list[Extrinsic]
+
+
+class ExtrinsicsFilter(BaseModel):
+    """
+    Criteria narrowing down a list of extrinsics; an extrinsic matches when it matches all the given criteria.
+    """
+
+    call_module: str | None = None
+    call_function: str | None = None
+    address: str | None = None
+
+    def matches(self, extrinsic: Extrinsic) -> bool:
+        return (
+            (self.call_module is None or extrinsic.call.call_module == self.call_module)
+            and (self.call_function is None or extrinsic.call.call_function == self.call_function)
+            and (self.address is None or extrinsic.address == self.address)
+        )
@@ -17,8 +17,13 @@ class Settings(BaseSettings):
     # bittensor
     bittensor_network: BittensorNetwork = BittensorNetwork("finney")
     bittensor_archive_network: BittensorNetwork = BittensorNetwork("archive")
+    # additional interchangeable nodes; requests are routed to the healthiest node of each side
+    bittensor_extra_networks: list[BittensorNetwork] = Field(default_factory=list)
+    bittensor_extra_archive_networks: list[BittensorNetwork] = Field(default_factory=list)
     bittensor_archive_blocks_cutoff: ArchiveBlocksCutoff = ArchiveBlocksCutoff(300)
     bittensor_wallet_path: str = "/root/.bittensor/wallets"
+    # build neurons from the subnet state columns instead of the full per-neuron payload
+    bittensor_columnar_neurons: bool = False
 
     # Identities and access
     identities: list[IdentityName] = Field(default_factory=list)
@@ -46,6 +51,10 @@ class Settings(BaseSettings):
     commitment_retry_attempts: int = 10
     commitment_retry_delay_seconds: int = 1
 
+    # extrinsics block range endpoint behaviour
+    extrinsics_range_max_blocks: int = 100
+    extrinsics_range_concurrency: int = 8
+
     # sentry
     sentry_dsn: str = ""
     sentry_environment: str = "production"
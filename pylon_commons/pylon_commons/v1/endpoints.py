@@ -23,6 +23,12 @@ class Endpoint(BaseEndpoint):
     CERTIFICATES_SELF = (HTTPMethod.GET, "/block/latest/certificates/self", "certificates_self_v1")
     COMMITMENTS = (HTTPMethod.POST, "/commitments", "commitments_v1")
     EXTRINSIC = (HTTPMethod.GET, "/block/{block_number:int}/extrinsic/{extrinsic_index:int}", "extrinsic_v1")
+    EXTRINSICS = (HTTPMethod.GET, "/block/{block_number:int}/extrinsics", "extrinsics_v1")
+    EXTRINSICS_RANGE = (
+        HTTPMethod.GET,
+        "/block/range/{start_block_number:int}/{end_block_number:int}/extrinsics",
+        "extrinsics_range_v1",
+    )
     IDENTITY_LOGIN = (HTTPMethod.POST, "/login/identity/{identity_name:str}", "identity_login_v1")
     LATEST_BLOCK_INFO = (HTTPMethod.GET, "/block/latest", "latest_block_info")
     LATEST_COMMITMENTS = (HTTPMethod.GET, "/block/latest/commitments", "latest_commitments_v1")
@@ -35,6 +41,13 @@ class Endpoint(BaseEndpoint):
     LATEST_NEURONS = (HTTPMethod.GET, "/block/latest/neurons", "latest_neurons_v1")
     LATEST_VALIDATORS = (HTTPMethod.GET, "/block/latest/validators", "latest_validators_v1")
     NEURONS = (HTTPMethod.GET, "/block/{block_number:int}/neurons", "neurons_v1")
+    NEURONS_AT_TIME = (HTTPMethod.GET, "/time/{timestamp:int}/neurons", "neurons_at_time_v1")
+    RECENT_CERTIFICATES = (HTTPMethod.GET, "/block/recent/certificates", "recent_certificates_v1")
+    RECENT_COMMITMENTS = (HTTPMethod.GET, "/block/recent/commitments", "recent_commitments_v1")
+    RECENT_HYPERPARAMS = (HTTPMethod.GET, "/block/recent/hyperparams", "recent_hyperparams_v1")
     RECENT_NEURONS = (HTTPMethod.GET, "/block/recent/neurons", "recent_neurons_v1")
+    RECENT_SUBNET_STATE = (HTTPMethod.GET, "/block/recent/state", "recent_subnet_state_v1")
+    RECENT_VALIDATORS = (HTTPMethod.GET, "/block/recent/validators", "recent_validators_v1")
     SUBNET_WEIGHTS = (HTTPMethod.PUT, "/weights", "subnet_weights_v1")
     VALIDATORS = (HTTPMethod.GET, "/block/{block_number:int}/validators", "validators_v1")
+    VALIDATORS_AT_TIME = (HTTPMethod.GET, "/time/{timestamp:int}/validators", "validators_at_time_v1")
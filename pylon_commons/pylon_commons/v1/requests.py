@@ -3,12 +3,20 @@ from .._unstable.requests import (  # noqa: F401
     GenerateCertificateKeypairRequest,
     GetCommitmentRequest,
     GetExtrinsicRequest,
+    GetExtrinsicsRangeRequest,
+    GetExtrinsicsRequest,
     GetLatestBlockInfoRequest,
     GetLatestNeuronsRequest,
     GetLatestValidatorsRequest,
+    GetNeuronsAtTimeRequest,
     GetNeuronsRequest,
     GetOwnCommitmentRequest,
+    GetRecentCertificatesRequest,
+    GetRecentHyperparamsRequest,
     GetRecentNeuronsRequest,
+    GetRecentSubnetStateRequest,
+    GetRecentValidatorsRequest,
+    GetValidatorsAtTimeRequest,
     GetValidatorsRequest,
     IdentityLoginRequest,
     IdentityPylonRequest,
@@ -27,12 +35,21 @@ __all__ = [
     "GetCommitmentRequest",
     "GetCommitmentsRequest",
     "GetExtrinsicRequest",
+    "GetExtrinsicsRangeRequest",
+    "GetExtrinsicsRequest",
     "GetLatestBlockInfoRequest",
     "GetLatestNeuronsRequest",
     "GetLatestValidatorsRequest",
+    "GetNeuronsAtTimeRequest",
     "GetNeuronsRequest",
     "GetOwnCommitmentRequest",
+    "GetRecentCertificatesRequest",
+    "GetRecentCommitmentsRequest",
+    "GetRecentHyperparamsRequest",
     "GetRecentNeuronsRequest",
+    "GetRecentSubnetStateRequest",
+    "GetRecentValidatorsRequest",
+    "GetValidatorsAtTimeRequest",
     "GetValidatorsRequest",
     "IdentityLoginRequest",
     "IdentityPylonRequest",
@@ -51,3 +68,11 @@ class GetCommitmentsRequest(AuthenticatedPylonRequest[GetCommitmentsResponse]):
     """
 
     response_cls = GetCommitmentsResponse
+
+
+class GetRecentCommitmentsRequest(AuthenticatedPylonRequest[GetCommitmentsResponse]):
+    """
+    V1 class used to fetch the cached commitments for the subnet by the Pylon client.
+    """
+
+    response_cls = GetCommitmentsResponse
@@ -1,8 +1,13 @@
 from .._unstable.responses import (  # noqa: F401
+    GetCertificatesResponse,
     GetCommitmentResponse,
     GetExtrinsicResponse,
+    GetExtrinsicsRangeResponse,
+    GetExtrinsicsResponse,
+    GetHyperparamsResponse,
     GetLatestBlockInfoResponse,
     GetNeuronsResponse,
+    GetSubnetStateResponse,
     GetValidatorsResponse,
     IdentityLoginResponse,
     LoginResponse,
@@ -15,11 +20,16 @@ from ..models import Block
 from ..types import CommitmentDataHex, Hotkey
 
 __all__ = [
+    "GetCertificatesResponse",
     "GetCommitmentResponse",
     "GetCommitmentsResponse",
     "GetExtrinsicResponse",
+    "GetExtrinsicsRangeResponse",
+    "GetExtrinsicsResponse",
+    "GetHyperparamsResponse",
     "GetLatestBlockInfoResponse",
     "GetNeuronsResponse",
+    "GetSubnetStateResponse",
     "GetValidatorsResponse",
     "IdentityLoginResponse",
     "LoginResponse",
@@ -1,27 +1,48 @@
+import asyncio
+import itertools
 import logging
+from collections import deque
+from collections.abc import AsyncGenerator
 
-from litestar import Controller, Response, status_codes
+from litestar import Controller, Request, Response, status_codes
 from litestar.di import Provide
-from litestar.exceptions import NotFoundException, ServiceUnavailableException
+from litestar.exceptions import NotFoundException, ValidationException
+from litestar.response import Stream
 from pylon_commons._unstable.bodies import LoginBody, SetCommitmentBody, SetWeightsBody
 from pylon_commons._unstable.endpoints import Endpoint
 from pylon_commons._unstable.requests import GenerateCertificateKeypairRequest
 from pylon_commons._unstable.responses import (
+    GetCertificatesResponse,
     GetCommitmentResponse,
     GetCommitmentsResponse,
     GetExtrinsicResponse,
+    GetExtrinsicsResponse,
+    GetHyperparamsResponse,
     GetLatestBlockInfoResponse,
     GetNeuronsResponse,
+    GetSubnetStateResponse,
     GetValidatorsResponse,
     IdentityLoginResponse,
 )
-from pylon_commons.models import Hotkey, NeuronCertificate, SubnetNeurons
-from pylon_commons.types import BlockNumber, ExtrinsicIndex, NetUid
+from pylon_commons.models import (
+    Block,
+    BlockExtrinsics,
+    BlockSubnetHyperparams,
+    BlockSubnetState,
+    ExtrinsicsFilter,
+    Hotkey,
+    NeuronCertificate,
+    SubnetCertificates,
+    SubnetCommitments,
+    SubnetNeurons,
+    SubnetValidators,
+)
+from pylon_commons.types import BlockNumber, ExtrinsicIndex, NetUid, Timestamp
 
 from pylon_service.api._unstable.tasks import ApplyWeights, SetCommitment
-from pylon_service.api.utils import handler
+from pylon_service.api.utils import get_recent_object_response, handler
 from pylon_service.bittensor.client import AbstractBittensorClient
-from pylon_service.bittensor.recent import RecentObjectMissing, RecentObjectProvider, RecentObjectStale
+from pylon_service.bittensor.recent import RecentObjectProvider
 from pylon_service.dependencies import (
     bt_client_identity_dep,
     bt_client_open_access_dep,
@@ -31,6 +52,7 @@ from pylon_service.dependencies import (
 )
 from pylon_service.exceptions import BadGatewayException
 from pylon_service.identities import Identity
+from pylon_service.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +69,7 @@ async def identity_login(data: LoginBody, identity: Identity) -> IdentityLoginRe
 
 @handler(
     Endpoint.LATEST_BLOCK_INFO,
-    cache=3,
+    block_cached=True,
     dependencies={"bt_client": Provide(bt_client_open_access_dep)},
 )
 async def get_latest_block_info_endpoint(bt_client: AbstractBittensorClient) -> GetLatestBlockInfoResponse:
@@ -61,6 +83,7 @@ async def get_latest_block_info_endpoint(bt_client: AbstractBittensorClient) ->
 
 @handler(
     Endpoint.EXTRINSIC,
+    immutable=True,
     dependencies={"bt_client": Provide(bt_client_open_access_dep)},
 )
 async def get_extrinsic_endpoint(
@@ -83,6 +106,134 @@ async def get_extrinsic_endpoint(
     return GetExtrinsicResponse.model_validate(extrinsic, from_attributes=True)
 
 
+@handler(
+    Endpoint.EXTRINSICS,
+    immutable=True,
+    dependencies={"bt_client": Provide(bt_client_open_access_dep)},
+)
+async def get_extrinsics_endpoint(
+    bt_client: AbstractBittensorClient,
+    block_number: BlockNumber,
+    call_module: str | None = None,
+    call_function: str | None = None,
+    address: str | None = None,
+) -> GetExtrinsicsResponse:
+    """
+    Get all the decoded extrinsics from a specific block, optionally filtered by the call and the signer address.
+
+    This is a block-level endpoint that does not require subnet context.
+
+    Raises:
+        NotFoundException: If block could not be found.
+    """
+    extrinsics_filter = ExtrinsicsFilter(call_module=call_module, call_function=call_function, address=address)
+    block_extrinsics = await _get_block_extrinsics(bt_client, block_number, extrinsics_filter)
+    if block_extrinsics is None:
+        raise NotFoundException(detail=f"Block {block_number} not found.")
+    return GetExtrinsicsResponse.model_validate(block_extrinsics, from_attributes=True)
+
+
+@handler(
+    Endpoint.EXTRINSICS_RANGE,
+    dependencies={"bt_client": Provide(bt_client_open_access_dep)},
+)
+async def get_extrinsics_range_endpoint(
+    bt_client: AbstractBittensorClient,
+    start_block_number: BlockNumber,
+    end_block_number: BlockNumber,
+    call_module: str | None = None,
+    call_function: str | None = None,
+    address: str | None = None,
+) -> Stream:
+    """
+    Stream the decoded extrinsics of a range of blocks (both ends inclusive) as NDJSON, one block per line,
+    optionally filtered by the call and the signer address.
+
+    The blocks are fetched with at most `extrinsics_range_concurrency` blocks in flight and are streamed
+    in the block order.
+
+    Raises:
+        ValidationException: If the range is empty or longer than `extrinsics_range_max_blocks`.
+        NotFoundException: If the end of the range is past the latest block.
+    """
+    if end_block_number < start_block_number:
+        raise ValidationException(detail="end_block_number must not be lower than start_block_number.")
+    if end_block_number - start_block_number + 1 > settings.extrinsics_range_max_blocks:
+        raise ValidationException(
+            detail=f"The block range must not be longer than {settings.extrinsics_range_max_blocks} blocks."
+        )
+    latest_block = await bt_client.get_latest_block()
+    if end_block_number > latest_block.number:
+        raise NotFoundException(detail=f"Block {end_block_number} not found.")
+    extrinsics_filter = ExtrinsicsFilter(call_module=call_module, call_function=call_function, address=address)
+    return Stream(
+        _stream_block_extrinsics(
+            bt_client,
+            range(start_block_number, end_block_number + 1),
+            extrinsics_filter,
+            settings.extrinsics_range_concurrency,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _get_block_extrinsics(
+    bt_client: AbstractBittensorClient, block_number: BlockNumber, extrinsics_filter: ExtrinsicsFilter
+) -> BlockExtrinsics | None:
+    block = await bt_client.get_block(block_number)
+    if block is None:
+        return None
+    extrinsics = await bt_client.get_extrinsics(block)
+    if extrinsics is None:
+        return None
+    return BlockExtrinsics(
+        block=block, extrinsics=[extrinsic for extrinsic in extrinsics if extrinsics_filter.matches(extrinsic)]
+    )
+
+
+async def _stream_block_extrinsics(
+    bt_client: AbstractBittensorClient,
+    block_numbers: range,
+    extrinsics_filter: ExtrinsicsFilter,
+    concurrency: int,
+) -> AsyncGenerator[bytes]:
+    """
+    Yields the NDJSON lines with the extrinsics of the blocks, in the block order.
+
+    At most `concurrency` blocks are fetched at once; a block is fetched ahead only when there is room
+    in the window, so a slow reader does not make the whole range pile up in memory.
+    Blocks that could not be found are skipped.
+    """
+    block_numbers_iter = iter(block_numbers)
+    pending: deque[asyncio.Task[BlockExtrinsics | None]] = deque(
+        asyncio.create_task(_get_block_extrinsics(bt_client, BlockNumber(block_number), extrinsics_filter))
+        for block_number in itertools.islice(block_numbers_iter, max(concurrency, 1))
+    )
+    try:
+        while pending:
+            block_extrinsics = await pending.popleft()
+            if (block_number := next(block_numbers_iter, None)) is not None:
+                pending.append(
+                    asyncio.create_task(_get_block_extrinsics(bt_client, BlockNumber(block_number), extrinsics_filter))
+                )
+            if block_extrinsics is not None:
+                yield block_extrinsics.model_dump_json().encode() + b"\n"
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _get_block_at(bt_client: AbstractBittensorClient, timestamp: Timestamp) -> Block:
+    """
+    Raises:
+        NotFoundException: If there is no block at the timestamp.
+    """
+    block = await bt_client.get_block_at(timestamp)
+    if block is None:
+        raise NotFoundException(detail=f"No block found at timestamp {timestamp}.")
+    return block
+
+
 class OpenAccessController(Controller):
     path = "/subnet/{netuid:int}/"
     dependencies = {
@@ -90,7 +241,7 @@ class OpenAccessController(Controller):
         "recent_object_provider": Provide(recent_object_provider_open_access_dep),
     }
 
-    @handler(Endpoint.NEURONS)
+    @handler(Endpoint.NEURONS, immutable=True)
     async def get_neurons(
         self, bt_client: AbstractBittensorClient, block_number: BlockNumber, netuid: NetUid
     ) -> GetNeuronsResponse:
@@ -108,26 +259,34 @@ class OpenAccessController(Controller):
         result = await bt_client.get_neurons(netuid, block=block)
         return GetNeuronsResponse.model_validate(result, from_attributes=True)
 
-    @handler(Endpoint.LATEST_NEURONS)
+    @handler(Endpoint.NEURONS_AT_TIME)
+    async def get_neurons_at_time(
+        self, bt_client: AbstractBittensorClient, timestamp: Timestamp, netuid: NetUid
+    ) -> GetNeuronsResponse:
+        """
+        Get a metagraph at a point in time (unix timestamp in seconds), i.e. for the last block produced at
+        or before it.
+
+        Raises:
+            NotFoundException: If there is no block at the timestamp.
+        """
+        block = await _get_block_at(bt_client, timestamp)
+        result = await bt_client.get_neurons(netuid, block=block)
+        return GetNeuronsResponse.model_validate(result, from_attributes=True)
+
+    @handler(Endpoint.LATEST_NEURONS, block_cached=True)
     async def get_latest_neurons(self, bt_client: AbstractBittensorClient, netuid: NetUid) -> GetNeuronsResponse:
         block = await bt_client.get_latest_block()
         result = await bt_client.get_neurons(netuid, block=block)
         return GetNeuronsResponse.model_validate(result, from_attributes=True)
 
     @handler(Endpoint.RECENT_NEURONS)
-    async def get_recent_neurons(self, recent_object_provider: RecentObjectProvider) -> GetNeuronsResponse:
-        try:
-            result = await recent_object_provider.get(SubnetNeurons)
-            return GetNeuronsResponse.model_validate(result, from_attributes=True)
-        except RecentObjectMissing as e:
-            raise ServiceUnavailableException(
-                "Recent neurons data is not available. Cache update may not have finished "
-                "yet or subnet may not be configured for caching recent objects."
-            ) from e
-        except RecentObjectStale as e:
-            raise ServiceUnavailableException("Recent neurons data is stale. Cache update may be failing.") from e
-
-    @handler(Endpoint.VALIDATORS)
+    async def get_recent_neurons(
+        self, request: Request, recent_object_provider: RecentObjectProvider
+    ) -> Response[GetNeuronsResponse]:
+        return await get_recent_object_response(request, recent_object_provider, SubnetNeurons, "neurons")
+
+    @handler(Endpoint.VALIDATORS, immutable=True)
     async def get_validators(
         self, bt_client: AbstractBittensorClient, block_number: BlockNumber, netuid: NetUid
     ) -> GetValidatorsResponse:
@@ -143,7 +302,22 @@ class OpenAccessController(Controller):
         result = await bt_client.get_validators(netuid, block=block)
         return GetValidatorsResponse.model_validate(result, from_attributes=True)
 
-    @handler(Endpoint.LATEST_VALIDATORS)
+    @handler(Endpoint.VALIDATORS_AT_TIME)
+    async def get_validators_at_time(
+        self, bt_client: AbstractBittensorClient, timestamp: Timestamp, netuid: NetUid
+    ) -> GetValidatorsResponse:
+        """
+        Get validators (neurons with validator_permit=True) at a point in time (unix timestamp in seconds), i.e. for
+        the last block produced at or before it, sorted by total stake descending.
+
+        Raises:
+            NotFoundException: If there is no block at the timestamp.
+        """
+        block = await _get_block_at(bt_client, timestamp)
+        result = await bt_client.get_validators(netuid, block=block)
+        return GetValidatorsResponse.model_validate(result, from_attributes=True)
+
+    @handler(Endpoint.LATEST_VALIDATORS, block_cached=True)
     async def get_latest_validators(self, bt_client: AbstractBittensorClient, netuid: NetUid) -> GetValidatorsResponse:
         """
         Get validators (neurons with validator_permit=True) at the latest block, sorted by total stake descending.
@@ -152,7 +326,52 @@ class OpenAccessController(Controller):
         result = await bt_client.get_validators(netuid, block=block)
         return GetValidatorsResponse.model_validate(result, from_attributes=True)
 
-    @handler(Endpoint.CERTIFICATES)
+    @handler(Endpoint.RECENT_VALIDATORS)
+    async def get_recent_validators(
+        self, request: Request, recent_object_provider: RecentObjectProvider
+    ) -> Response[GetValidatorsResponse]:
+        """
+        Get the cached validators, sorted by total stake descending.
+        """
+        return await get_recent_object_response(request, recent_object_provider, SubnetValidators, "validators")
+
+    @handler(Endpoint.RECENT_CERTIFICATES)
+    async def get_recent_certificates(
+        self, request: Request, recent_object_provider: RecentObjectProvider
+    ) -> Response[GetCertificatesResponse]:
+        """
+        Get the cached certificates for the subnet.
+        """
+        return await get_recent_object_response(request, recent_object_provider, SubnetCertificates, "certificates")
+
+    @handler(Endpoint.RECENT_COMMITMENTS)
+    async def get_recent_commitments(
+        self, request: Request, recent_object_provider: RecentObjectProvider
+    ) -> Response[GetCommitmentsResponse]:
+        """
+        Get the cached commitments for the subnet.
+        """
+        return await get_recent_object_response(request, recent_object_provider, SubnetCommitments, "commitments")
+
+    @handler(Endpoint.RECENT_HYPERPARAMS)
+    async def get_recent_hyperparams(
+        self, request: Request, recent_object_provider: RecentObjectProvider
+    ) -> Response[GetHyperparamsResponse]:
+        """
+        Get the cached hyperparameters of the subnet.
+        """
+        return await get_recent_object_response(request, recent_object_provider, BlockSubnetHyperparams, "hyperparams")
+
+    @handler(Endpoint.RECENT_SUBNET_STATE)
+    async def get_recent_subnet_state(
+        self, request: Request, recent_object_provider: RecentObjectProvider
+    ) -> Response[GetSubnetStateResponse]:
+        """
+        Get the cached state of the subnet.
+        """
+        return await get_recent_object_response(request, recent_object_provider, BlockSubnetState, "subnet state")
+
+    @handler(Endpoint.CERTIFICATES, block_cached=True)
     async def get_certificates_endpoint(
         self, bt_client: AbstractBittensorClient, netuid: NetUid
     ) -> dict[Hotkey, NeuronCertificate]:
@@ -162,7 +381,7 @@ class OpenAccessController(Controller):
         block = await bt_client.get_latest_block()
         return await bt_client.get_certificates(netuid, block)
 
-    @handler(Endpoint.CERTIFICATES_HOTKEY)
+    @handler(Endpoint.CERTIFICATES_HOTKEY, block_cached=True)
     async def get_certificate_endpoint(
         self, hotkey: Hotkey, bt_client: AbstractBittensorClient, netuid: NetUid
     ) -> NeuronCertificate:
@@ -179,7 +398,7 @@ class OpenAccessController(Controller):
 
         return certificate
 
-    @handler(Endpoint.LATEST_COMMITMENTS)
+    @handler(Endpoint.LATEST_COMMITMENTS, block_cached=True)
     async def get_commitments_endpoint(
         self, bt_client: AbstractBittensorClient, netuid: NetUid
     ) -> GetCommitmentsResponse:
@@ -190,7 +409,7 @@ class OpenAccessController(Controller):
         result = await bt_client.get_commitments(netuid, block)
         return GetCommitmentsResponse.model_validate(result, from_attributes=True)
 
-    @handler(Endpoint.LATEST_COMMITMENTS_HOTKEY)
+    @handler(Endpoint.LATEST_COMMITMENTS_HOTKEY, block_cached=True)
     async def get_commitment_endpoint(
         self, hotkey: Hotkey, bt_client: AbstractBittensorClient, netuid: NetUid
     ) -> GetCommitmentResponse:
@@ -251,7 +470,7 @@ class IdentityController(OpenAccessController):
             status_code=status_codes.HTTP_201_CREATED,
         )
 
-    @handler(Endpoint.CERTIFICATES_SELF)
+    @handler(Endpoint.CERTIFICATES_SELF, block_cached=True)
     async def get_own_certificate_endpoint(self, bt_client: AbstractBittensorClient, netuid: NetUid) -> Response:
         """
         Get a certificate for the identity's wallet.
@@ -266,7 +485,7 @@ class IdentityController(OpenAccessController):
 
         return Response(certificate, status_code=status_codes.HTTP_200_OK)
 
-    @handler(Endpoint.LATEST_COMMITMENTS_SELF)
+    @handler(Endpoint.LATEST_COMMITMENTS_SELF, block_cached=True)
     async def get_own_commitment_endpoint(
         self, bt_client: AbstractBittensorClient, netuid: NetUid
     ) -> GetCommitmentResponse:
@@ -304,4 +523,6 @@ __all__ = [
     "IdentityController",
     "identity_login",
     "get_extrinsic_endpoint",
+    "get_extrinsics_endpoint",
+    "get_extrinsics_range_endpoint",
 ]
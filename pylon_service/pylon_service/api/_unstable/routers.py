@@ -5,10 +5,19 @@ from pylon_service.api._unstable.api import (
     IdentityController,
     OpenAccessController,
     get_extrinsic_endpoint,
+    get_extrinsics_endpoint,
+    get_extrinsics_range_endpoint,
     identity_login,
 )
 
 unstable_router = Router(
     path=ApiVersion.UNSTABLE.prefix,
-    route_handlers=[IdentityController, OpenAccessController, identity_login, get_extrinsic_endpoint],
+    route_handlers=[
+        IdentityController,
+        OpenAccessController,
+        identity_login,
+        get_extrinsic_endpoint,
+        get_extrinsics_endpoint,
+        get_extrinsics_range_endpoint,
+    ],
 )
@@ -0,0 +1,92 @@
+"""
+Response caching aligned to the chain head.
+
+Responses of the endpoints that serve the data at the latest block are the same for every request made within
+one block, so they are cached under a key that includes the hash of the current chain head, taken from the chain
+head tracker kept in the app state. When the head advances, the key changes, so the responses for the previous
+head are not served anymore and expire shortly after. While the head is unknown, nothing is cached. The head is read
+once per request and kept in the request scope, so the key the response is looked up with, the key it is stored
+under and its entity tag all refer to the same head even if the head advances while the request is handled.
+
+The same block alignment is used to validate the responses held by the clients, see
+pylon_service.middleware.conditional_requests: the entity tags are derived from what identifies the content of
+the response - the request path and query (which carry the API version, netuid, hotkey and block number) and
+the block the data was read at.
+"""
+
+import hashlib
+from typing import Any
+
+from litestar import Litestar, Request
+from litestar.config.response_cache import default_cache_key_builder, default_do_cache_predicate
+from litestar.handlers import HTTPRouteHandler
+from litestar.types import HTTPScope, WebSocketScope
+from pylon_commons.models import Block
+
+UNKNOWN_HEAD = "unknown"
+IMMUTABLE_OPTION = "immutable"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_REQUEST_HEAD_STATE_KEY = "pylon_chain_head"
+
+
+def chain_head(app: Litestar) -> Block | None:
+    head_tracker = app.state.get("chain_head_tracker")
+    return head_tracker.head if head_tracker is not None else None
+
+
+def finalized_block(app: Litestar) -> Block | None:
+    head_tracker = app.state.get("chain_head_tracker")
+    return head_tracker.finalized if head_tracker is not None else None
+
+
+def request_chain_head(scope: HTTPScope | WebSocketScope) -> Block | None:
+    """
+    Returns the chain head the request is served at: the head known when it was first asked for during the request.
+    """
+    state = scope["state"]
+    if _REQUEST_HEAD_STATE_KEY not in state:
+        state[_REQUEST_HEAD_STATE_KEY] = chain_head(scope["app"])
+    return state[_REQUEST_HEAD_STATE_KEY]
+
+
+def block_cache_key_builder(request: Request[Any, Any, Any]) -> str:
+    """
+    Builds the cache key from the request method, path and query parameters and the hash of the chain head
+    the request is served at.
+    """
+    head = request_chain_head(request.scope)
+    return f"{default_cache_key_builder(request)}@{head.hash if head is not None else UNKNOWN_HEAD}"
+
+
+def block_cache_response_filter(scope: HTTPScope, status_code: int) -> bool:
+    """
+    Caches the successful responses, except the block-aligned ones while the chain head is unknown.
+    """
+    if not default_do_cache_predicate(scope, status_code):
+        return False
+    route_handler = scope["route_handler"]
+    if (
+        not isinstance(route_handler, HTTPRouteHandler)
+        or route_handler.cache_key_builder is not block_cache_key_builder
+    ):
+        return True
+    return request_chain_head(scope) is not None
+
+
+def make_etag(path: str, query_string: str, version: str) -> str:
+    """
+    Builds a strong entity tag for the JSON representation of the resource at the path, in the given version.
+    """
+    digest = hashlib.blake2b(f"{path}?{query_string}@{version}".encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Tells whether the value of an If-None-Match header matches the entity tag.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
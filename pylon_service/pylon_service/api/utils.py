@@ -1,8 +1,21 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from litestar import MediaType, Request, Response
+from litestar.exceptions import ServiceUnavailableException
 from litestar.handlers.http_handlers import decorators as http_decorators
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
+from pylon_commons.constants import AGE_BLOCKS_HEADER, BLOCK_PROCESSING_TIME
 from pylon_commons.endpoints import Endpoint
+from pylon_commons.models import BittensorModel
+
+from pylon_service.api.caching import IMMUTABLE_OPTION, block_cache_key_builder, etag_matches, make_etag
+from pylon_service.bittensor.recent import RecentObjectMissing, RecentObjectProvider, RecentObjectStale, age_blocks
 
 
-def handler(endpoint: Endpoint, **kwargs):
+def handler(endpoint: Endpoint, block_cached: bool = False, immutable: bool = False, **kwargs):
     """
     Decorator to create litestar handlers using endpoints defined in Endpoint enums.
 
@@ -10,6 +23,73 @@ def handler(endpoint: Endpoint, **kwargs):
     with Pylon client.
     The decorator automatically sets the proper url, name and method for the endpoint,
     other kwargs may be set by passing them to this decorator.
+    With block_cached set, the responses are cached for the current chain head, see pylon_service.api.caching;
+    it is meant for the endpoints that serve the data at the latest block.
+    With immutable set, the responses for the finalized blocks are marked as immutable, see
+    pylon_service.middleware.conditional_requests; it is meant for the endpoints that serve the data at the block
+    given by the block_number path parameter.
     """
+    if block_cached:
+        kwargs.setdefault("cache", BLOCK_PROCESSING_TIME)
+        kwargs["cache_key_builder"] = block_cache_key_builder
+    if immutable:
+        kwargs["opt"] = {**kwargs.get("opt", {}), IMMUTABLE_OPTION: True}
     method = getattr(http_decorators, endpoint.method.lower())
     return method(endpoint.url, name=endpoint.reverse, **kwargs)
+
+
+async def get_recent_object[ModelT: BittensorModel](
+    recent_object_provider: RecentObjectProvider, model: type[ModelT], name: str
+) -> ModelT:
+    """
+    Get a recent object from the cache, translating its absence or staleness into an HTTP error.
+
+    Raises:
+        ServiceUnavailableException: If the recent object is missing or stale.
+    """
+    with _recent_object_errors(name):
+        return await recent_object_provider.get(model)
+
+
+async def get_recent_object_response(
+    request: Request[Any, Any, Any],
+    recent_object_provider: RecentObjectProvider,
+    model: type[BittensorModel],
+    name: str,
+) -> Response[Any]:
+    """
+    Get a response with a recent object, serving the JSON stored in the cache as is. The object is not validated
+    nor serialized again, so the response model of the endpoint must have the same fields as the cached model.
+
+    The response is tagged with an entity tag derived from the time the object was cached at, as the object is
+    replaced only when it is fetched anew; a request with a matching If-None-Match header gets 304 Not Modified.
+    The Age header and the X-Pylon-Age-Blocks header tell how old the object is, in seconds and in blocks behind
+    the chain head.
+
+    Raises:
+        ServiceUnavailableException: If the recent object is missing or stale.
+    """
+    with _recent_object_errors(name):
+        cached_at, data = await recent_object_provider.get_raw(model)
+    etag = make_etag(request.url.path, request.url.query, str(cached_at))
+    headers = {"ETag": etag, "Age": str(_age_seconds(cached_at)), AGE_BLOCKS_HEADER: str(age_blocks(cached_at))}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(content=None, status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=data, media_type=MediaType.JSON, headers=headers)
+
+
+def _age_seconds(cached_at: float) -> int:
+    return max(0, int(time.time() - cached_at))
+
+
+@contextmanager
+def _recent_object_errors(name: str) -> Iterator[None]:
+    try:
+        yield
+    except RecentObjectMissing as e:
+        raise ServiceUnavailableException(
+            f"Recent {name} data is not available. Cache update may not have finished "
+            "yet or subnet may not be configured for caching recent objects."
+        ) from e
+    except RecentObjectStale as e:
+        raise ServiceUnavailableException(f"Recent {name} data is stale. Cache update may be failing.") from e
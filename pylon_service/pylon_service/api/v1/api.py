@@ -1,3 +1,4 @@
+from pylon_commons.models import SubnetCommitments
 from pylon_commons.types import NetUid
 from pylon_commons.v1.endpoints import Endpoint
 from pylon_commons.v1.responses import GetCommitmentsResponse
@@ -10,15 +11,25 @@ from pylon_service.api._unstable.api import (
 )
 from pylon_service.api._unstable.api import (
     get_extrinsic_endpoint,
+    get_extrinsics_endpoint,
+    get_extrinsics_range_endpoint,
     get_latest_block_info_endpoint,
     identity_login,
 )
-from pylon_service.api.utils import handler
+from pylon_service.api.utils import get_recent_object, handler
 from pylon_service.bittensor.client import AbstractBittensorClient
+from pylon_service.bittensor.recent import RecentObjectProvider
+
+
+def _to_commitments_response(commitments: SubnetCommitments) -> GetCommitmentsResponse:
+    return GetCommitmentsResponse(
+        block=commitments.block,
+        commitments={hotkey: c.commitment for hotkey, c in commitments.commitments.items()},
+    )
 
 
 class OpenAccessController(NewOpenAccessController):
-    @handler(Endpoint.LATEST_COMMITMENTS)
+    @handler(Endpoint.LATEST_COMMITMENTS, block_cached=True)
     async def get_commitments_endpoint(
         self, bt_client: AbstractBittensorClient, netuid: NetUid
     ) -> GetCommitmentsResponse:
@@ -27,10 +38,15 @@ class OpenAccessController(NewOpenAccessController):
         """
         block = await bt_client.get_latest_block()
         result = await bt_client.get_commitments(netuid, block)
-        return GetCommitmentsResponse(
-            block=result.block,
-            commitments={hotkey: c.commitment for hotkey, c in result.commitments.items()},
-        )
+        return _to_commitments_response(result)
+
+    @handler(Endpoint.RECENT_COMMITMENTS)
+    async def get_recent_commitments(self, recent_object_provider: RecentObjectProvider) -> GetCommitmentsResponse:
+        """
+        Get the cached commitments for the subnet.
+        """
+        result = await get_recent_object(recent_object_provider, SubnetCommitments, "commitments")
+        return _to_commitments_response(result)
 
 
 class IdentityController(OpenAccessController, NewIdentityController):
@@ -42,5 +58,7 @@ __all__ = [
     "IdentityController",
     "identity_login",
     "get_extrinsic_endpoint",
+    "get_extrinsics_endpoint",
+    "get_extrinsics_range_endpoint",
     "get_latest_block_info_endpoint",
 ]
@@ -5,6 +5,8 @@ from pylon_service.api.v1.api import (
     IdentityController,
     OpenAccessController,
     get_extrinsic_endpoint,
+    get_extrinsics_endpoint,
+    get_extrinsics_range_endpoint,
     get_latest_block_info_endpoint,
     identity_login,
 )
@@ -16,6 +18,8 @@ v1_router = Router(
         OpenAccessController,
         identity_login,
         get_extrinsic_endpoint,
+        get_extrinsics_endpoint,
+        get_extrinsics_range_endpoint,
         get_latest_block_info_endpoint,
     ],
 )
@@ -0,0 +1,276 @@
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic_core import to_json
+from pylon_commons.models import Block, Extrinsic
+from pylon_commons.types import BlockHash, BlockNumber, ExtrinsicIndex, NetUid, Timestamp
+from turbobt.substrate.pallets.chain import SignedBlock
+
+from pylon_service.metrics import block_cache_evictions_total, block_cache_hits_total, block_cache_misses_total
+
+logger = logging.getLogger(__name__)
+
+MISSING: Any = object()
+
+
+class BlockCacheKey(NamedTuple):
+    operation: str
+    netuid: NetUid
+    block_hash: BlockHash
+
+
+class _ResultEntry(NamedTuple):
+    value: Any
+    size: int
+
+
+class BlockResultCache:
+    """
+    In-memory LRU cache of the results of block-scoped operations.
+
+    Results are keyed by the operation name, netuid and the hash of the block, so the cache must only be fed with
+    results for finalized blocks - the data for such blocks never changes. The cache is bounded by the approximate
+    memory used by the results - the size of a result is estimated as the size of its JSON representation, so a whole
+    metagraph weighs far more than a hyperparams object; the least recently used results are evicted when the limit
+    is exceeded.
+    The cache is concurrency safe, but not thread safe.
+    """
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024) -> None:
+        """
+        Args:
+            max_bytes: Approximate maximum size of the results held by the cache.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[BlockCacheKey, _ResultEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: BlockCacheKey) -> Any:
+        """
+        Returns the cached result or MISSING if there is no result for the key.
+        """
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            block_cache_misses_total.labels(operation=key.operation).inc()
+            return MISSING
+        self._entries.move_to_end(key)
+        block_cache_hits_total.labels(operation=key.operation).inc()
+        return entry.value
+
+    def put(self, key: BlockCacheKey, value: Any) -> None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        size = len(to_json(value, fallback=str))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = _ResultEntry(value=value, size=size)
+        self.size += size
+        while self.size > self.max_bytes:
+            evicted_key, evicted_entry = self._entries.popitem(last=False)
+            self.size -= evicted_entry.size
+            block_cache_evictions_total.labels(operation=evicted_key.operation).inc()
+
+    def is_cacheable(self, block_number: int, finalized_number: int) -> bool:
+        """
+        Tells whether the results for the block may be cached, i.e. whether the block is finalized.
+        """
+        return block_number <= finalized_number
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class _SignedBlockEntry(NamedTuple):
+    signed_block: SignedBlock
+    size: int
+    extrinsics: dict[ExtrinsicIndex, Extrinsic]
+
+
+class SignedBlockCache:
+    """
+    In-memory LRU cache of the decoded signed blocks and the extrinsics translated from them.
+
+    Blocks are keyed by their hash, which identifies the block content, so no finality check is needed.
+    The cache is bounded by the approximate memory used by the blocks - the size of a block is estimated as the size
+    of its JSON representation; the translated extrinsics are stored along with their block and evicted with it.
+    The cache is concurrency safe, but not thread safe.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Args:
+            max_bytes: Approximate maximum size of the blocks held by the cache.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[BlockHash, _SignedBlockEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_block(self, block_hash: BlockHash) -> SignedBlock | None:
+        entry = self._entries.get(block_hash)
+        if entry is None:
+            block_cache_misses_total.labels(operation="get_signed_block").inc()
+            return None
+        self._entries.move_to_end(block_hash)
+        block_cache_hits_total.labels(operation="get_signed_block").inc()
+        return entry.signed_block
+
+    def put_block(self, block_hash: BlockHash, signed_block: SignedBlock) -> None:
+        if block_hash in self._entries:
+            return
+        size = len(json.dumps(signed_block, default=str))
+        if size > self.max_bytes:
+            return
+        self._entries[block_hash] = _SignedBlockEntry(signed_block=signed_block, size=size, extrinsics={})
+        self.size += size
+        while self.size > self.max_bytes:
+            _, evicted_entry = self._entries.popitem(last=False)
+            self.size -= evicted_entry.size
+            block_cache_evictions_total.labels(operation="get_signed_block").inc()
+
+    def get_extrinsic(self, block_hash: BlockHash, extrinsic_index: ExtrinsicIndex) -> Extrinsic | None:
+        entry = self._entries.get(block_hash)
+        if entry is None or (extrinsic := entry.extrinsics.get(extrinsic_index)) is None:
+            block_cache_misses_total.labels(operation="get_extrinsic").inc()
+            return None
+        self._entries.move_to_end(block_hash)
+        block_cache_hits_total.labels(operation="get_extrinsic").inc()
+        return extrinsic
+
+    def put_extrinsic(self, block_hash: BlockHash, extrinsic: Extrinsic) -> None:
+        """
+        Stores the translated extrinsic if its block is in the cache.
+        """
+        if (entry := self._entries.get(block_hash)) is not None:
+            entry.extrinsics[extrinsic.extrinsic_index] = extrinsic
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class BlockIndex:
+    """
+    In-memory index of the finalized block hashes by block number and of the block timestamps by block hash.
+
+    Only the hashes of the finalized blocks may be stored, as the hash under a block number may change until
+    the block is finalized; the timestamp of a block is identified by the block hash, so it never changes.
+    Each of the two mappings holds at most max_entries items; the least recently used items are evicted first.
+    If a path is given, the index may be loaded from and saved to a JSON file there, so that it survives restarts.
+    The index is concurrency safe, but not thread safe.
+    """
+
+    def __init__(self, max_entries: int = 100_000, path: Path | None = None) -> None:
+        """
+        Args:
+            max_entries: Maximum number of block hashes and, separately, block timestamps held by the index.
+            path: Path of the file the index is persisted to.
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self._hashes: OrderedDict[BlockNumber, BlockHash] = OrderedDict()
+        self._timestamps: OrderedDict[BlockHash, Timestamp] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def get_block(self, number: BlockNumber) -> Block | None:
+        block_hash = self._hashes.get(number)
+        if block_hash is None:
+            block_cache_misses_total.labels(operation="get_block").inc()
+            return None
+        self._hashes.move_to_end(number)
+        block_cache_hits_total.labels(operation="get_block").inc()
+        return Block(number=number, hash=block_hash)
+
+    def put_block(self, block: Block) -> None:
+        """
+        Stores the hash of the block. The block must be finalized, see is_finalized.
+        """
+        self._put(self._hashes, block.number, block.hash, operation="get_block")
+
+    def get_timestamp(self, block: Block) -> Timestamp | None:
+        timestamp = self._timestamps.get(block.hash)
+        if timestamp is None:
+            block_cache_misses_total.labels(operation="get_block_timestamp").inc()
+            return None
+        self._timestamps.move_to_end(block.hash)
+        block_cache_hits_total.labels(operation="get_block_timestamp").inc()
+        return timestamp
+
+    def put_timestamp(self, block: Block, timestamp: Timestamp) -> None:
+        self._put(self._timestamps, block.hash, timestamp, operation="get_block_timestamp")
+
+    def is_finalized(self, block_number: int, finalized_number: int) -> bool:
+        return block_number <= finalized_number
+
+    def block_timestamps(self) -> Iterator[tuple[BlockNumber, Timestamp]]:
+        """
+        Yields the numbers and timestamps of the finalized blocks whose both hash and timestamp are indexed.
+        """
+        for number, block_hash in self._hashes.items():
+            if (timestamp := self._timestamps.get(block_hash)) is not None:
+                yield number, timestamp
+
+    def load(self) -> None:
+        """
+        Loads the index from the file, if there is one. An unreadable file is ignored, as the index can always be
+        rebuilt from the chain.
+        """
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            hashes = {BlockNumber(int(number)): BlockHash(block_hash) for number, block_hash in data["hashes"]}
+            timestamps = {BlockHash(block_hash): Timestamp(int(ts)) for block_hash, ts in data["timestamps"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(
+                f"Could not load the block index from {self.path}, starting with an empty one", exc_info=True
+            )
+            return
+        for number, block_hash in hashes.items():
+            self._put(self._hashes, number, block_hash, operation="get_block")
+        for block_hash, timestamp in timestamps.items():
+            self._put(self._timestamps, block_hash, timestamp, operation="get_block_timestamp")
+        logger.info(f"Loaded {len(self._hashes)} block hashes and {len(self._timestamps)} timestamps from {self.path}")
+
+    def save(self) -> None:
+        """
+        Saves the index to the file, if a path is set. The file is replaced atomically.
+        """
+        if self.path is None:
+            return
+        data = {"hashes": list(self._hashes.items()), "timestamps": list(self._timestamps.items())}
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            logger.warning(f"Could not save the block index to {self.path}", exc_info=True)
+
+    def clear(self) -> None:
+        self._hashes.clear()
+        self._timestamps.clear()
+
+    def _put[Key, Value](self, entries: OrderedDict[Key, Value], key: Key, value: Value, operation: str) -> None:
+        if self.max_entries <= 0:
+            return
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            block_cache_evictions_total.labels(operation=operation).inc()
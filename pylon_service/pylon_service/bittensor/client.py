@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from enum import StrEnum
-from typing import Any
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 
 from bittensor_wallet import Wallet
 from pylon_commons.constants import LATEST_BLOCK_MARK
-from pylon_commons.currency import Currency, Token
+from pylon_commons.currency import RAO_PER_TAO, Currency, Token
 from pylon_commons.models import (
     AxonInfo,
     AxonProtocol,
@@ -73,24 +75,44 @@ from turbobt.subnet import (
 from turbobt.subnet import (
     SubnetHyperparams as TurboBtSubnetHyperparams,
 )
+from turbobt.substrate._scalecodec import u16_proportion_to_float
 from turbobt.substrate.exceptions import UnknownBlock
 from turbobt.substrate.pallets.chain import Extrinsic as TurboBtExtrinsic
 from turbobt.substrate.pallets.chain import SignedBlock
-
-from pylon_service.bittensor.exceptions import ArchiveFallbackException
+from turbobt.subtensor.pallets._types import StorageDoubleMap
+from turbobt.subtensor.types import HotKey as TurboBtHotKey
+from turbobt.subtensor.types import NetUid as TurboBtNetUid
+
+from pylon_service.bittensor.cache import MISSING, BlockCacheKey, BlockIndex, BlockResultCache, SignedBlockCache
+from pylon_service.bittensor.exceptions import ArchiveFallbackException, SubnetNotFound
+from pylon_service.bittensor.hedging import HedgeDelays, hedged
+from pylon_service.bittensor.nodes import Node, NodeHealthPolicy, NodeSet
+from pylon_service.bittensor.singleflight import CoalesceKey, SingleFlight
+from pylon_service.bittensor.timeline import BlockTimeline
+from pylon_service.bittensor.uids import HotkeyUidIndex
 from pylon_service.metrics import (
     Attr,
     Param,
+    bittensor_connection_ping_seconds,
+    bittensor_connection_recreations_total,
     bittensor_fallback_total,
     bittensor_operation_duration,
     track_operation,
 )
 
+if TYPE_CHECKING:
+    from pylon_service.bittensor.head import ChainHeadTracker
+
 logger = logging.getLogger(__name__)
 
 unknown_hotkey = Hotkey("N/A")
 
 
+class RecreationReason(StrEnum):
+    RUNTIME_ERROR = "runtime_error"
+    PING_FAILED = "ping_failed"
+
+
 class AbstractBittensorClient(ABC):
     """
     Interface for Bittensor clients.
@@ -123,6 +145,18 @@ class AbstractBittensorClient(ABC):
         Closes the client and cleans up resources.
         """
 
+    async def ping(self) -> None:
+        """
+        Checks that the connections of the client are alive, recreating the dead ones, so that requests do not run
+        into them. Does nothing by default.
+        """
+
+    async def warm_up(self) -> None:
+        """
+        Connects the open client to its nodes ahead of its first request, so that the request does not wait for
+        the handshake. Does nothing by default.
+        """
+
     @abstractmethod
     async def get_block(self, number: BlockNumber) -> Block | None:
         """
@@ -135,12 +169,24 @@ class AbstractBittensorClient(ABC):
         Fetches the latest block.
         """
 
+    @abstractmethod
+    async def get_finalized_block(self) -> Block:
+        """
+        Fetches the last finalized block. The blocks up to it are never reverted.
+        """
+
     @abstractmethod
     async def get_block_timestamp(self, block: Block) -> Timestamp:
         """
         Returns the timestamp of a block in seconds.
         """
 
+    async def get_block_at(self, timestamp: Timestamp) -> Block | None:
+        """
+        Returns the last block produced at or before the timestamp (in seconds), see BlockTimeline.
+        """
+        return await BlockTimeline().resolve(self, timestamp)
+
     @abstractmethod
     async def get_neurons_list(self, netuid: NetUid, block: Block) -> list[Neuron]:
         """
@@ -180,6 +226,9 @@ class AbstractBittensorClient(ABC):
     async def get_subnet_state(self, netuid: NetUid, block: Block) -> SubnetState:
         """
         Fetches subnet's state at the given block.
+
+        Raises:
+            SubnetNotFound: When the subnet does not exist at the block.
         """
 
     @abstractmethod
@@ -226,6 +275,16 @@ class AbstractBittensorClient(ABC):
         sorted by total stake in descending order.
         """
 
+    @staticmethod
+    def select_validators(subnet_neurons: SubnetNeurons) -> SubnetValidators:
+        """
+        Selects the validators (neurons with validator_permit=True) of the subnet neurons,
+        sorted by total stake in descending order.
+        """
+        validators = [n for n in subnet_neurons.neurons.values() if n.validator_permit]
+        validators.sort(key=lambda n: n.stakes.total, reverse=True)
+        return SubnetValidators(block=subnet_neurons.block, validators=validators)
+
     @abstractmethod
     async def get_signed_block(self, block: Block) -> SignedBlock | None:
         """
@@ -252,16 +311,66 @@ class AbstractBittensorClient(ABC):
             The decoded extrinsic if found, None if the index is out of bounds.
         """
 
+    @abstractmethod
+    async def get_extrinsics(self, block: Block) -> list[Extrinsic] | None:
+        """
+        Fetches all the decoded extrinsics from a specific block.
+
+        Args:
+            block: The block containing the extrinsics.
+
+        Returns:
+            The decoded extrinsics in the block order, None if the block could not be fetched.
+        """
+
 
 class TurboBtClient(AbstractBittensorClient):
     """
     Adapter for turbobt client.
+
+    With columnar_neurons enabled, neurons are built from the subnet state columns and the axons storage
+    instead of the full per-neuron payload returned by list_neurons, which is much lighter for large subnets.
+
+    Hotkeys are translated to uids for weight setting with the uid_index, if given, so that repeated weight
+    submissions within one block do not hit the node for the subnet's uids.
+
+    Decoded signed blocks and the extrinsics translated from them are kept in the signed_block_cache, if given,
+    so that reading many extrinsics of one block downloads the block once.
+
+    The turbobt client is recreated when it raises RuntimeError during a request or fails a ping. A fresh client
+    is connected and pinged before the current one is replaced, so the requests keep going while it connects and
+    a client that cannot connect is never swapped in; the replaced client is closed once the requests still running
+    on it finish, or after drain_timeout seconds.
+    With health_check_interval set, the connection is pinged in the background every health_check_interval
+    seconds, so that a dead connection is replaced before a request runs into it.
     """
 
-    def __init__(self, wallet: Wallet | None, uri: BittensorNetwork):
+    def __init__(
+        self,
+        wallet: Wallet | None,
+        uri: BittensorNetwork,
+        columnar_neurons: bool = False,
+        uid_index: HotkeyUidIndex | None = None,
+        signed_block_cache: SignedBlockCache | None = None,
+        health_check_interval: float | None = None,
+        health_check_timeout: float = 10.0,
+        drain_timeout: float = 30.0,
+    ):
         super().__init__(wallet, uri)
+        self.columnar_neurons = columnar_neurons
+        self.uid_index = uid_index
+        self.signed_block_cache = signed_block_cache
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.drain_timeout = drain_timeout
+        self.ping_latency: float | None = None
         self._raw_client: Bittensor | None = None
         self._is_client_ready = asyncio.Event()
+        self._single_flight = SingleFlight(uri)
+        self._swap_task: asyncio.Task | None = None
+        self._monitor_task: asyncio.Task | None = None
+        self._retire_tasks: set[asyncio.Task] = set()
+        self._in_flight: dict[Bittensor, set[asyncio.Future]] = {}
 
     async def _get_bt_client(self) -> Bittensor:
         if self._raw_client is None:
@@ -278,47 +387,173 @@ class TurboBtClient(AbstractBittensorClient):
         self._raw_client = Bittensor(wallet=self.wallet, uri=self.uri)
         await asyncio.shield(self._raw_client.__aenter__())
         self._is_client_ready.set()
+        if self.health_check_interval is not None:
+            self._monitor_task = asyncio.create_task(self._monitor(), name=f"turbobt_health_monitor_{self.uri}")
 
     async def close(self) -> None:
         logger.info(f"Closing the TurboBtClient for {self.uri}")
         assert self._raw_client is not None, "The client is already closed."
+        if self._monitor_task is not None:
+            task, self._monitor_task = self._monitor_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         async with asyncio.timeout(5):
             await self._is_client_ready.wait()
+        if self._swap_task is not None:
+            try:
+                await asyncio.shield(self._swap_task)
+            except Exception:
+                pass
+        await asyncio.gather(*self._retire_tasks, return_exceptions=True)
         bt_client = self._raw_client
         self._raw_client = None
         self._is_client_ready.clear()
         await asyncio.shield(bt_client.__aexit__(None, None, None))
 
-    async def _recreate_bt_client(self) -> None:
+    async def ping(self) -> None:
+        """
+        Pings the connection unless the health monitor already does it.
+        """
+        if self._raw_client is None or self._monitor_task is not None:
+            return
+        await self._check_health()
+
+    async def warm_up(self) -> None:
+        """
+        Pings the node, as turbobt only connects on the first request.
+        """
+        await self._check_health()
+
+    async def _monitor(self) -> None:
+        assert self.health_check_interval is not None
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self._check_health()
+            except Exception:
+                logger.exception(f"Health check of the Bittensor client for {self.uri} failed")
+
+    async def _check_health(self) -> None:
+        """
+        Asks the node for the latest block hash, which is about the lightest call there is, tracking the round trip.
+        The turbobt client is recreated when the call fails or times out.
+        """
+        bt_client = await self._get_bt_client()
+        started = perf_counter()
+        try:
+            async with asyncio.timeout(self.health_check_timeout):
+                await self._run_on(bt_client, lambda c: c.subtensor.chain.getBlockHash())
+        except Exception:
+            logger.warning(f"Ping of {self.uri} failed, recreating the Bittensor client", exc_info=True)
+            await asyncio.shield(self._recreate_bt_client(bt_client, reason=RecreationReason.PING_FAILED))
+            return
+        self.ping_latency = perf_counter() - started
+        bittensor_connection_ping_seconds.labels(uri=self.uri).set(self.ping_latency)
+
+    async def _recreate_bt_client(
+        self, failed_client: Bittensor | None = None, reason: RecreationReason = RecreationReason.RUNTIME_ERROR
+    ) -> None:
+        """
+        Replaces the turbobt client with a fresh one; concurrent recreations share one replacement.
+        Nothing is done when the failed client was already replaced.
+        """
         assert self._raw_client is not None, "The client is None so cannot be recreated."
-        logger.warning(f"Recreating Bittensor client for {self.uri}")
-        # If _client_created is not set, that means another task is already in progress of (re)creating it.
+        # If _is_client_ready is not set, that means the client is still being opened.
         if not self._is_client_ready.is_set():
             async with asyncio.timeout(5):
                 await self._is_client_ready.wait()
             return
-        self._is_client_ready.clear()
+        if failed_client is not None and failed_client is not self._raw_client and self._swap_task is None:
+            return
+        if self._swap_task is None:
+            self._swap_task = asyncio.create_task(self._swap_bt_client(reason))
+        await asyncio.shield(self._swap_task)
+
+    async def _swap_bt_client(self, reason: RecreationReason) -> None:
+        logger.warning(f"Recreating Bittensor client for {self.uri} (reason: {reason})")
         try:
-            old_client = self._raw_client
+            new_client = Bittensor(wallet=self.wallet, uri=self.uri)
             try:
-                await asyncio.shield(old_client.__aexit__(None, None, None))
-            except Exception:
-                logger.warning("Failed to close old Bittensor client during recreation", exc_info=True)
-            self._raw_client = Bittensor(wallet=self.wallet, uri=self.uri)
-            await asyncio.shield(self._raw_client.__aenter__())
+                await new_client.__aenter__()
+                # turbobt connects on the first request, so the new client is pinged to connect before the swap.
+                async with asyncio.timeout(self.health_check_timeout):
+                    await new_client.subtensor.chain.getBlockHash()
+            except BaseException:
+                logger.warning(f"New Bittensor client for {self.uri} failed to connect, keeping the current one")
+                await self._close_bt_client(new_client, "Failed to close the half-opened Bittensor client")
+                raise
+            old_client, self._raw_client = self._raw_client, new_client
+            bittensor_connection_recreations_total.labels(uri=self.uri, reason=reason).inc()
+            if old_client is not None:
+                task = asyncio.create_task(self._retire_bt_client(old_client), name=f"turbobt_retire_{self.uri}")
+                self._retire_tasks.add(task)
+                task.add_done_callback(self._retire_tasks.discard)
         finally:
-            # Set the event back even on failure not to block other coroutines forever.
-            self._is_client_ready.set()
+            self._swap_task = None
+
+    async def _retire_bt_client(self, bt_client: Bittensor) -> None:
+        """
+        Closes the replaced turbobt client once the calls still running on it finish.
+        """
+        try:
+            async with asyncio.timeout(self.drain_timeout):
+                while calls := self._in_flight.get(bt_client):
+                    await asyncio.wait(calls)
+        except TimeoutError:
+            logger.warning(
+                f"Calls on the replaced Bittensor client for {self.uri} did not finish in {self.drain_timeout} "
+                "seconds, closing it anyway"
+            )
+        await self._close_bt_client(bt_client, "Failed to close old Bittensor client during recreation")
+
+    @staticmethod
+    async def _close_bt_client(bt_client: Bittensor, failure_message: str) -> None:
+        try:
+            await bt_client.__aexit__(None, None, None)
+        except Exception:
+            logger.warning(failure_message, exc_info=True)
+
+    async def _run_on[T](self, bt_client: Bittensor, coro_factory: Callable[[Bittensor], Awaitable[T]]) -> T:
+        """
+        Runs the turbobt call shielded from cancellation, tracking it as running on the client until it finishes,
+        even when the caller is cancelled meanwhile.
+        """
+        call = asyncio.ensure_future(coro_factory(bt_client))
+        calls = self._in_flight.setdefault(bt_client, set())
+        calls.add(call)
+
+        def call_done(_: asyncio.Future) -> None:
+            calls.discard(call)
+            if not calls and self._in_flight.get(bt_client) is calls:
+                del self._in_flight[bt_client]
+
+        call.add_done_callback(call_done)
+        return await asyncio.shield(call)
+
+    async def _protect_turbobt[T](
+        self, coro_factory: Callable[[Bittensor], Awaitable[T]], coalesce_key: CoalesceKey | None = None
+    ) -> T:
+        """
+        Run the turbobt call shielded from cancellation, recreating the turbobt client on its internal errors.
+
+        Read-only calls may pass a coalesce_key; concurrent calls with the same key share one upstream call.
+        """
+        if coalesce_key is None:
+            return await self._call_turbobt(coro_factory)
+        return await self._single_flight.do(coalesce_key, lambda: self._call_turbobt(coro_factory))
 
-    async def _protect_turbobt[T](self, coro_factory: Callable[[Bittensor], Awaitable[T]]) -> T:
+    async def _call_turbobt[T](self, coro_factory: Callable[[Bittensor], Awaitable[T]]) -> T:
         bt_client = await self._get_bt_client()
         try:
-            return await asyncio.shield(coro_factory(bt_client))
+            return await self._run_on(bt_client, coro_factory)
         except RuntimeError:
             logger.exception(f"RuntimeError caught during bittensor operation on {self.uri}, recreating client")
-            await asyncio.shield(self._recreate_bt_client())
+            await asyncio.shield(self._recreate_bt_client(bt_client))
             bt_client = await self._get_bt_client()
-            return await asyncio.shield(coro_factory(bt_client))
+            return await self._run_on(bt_client, coro_factory)
 
     def _resolve_hotkey(self, hotkey: Hotkey | None) -> Hotkey:
         if hotkey:
@@ -336,7 +571,7 @@ class TurboBtClient(AbstractBittensorClient):
     )
     async def get_block(self, number: BlockNumber) -> Block | None:
         logger.debug(f"Fetching the block with number {number} from {self.uri}")
-        block_obj = await self._protect_turbobt(lambda c: c.block(number).get())
+        block_obj = await self._protect_turbobt(lambda c: c.block(number).get(), coalesce_key=("get_block", number))
         if block_obj is None or block_obj.number is None or block_obj.hash is None:
             return None
         return Block(
@@ -357,16 +592,35 @@ class TurboBtClient(AbstractBittensorClient):
         assert block is not None, "Latest block should always exist"
         return block
 
+    @track_operation(
+        bittensor_operation_duration,
+        labels={
+            "uri": Attr("uri"),
+            "hotkey": Attr("hotkey"),
+        },
+    )
+    async def get_finalized_block(self) -> Block:
+        logger.debug(f"Fetching the finalized block from {self.uri}")
+
+        async def _get_finalized_block(bt_client: Bittensor) -> Block:
+            block_hash = await bt_client.subtensor.rpc(method="chain_getFinalizedHead", params={})
+            block_hash = block_hash if isinstance(block_hash, str) else f"0x{bytes(block_hash).hex()}"
+            header = await bt_client.subtensor.chain.getHeader(block_hash)
+            assert header is not None, "Finalized block should always exist"
+            return Block(number=BlockNumber(header["number"]), hash=BlockHash(block_hash))
+
+        return await self._protect_turbobt(_get_finalized_block, coalesce_key=("get_finalized_block",))
+
     async def get_block_timestamp(self, block: Block) -> Timestamp:
         async def _get_timestamp(bt_client: Bittensor):
             turbobt_block: TurboBtBlock = await bt_client.block(block.number).get()
             return await turbobt_block.get_timestamp()
 
-        timestamp = await self._protect_turbobt(_get_timestamp)
+        timestamp = await self._protect_turbobt(_get_timestamp, coalesce_key=("get_block_timestamp", block.hash))
         return Timestamp(int(timestamp.timestamp()))
 
     @staticmethod
-    async def _translate_neuron(neuron: TurboBtNeuron, stakes: Stakes) -> Neuron:
+    def _translate_neuron(neuron: TurboBtNeuron, stakes: Stakes) -> Neuron:
         return Neuron(
             uid=NeuronUid(neuron.uid),
             coldkey=Coldkey(neuron.coldkey),
@@ -401,11 +655,78 @@ class TurboBtClient(AbstractBittensorClient):
     )
     async def get_neurons_list(self, netuid: NetUid, block: Block) -> list[Neuron]:
         logger.debug(f"Fetching neurons from subnet {netuid} at block {block.number}, {self.uri}")
-        neurons = await self._protect_turbobt(lambda c: c.subnet(netuid).list_neurons(block_hash=block.hash))
-        # We need stakes fetched from subnet's state.
-        state = await self.get_subnet_state(netuid, block)
+        if self.columnar_neurons:
+            return await self._get_neurons_list_columnar(netuid, block)
+        # We need stakes fetched from subnet's state; both fetches are independent, so they are run concurrently.
+        neurons, state = await asyncio.gather(
+            self._protect_turbobt(
+                lambda c: c.subnet(netuid).list_neurons(block_hash=block.hash),
+                coalesce_key=("list_neurons", netuid, block.hash),
+            ),
+            self.get_subnet_state(netuid, block),
+        )
         stakes = state.hotkeys_stakes
-        return [await self._translate_neuron(neuron, stakes[Hotkey(neuron.hotkey)]) for neuron in neurons]
+        return [self._translate_neuron(neuron, stakes[Hotkey(neuron.hotkey)]) for neuron in neurons]
+
+    async def _get_neurons_list_columnar(self, netuid: NetUid, block: Block) -> list[Neuron]:
+        state, axons, validator_trust = await asyncio.gather(
+            self.get_subnet_state(netuid, block),
+            self._protect_turbobt(
+                lambda c: StorageDoubleMap[TurboBtNetUid, TurboBtHotKey, dict](
+                    c.subtensor, "SubtensorModule", "Axons"
+                ).fetch(netuid, block_hash=block.hash),
+                coalesce_key=("fetch_axons", netuid, block.hash),
+            ),
+            self._protect_turbobt(
+                lambda c: c.subtensor.state.getStorage("SubtensorModule.ValidatorTrust", netuid, block_hash=block.hash),
+                coalesce_key=("get_validator_trust", netuid, block.hash),
+            ),
+        )
+        axons_by_hotkey = {Hotkey(hotkey): axon for (_, hotkey), axon in axons}
+        return self._translate_subnet_state_neurons(state, axons_by_hotkey, validator_trust or [])
+
+    @staticmethod
+    def _translate_subnet_state_neurons(
+        state: SubnetState, axons: dict[Hotkey, dict[str, Any]], validator_trust: list[int]
+    ) -> list[Neuron]:
+        """
+        Builds neurons from the subnet state columns. Proportions are stored in the state as u16 values (typed as
+        the float proportions of the model, hence the int conversion), emission and stakes in rao; they are scaled
+        the same way turbobt scales the list_neurons payload.
+        """
+        empty_axon = {"ip": 0, "port": 0, "protocol": AxonProtocol.TCP}
+        stakes = state.hotkeys_stakes
+        neurons = []
+        for uid, hotkey in enumerate(state.hotkeys):
+            axon = axons.get(hotkey, empty_axon)
+            neurons.append(
+                Neuron(
+                    uid=NeuronUid(uid),
+                    coldkey=state.coldkeys[uid],
+                    hotkey=hotkey,
+                    active=NeuronActive(state.active[uid]),
+                    axon_info=AxonInfo(
+                        ip=ipaddress.ip_address(axon["ip"]),
+                        port=Port(axon["port"]),
+                        protocol=AxonProtocol(axon["protocol"]),
+                    ),
+                    stake=Stake(state.total_stake[uid] / RAO_PER_TAO),
+                    rank=Rank(u16_proportion_to_float(int(state.rank[uid]))),
+                    emission=Emission(Currency[Token.ALPHA].from_rao(state.emission[uid])),
+                    incentive=Incentive(u16_proportion_to_float(int(state.incentives[uid]))),
+                    consensus=Consensus(u16_proportion_to_float(int(state.consensus[uid]))),
+                    trust=Trust(u16_proportion_to_float(int(state.trust[uid]))),
+                    validator_trust=ValidatorTrust(
+                        u16_proportion_to_float(validator_trust[uid]) if uid < len(validator_trust) else 0.0
+                    ),
+                    dividends=Dividends(u16_proportion_to_float(int(state.dividends[uid]))),
+                    last_update=state.last_update[uid],
+                    validator_permit=state.validator_permit[uid],
+                    pruning_score=state.pruning_score[uid],
+                    stakes=stakes[hotkey],
+                )
+            )
+        return neurons
 
     @track_operation(
         bittensor_operation_duration,
@@ -438,7 +759,10 @@ class TurboBtClient(AbstractBittensorClient):
     )
     async def get_hyperparams(self, netuid: NetUid, block: Block) -> SubnetHyperparams | None:
         logger.debug(f"Fetching hyperparams from subnet {netuid} at block {block.number}, {self.uri}")
-        params = await self._protect_turbobt(lambda c: c.subnet(netuid).get_hyperparameters(block_hash=block.hash))
+        params = await self._protect_turbobt(
+            lambda c: c.subnet(netuid).get_hyperparameters(block_hash=block.hash),
+            coalesce_key=("get_hyperparameters", netuid, block.hash),
+        )
         if not params:
             return None
         return await self._translate_hyperparams(params)
@@ -461,7 +785,8 @@ class TurboBtClient(AbstractBittensorClient):
     async def get_certificates(self, netuid: NetUid, block: Block) -> dict[Hotkey, NeuronCertificate]:
         logger.debug(f"Fetching certificates from subnet {netuid} at block {block.number}, {self.uri}")
         certificates = await self._protect_turbobt(
-            lambda c: c.subnet(netuid).neurons.get_certificates(block_hash=block.hash)
+            lambda c: c.subnet(netuid).neurons.get_certificates(block_hash=block.hash),
+            coalesce_key=("get_certificates", netuid, block.hash),
         )
         if not certificates:
             return {}
@@ -486,7 +811,8 @@ class TurboBtClient(AbstractBittensorClient):
             f"Fetching certificate of {hotkey} hotkey from subnet {netuid} at block {block.number}, {self.uri}"
         )
         certificate = await self._protect_turbobt(
-            lambda c: c.subnet(netuid).neuron(hotkey=hotkey).get_certificate(block_hash=block.hash)
+            lambda c: c.subnet(netuid).neuron(hotkey=hotkey).get_certificate(block_hash=block.hash),
+            coalesce_key=("get_certificate", netuid, block.hash, hotkey),
         )
         if certificate:
             certificate = await self._translate_certificate(certificate)
@@ -531,15 +857,30 @@ class TurboBtClient(AbstractBittensorClient):
     )
     async def get_subnet_state(self, netuid: NetUid, block: Block) -> SubnetState:
         logger.debug(f"Fetching subnet {netuid} state at block {block.number}, {self.uri}")
-        state = await self._protect_turbobt(lambda c: c.subnet(netuid).get_state(block.hash))
+        state = await self._protect_turbobt(
+            lambda c: c.subnet(netuid).get_state(block.hash), coalesce_key=("get_state", netuid, block.hash)
+        )
+        if not state:
+            raise SubnetNotFound(detail=f"Subnet {netuid} does not exist at block {block.number}.")
         return SubnetState(**state)  # type: ignore
 
+    async def _get_hotkey_to_uid(self, netuid: NetUid) -> dict[Hotkey, NeuronUid]:
+        if self.uid_index is not None and (hotkey_to_uid := self.uid_index.get(netuid)) is not None:
+            return hotkey_to_uid
+        latest_block = (self.uid_index and self.uid_index.head) or await self.get_latest_block()
+        uids = await self._protect_turbobt(
+            lambda c: c.subtensor.subtensor_module.Uids.fetch(netuid, block_hash=latest_block.hash),
+            coalesce_key=("fetch_uids", netuid, latest_block.hash),
+        )
+        hotkey_to_uid = {Hotkey(hotkey): NeuronUid(uid) for (_, hotkey), uid in uids}
+        if self.uid_index is not None:
+            self.uid_index.update(netuid, latest_block, hotkey_to_uid)
+        return hotkey_to_uid
+
     async def _translate_weights(self, netuid: NetUid, weights: dict[Hotkey, Weight]) -> dict[int, float]:
         translated_weights = {}
         missing = []
-        latest_block = await self.get_latest_block()
-        neurons = await self._protect_turbobt(lambda c: c.subnet(netuid).list_neurons(block_hash=latest_block.hash))
-        hotkey_to_uid = {n.hotkey: n.uid for n in neurons}
+        hotkey_to_uid = await self._get_hotkey_to_uid(netuid)
         for hotkey, weight in weights.items():
             if hotkey in hotkey_to_uid:
                 translated_weights[hotkey_to_uid[hotkey]] = weight
@@ -590,7 +931,10 @@ class TurboBtClient(AbstractBittensorClient):
     async def get_commitment(self, netuid: NetUid, block: Block, hotkey: Hotkey | None = None) -> Commitment | None:
         hotkey = self._resolve_hotkey(hotkey)
         logger.debug(f"Fetching commitment for {hotkey} from subnet {netuid} at block {block.number}, {self.uri}")
-        result = await self._protect_turbobt(lambda c: c.subnet(netuid).commitments.get(hotkey, block_hash=block.hash))
+        result = await self._protect_turbobt(
+            lambda c: c.subnet(netuid).commitments.get(hotkey, block_hash=block.hash),
+            coalesce_key=("get_commitment", netuid, block.hash, hotkey),
+        )
         if result is None:
             return None
         return Commitment(
@@ -610,7 +954,8 @@ class TurboBtClient(AbstractBittensorClient):
     async def get_commitments(self, netuid: NetUid, block: Block) -> SubnetCommitments:
         logger.debug(f"Fetching all commitments from subnet {netuid} at block {block.number}, {self.uri}")
         raw_commitments = await self._protect_turbobt(
-            lambda c: c.subnet(netuid).commitments.fetch(block_hash=block.hash)
+            lambda c: c.subnet(netuid).commitments.fetch(block_hash=block.hash),
+            coalesce_key=("fetch_commitments", netuid, block.hash),
         )
         commitments: dict[Hotkey, Commitment] = {}
         for hotkey_str, result in raw_commitments.items():
@@ -647,15 +992,28 @@ class TurboBtClient(AbstractBittensorClient):
     async def get_validators(self, netuid: NetUid, block: Block) -> SubnetValidators:
         logger.debug(f"Fetching validators from subnet {netuid} at block {block.number}, {self.uri}")
         subnet_neurons = await self.get_neurons(netuid, block=block)
-        validators = [n for n in subnet_neurons.neurons.values() if n.validator_permit]
-        validators.sort(key=lambda n: n.stakes.total, reverse=True)
-        return SubnetValidators(block=block, validators=validators)
+        return self.select_validators(subnet_neurons)
 
     async def get_signed_block(self, block: Block) -> SignedBlock | None:
+        if (
+            self.signed_block_cache is not None
+            and (signed_block := self.signed_block_cache.get_block(block.hash)) is not None
+        ):
+            return signed_block
         logger.debug(f"Fetching signed block {block.number} at {self.uri}")
-        return await self._protect_turbobt(lambda c: c.subtensor.chain.getBlock(block.hash))
+        signed_block = await self._protect_turbobt(
+            lambda c: c.subtensor.chain.getBlock(block.hash), coalesce_key=("get_signed_block", block.hash)
+        )
+        if self.signed_block_cache is not None and signed_block is not None:
+            self.signed_block_cache.put_block(block.hash, signed_block)
+        return signed_block
 
     async def get_extrinsic(self, block: Block, extrinsic_index: ExtrinsicIndex) -> Extrinsic | None:
+        if (
+            self.signed_block_cache is not None
+            and (extrinsic := self.signed_block_cache.get_extrinsic(block.hash, extrinsic_index)) is not None
+        ):
+            return extrinsic
         logger.debug(f"Fetching extrinsic {extrinsic_index} from block {block.number} at {self.uri}")
 
         signed_block = await self.get_signed_block(block)
@@ -667,7 +1025,30 @@ class TurboBtClient(AbstractBittensorClient):
             return None
 
         raw_extrinsic = extrinsics[extrinsic_index]
-        return self._translate_extrinsic(raw_extrinsic, block.number, extrinsic_index)
+        extrinsic = self._translate_extrinsic(raw_extrinsic, block.number, extrinsic_index)
+        if self.signed_block_cache is not None:
+            self.signed_block_cache.put_extrinsic(block.hash, extrinsic)
+        return extrinsic
+
+    async def get_extrinsics(self, block: Block) -> list[Extrinsic] | None:
+        logger.debug(f"Fetching extrinsics from block {block.number} at {self.uri}")
+        signed_block = await self.get_signed_block(block)
+        if signed_block is None:
+            return None
+
+        raw_extrinsics: list[TurboBtExtrinsic] = signed_block["block"]["extrinsics"]  # type: ignore[assignment]
+        extrinsics = []
+        for index, raw_extrinsic in enumerate(raw_extrinsics):
+            extrinsic_index = ExtrinsicIndex(index)
+            extrinsic = None
+            if self.signed_block_cache is not None:
+                extrinsic = self.signed_block_cache.get_extrinsic(block.hash, extrinsic_index)
+            if extrinsic is None:
+                extrinsic = self._translate_extrinsic(raw_extrinsic, block.number, extrinsic_index)
+                if self.signed_block_cache is not None:
+                    self.signed_block_cache.put_extrinsic(block.hash, extrinsic)
+            extrinsics.append(extrinsic)
+        return extrinsics
 
     @staticmethod
     def _translate_extrinsic(
@@ -710,8 +1091,64 @@ class BittensorClient[SubClient: AbstractBittensorClient](AbstractBittensorClien
 
     This is a wrapper that delegates to two underlying
     client instances (main and archive) and handles fallback logic.
+
+    When a head tracker is given, the latest and the finalized block are read from it instead of being fetched from
+    the main node, as long as the tracker knows them.
+
+    When a result cache is given, the results of the historical queries (neurons, validators, commitments,
+    certificates, hyperparams and subnet state) for the finalized blocks are cached in it. A block is finalized when
+    it is not after the finalized head reported by the chain, so it can never be reverted.
+
+    When a block index is given, the hashes of the finalized blocks looked up by number and the block timestamps
+    are kept in it, so that the historical queries do not have to fetch the block again. When a block timeline is
+    given, the timestamps are resolved to blocks with it, so that the blocks probed by the previous resolutions
+    are reused.
+
+    Both the main and the archive side may consist of several interchangeable nodes (uri plus extra_uris,
+    archive_uri plus extra_archive_uris). Each request is routed to the healthiest node of the side, see NodeSet.
+    When a side has more than one node, the nodes are probed every node_probe_interval seconds to keep their
+    latency and head lag up to date.
+
+    When hedge delays are given, the idempotent reads (see HEDGEABLE_OPERATIONS) that take longer than the delay
+    of the operation are duplicated on another node of the same side; the first successful result is used and
+    the other call is cancelled. Hedging is never used for the operations that submit extrinsics.
+
+    When a read client is given (the pool gives the shared open access client to all the wallet-bound clients),
+    all the operations except SIGNING_OPERATIONS are delegated to it, so that reads share its connections and
+    caches regardless of the wallet. The own connections of the client are then opened only when the first signing
+    operation is performed and only on the main side, as signing operations never need the archive.
     """
 
+    SIGNING_OPERATIONS = frozenset(
+        {
+            "commit_weights",
+            "set_weights",
+            "set_commitment",
+            "generate_certificate_keypair",
+        }
+    )
+
+    HEDGEABLE_OPERATIONS = frozenset(
+        {
+            "get_block",
+            "get_latest_block",
+            "get_finalized_block",
+            "get_neurons_list",
+            "get_neurons",
+            "get_subnet_state",
+            "get_hyperparams",
+            "get_certificates",
+            "get_certificate",
+            "get_block_timestamp",
+            "get_commitment",
+            "get_commitments",
+            "get_validators",
+            "get_signed_block",
+            "get_extrinsic",
+            "get_extrinsics",
+        }
+    )
+
     def __init__(
         self,
         wallet: Wallet | None,
@@ -719,40 +1156,138 @@ class BittensorClient[SubClient: AbstractBittensorClient](AbstractBittensorClien
         archive_uri: BittensorNetwork,
         archive_blocks_cutoff: ArchiveBlocksCutoff = ArchiveBlocksCutoff(300),
         subclient_cls: type[SubClient] = TurboBtClient,
+        head_tracker: ChainHeadTracker | None = None,
+        result_cache: BlockResultCache | None = None,
+        block_index: BlockIndex | None = None,
+        block_timeline: BlockTimeline | None = None,
+        subclient_kwargs: dict[str, Any] | None = None,
+        extra_uris: Sequence[BittensorNetwork] = (),
+        extra_archive_uris: Sequence[BittensorNetwork] = (),
+        node_health_policy: NodeHealthPolicy | None = None,
+        node_probe_interval: float = 12.0,
+        hedge_delays: HedgeDelays | None = None,
+        read_client: AbstractBittensorClient | None = None,
     ):
         super().__init__(wallet, uri)
         self.archive_uri = archive_uri
         self._archive_blocks_cutoff = archive_blocks_cutoff
         self.subclient_cls = subclient_cls
-        self._main_client: SubClient = self.subclient_cls(wallet, uri)
-        self._archive_client: SubClient = self.subclient_cls(wallet, archive_uri)
+        self.head_tracker = head_tracker
+        self.result_cache = result_cache
+        self.block_index = block_index
+        self.block_timeline = block_timeline
+        self.node_probe_interval = node_probe_interval
+        self.hedge_delays = hedge_delays
+        self.read_client = read_client
+        subclient_kwargs = subclient_kwargs or {}
+        self._main_nodes: NodeSet[SubClient] = NodeSet(
+            [self.subclient_cls(wallet, main_uri, **subclient_kwargs) for main_uri in (uri, *extra_uris)],
+            policy=node_health_policy,
+        )
+        self._archive_nodes: NodeSet[SubClient] = NodeSet(
+            [
+                self.subclient_cls(wallet, node_archive_uri, **subclient_kwargs)
+                for node_archive_uri in (archive_uri, *extra_archive_uris)
+            ],
+            policy=node_health_policy,
+        )
+        self._probe_task: asyncio.Task | None = None
+        self._open_node_sets: list[NodeSet[SubClient]] = []
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def _main_client(self) -> SubClient:
+        return self._main_nodes.primary.client
+
+    @property
+    def _archive_client(self) -> SubClient:
+        return self._archive_nodes.primary.client
 
     async def open(self) -> None:
-        await self._main_client.open()
-        await self._archive_client.open()
+        if self.read_client is not None:
+            return
+        await self._open_node_set(self._main_nodes)
+        await self._open_node_set(self._archive_nodes)
+        if len(self._main_nodes) > 1 or len(self._archive_nodes) > 1:
+            self._probe_task = asyncio.create_task(self._probe_nodes(), name="bittensor_node_probe")
 
     async def close(self) -> None:
-        await self._main_client.close()
-        await self._archive_client.close()
+        if self._probe_task is not None:
+            task, self._probe_task = self._probe_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        async with self._open_lock:
+            for nodes in self._open_node_sets:
+                await nodes.close()
+            self._open_node_sets.clear()
+
+    async def ping(self) -> None:
+        await asyncio.gather(*(node.client.ping() for nodes in self._open_node_sets for node in nodes))
+
+    async def warm_up(self) -> None:
+        """
+        Warms up the clients of the open node sets. With a read client, the reads are warmed up by the read client
+        itself, so only the main nodes, used for the signing operations, are opened and warmed up.
+        """
+        if self.read_client is not None:
+            await self._open_node_set(self._main_nodes)
+        await asyncio.gather(*(node.client.warm_up() for nodes in self._open_node_sets for node in nodes))
+
+    async def _open_node_set(self, nodes: NodeSet[SubClient]) -> None:
+        async with self._open_lock:
+            if not any(open_nodes is nodes for open_nodes in self._open_node_sets):
+                await nodes.open()
+                self._open_node_sets.append(nodes)
+
+    async def _probe_nodes(self) -> None:
+        while True:
+            await asyncio.sleep(self.node_probe_interval)
+            await asyncio.gather(self._main_nodes.probe(), self._archive_nodes.probe())
 
     async def get_block(self, number: BlockNumber) -> Block | None:
-        return await self._delegate(self.subclient_cls.get_block, number=number)
+        if self.block_index is None or self.read_client is not None or number < 0:
+            return await self._delegate(self.subclient_cls.get_block, number=number)
+        if (block := self.block_index.get_block(number)) is not None:
+            return block
+        block = await self._delegate(self.subclient_cls.get_block, number=number)
+        if block is not None:
+            finalized_block = await self.get_finalized_block()
+            if self.block_index.is_finalized(block.number, finalized_block.number):
+                self.block_index.put_block(block)
+        return block
 
     async def get_latest_block(self) -> Block:
-        return await self._delegate(self.subclient_cls.get_latest_block)
+        if self.head_tracker is not None and (head := self.head_tracker.head) is not None:
+            return head
+        block = await self._delegate(self.subclient_cls.get_latest_block)
+        if self.head_tracker is not None:
+            self.head_tracker.update(block)
+        return block
+
+    async def get_finalized_block(self) -> Block:
+        if self.head_tracker is not None and (finalized := self.head_tracker.finalized) is not None:
+            return finalized
+        block = await self._delegate(self.subclient_cls.get_finalized_block)
+        if self.head_tracker is not None:
+            self.head_tracker.update_finalized(block)
+        return block
 
     async def get_neurons_list(self, netuid: NetUid, block: Block) -> list[Neuron]:
         return await self._delegate(self.subclient_cls.get_neurons_list, netuid=netuid, block=block)
 
     async def get_hyperparams(self, netuid: NetUid, block: Block) -> SubnetHyperparams | None:
-        return await self._delegate(self.subclient_cls.get_hyperparams, netuid=netuid, block=block)
+        return await self._delegate_cached(self.subclient_cls.get_hyperparams, netuid=netuid, block=block)
 
     async def get_certificates(self, netuid: NetUid, block: Block) -> dict[Hotkey, NeuronCertificate]:
-        return await self._delegate(self.subclient_cls.get_certificates, netuid=netuid, block=block)
+        return await self._delegate_cached(self.subclient_cls.get_certificates, netuid=netuid, block=block)
 
     async def get_certificate(
         self, netuid: NetUid, block: Block, hotkey: Hotkey | None = None
     ) -> NeuronCertificate | None:
+        hotkey = hotkey or self._wallet_hotkey()
         return await self._delegate(self.subclient_cls.get_certificate, netuid=netuid, block=block, hotkey=hotkey)
 
     async def generate_certificate_keypair(
@@ -767,25 +1302,39 @@ class BittensorClient[SubClient: AbstractBittensorClient](AbstractBittensorClien
         return await self._delegate(self.subclient_cls.set_weights, netuid=netuid, weights=weights)
 
     async def get_neurons(self, netuid: NetUid, block: Block) -> SubnetNeurons:
-        return await self._delegate(self.subclient_cls.get_neurons, netuid=netuid, block=block)
+        return await self._delegate_cached(self.subclient_cls.get_neurons, netuid=netuid, block=block)
 
     async def get_subnet_state(self, netuid: NetUid, block: Block) -> SubnetState:
-        return await self._delegate(self.subclient_cls.get_subnet_state, netuid=netuid, block=block)
+        return await self._delegate_cached(self.subclient_cls.get_subnet_state, netuid=netuid, block=block)
 
     async def get_block_timestamp(self, block: Block) -> Timestamp:
-        return await self._delegate(self.subclient_cls.get_block_timestamp, block=block)
+        if self.block_index is None or self.read_client is not None:
+            return await self._delegate(self.subclient_cls.get_block_timestamp, block=block)
+        if (timestamp := self.block_index.get_timestamp(block)) is not None:
+            return timestamp
+        timestamp = await self._delegate(self.subclient_cls.get_block_timestamp, block=block)
+        self.block_index.put_timestamp(block, timestamp)
+        return timestamp
+
+    async def get_block_at(self, timestamp: Timestamp) -> Block | None:
+        if self.read_client is not None:
+            return await self.read_client.get_block_at(timestamp)
+        if self.block_timeline is None:
+            return await super().get_block_at(timestamp)
+        return await self.block_timeline.resolve(self, timestamp)
 
     async def get_commitment(self, netuid: NetUid, block: Block, hotkey: Hotkey | None = None) -> Commitment | None:
+        hotkey = hotkey or self._wallet_hotkey()
         return await self._delegate(self.subclient_cls.get_commitment, netuid=netuid, block=block, hotkey=hotkey)
 
     async def get_commitments(self, netuid: NetUid, block: Block) -> SubnetCommitments:
-        return await self._delegate(self.subclient_cls.get_commitments, netuid=netuid, block=block)
+        return await self._delegate_cached(self.subclient_cls.get_commitments, netuid=netuid, block=block)
 
     async def set_commitment(self, netuid: NetUid, data: CommitmentDataBytes) -> None:
         return await self._delegate(self.subclient_cls.set_commitment, netuid=netuid, data=data)
 
     async def get_validators(self, netuid: NetUid, block: Block) -> SubnetValidators:
-        return await self._delegate(self.subclient_cls.get_validators, netuid=netuid, block=block)
+        return await self._delegate_cached(self.subclient_cls.get_validators, netuid=netuid, block=block)
 
     async def get_signed_block(self, block: Block) -> SignedBlock | None:
         return await self._delegate(self.subclient_cls.get_signed_block, block=block)
@@ -793,6 +1342,35 @@ class BittensorClient[SubClient: AbstractBittensorClient](AbstractBittensorClien
     async def get_extrinsic(self, block: Block, extrinsic_index: ExtrinsicIndex) -> Extrinsic | None:
         return await self._delegate(self.subclient_cls.get_extrinsic, block=block, extrinsic_index=extrinsic_index)
 
+    async def get_extrinsics(self, block: Block) -> list[Extrinsic] | None:
+        return await self._delegate(self.subclient_cls.get_extrinsics, block=block)
+
+    def _wallet_hotkey(self) -> Hotkey | None:
+        """
+        The hotkey of the wallet, resolved here so that the reads delegated to the read client are made for it.
+        """
+        return self.hotkey if self.wallet is not None and self.hotkey != unknown_hotkey else None
+
+    async def _delegate_cached[DelegateReturn](
+        self, operation: Callable[..., Awaitable[DelegateReturn]], netuid: NetUid, block: Block
+    ) -> DelegateReturn:
+        """
+        Execute operation with a proper client, serving the result from the block result cache when possible.
+
+        Only the results for the finalized blocks are stored in the cache.
+        """
+        if self.result_cache is None or self.read_client is not None:
+            return await self._delegate(operation, netuid=netuid, block=block)
+        key = BlockCacheKey(operation=operation.__name__, netuid=netuid, block_hash=block.hash)
+        result = self.result_cache.get(key)
+        if result is not MISSING:
+            return result
+        result = await self._delegate(operation, netuid=netuid, block=block)
+        finalized_block = await self.get_finalized_block()
+        if self.result_cache.is_cacheable(block.number, finalized_block.number):
+            self.result_cache.put(key, result)
+        return result
+
     async def _delegate[DelegateReturn](
         self, operation: Callable[..., Awaitable[DelegateReturn]], *args, block: Block | None = None, **kwargs
     ) -> DelegateReturn:
@@ -800,28 +1378,38 @@ class BittensorClient[SubClient: AbstractBittensorClient](AbstractBittensorClien
         Execute operation with a proper client.
 
         Operations that does not need a block are executed by the main client.
-        Archive client is used when the block is stale (older than archive_blocks_cutoff blocks).
+        The client is the one of the healthiest node of the main or the archive node set.
+        Archive client is used when the block is stale (older than archive_blocks_cutoff blocks); the latest block
+        used for this check comes from the head tracker when possible.
         Operations on the main client are retried if UnknownBlock exception is raised.
+        With a read client, only the signing operations are executed by the own clients, the rest is delegated
+        to the read client.
 
         Raises:
             ArchiveFallbackException: When block data is unavailable on both main and archive nodes.
         """
         operation_name = operation.__name__
 
+        if self.read_client is not None:
+            if operation_name not in self.SIGNING_OPERATIONS:
+                if block:
+                    kwargs["block"] = block
+                return await getattr(self.read_client, operation_name)(*args, **kwargs)
+            await self._open_node_set(self._main_nodes)
+
         if block:
             kwargs["block"] = block
-            latest_block = await self._main_client.get_latest_block()
+            latest_block = await self.get_latest_block()
             if latest_block.number - block.number > self._archive_blocks_cutoff:
-                logger.debug(
-                    f"Block {block.number} is stale, falling back to the archive client: {self._archive_client.uri}"
-                )
+                archive_node = self._archive_nodes.select()
+                logger.debug(f"Block {block.number} is stale, falling back to the archive client: {archive_node.uri}")
                 bittensor_fallback_total.labels(
                     reason=FallbackReason.STALE_BLOCK,
                     operation=operation_name,
                     hotkey=self.hotkey,
                 ).inc()
                 try:
-                    return await operation(self._archive_client, *args, **kwargs)
+                    return await self._call_nodes(self._archive_nodes, archive_node, operation, *args, **kwargs)
                 except UnknownBlock as e:
                     raise ArchiveFallbackException(
                         detail=(
@@ -832,12 +1420,13 @@ class BittensorClient[SubClient: AbstractBittensorClient](AbstractBittensorClien
                     ) from e
 
         try:
-            return await operation(self._main_client, *args, **kwargs)
+            return await self._call_nodes(self._main_nodes, self._main_nodes.select(), operation, *args, **kwargs)
         except UnknownBlock:
             assert block, "UnknownBlock exception raised by operation that does not use a block!"
+            archive_node = self._archive_nodes.select()
             logger.warning(
                 f"Block {block.number} unknown for the main client, "
-                f"falling back to the archive client: {self._archive_client.uri}"
+                f"falling back to the archive client: {archive_node.uri}"
             )
             bittensor_fallback_total.labels(
                 reason=FallbackReason.UNKNOWN_BLOCK,
@@ -845,8 +1434,60 @@ class BittensorClient[SubClient: AbstractBittensorClient](AbstractBittensorClien
                 hotkey=self.hotkey,
             ).inc()
             try:
-                return await operation(self._archive_client, *args, **kwargs)
+                return await self._call_nodes(self._archive_nodes, archive_node, operation, *args, **kwargs)
             except UnknownBlock as e:
                 raise ArchiveFallbackException(
                     detail=f"Block {block.number} data is unavailable on both main and archive nodes."
                 ) from e
+
+    async def _call_nodes[DelegateReturn](
+        self,
+        nodes: NodeSet[SubClient],
+        node: Node[SubClient],
+        operation: Callable[..., Awaitable[DelegateReturn]],
+        *args,
+        **kwargs,
+    ) -> DelegateReturn:
+        """
+        Execute operation with the client of the node, hedging it on another node of the set when possible.
+        """
+        operation_name = operation.__name__
+        delay = None
+        if self.hedge_delays is not None and len(nodes) > 1 and operation_name in self.HEDGEABLE_OPERATIONS:
+            delay = self.hedge_delays.get(operation_name)
+        if delay is None:
+            return await self._call_node(nodes, node, operation, *args, **kwargs)
+        return await hedged(
+            operation_name,
+            lambda: self._call_node(nodes, node, operation, *args, **kwargs),
+            lambda: self._call_node(nodes, nodes.select(exclude=node), operation, *args, **kwargs),
+            delay,
+        )
+
+    @staticmethod
+    async def _call_node[DelegateReturn](
+        nodes: NodeSet[SubClient],
+        node: Node[SubClient],
+        operation: Callable[..., Awaitable[DelegateReturn]],
+        *args,
+        **kwargs,
+    ) -> DelegateReturn:
+        """
+        Execute operation with the client of the node, recording the outcome in the health of the node.
+
+        UnknownBlock and SubnetNotFound are valid answers of a healthy node, so they are not counted as failures.
+
+        Raises:
+            UnknownBlock: When the node does not know the block the operation is performed on.
+            SubnetNotFound: When the subnet the operation is performed on does not exist.
+        """
+        try:
+            result = await operation(node.client, *args, **kwargs)
+        except (UnknownBlock, SubnetNotFound):
+            nodes.record_success(node)
+            raise
+        except Exception:
+            nodes.record_failure(node)
+            raise
+        nodes.record_success(node)
+        return result
@@ -12,3 +12,9 @@ class ArchiveFallbackException(BittensorException):
     """
     Raised when block data is unavailable after archive node fallback.
     """
+
+
+class SubnetNotFound(BittensorException):
+    """
+    Raised when the subnet does not exist at the given block.
+    """
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from time import monotonic
+from typing import Self
+
+from pylon_commons.models import Block
+
+from pylon_service.bittensor.client import AbstractBittensorClient
+from pylon_service.metrics import chain_finalized_block_number, chain_head_block_number
+
+logger = logging.getLogger(__name__)
+
+
+class ChainHeadTracker:
+    """
+    Keeps the current chain head (block number and hash) and the last finalized block in memory, so that the clients
+    do not have to ask subtensor for the latest or the finalized block before every block-scoped call.
+
+    One tracker is shared by all the clients in the pool. The head is refreshed by a background task that polls
+    the upstream node at a block cadence. If the head was not refreshed for longer than max_age seconds (e.g. the node
+    is unreachable), it is reported as unknown and the readers are expected to fetch the latest block by themselves;
+    the same goes for the finalized block.
+    """
+
+    def __init__(self, client: AbstractBittensorClient, poll_interval: float = 6.0, max_age: float = 24.0) -> None:
+        """
+        Args:
+            client: Client used to poll the latest block. The tracker owns the client: it opens and closes it.
+            poll_interval: Seconds between consecutive polls of the latest block.
+            max_age: Seconds after which the last known head is considered outdated.
+        """
+        self._client = client
+        self._poll_interval = poll_interval
+        self._max_age = max_age
+        self._head: Block | None = None
+        self._updated_at = 0.0
+        self._finalized: Block | None = None
+        self._finalized_updated_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self) -> None:
+        assert self._task is None, "The head tracker is already open."
+        logger.info(f"Opening the chain head tracker for {self._client.uri}")
+        await self._client.open()
+        self._task = asyncio.create_task(self._poll(), name="chain_head_tracker")
+
+    async def close(self) -> None:
+        assert self._task is not None, "The head tracker is already closed."
+        logger.info(f"Closing the chain head tracker for {self._client.uri}")
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await self._client.close()
+        self._head = None
+        self._finalized = None
+
+    @property
+    def head(self) -> Block | None:
+        """
+        The current chain head or None if it is unknown or outdated.
+        """
+        if self._head is None or monotonic() - self._updated_at > self._max_age:
+            return None
+        return self._head
+
+    @property
+    def finalized(self) -> Block | None:
+        """
+        The last finalized block or None if it is unknown or outdated.
+        """
+        if self._finalized is None or monotonic() - self._finalized_updated_at > self._max_age:
+            return None
+        return self._finalized
+
+    def update(self, block: Block) -> None:
+        """
+        Reports a block that is known to be the chain head. Blocks older than the current head are ignored.
+        """
+        if self._head is not None and block.number < self._head.number:
+            return
+        if self._head is None or block.number > self._head.number:
+            chain_head_block_number.set(block.number)
+        self._head = block
+        self._updated_at = monotonic()
+
+    def update_finalized(self, block: Block) -> None:
+        """
+        Reports a block that is known to be finalized. Blocks older than the current finalized block are ignored.
+        """
+        if self._finalized is not None and block.number < self._finalized.number:
+            return
+        if self._finalized is None or block.number > self._finalized.number:
+            chain_finalized_block_number.set(block.number)
+        self._finalized = block
+        self._finalized_updated_at = monotonic()
+
+    async def refresh(self) -> Block:
+        """
+        Fetches the latest block from the upstream node and updates the head.
+        """
+        block = await self._client.get_latest_block()
+        self.update(block)
+        return block
+
+    async def refresh_finalized(self) -> Block:
+        """
+        Fetches the last finalized block from the upstream node and updates it.
+        """
+        block = await self._client.get_finalized_block()
+        self.update_finalized(block)
+        return block
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Failed to refresh the chain head from {self._client.uri}: {e}")
+            try:
+                await self.refresh_finalized()
+            except Exception as e:
+                logger.warning(f"Failed to refresh the finalized block from {self._client.uri}: {e}")
+            await asyncio.sleep(self._poll_interval)
@@ -0,0 +1,134 @@
+import asyncio
+import math
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+from time import monotonic
+
+from prometheus_client import Histogram
+
+from pylon_service.metrics import bittensor_hedged_calls_total, bittensor_operation_duration
+
+type Buckets = list[tuple[float, float]]
+
+
+class HedgeWinner(StrEnum):
+    PRIMARY = "primary"
+    HEDGE = "hedge"
+    NONE = "none"
+
+
+class HedgeDelays:
+    """
+    Per-operation delays after which an idempotent read is hedged, i.e. duplicated on another node.
+
+    The delay of an operation is the given percentile of the durations of its successful calls, estimated from
+    the buckets of the operation duration histogram the same way Prometheus histogram_quantile does. Only the
+    calls recorded since the previous estimation are taken into account, so the delay follows the recent
+    latency; it is re-estimated at most once per window_seconds and only when at least min_samples new calls
+    were recorded, otherwise the previous estimation is kept. Until the first estimation there is no delay and
+    the operation is not hedged.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window_seconds: float = 60.0,
+        min_delay_seconds: float = 0.05,
+        histogram: Histogram = bittensor_operation_duration,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("Percentile must be between 0 and 1.")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window_seconds = window_seconds
+        self.min_delay_seconds = min_delay_seconds
+        self.histogram = histogram
+        self._delays: dict[str, float | None] = {}
+        self._snapshots: dict[str, Buckets] = {}
+        self._estimated_at: dict[str, float] = {}
+
+    def get(self, operation: str) -> float | None:
+        """
+        Returns the hedging delay of the operation in seconds, or None if the operation should not be hedged yet.
+        """
+        now = monotonic()
+        estimated_at = self._estimated_at.get(operation)
+        if estimated_at is None or now - estimated_at >= self.window_seconds:
+            self._estimated_at[operation] = now
+            self._estimate(operation)
+        return self._delays.get(operation)
+
+    def _estimate(self, operation: str) -> None:
+        buckets = self._collect_buckets(operation)
+        previous = dict(self._snapshots.get(operation, []))
+        recent = [(bound, count - previous.get(bound, 0.0)) for bound, count in buckets]
+        if not recent or recent[-1][1] < self.min_samples:
+            return
+        self._snapshots[operation] = buckets
+        self._delays[operation] = max(self._quantile(recent), self.min_delay_seconds)
+
+    def _collect_buckets(self, operation: str) -> Buckets:
+        """
+        Returns the cumulative bucket counts of the successful calls of the operation, summed over all the series.
+        """
+        counts: dict[float, float] = {}
+        for metric in self.histogram.collect():
+            for sample in metric.samples:
+                if not sample.name.endswith("_bucket"):
+                    continue
+                if sample.labels.get("operation") != operation or sample.labels.get("status") != "success":
+                    continue
+                bound = float(sample.labels["le"])
+                counts[bound] = counts.get(bound, 0.0) + sample.value
+        return sorted(counts.items())
+
+    def _quantile(self, buckets: Buckets) -> float:
+        total = buckets[-1][1]
+        rank = self.percentile * total
+        lower_bound, lower_count = 0.0, 0.0
+        for bound, count in buckets:
+            if count >= rank:
+                if math.isinf(bound):
+                    return lower_bound
+                if count == lower_count:
+                    return bound
+                return lower_bound + (bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+            lower_bound, lower_count = bound, count
+        return lower_bound
+
+
+async def hedged[T](
+    operation: str,
+    primary: Callable[[], Awaitable[T]],
+    hedge: Callable[[], Awaitable[T]],
+    delay: float,
+) -> T:
+    """
+    Runs the primary call and, if it does not complete within the delay, the hedge call alongside it.
+
+    The result of the first call that succeeds is returned and the other call is cancelled. When both calls fail,
+    the exception of the primary call is raised. Must only be used for idempotent calls.
+    """
+    primary_task = asyncio.ensure_future(primary())
+    tasks = {primary_task}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return primary_task.result()
+        hedge_task = asyncio.ensure_future(hedge())
+        tasks.add(hedge_task)
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    winner = HedgeWinner.PRIMARY if task is primary_task else HedgeWinner.HEDGE
+                    bittensor_hedged_calls_total.labels(operation=operation, winner=winner).inc()
+                    return task.result()
+        bittensor_hedged_calls_total.labels(operation=operation, winner=HedgeWinner.NONE).inc()
+        return primary_task.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterator
+from enum import StrEnum
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict
+from pylon_commons.types import BittensorNetwork, BlockNumber
+
+from pylon_service.metrics import (
+    bittensor_node_ejected,
+    bittensor_node_ejections_total,
+    bittensor_node_error_rate,
+    bittensor_node_head_lag_blocks,
+    bittensor_node_latency_seconds,
+    bittensor_node_selected_total,
+)
+
+if TYPE_CHECKING:
+    from pylon_service.bittensor.client import AbstractBittensorClient
+
+logger = logging.getLogger(__name__)
+
+
+class EjectionReason(StrEnum):
+    ERROR_RATE = "error_rate"
+    HEAD_LAG = "head_lag"
+
+
+class NodeHealthPolicy(BaseModel):
+    """
+    Thresholds and weights used to score the nodes of a node set and to eject the unhealthy ones.
+    """
+
+    smoothing: float = 0.2
+    max_error_rate: float = 0.5
+    min_samples: int = 5
+    max_head_lag_blocks: int = 3
+    ejection_seconds: float = 30.0
+    error_penalty_seconds: float = 5.0
+    head_lag_penalty_seconds: float = 1.0
+
+    model_config = ConfigDict(frozen=True)
+
+
+class Node[SubClient: AbstractBittensorClient]:
+    """
+    Upstream node with the rolling scores of its health.
+
+    The latency is an exponentially weighted average of the probe round trips, the error rate is an exponentially
+    weighted average of the request and probe outcomes (1 for a failure, 0 for a success) and the head lag is
+    the number of blocks the node is behind the best head seen in its node set.
+    """
+
+    def __init__(self, client: SubClient) -> None:
+        self.client = client
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.head_number: BlockNumber | None = None
+        self.head_lag = 0
+        self.ejected_until: float | None = None
+
+    @property
+    def uri(self) -> BittensorNetwork:
+        return self.client.uri
+
+    def score(self, policy: NodeHealthPolicy) -> float:
+        """
+        The lower, the healthier. Nodes that were not probed yet have no latency penalty so that they get tried.
+        """
+        return (
+            (self.latency or 0.0)
+            + self.error_rate * policy.error_penalty_seconds
+            + self.head_lag * policy.head_lag_penalty_seconds
+        )
+
+
+class NodeSet[SubClient: AbstractBittensorClient]:
+    """
+    Set of interchangeable upstream nodes (e.g. several lite nodes) with health-weighted node selection.
+
+    Requests are routed to the node with the best score. A node is ejected from the routing for ejection_seconds
+    when its error rate exceeds max_error_rate or when it lags more than max_head_lag_blocks behind the best
+    node of the set; after that it is given another chance with a clean error rate. When all the nodes are ejected,
+    the best scored one is used anyway.
+
+    The head lag and the latency are only known after the set is probed, which is only worth doing when there is
+    more than one node to choose from.
+    """
+
+    def __init__(self, clients: list[SubClient], policy: NodeHealthPolicy | None = None) -> None:
+        if not clients:
+            raise ValueError("Node set requires at least one node.")
+        self.nodes = [Node(client) for client in clients]
+        self.policy = policy or NodeHealthPolicy()
+
+    def __iter__(self) -> Iterator[Node[SubClient]]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def primary(self) -> Node[SubClient]:
+        return self.nodes[0]
+
+    async def open(self) -> None:
+        for node in self.nodes:
+            await node.client.open()
+
+    async def close(self) -> None:
+        for node in self.nodes:
+            await node.client.close()
+
+    def select(self, exclude: Node[SubClient] | None = None) -> Node[SubClient]:
+        """
+        Returns the healthiest node that is not ejected; ties are resolved by the order of the nodes.
+        The excluded node is only returned when there is no other node.
+        """
+        if len(self.nodes) == 1:
+            return self.primary
+        now = monotonic()
+        nodes = [node for node in self.nodes if node is not exclude]
+        candidates = [node for node in nodes if not self._is_ejected(node, now)] or nodes
+        node = min(candidates, key=lambda candidate: candidate.score(self.policy))
+        bittensor_node_selected_total.labels(uri=node.uri).inc()
+        return node
+
+    def record_success(self, node: Node[SubClient], latency: float | None = None) -> None:
+        """
+        Records a successful call to the node. Only the latency of the probes should be recorded, as the durations
+        of different operations are not comparable.
+        """
+        if latency is not None:
+            smoothing = self.policy.smoothing
+            node.latency = latency if node.latency is None else (1 - smoothing) * node.latency + smoothing * latency
+            bittensor_node_latency_seconds.labels(uri=node.uri).set(node.latency)
+        self._record_outcome(node, failed=False)
+
+    def record_failure(self, node: Node[SubClient]) -> None:
+        self._record_outcome(node, failed=True)
+        if node.samples >= self.policy.min_samples and node.error_rate > self.policy.max_error_rate:
+            self._eject(node, EjectionReason.ERROR_RATE)
+
+    def record_head(self, node: Node[SubClient], number: BlockNumber) -> None:
+        """
+        Records the head block number reported by the node and updates the head lags of all the nodes.
+        """
+        node.head_number = number
+        best_head = max(other.head_number for other in self.nodes if other.head_number is not None)
+        for other in self.nodes:
+            if other.head_number is None:
+                continue
+            other.head_lag = best_head - other.head_number
+            bittensor_node_head_lag_blocks.labels(uri=other.uri).set(other.head_lag)
+            if other.head_lag > self.policy.max_head_lag_blocks:
+                self._eject(other, EjectionReason.HEAD_LAG)
+
+    async def probe(self) -> None:
+        """
+        Asks all the nodes for their latest block concurrently, recording the round trip latency and the head lag.
+        """
+        await asyncio.gather(*(self._probe_node(node) for node in self.nodes))
+
+    async def _probe_node(self, node: Node[SubClient]) -> None:
+        started = perf_counter()
+        try:
+            block = await node.client.get_latest_block()
+        except Exception:
+            logger.warning(f"Health probe of the node {node.uri} failed", exc_info=True)
+            self.record_failure(node)
+            return
+        self.record_success(node, latency=perf_counter() - started)
+        self.record_head(node, block.number)
+
+    def _record_outcome(self, node: Node[SubClient], failed: bool) -> None:
+        smoothing = self.policy.smoothing
+        node.error_rate = (1 - smoothing) * node.error_rate + smoothing * float(failed)
+        node.samples += 1
+        bittensor_node_error_rate.labels(uri=node.uri).set(node.error_rate)
+
+    def _eject(self, node: Node[SubClient], reason: EjectionReason) -> None:
+        if self._is_ejected(node, monotonic()):
+            return
+        logger.warning(
+            f"Ejecting the node {node.uri} for {self.policy.ejection_seconds}s "
+            f"(reason: {reason}, error rate: {node.error_rate:.2f}, head lag: {node.head_lag})"
+        )
+        node.ejected_until = monotonic() + self.policy.ejection_seconds
+        bittensor_node_ejections_total.labels(uri=node.uri, reason=reason).inc()
+        bittensor_node_ejected.labels(uri=node.uri).set(1)
+
+    def _is_ejected(self, node: Node[SubClient], now: float) -> bool:
+        if node.ejected_until is None:
+            return False
+        if now < node.ejected_until:
+            return True
+        logger.info(f"Reinstating the node {node.uri}")
+        node.ejected_until = None
+        node.error_rate = 0.0
+        node.samples = 0
+        bittensor_node_ejected.labels(uri=node.uri).set(0)
+        return False
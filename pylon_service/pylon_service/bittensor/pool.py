@@ -1,8 +1,10 @@
 import asyncio
 import logging
-from collections.abc import AsyncGenerator
+from collections import Counter
+from collections.abc import AsyncGenerator, Iterable
 from contextlib import asynccontextmanager
 from enum import StrEnum
+from time import monotonic, perf_counter
 from typing import Self
 
 from bittensor_wallet import Wallet
@@ -10,6 +12,13 @@ from pydantic import BaseModel, ConfigDict
 from pylon_commons.types import HotkeyName, WalletName
 
 from pylon_service.bittensor.client import AbstractBittensorClient, BittensorClient
+from pylon_service.metrics import (
+    bittensor_pool_acquire_duration,
+    bittensor_pool_client_open_duration,
+    bittensor_pool_clients_in_use,
+    bittensor_pool_clients_open,
+    bittensor_pool_evictions_total,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +38,10 @@ class WalletKey(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    def __hash__(self) -> int:
+        # Frozen models are hashable already; declared explicitly so that type checkers know it too.
+        return hash((self.wallet_name, self.hotkey_name, self.path))
+
     @classmethod
     def from_wallet(cls, wallet: Wallet) -> Self:
         return cls(
@@ -38,17 +51,35 @@ class WalletKey(BaseModel):
         )
 
 
+class EvictionReason(StrEnum):
+    IDLE = "idle"
+    MAX_CLIENTS = "max_clients"
+
+
 class BittensorClientPool[BTClient: AbstractBittensorClient]:
     """
     Pool from which bittensor clients can be acquired based on the provided wallet.
     One client is shared for the same wallet.
     Once the client is opened, connection is maintained until the pool itself is closed.
     The pool is concurrency safe, but not thread safe:
-      - lock ensures that no two tasks will create the same client instance simultaneously;
-        they will use the same instance,
+      - a client is created and opened once per wallet, in a task that the other tasks acquiring the same wallet
+        await instead of creating their own instance; opening a client does not block acquiring the clients of
+        the other wallets, and already open clients are returned without waiting,
+      - when opening a client fails, all the tasks waiting for it get the error and the next acquire retries,
       - when the pool closes, first it waits for all the acquired clients to be released,
         then closes the clients gracefully.
     The pool may be re-opened after it is closed.
+
+    With shared_reads enabled, the client without a wallet is given to all the wallet-bound clients as their read
+    client: reads are made through its connections whichever wallet is used, and the wallet-bound clients only
+    connect for signing operations. The client class must accept the read_client kwarg (see BittensorClient).
+
+    The size of the pool may be bounded with max_clients: when a new client exceeds the bound, the least recently
+    used clients that are not acquired are closed and removed. With maintenance_interval set, the pool
+    periodically removes the clients not acquired for idle_timeout seconds (if set) and pings the rest, so that
+    dead connections are recreated before a request runs into them. The client without a wallet is never removed
+    when shared_reads is enabled, as it is used by the other clients.
+    Clients may be opened ahead of the first request with prewarm.
     """
 
     class State(StrEnum):
@@ -57,16 +88,30 @@ class BittensorClientPool[BTClient: AbstractBittensorClient]:
         CLOSED = "closed"
 
     def __init__(
-        self, client_cls: type[BTClient] = BittensorClient, pool_closing_timeout: float = 60, **client_kwargs
+        self,
+        client_cls: type[BTClient] = BittensorClient,
+        pool_closing_timeout: float = 60,
+        shared_reads: bool = False,
+        max_clients: int | None = None,
+        idle_timeout: float | None = None,
+        maintenance_interval: float | None = None,
+        **client_kwargs,
     ) -> None:
         if "wallet" in client_kwargs:
             raise ValueError("Wallet may not be given as a client kwarg in the client pool.")
         self.state = self.State.CLOSED
         self.client_cls = client_cls
         self.closing_timeout = pool_closing_timeout
+        self.shared_reads = shared_reads
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.maintenance_interval = maintenance_interval
         self._pool: dict[WalletKey | None, BTClient] = {}
+        self._opening: dict[WalletKey | None, asyncio.Task[BTClient]] = {}
+        self._in_use: Counter[WalletKey | None] = Counter()
+        self._last_used: dict[WalletKey | None, float] = {}
+        self._maintenance_task: asyncio.Task | None = None
         self._close_condition = asyncio.Condition()
-        self._acquire_lock = asyncio.Lock()
         self._acquire_counter = 0
         self.client_kwargs = client_kwargs
 
@@ -81,11 +126,20 @@ class BittensorClientPool[BTClient: AbstractBittensorClient]:
         self._verify_not_open()
         logger.info(f"Opening {self.client_cls.__name__} client pool.")
         self.state = self.State.OPEN
+        if self.maintenance_interval is not None:
+            self._maintenance_task = asyncio.create_task(self._maintain(), name="bittensor_client_pool_maintenance")
 
     async def close(self):
         self._verify_open()
         logger.info(f"Closing sequence initialized for {self.client_cls.__name__} client pool.")
         self.state = self.State.CLOSING
+        if self._maintenance_task is not None:
+            task, self._maintenance_task = self._maintenance_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         logger.info(
             f"Entered the closing state. Waiting {self.closing_timeout} seconds until all "
             f"({self._acquire_counter}) clients are returned to the pool..."
@@ -101,11 +155,126 @@ class BittensorClientPool[BTClient: AbstractBittensorClient]:
             )
         else:
             logger.info("Closing all the clients...")
+        await asyncio.gather(*self._opening.values(), return_exceptions=True)
         await asyncio.gather(*(client.close() for client in self._pool.values()), return_exceptions=True)
         self._pool.clear()
+        self._last_used.clear()
+        bittensor_pool_clients_open.set(0)
         self.state = self.State.CLOSED
         logger.info(f"{self.client_cls.__name__} client pool successfully closed.")
 
+    async def _get_client(self, wallet: Wallet | None, wallet_key: WalletKey | None) -> BTClient:
+        """
+        Returns the client for the wallet from the pool, creating and opening it if needed.
+
+        The client is opened in a separate task shared by all the callers acquiring the same wallet meanwhile;
+        it is shielded from the callers, so cancelling one of them does not cancel the opening for the others.
+        """
+        if wallet_key in self._pool:
+            return self._pool[wallet_key]
+        task = self._opening.get(wallet_key)
+        if task is None:
+            task = self._opening[wallet_key] = asyncio.create_task(self._open_client(wallet, wallet_key))
+            task.add_done_callback(lambda done_task: self._opening_done(wallet_key, done_task))
+        return await asyncio.shield(task)
+
+    async def _open_client(self, wallet: Wallet | None, wallet_key: WalletKey | None) -> BTClient:
+        client_kwargs = self.client_kwargs
+        if self.shared_reads and wallet_key is not None:
+            client_kwargs = {**client_kwargs, "read_client": await self._get_client(None, None)}
+        wallet_name = f"'{wallet.name}'" if wallet else "no"
+        logger.debug(f"New client open with {wallet_name} wallet.")
+        client = self.client_cls(wallet, **client_kwargs)
+        started = perf_counter()
+        try:
+            await client.open()
+        except Exception:
+            bittensor_pool_client_open_duration.labels(status="error").observe(perf_counter() - started)
+            raise
+        bittensor_pool_client_open_duration.labels(status="success").observe(perf_counter() - started)
+        self._pool[wallet_key] = client
+        self._last_used[wallet_key] = monotonic()
+        bittensor_pool_clients_open.set(len(self._pool))
+        await self._evict_over_limit(wallet_key)
+        return client
+
+    async def prewarm(self, wallets: Iterable[Wallet | None]) -> None:
+        """
+        Opens the clients for the wallets ahead of their first acquire and connects them to their nodes (see
+        AbstractBittensorClient.warm_up). Clients that fail to open are only logged; opening them is retried by
+        their first acquire.
+
+        Raises:
+            BittensorClientPoolInvalidState: When the pool is not open.
+        """
+        self._verify_open()
+        wallets = list(wallets)
+        results = await asyncio.gather(*(self._prewarm_client(wallet) for wallet in wallets), return_exceptions=True)
+        for wallet, result in zip(wallets, results):
+            if isinstance(result, BaseException):
+                wallet_name = f"'{wallet.name}'" if wallet else "no"
+                logger.warning(f"Failed to pre-warm the client with {wallet_name} wallet.", exc_info=result)
+
+    async def _prewarm_client(self, wallet: Wallet | None) -> None:
+        client = await self._get_client(wallet, wallet and WalletKey.from_wallet(wallet))
+        await client.warm_up()
+
+    def _evictable(self) -> list[WalletKey | None]:
+        return [
+            wallet_key
+            for wallet_key in self._pool
+            if not self._in_use[wallet_key] and not (self.shared_reads and wallet_key is None)
+        ]
+
+    def _idle(self, idle_timeout: float) -> list[WalletKey | None]:
+        idle_since = monotonic() - idle_timeout
+        return [wallet_key for wallet_key in self._evictable() if self._last_used.get(wallet_key, 0.0) <= idle_since]
+
+    async def _evict(self, wallet_key: WalletKey | None, reason: EvictionReason) -> None:
+        client = self._pool.pop(wallet_key)
+        self._last_used.pop(wallet_key, None)
+        bittensor_pool_clients_open.set(len(self._pool))
+        bittensor_pool_evictions_total.labels(reason=reason).inc()
+        logger.info(f"Evicting the client {wallet_key} from the pool (reason: {reason}).")
+        try:
+            await client.close()
+        except Exception:
+            logger.warning(f"Failed to close the evicted client {wallet_key}.", exc_info=True)
+
+    async def _evict_over_limit(self, opened_key: WalletKey | None) -> None:
+        if self.max_clients is None:
+            return
+        while len(self._pool) > self.max_clients:
+            candidates = [wallet_key for wallet_key in self._evictable() if wallet_key != opened_key]
+            if not candidates:
+                logger.warning(
+                    f"The pool exceeds {self.max_clients} clients, but all of them are in use and cannot be evicted."
+                )
+                return
+            lru_key = min(candidates, key=lambda wallet_key: self._last_used.get(wallet_key, 0.0))
+            await self._evict(lru_key, EvictionReason.MAX_CLIENTS)
+
+    async def _maintain(self) -> None:
+        assert self.maintenance_interval is not None
+        while True:
+            await asyncio.sleep(self.maintenance_interval)
+            if self.idle_timeout is not None:
+                # Looked up anew after every eviction, as the clients may be acquired while the previous one closes.
+                while idle_keys := self._idle(self.idle_timeout):
+                    await self._evict(idle_keys[0], EvictionReason.IDLE)
+            clients = list(self._pool.values())
+            results = await asyncio.gather(*(client.ping() for client in clients), return_exceptions=True)
+            for client, result in zip(clients, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Keepalive ping of the client for {client.uri} failed.", exc_info=result)
+
+    def _opening_done(self, wallet_key: WalletKey | None, task: asyncio.Task[BTClient]) -> None:
+        if self._opening.get(wallet_key) is task:
+            del self._opening[wallet_key]
+        # Retrieve the exception so that it is not reported as never retrieved when all the callers were cancelled.
+        if not task.cancelled():
+            task.exception()
+
     def _can_close(self) -> bool:
         return self._acquire_counter == 0
 
@@ -130,25 +299,32 @@ class BittensorClientPool[BTClient: AbstractBittensorClient]:
             BittensorClientPoolInvalidState: When acquire is called when the pool is not open.
         """
         self._verify_open()
+        started = perf_counter()
         self._acquire_counter += 1
+        bittensor_pool_clients_in_use.set(self._acquire_counter)
         wallet_key = wallet and WalletKey.from_wallet(wallet)
         wallet_name = f"'{wallet.name}'" if wallet else "no"
         logger.debug(
             f"Acquiring client with {wallet_name} wallet from the pool. "
             f"Count of clients acquired: {self._acquire_counter}"
         )
-        async with self._acquire_lock:
-            if wallet_key in self._pool:
-                client = self._pool[wallet_key]
-            else:
-                logger.debug(f"New client open with {wallet_name} wallet.")
-                client = self._pool[wallet_key] = self.client_cls(wallet, **self.client_kwargs)
-                await client.open()
         try:
-            yield client
+            client = self._pool.get(wallet_key)
+            while client is None:
+                opened_client = await self._get_client(wallet, wallet_key)
+                # The client might have been evicted before this task resumed.
+                client = opened_client if self._pool.get(wallet_key) is opened_client else None
+            bittensor_pool_acquire_duration.observe(perf_counter() - started)
+            self._in_use[wallet_key] += 1
+            try:
+                yield client
+            finally:
+                self._in_use[wallet_key] -= 1
+                self._last_used[wallet_key] = monotonic()
         finally:
             async with self._close_condition:
                 self._acquire_counter -= 1
+                bittensor_pool_clients_in_use.set(self._acquire_counter)
                 logger.debug(
                     f"Returning client with {wallet_name} wallet to the pool. "
                     f"Count of clients acquired: {self._acquire_counter}"
@@ -1,9 +1,20 @@
 from .adapter import RecentCacheAdapter
 from .exceptions import RecentObjectMissing, RecentObjectStale
-from .provider import RecentObjectProvider
+from .provider import RecentObjectProvider, age_blocks
 from .context import IdentitySubnetContext, AbstractContext, SubnetContext
 from .types import HardLimit, SoftLimit
-from .tasks import UpdateRecentNeurons, RecentObjectUpdateTaskExecutor
+from .refresh import RecentObjectRefresher, RefreshPolicy, RefreshTrigger
+from .tasks import (
+    RECENT_OBJECT_UPDATERS,
+    RecentObjectUpdateTaskExecutor,
+    UpdateRecentCertificates,
+    UpdateRecentCommitments,
+    UpdateRecentHyperparams,
+    UpdateRecentNeurons,
+    UpdateRecentObject,
+    UpdateRecentSubnetObject,
+    UpdateRecentSubnetState,
+)
 
 
 __all__ = [
@@ -16,6 +27,16 @@ __all__ = [
     "IdentitySubnetContext",
     "HardLimit",
     "SoftLimit",
+    "RECENT_OBJECT_UPDATERS",
+    "UpdateRecentObject",
+    "UpdateRecentSubnetObject",
     "UpdateRecentNeurons",
+    "UpdateRecentCommitments",
+    "UpdateRecentCertificates",
+    "UpdateRecentHyperparams",
+    "UpdateRecentSubnetState",
     "RecentObjectUpdateTaskExecutor",
+    "RecentObjectRefresher",
+    "RefreshPolicy",
+    "RefreshTrigger",
 ]
@@ -1,8 +1,8 @@
 import logging
-from typing import Self
+from typing import NamedTuple, Self
 
 from litestar.stores.base import Store
-from pydantic import BaseModel, ValidationError
+from pydantic import ValidationError
 from pylon_commons.models import BittensorModel
 from pylon_commons.types import HotkeyName, NetUid, Timestamp
 
@@ -21,14 +21,31 @@ class CacheKey[ModelT: BittensorModel](str):
         return super().__new__(cls, key)  # type: ignore
 
 
-class _CacheEntry(BaseModel):
+class _CacheEntry(NamedTuple):
     """
-    This class is internal to this module. It is used to serialize/deserialize cache entries via pydantic.
+    This class is internal to this module. It is used to encode/decode cache entries.
+
+    An entry is encoded as the timestamp line followed by the JSON of the object, so that the JSON can be served
+    as is, without being parsed and dumped again.
     """
 
-    data: str
+    data: bytes
     timestamp: Timestamp
 
+    def encode(self) -> bytes:
+        return b"%d\n%b" % (self.timestamp, self.data)
+
+    @classmethod
+    def decode(cls, raw: bytes) -> Self:
+        """
+        Raises:
+            ValueError: If the entry is malformed.
+        """
+        timestamp, separator, data = raw.partition(b"\n")
+        if not separator:
+            raise ValueError("Cache entry has no timestamp.")
+        return cls(data=data, timestamp=Timestamp(int(timestamp)))
+
 
 class RecentCacheAdapter[ModelT: BittensorModel]:
     """
@@ -62,24 +79,51 @@ class RecentCacheAdapter[ModelT: BittensorModel]:
             timestamp: timestamp of the block this data is associated with.
             object_: The object to be cached.
         """
-        data = object_.model_dump_json()
-        entry = _CacheEntry(data=data, timestamp=timestamp).model_dump_json()
-        await self._store.set(self._key, entry)
+        await self.save_raw(timestamp, object_.model_dump_json().encode())
+
+    async def save_raw(self, timestamp: Timestamp, data: bytes) -> None:
+        """
+        Saves a cache entry with an object already serialized to JSON, e.g. to store one object under many keys.
+        Args:
+            timestamp: timestamp of the block this data is associated with.
+            data: The object serialized to JSON.
+        """
+        entry = _CacheEntry(data=data, timestamp=timestamp)
+        await self._store.set(self._key, entry.encode())
+
+    async def get_raw(self) -> tuple[Timestamp, bytes] | None:
+        """
+        Gets a cache entry from the store backend with the object as JSON, without validating it.
+        """
+        raw = await self._store.get(self._key)
+        if raw is None:
+            return None
+
+        try:
+            entry = _CacheEntry.decode(raw)
+        except ValueError:
+            await self._delete_invalid()
+            return None
+
+        return entry.timestamp, entry.data
 
     async def get(self) -> tuple[Timestamp, ModelT] | None:
         """
         Gets a cache entry from the store backend.
         """
-        data = await self._store.get(self._key)
-        if data is None:
+        raw_entry = await self.get_raw()
+        if raw_entry is None:
             return None
 
+        timestamp, data = raw_entry
         try:
-            entry = _CacheEntry.model_validate_json(data)
-            object_ = self._model.model_validate_json(entry.data)
+            object_ = self._model.model_validate_json(data)
         except ValidationError:
-            logger.warning("Cache entry validation failed. Deleting invalid entry.")
-            await self._store.delete(self._key)
+            await self._delete_invalid()
             return None
 
-        return entry.timestamp, object_
+        return timestamp, object_
+
+    async def _delete_invalid(self) -> None:
+        logger.warning("Cache entry validation failed. Deleting invalid entry.")
+        await self._store.delete(self._key)
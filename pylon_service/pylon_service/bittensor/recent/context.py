@@ -6,6 +6,9 @@ from pylon_commons.types import HotkeyName, NetUid
 
 from .adapter import CacheKey
 
+IDENTITY_PRIORITY = 0
+OPEN_ACCESS_PRIORITY = 1
+
 
 class AbstractContext(ABC):
     """
@@ -22,6 +25,13 @@ class AbstractContext(ABC):
     def wallet(self) -> Wallet | None:
         return None
 
+    @property
+    def priority(self) -> int:
+        """
+        Priority of the updates of the objects in this context; the lower, the sooner they are updated.
+        """
+        return OPEN_ACCESS_PRIORITY
+
     @abstractmethod
     def build_key[ModelT: BittensorModel](self, model: type[ModelT]) -> CacheKey[ModelT]:
         pass
@@ -65,6 +75,10 @@ class IdentitySubnetContext(SubnetContext):
     def wallet(self) -> Wallet | None:
         return self._wallet
 
+    @property
+    def priority(self) -> int:
+        return IDENTITY_PRIORITY
+
     def build_key[ModelT: BittensorModel](self, model: type[ModelT]) -> CacheKey[ModelT]:
         return CacheKey(model, self.netuid, HotkeyName(self._wallet.hotkey_str))
 
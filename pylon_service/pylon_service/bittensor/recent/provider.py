@@ -4,22 +4,46 @@ import logging
 from litestar.stores.base import Store
 from pylon_commons.constants import BLOCK_PROCESSING_TIME
 from pylon_commons.models import BittensorModel
+from pylon_commons.types import Timestamp
 
 from .adapter import RecentCacheAdapter
 from .context import AbstractContext
 from .exceptions import RecentObjectMissing, RecentObjectStale
+from .refresh import RecentObjectRefresher
 from .types import HardLimit, SoftLimit
 
 logger = logging.getLogger(__name__)
 
 
+def age_blocks(cached_at: Timestamp) -> int:
+    """
+    Estimates how many blocks behind the chain head a recent object cached at the given time is.
+    """
+    now = dt.datetime.now(dt.UTC).timestamp()
+    return max(0, int(now - cached_at)) // BLOCK_PROCESSING_TIME
+
+
 class RecentObjectProvider:
     """
     A readonly layer for accessing fresh recent objects from the cache. It performs freshness
     checks on the objects and raises exceptions if they are stale or missing.
+
+    With a refresher, the provider works in the stale-while-revalidate mode: an object older than the soft limit
+    is still returned, and its refresh is requested in the background. The refresh requests are coalesced by
+    the refresher, so many requests for a stale object result in a single update. Objects older than the hard
+    limit are still returned for stale_grace more blocks, so that the clients are served while the refresh runs;
+    only the objects older than that are refused, but their refresh is requested as well.
     """
 
-    def __init__(self, soft_limit: SoftLimit, hard_limit: HardLimit, store: Store, context: AbstractContext) -> None:
+    def __init__(
+        self,
+        soft_limit: SoftLimit,
+        hard_limit: HardLimit,
+        store: Store,
+        context: AbstractContext,
+        refresher: RecentObjectRefresher | None = None,
+        stale_grace: int = 0,
+    ) -> None:
         """
         Args:
             soft_limit: soft limit for recent object age in blocks.
@@ -27,11 +51,17 @@ class RecentObjectProvider:
             store: litestar store instance. It is directly passed to cache adapters for accessing
                 recent objects.
             context: a Context instance that defines the context to build the cache key for a given model.
+            refresher: refresher to request the refreshes of the stale objects from; enables the
+                stale-while-revalidate mode.
+            stale_grace: number of blocks past the hard limit for which the objects are still returned in the
+                stale-while-revalidate mode.
         """
         self._soft_limit = soft_limit
         self._hard_limit = hard_limit
         self._store = store
         self._context = context
+        self._refresher = refresher
+        self._stale_grace = stale_grace
 
     async def get[ModelT: BittensorModel](self, model: type[ModelT]) -> ModelT:
         """
@@ -45,25 +75,59 @@ class RecentObjectProvider:
             RecentObjectStale: if the object is stale (older than hard limit).
         """
         cache_adapter = RecentCacheAdapter(self._context.build_key(model), self._store, model)
-
         cache_entry = await cache_adapter.get()
         if cache_entry is None:
             raise RecentObjectMissing(f"Recent object not found. object: {model.__name__}")
 
         cached_at, object_ = cache_entry
-        now = dt.datetime.now(dt.UTC).timestamp()
-        elapsed_blocks = max(0, int(now - cached_at)) // BLOCK_PROCESSING_TIME
+        self._check_freshness(model, cached_at)
+        return object_
 
-        if elapsed_blocks > self._hard_limit:
+    async def get_raw[ModelT: BittensorModel](self, model: type[ModelT]) -> tuple[Timestamp, bytes]:
+        """
+        Get a recent object from the cache as JSON, the way it was stored, without deserializing it, along with
+        the time it was cached at. It performs the same freshness checks as get.
+        Args:
+            model: BittensorModel class the cache entry was stored for.
+
+        Raises:
+            RecentObjectMissing: if the object is missing from the cache.
+            RecentObjectStale: if the object is stale (older than hard limit).
+        """
+        cache_adapter = RecentCacheAdapter(self._context.build_key(model), self._store, model)
+        cache_entry = await cache_adapter.get_raw()
+        if cache_entry is None:
+            raise RecentObjectMissing(f"Recent object not found. object: {model.__name__}")
+
+        cached_at, data = cache_entry
+        self._check_freshness(model, cached_at)
+        return cached_at, data
+
+    def _check_freshness(self, model: type[BittensorModel], cached_at: Timestamp) -> None:
+        """
+        Raises:
+            RecentObjectStale: if the object is stale (older than hard limit, plus the grace period in the
+                stale-while-revalidate mode).
+        """
+        elapsed_blocks = age_blocks(cached_at)
+
+        if elapsed_blocks > self._soft_limit and self._refresher is not None:
+            self._refresher.request_refresh(self._context, model)
+
+        grace = self._stale_grace if self._refresher is not None else 0
+        if elapsed_blocks > self._hard_limit + grace:
             raise RecentObjectStale(
                 f"Recent object is stale. context: {self._context}, object: {model.__name__}, "
-                f"elapsed_blocks: {elapsed_blocks}, hard_limit: {self._hard_limit}"
+                f"elapsed_blocks: {elapsed_blocks}, hard_limit: {self._hard_limit}, grace: {grace}"
             )
 
-        if elapsed_blocks > self._soft_limit:
+        if elapsed_blocks > self._hard_limit:
+            logger.warning(
+                f"Recent object is older than hard limit, served while refreshed. context: {self._context}, "
+                f"object: {model.__name__}, elapsed blocks: {elapsed_blocks}, hard_limit: {self._hard_limit}"
+            )
+        elif elapsed_blocks > self._soft_limit:
             logger.warning(
                 f"Recent object is older than soft limit. context: {self._context}, object: {model.__name__},"
                 f"elapsed blocks: {elapsed_blocks}, soft_limit: {self._soft_limit}"
             )
-
-        return object_
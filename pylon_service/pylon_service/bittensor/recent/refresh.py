@@ -0,0 +1,319 @@
+import asyncio
+import itertools
+import logging
+import random
+from collections.abc import Callable, Coroutine
+from time import monotonic
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, ConfigDict, PositiveInt
+from pylon_commons.constants import BLOCK_PROCESSING_TIME
+from pylon_commons.models import BittensorModel
+from pylon_commons.types import BlockNumber, NetUid
+
+from pylon_service.bittensor.head import ChainHeadTracker
+from pylon_service.metrics import recent_objects_queue_depth, recent_objects_refresh_lag
+
+from .context import AbstractContext, SubnetContext
+from .tasks import RecentObjectUpdateTaskExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshPolicy(BaseModel):
+    """
+    When to refresh the recent objects of a subnet, in addition to the refresh forced by the maximum interval.
+
+    Args:
+        epoch: Refresh at the first block of every epoch of the subnet, when the metagraph values change.
+        every_blocks: Refresh every that many new blocks.
+    """
+
+    epoch: bool = False
+    every_blocks: PositiveInt | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+class _LastRefresh(NamedTuple):
+    block_number: BlockNumber | None
+    at: float
+
+
+class RefreshTrigger:
+    """
+    Decides, per subnet, when the recent objects are due for a refresh, based on the chain head.
+
+    The objects of a subnet are refreshed when they were never refreshed, when max_interval_blocks passed since
+    the last refresh (so that they never reach the soft limit) and whenever the refresh policy of the subnet says so.
+    While the chain head is unknown, only the maximum interval is checked, against the wall clock.
+    """
+
+    def __init__(
+        self,
+        max_interval_blocks: int,
+        epoch_start: Callable[[BlockNumber, NetUid], BlockNumber],
+        default_policy: RefreshPolicy | None = None,
+        policies: dict[NetUid, RefreshPolicy] | None = None,
+    ) -> None:
+        """
+        Args:
+            max_interval_blocks: Maximum number of blocks between the refreshes of a subnet.
+            epoch_start: Returns the first block of the epoch of the subnet that contains the block.
+            default_policy: Refresh policy of the subnets that have no policy of their own.
+            policies: Refresh policies by netuid.
+        """
+        self.max_interval_blocks = max_interval_blocks
+        self._epoch_start = epoch_start
+        self._default_policy = default_policy or RefreshPolicy()
+        self._policies = policies or {}
+        self._last_refresh: dict[NetUid, _LastRefresh] = {}
+
+    def policy(self, netuid: NetUid) -> RefreshPolicy:
+        return self._policies.get(netuid, self._default_policy)
+
+    def is_due(self, netuid: NetUid, head_number: BlockNumber | None) -> bool:
+        last_refresh = self._last_refresh.get(netuid)
+        if last_refresh is None:
+            return True
+        if head_number is None or last_refresh.block_number is None:
+            return monotonic() - last_refresh.at >= self.max_interval_blocks * BLOCK_PROCESSING_TIME
+        elapsed_blocks = head_number - last_refresh.block_number
+        if elapsed_blocks >= self.max_interval_blocks:
+            return True
+        policy = self.policy(netuid)
+        if policy.every_blocks is not None and elapsed_blocks >= policy.every_blocks:
+            return True
+        return policy.epoch and self._epoch_start(head_number, netuid) > last_refresh.block_number
+
+    def record(self, netuid: NetUid, head_number: BlockNumber | None) -> None:
+        self._last_refresh[netuid] = _LastRefresh(block_number=head_number, at=monotonic())
+
+    def forget(self, netuid: NetUid) -> None:
+        self._last_refresh.pop(netuid, None)
+
+
+class _QueuedUpdate(NamedTuple):
+    priority: int
+    sequence: int
+    due_at: float
+    netuid: NetUid
+    executor: RecentObjectUpdateTaskExecutor
+
+
+class RecentObjectRefresher:
+    """
+    Refreshes the recent objects of the subnets when the refresh trigger says they are due.
+
+    It is meant to be run at the chain head tracker cadence. Each run only enqueues the updates of the objects of
+    the due subnets; the updates are run by a fixed number of workers, so that configuring many subnets does not
+    flood the upstream node. The updates of the identity subnets go first (see AbstractContext.priority) and
+    each update is delayed by a random jitter, so that the subnets that become due at the same block are spread
+    in time. A subnet is not enqueued again until all the updates of its previous refresh are finished.
+    The updates are not retried by their executors; when one fails, the subnet is due again at the next run.
+
+    With an executor factory, subnets other than the configured ones are enrolled on demand (see enroll) and
+    dropped again once they were not requested for idle_timeout_seconds. Only the subnets that exist are enrolled;
+    the ones found missing are not checked again until idle_timeout_seconds passes.
+    """
+
+    def __init__(
+        self,
+        executors: dict[NetUid, list[RecentObjectUpdateTaskExecutor]],
+        trigger: RefreshTrigger,
+        head_tracker: ChainHeadTracker,
+        concurrency: int = 8,
+        jitter_seconds: float = 0.0,
+        executor_factory: Callable[[NetUid], list[RecentObjectUpdateTaskExecutor]] | None = None,
+        idle_timeout_seconds: float = 3600.0,
+        max_enrolled_subnets: int | None = None,
+        subnet_exists: Callable[[NetUid], Coroutine[Any, Any, bool]] | None = None,
+    ) -> None:
+        """
+        Args:
+            executors: Executors of the recent object updates, by the netuid of their contexts.
+            trigger: Trigger deciding when the subnets are due for a refresh.
+            head_tracker: Source of the current chain head.
+            concurrency: Maximum number of updates run at the same time.
+            jitter_seconds: Maximum random delay of an update.
+            executor_factory: Creates the executors of the updates of a subnet enrolled on demand; enrollment
+                is disabled without it.
+            idle_timeout_seconds: Time after the last request after which an enrolled subnet is dropped.
+            max_enrolled_subnets: Maximum number of subnets enrolled at the same time, unbounded if None.
+            subnet_exists: Tells whether the subnet exists; the subnets are enrolled without the check if None.
+        """
+        self._executors = executors
+        self._trigger = trigger
+        self._head_tracker = head_tracker
+        self._concurrency = concurrency
+        self._jitter_seconds = jitter_seconds
+        self._executor_factory = executor_factory
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._max_enrolled_subnets = max_enrolled_subnets
+        self._subnet_exists = subnet_exists
+        self._enrolled: dict[NetUid, float] = {}
+        self._missing: dict[NetUid, float] = {}
+        self._existence_checks: dict[NetUid, asyncio.Task[bool]] = {}
+        self._queue: asyncio.PriorityQueue[_QueuedUpdate] = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._pending: dict[NetUid, int] = {}
+        self._queued: set[tuple[NetUid, str]] = set()
+        self._delayed: set[asyncio.TimerHandle] = set()
+        self._workers: list[asyncio.Task] = []
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def run(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._work(), name=f"recent_objects_worker_{number}")
+                for number in range(self._concurrency)
+            ]
+        self._drop_idle_subnets()
+        head = self._head_tracker.head
+        head_number = head.number if head is not None else None
+        for netuid, executors in self._executors.items():
+            if self._pending.get(netuid) or not self._trigger.is_due(netuid, head_number):
+                continue
+            self._trigger.record(netuid, head_number)
+            logger.debug(f"Refreshing recent objects. netuid: {netuid}, head: {head_number}")
+            for executor in executors:
+                self._enqueue(netuid, executor)
+
+    async def enroll(self, netuid: NetUid) -> None:
+        """
+        Enrolls the subnet for the refreshes, if it is not refreshed already and it exists, and marks it
+        as requested. The objects of a newly enrolled subnet are fetched by the next run.
+        """
+        if netuid in self._enrolled:
+            self._enrolled[netuid] = monotonic()
+            return
+        if netuid in self._executors or self._executor_factory is None or not self._can_enroll(netuid):
+            return
+        if self._subnet_exists is not None and not await self._check_subnet_exists(netuid):
+            return
+        # The state might have changed while the existence was checked.
+        if netuid in self._executors or not self._can_enroll(netuid):
+            return
+        logger.info(f"Enrolling subnet for recent objects. netuid: {netuid}")
+        self._executors[netuid] = self._executor_factory(netuid)
+        self._enrolled[netuid] = monotonic()
+
+    def _can_enroll(self, netuid: NetUid) -> bool:
+        if netuid in self._missing:
+            return False
+        if self._max_enrolled_subnets is not None and len(self._enrolled) >= self._max_enrolled_subnets:
+            logger.warning(f"Cannot enroll subnet for recent objects, the limit is reached. netuid: {netuid}")
+            return False
+        return True
+
+    async def _check_subnet_exists(self, netuid: NetUid) -> bool:
+        """
+        Checks whether the subnet exists, once for all the concurrent enrollments of the subnet. A failed check
+        counts as missing for this enrollment only.
+        """
+        assert self._subnet_exists is not None
+        check = self._existence_checks.get(netuid)
+        if check is None:
+            check = asyncio.create_task(self._subnet_exists(netuid), name=f"subnet_exists_{netuid}")
+            self._existence_checks[netuid] = check
+            check.add_done_callback(lambda _: self._existence_checks.pop(netuid, None))
+        try:
+            exists = await asyncio.shield(check)
+        except Exception:
+            logger.exception(f"Failed to check whether subnet exists. netuid: {netuid}")
+            return False
+        if not exists:
+            if netuid not in self._missing:
+                logger.warning(f"Cannot enroll subnet for recent objects, it does not exist. netuid: {netuid}")
+            self._missing[netuid] = monotonic()
+        return exists
+
+    def request_refresh(self, context: AbstractContext, model: type[BittensorModel]) -> None:
+        """
+        Enqueues the update of the object of the context's subnet, unless it is already enqueued or running.
+        The update is not delayed by the jitter, as it was requested by a client waiting for fresh data.
+        """
+        if not isinstance(context, SubnetContext):
+            return
+        for executor in self._executors.get(context.netuid, ()):
+            if model in executor.models and (context.netuid, executor.name) not in self._queued:
+                logger.debug(f"Refresh of a recent object requested. context: {context}, object: {model.__name__}")
+                self._enqueue(context.netuid, executor, jitter=False)
+
+    def _drop_idle_subnets(self) -> None:
+        now = monotonic()
+        for netuid, checked_at in list(self._missing.items()):
+            if now - checked_at >= self._idle_timeout_seconds:
+                del self._missing[netuid]
+        for netuid, requested_at in list(self._enrolled.items()):
+            if now - requested_at < self._idle_timeout_seconds or self._pending.get(netuid):
+                continue
+            logger.info(f"Dropping idle subnet from recent objects. netuid: {netuid}")
+            del self._enrolled[netuid]
+            del self._executors[netuid]
+            self._pending.pop(netuid, None)
+            self._trigger.forget(netuid)
+
+    async def wait(self) -> None:
+        """
+        Waits for the enqueued updates to finish.
+        """
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """
+        Drops the enqueued updates and stops the workers.
+        """
+        for handle in self._delayed:
+            handle.cancel()
+        self._delayed.clear()
+        checks = list(self._existence_checks.values())
+        for task in [*self._workers, *checks]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *checks, return_exceptions=True)
+        self._workers = []
+        self._pending.clear()
+        self._queued.clear()
+        self._idle.set()
+        self._queue = asyncio.PriorityQueue()
+        recent_objects_queue_depth.set(0)
+
+    def _enqueue(self, netuid: NetUid, executor: RecentObjectUpdateTaskExecutor, jitter: bool = True) -> None:
+        update = _QueuedUpdate(executor.priority, next(self._sequence), monotonic(), netuid, executor)
+        self._pending[netuid] = self._pending.get(netuid, 0) + 1
+        self._queued.add((netuid, executor.name))
+        self._idle.clear()
+        recent_objects_queue_depth.inc()
+        delay = random.uniform(0, self._jitter_seconds) if jitter and self._jitter_seconds > 0 else 0.0
+        if delay == 0:
+            self._queue.put_nowait(update)
+            return
+
+        def put() -> None:
+            self._delayed.discard(handle)
+            self._queue.put_nowait(update)
+
+        handle = asyncio.get_running_loop().call_later(delay, put)
+        self._delayed.add(handle)
+
+    async def _work(self) -> None:
+        while True:
+            update = await self._queue.get()
+            recent_objects_queue_depth.dec()
+            succeeded = False
+            try:
+                succeeded = await update.executor.run()
+            except Exception:
+                logger.exception(
+                    f"Failed to refresh recent object. netuid: {update.netuid}, object: {update.executor.name}"
+                )
+            finally:
+                if not succeeded:
+                    self._trigger.forget(update.netuid)
+                self._pending[update.netuid] -= 1
+                self._queued.discard((update.netuid, update.executor.name))
+                if not any(self._pending.values()):
+                    self._idle.set()
+                self._queue.task_done()
+            recent_objects_refresh_lag.labels(object=update.executor.name).observe(monotonic() - update.due_at)
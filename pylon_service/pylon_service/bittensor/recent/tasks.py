@@ -1,17 +1,28 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 
 from litestar.stores.base import Store
-from pylon_commons.models import BittensorModel, SubnetNeurons
-from pylon_commons.types import Timestamp
-from tenacity import AsyncRetrying, stop_before_delay, wait_exponential
+from pylon_commons.models import (
+    BittensorModel,
+    Block,
+    BlockSubnetHyperparams,
+    BlockSubnetState,
+    SubnetCertificates,
+    SubnetCommitments,
+    SubnetNeurons,
+    SubnetValidators,
+)
+from pylon_commons.types import NetUid, Tempo, Timestamp
+from tenacity import AsyncRetrying
 
 from pylon_service.bittensor.client import AbstractBittensorClient
+from pylon_service.bittensor.exceptions import SubnetNotFound
 from pylon_service.bittensor.pool import BittensorClientPool
 
 from .adapter import RecentCacheAdapter
-from .context import AbstractContext, SubnetContext
+from .context import OPEN_ACCESS_PRIORITY, AbstractContext, SubnetContext
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +32,10 @@ class UpdateRecentObject[ModelT: BittensorModel, ContextT: AbstractContext](ABC)
     An abstract task for implementing tasks for updating recent objects.
     """
 
+    # Name of the kind of the objects, used to select the updaters in the settings, to identify the queued
+    # updates of a subnet and in the logs and metrics.
+    name: str
+
     def __init__(self, store: Store, pool: BittensorClientPool) -> None:
         self._store = store
         self._pool = pool
@@ -30,11 +45,43 @@ class UpdateRecentObject[ModelT: BittensorModel, ContextT: AbstractContext](ABC)
     def _model(self) -> type[ModelT]:
         pass
 
+    @property
+    def models(self) -> tuple[type[BittensorModel], ...]:
+        """
+        Models of all the objects saved by the task: its own model and the models of the derived objects.
+        """
+        return self._model, *self._derived_models
+
+    @property
+    def _derived_models(self) -> tuple[type[BittensorModel], ...]:
+        return ()
+
+    def _derive_objects(self, object_: ModelT) -> list[BittensorModel]:
+        """
+        Builds the objects of the derived models from the fetched object, so that they are saved without fetching
+        them separately.
+        """
+        return []
+
     @abstractmethod
-    async def _get_object(self, context: ContextT, client: AbstractBittensorClient) -> tuple[Timestamp, ModelT]:
-        pass
+    async def _get_object(self, context: ContextT, client: AbstractBittensorClient) -> tuple[Timestamp, ModelT | None]:
+        """
+        Fetches the object for the context. None means that there is no object to cache, e.g. the subnet
+        does not exist.
+        """
+
+    def fetch_key(self, context: ContextT) -> Hashable:
+        """
+        Identifies the data needed by the context. The object is fetched once for all the contexts with the same
+        fetch key, see execute. By default, every context needs its own fetch.
+        """
+        return context.build_key(self._model)
 
-    async def execute(self, context: ContextT) -> None:
+    async def execute(self, context: ContextT, *shared_contexts: ContextT) -> None:
+        """
+        Fetches the object for the context and saves it for the context and for the shared contexts, which must
+        have the same fetch key as the context.
+        """
         async with self._pool.acquire(wallet=context.wallet) as client:
             try:
                 timestamp, object_ = await self._get_object(context, client)
@@ -42,81 +89,244 @@ class UpdateRecentObject[ModelT: BittensorModel, ContextT: AbstractContext](ABC)
                 logger.exception(f"Failed to fetch recent object. object={self._model.__name__}, error: {e}")
                 raise
 
-        cache_key = context.build_key(self._model)
-        cache_adapter = RecentCacheAdapter(cache_key, self._store, self._model)
-        await cache_adapter.save(timestamp, object_)
+        if object_ is None:
+            logger.warning(f"Recent object not available upstream. context: {context}, object: {self._model.__name__}")
+            return
 
-        logger.info(f"Updated recent object. context: {context}, object: {self._model.__name__}")
+        for saved_object in (object_, *self._derive_objects(object_)):
+            model = type(saved_object)
+            data = saved_object.model_dump_json().encode()
+            for saved_context in (context, *shared_contexts):
+                cache_adapter = RecentCacheAdapter(saved_context.build_key(model), self._store, model)
+                await cache_adapter.save_raw(timestamp, data)
+                logger.info(f"Updated recent object. context: {saved_context}, object: {model.__name__}")
 
 
-class UpdateRecentNeurons(UpdateRecentObject[SubnetNeurons, SubnetContext]):
+class UpdateRecentSubnetObject[ModelT: BittensorModel](UpdateRecentObject[ModelT, SubnetContext]):
     """
-    Handles the update process for recent neurons within a subnet context.
+    An abstract task for updating recent objects of a subnet, fetched at the latest block.
+
+    The objects do not depend on the identity, so they are fetched once per subnet and saved for all the contexts
+    of the subnet. A subnet that does not exist has no objects; this is not a failure, as fetching them again
+    would not change it.
     """
 
-    @property
-    def _model(self) -> type[SubnetNeurons]:
-        return SubnetNeurons
+    def fetch_key(self, context: SubnetContext) -> Hashable:
+        return self._model, context.netuid
+
+    @abstractmethod
+    async def _get_subnet_object(
+        self, context: SubnetContext, client: AbstractBittensorClient, block: Block
+    ) -> ModelT | None:
+        pass
 
     async def _get_object(
         self,
         context: SubnetContext,
         client: AbstractBittensorClient,
-    ) -> tuple[Timestamp, SubnetNeurons]:
+    ) -> tuple[Timestamp, ModelT | None]:
         block = await client.get_latest_block()
         timestamp = await client.get_block_timestamp(block)
-        neurons = await client.get_neurons(context.netuid, block)
-        return timestamp, neurons
+        try:
+            object_ = await self._get_subnet_object(context, client, block)
+        except SubnetNotFound:
+            return timestamp, None
+        return timestamp, object_
+
+
+class UpdateRecentNeurons(UpdateRecentSubnetObject[SubnetNeurons]):
+    """
+    Handles the update process for recent neurons within a subnet context.
+    The validators are selected from the same neurons, so the metagraph is fetched once for both.
+    """
+
+    name = "neurons"
+
+    @property
+    def _model(self) -> type[SubnetNeurons]:
+        return SubnetNeurons
+
+    @property
+    def _derived_models(self) -> tuple[type[BittensorModel], ...]:
+        return (SubnetValidators,)
+
+    def _derive_objects(self, object_: SubnetNeurons) -> list[BittensorModel]:
+        return [AbstractBittensorClient.select_validators(object_)]
+
+    async def _get_subnet_object(
+        self, context: SubnetContext, client: AbstractBittensorClient, block: Block
+    ) -> SubnetNeurons:
+        return await client.get_neurons(context.netuid, block)
+
+
+class UpdateRecentCommitments(UpdateRecentSubnetObject[SubnetCommitments]):
+    """
+    Handles the update process for recent commitments within a subnet context.
+    """
+
+    name = "commitments"
+
+    @property
+    def _model(self) -> type[SubnetCommitments]:
+        return SubnetCommitments
+
+    async def _get_subnet_object(
+        self, context: SubnetContext, client: AbstractBittensorClient, block: Block
+    ) -> SubnetCommitments:
+        return await client.get_commitments(context.netuid, block)
+
+
+class UpdateRecentCertificates(UpdateRecentSubnetObject[SubnetCertificates]):
+    """
+    Handles the update process for recent certificates within a subnet context.
+    """
+
+    name = "certificates"
+
+    @property
+    def _model(self) -> type[SubnetCertificates]:
+        return SubnetCertificates
+
+    async def _get_subnet_object(
+        self, context: SubnetContext, client: AbstractBittensorClient, block: Block
+    ) -> SubnetCertificates:
+        certificates = await client.get_certificates(context.netuid, block)
+        return SubnetCertificates(block=block, certificates=certificates)
+
+
+class UpdateRecentHyperparams(UpdateRecentSubnetObject[BlockSubnetHyperparams]):
+    """
+    Handles the update process for recent hyperparameters within a subnet context.
+    The tempo of the subnet is recorded in the given tempos by netuid, if any, so that the refreshes follow
+    the epochs of the subnet.
+    """
+
+    name = "hyperparams"
+
+    def __init__(self, store: Store, pool: BittensorClientPool, tempos: dict[NetUid, Tempo] | None = None) -> None:
+        super().__init__(store, pool)
+        self._tempos = tempos
+
+    @property
+    def _model(self) -> type[BlockSubnetHyperparams]:
+        return BlockSubnetHyperparams
+
+    async def _get_subnet_object(
+        self, context: SubnetContext, client: AbstractBittensorClient, block: Block
+    ) -> BlockSubnetHyperparams | None:
+        hyperparams = await client.get_hyperparams(context.netuid, block)
+        if hyperparams is None:
+            return None
+        if self._tempos is not None and hyperparams.tempo is not None:
+            self._tempos[context.netuid] = hyperparams.tempo
+        return BlockSubnetHyperparams(block=block, hyperparams=hyperparams)
+
+
+class UpdateRecentSubnetState(UpdateRecentSubnetObject[BlockSubnetState]):
+    """
+    Handles the update process for recent subnet state within a subnet context.
+    """
+
+    name = "subnet_state"
+
+    @property
+    def _model(self) -> type[BlockSubnetState]:
+        return BlockSubnetState
+
+    async def _get_subnet_object(
+        self, context: SubnetContext, client: AbstractBittensorClient, block: Block
+    ) -> BlockSubnetState:
+        state = await client.get_subnet_state(context.netuid, block)
+        return BlockSubnetState(block=block, state=state)
+
+
+# Registry of the recent objects kept up to date by the scheduler. A single job drives all of them through
+# RecentObjectRefresher, for the kinds selected by name in the settings.
+RECENT_OBJECT_UPDATERS: tuple[type[UpdateRecentSubnetObject], ...] = (
+    UpdateRecentNeurons,
+    UpdateRecentCommitments,
+    UpdateRecentCertificates,
+    UpdateRecentHyperparams,
+    UpdateRecentSubnetState,
+)
 
 
 class RecentObjectUpdateTaskExecutor:
     """
     An executor class for executing UpdateRecentObject tasks with configured contexts.
-    This class implements batching and retrying strategies for updating recent objects.
-    """
+    The contexts that need the same data (see UpdateRecentObject.fetch_key) share a single fetch.
 
-    # for now, the object for all contexts is updated in parallel. later we can implement more
-    # sophisticated batching and retrying logic based on timeout.
+    A failed update is not retried by default: the executor is run by the refresher at the chain head cadence,
+    which runs it again at one of the next blocks (see RecentObjectRefresher), so the timeout is meant to be short,
+    about one block time, and a slow or failing upstream does not hold a worker for long.
+    """
 
     def __init__(
         self,
         updater: UpdateRecentObject,
         contexts: list[AbstractContext],
-        timeout: int,
+        timeout: float,
         retrying: AsyncRetrying | None = None,
     ) -> None:
-        if retrying is None:
-            lead_time = 10  # seconds before timeout.
-            retry_time = max(timeout - lead_time, 0)
-            retrying = AsyncRetrying(
-                wait=wait_exponential(multiplier=10, min=10, max=120),
-                stop=stop_before_delay(retry_time),
-                reraise=True,
-            )
-
         self._updater = updater
         self._contexts = contexts
+        self._context_groups = self._group_contexts(updater, contexts)
         self._timeout = timeout
         self._retrying = retrying
 
-    async def run(self) -> None:
-        tasks = [self.task(s) for s in self._contexts]
-        try:
-            async with asyncio.timeout(self._timeout):
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-        except TimeoutError:
-            logger.exception(
-                f"Timeout while waiting for UpdateRecentObject tasks to complete. "
-                f"task={self._updater.__class__.__name__}"
-            )
-            return
+    @staticmethod
+    def _group_contexts(updater: UpdateRecentObject, contexts: list[AbstractContext]) -> list[list[AbstractContext]]:
+        """
+        Groups the contexts by their fetch key, keeping the order of the contexts.
+        """
+        groups: dict[Hashable, list[AbstractContext]] = {}
+        for context in contexts:
+            groups.setdefault(updater.fetch_key(context), []).append(context)
+        return list(groups.values())
+
+    @property
+    def name(self) -> str:
+        return self._updater.name
+
+    @property
+    def models(self) -> tuple[type[BittensorModel], ...]:
+        return self._updater.models
+
+    @property
+    def priority(self) -> int:
+        """
+        Priority of the executor, which is the priority of its most important context.
+        """
+        return min((context.priority for context in self._contexts), default=OPEN_ACCESS_PRIORITY)
 
-        for context, result in zip(self._contexts, results):
-            if isinstance(result, BaseException):
+    async def run(self) -> bool:
+        """
+        Updates the objects of all the context groups. Returns whether all of them were updated.
+        """
+        tasks = [self.task(*contexts) for contexts in self._context_groups]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for contexts, result in zip(self._context_groups, results):
+            if isinstance(result, TimeoutError):
+                logger.error(
+                    f"Timeout while updating recent object. task={self._updater.__class__.__name__},"
+                    f" contexts: {', '.join(map(str, contexts))}"
+                )
+            elif isinstance(result, BaseException):
                 logger.exception(
                     f"Failed to update recent object. task={self._updater.__class__.__name__},"
-                    f" context: {context}, error: {result}"
+                    f" contexts: {', '.join(map(str, contexts))}, error: {result}"
                 )
+        return not any(isinstance(result, BaseException) for result in results)
 
-    async def task(self, context: AbstractContext) -> None:
-        await self._retrying.wraps(self._updater.execute)(context)
+    async def task(self, context: AbstractContext, *shared_contexts: AbstractContext) -> None:
+        """
+        Updates the object for the contexts within the executor timeout, retrying on failures if the executor
+        was given a retrying strategy. Each group of contexts has its own deadline, so a slow fetch does not cut
+        the others short.
+        """
+        async with asyncio.timeout(self._timeout):
+            if self._retrying is None:
+                await self._updater.execute(context, *shared_contexts)
+            else:
+                await self._retrying.wraps(self._updater.execute)(context, *shared_contexts)
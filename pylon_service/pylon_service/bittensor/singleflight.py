@@ -0,0 +1,42 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+from pylon_service.metrics import bittensor_coalesced_calls_total
+
+type CoalesceKey = tuple[str, *tuple[Hashable, ...]]
+
+
+class SingleFlight:
+    """
+    Deduplicates identical concurrent calls: while a call for a key is in flight, other callers with the same key
+    await the result of that call instead of starting a new one.
+
+    The shared call runs in a separate task and is shielded from the callers, so cancelling one of the callers
+    does not cancel the call for the others. Once the call finishes (successfully or not) the key is released
+    and the next caller starts a fresh call.
+    The first element of the key is the name of the operation, used as the metric label.
+    """
+
+    def __init__(self, uri: str = "") -> None:
+        self.uri = uri
+        self._in_flight: dict[CoalesceKey, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do[T](self, key: CoalesceKey, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done_task: self._release(key, done_task))
+        else:
+            bittensor_coalesced_calls_total.labels(operation=key[0], uri=self.uri).inc()
+        return await asyncio.shield(task)
+
+    def _release(self, key: CoalesceKey, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve the exception so that it is not reported as never retrieved when all the callers were cancelled.
+        if not task.cancelled():
+            task.exception()
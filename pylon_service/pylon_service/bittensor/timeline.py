@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import bisect
+import math
+from typing import TYPE_CHECKING, NamedTuple
+
+from pylon_commons.constants import BLOCK_PROCESSING_TIME
+from pylon_commons.models import Block
+from pylon_commons.types import BlockNumber, Timestamp
+
+from pylon_service.metrics import block_time_lookup_probes
+
+if TYPE_CHECKING:
+    from pylon_service.bittensor.cache import BlockIndex
+    from pylon_service.bittensor.client import AbstractBittensorClient
+
+
+class _Anchor(NamedTuple):
+    number: BlockNumber
+    timestamp: Timestamp
+
+
+class BlockTimeline:
+    """
+    Resolves wall-clock timestamps to blocks, i.e. finds the last block produced at or before the given time.
+
+    The block is found with an interpolation search between the closest blocks of known timestamps (anchors):
+    the first guess assumes one block every BLOCK_PROCESSING_TIME seconds before the chain head, the next ones
+    interpolate between the anchors, falling back to bisection when interpolation does not halve the range.
+    The timestamps of the finalized blocks never change, so every finalized block probed during a search becomes
+    an anchor, which makes the following searches around the same time nearly free. The anchors are seeded from
+    the block index, if given, so they survive restarts along with the index. At most max_anchors anchors are kept;
+    when the limit is exceeded every other anchor is dropped, which keeps the anchors spread over the whole chain.
+    The timeline is concurrency safe, but not thread safe.
+    """
+
+    def __init__(self, block_index: BlockIndex | None = None, max_anchors: int = 10_000) -> None:
+        """
+        Args:
+            block_index: Block index to seed the anchors from.
+            max_anchors: Maximum number of anchors held by the timeline.
+        """
+        self.max_anchors = max_anchors
+        self._numbers: list[BlockNumber] = []
+        self._timestamps: list[Timestamp] = []
+        if block_index is not None:
+            for number, timestamp in block_index.block_timestamps():
+                self._add_anchor(number, timestamp)
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    async def resolve(self, client: AbstractBittensorClient, timestamp: Timestamp) -> Block | None:
+        """
+        Returns the last block with the timestamp not later than the given one, or None if the timestamp is before
+        the first block or more than one block time after the chain head.
+        """
+        head = await client.get_latest_block()
+        head_timestamp = await client.get_block_timestamp(head)
+        finalized_number = (await client.get_finalized_block()).number
+        if timestamp >= head_timestamp:
+            return head if timestamp < head_timestamp + BLOCK_PROCESSING_TIME else None
+        probes = 0
+        try:
+            lower, upper = self._bracket(timestamp, _Anchor(head.number, head_timestamp))
+            step = max(math.ceil((upper.timestamp - timestamp) / BLOCK_PROCESSING_TIME), 1)
+            while lower is None:
+                if upper.number == 0:
+                    return None
+                probe = await self._probe(client, BlockNumber(max(upper.number - step, 0)), finalized_number)
+                probes += 1
+                if probe is None:
+                    return None
+                if probe.timestamp <= timestamp:
+                    lower = probe
+                else:
+                    upper = probe
+                    step *= 2
+            previous_span: int | None = None
+            while (span := upper.number - lower.number) > 1:
+                if previous_span is not None and span > previous_span // 2:
+                    guess = lower.number + span // 2
+                else:
+                    guess = lower.number + (timestamp - lower.timestamp) * span // (upper.timestamp - lower.timestamp)
+                guess = min(max(guess, lower.number + 1), upper.number - 1)
+                previous_span = span
+                probe = await self._probe(client, BlockNumber(guess), finalized_number)
+                probes += 1
+                if probe is None:
+                    return None
+                if probe.timestamp <= timestamp:
+                    lower = probe
+                else:
+                    upper = probe
+        finally:
+            block_time_lookup_probes.observe(probes)
+        return await client.get_block(lower.number)
+
+    def _bracket(self, timestamp: Timestamp, head: _Anchor) -> tuple[_Anchor | None, _Anchor]:
+        """
+        Returns the closest anchors around the timestamp: the lower one is not later than the timestamp, the upper one
+        is later than it. The head is the upper anchor when no anchor is later than the timestamp.
+        """
+        index = bisect.bisect_right(self._timestamps, timestamp)
+        lower = _Anchor(self._numbers[index - 1], self._timestamps[index - 1]) if index > 0 else None
+        upper = head
+        if index < len(self._numbers) and self._numbers[index] < head.number:
+            upper = _Anchor(self._numbers[index], self._timestamps[index])
+        return lower, upper
+
+    async def _probe(
+        self, client: AbstractBittensorClient, number: BlockNumber, finalized_number: BlockNumber
+    ) -> _Anchor | None:
+        block = await client.get_block(number)
+        if block is None:
+            return None
+        timestamp = await client.get_block_timestamp(block)
+        if number <= finalized_number:
+            self._add_anchor(number, timestamp)
+        return _Anchor(number, timestamp)
+
+    def _add_anchor(self, number: BlockNumber, timestamp: Timestamp) -> None:
+        index = bisect.bisect_left(self._numbers, number)
+        if index < len(self._numbers) and self._numbers[index] == number:
+            return
+        self._numbers.insert(index, number)
+        self._timestamps.insert(index, timestamp)
+        if len(self._numbers) > self.max_anchors:
+            self._numbers = self._numbers[::2]
+            self._timestamps = self._timestamps[::2]
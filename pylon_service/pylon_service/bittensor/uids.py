@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from pylon_commons.models import Block
+from pylon_commons.types import Hotkey, NetUid, NeuronUid
+
+if TYPE_CHECKING:
+    from pylon_service.bittensor.head import ChainHeadTracker
+
+
+class _IndexEntry(NamedTuple):
+    block: Block
+    hotkey_to_uid: dict[Hotkey, NeuronUid]
+
+
+class HotkeyUidIndex:
+    """
+    Hotkey to uid mapping of the subnets, shared by all the clients in the pool.
+
+    The mapping of a subnet is valid for the block it was built at: it is served until the chain head moves past
+    that block (a new block may contain a registration that reassigns a uid), then the clients are expected to
+    rebuild it and update the index. Without a head tracker the current head is not known, so the index never
+    serves a mapping.
+    """
+
+    def __init__(self, head_tracker: ChainHeadTracker | None = None) -> None:
+        self.head_tracker = head_tracker
+        self._entries: dict[NetUid, _IndexEntry] = {}
+
+    @property
+    def head(self) -> Block | None:
+        """
+        The current chain head or None if it is unknown.
+        """
+        return self.head_tracker.head if self.head_tracker is not None else None
+
+    def get(self, netuid: NetUid) -> dict[Hotkey, NeuronUid] | None:
+        """
+        Returns the mapping of the subnet built at the current chain head, or None if there is no such mapping.
+        """
+        entry = self._entries.get(netuid)
+        if entry is None or (head := self.head) is None:
+            return None
+        if entry.block.number < head.number:
+            return None
+        return entry.hotkey_to_uid
+
+    def update(self, netuid: NetUid, block: Block, hotkey_to_uid: dict[Hotkey, NeuronUid]) -> None:
+        """
+        Stores the mapping of the subnet built at the given block, unless a mapping for a newer block is stored.
+        """
+        entry = self._entries.get(netuid)
+        if entry is not None and entry.block.number > block.number:
+            return
+        self._entries[netuid] = _IndexEntry(block=block, hotkey_to_uid=hotkey_to_uid)
@@ -49,15 +49,22 @@ async def bt_client_open_access_dep[BtClient: AbstractBittensorClient](
 
 
 def _create_recent_object_provider(request: Request, context: AbstractContext) -> RecentObjectProvider:
+    refresher = None
+    if recent_objects_settings.stale_while_revalidate:
+        refresher = request.app.state.get("recent_object_refresher")
     return RecentObjectProvider(
         soft_limit=recent_objects_settings.soft_limit_blocks,
         hard_limit=recent_objects_settings.hard_limit_blocks,
         store=request.app.stores.get(StoreName.RECENT_OBJECTS),
         context=context,
+        refresher=refresher,
+        stale_grace=recent_objects_settings.stale_grace_blocks,
     )
 
 
 async def recent_object_provider_open_access_dep(netuid: NetUid, request: Request) -> RecentObjectProvider:
+    if recent_objects_settings.enroll_on_request and (refresher := request.app.state.get("recent_object_refresher")):
+        await refresher.enroll(netuid)
     return _create_recent_object_provider(request, SubnetContext(netuid))
 
 
@@ -1,8 +1,13 @@
 from litestar import Request, Response
+from litestar.exceptions import NotFoundException
 
-from pylon_service.bittensor.exceptions import ArchiveFallbackException
+from pylon_service.bittensor.exceptions import ArchiveFallbackException, SubnetNotFound
 from pylon_service.exceptions import BadGatewayException
 
 
 def archive_fallback_handler(_: Request, exc: ArchiveFallbackException) -> Response:
     raise BadGatewayException(detail=exc.detail)
+
+
+def subnet_not_found_handler(_: Request, exc: SubnetNotFound) -> Response:
+    raise NotFoundException(detail=exc.detail)
@@ -4,9 +4,25 @@ from contextlib import asynccontextmanager
 
 from litestar import Litestar
 
+from pylon_service.bittensor.cache import BlockIndex, BlockResultCache, SignedBlockCache
+from pylon_service.bittensor.client import TurboBtClient
+from pylon_service.bittensor.head import ChainHeadTracker
+from pylon_service.bittensor.hedging import HedgeDelays
+from pylon_service.bittensor.nodes import NodeHealthPolicy
 from pylon_service.bittensor.pool import BittensorClientPool
+from pylon_service.bittensor.timeline import BlockTimeline
+from pylon_service.bittensor.uids import HotkeyUidIndex
+from pylon_service.identities import identities
 from pylon_service.scheduler import create_scheduler
-from pylon_service.settings import settings
+from pylon_service.settings import (
+    block_cache_settings,
+    client_pool_settings,
+    connection_health_settings,
+    head_tracker_settings,
+    hedging_settings,
+    node_health_settings,
+    settings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +31,71 @@ logger = logging.getLogger(__name__)
 async def bittensor_client_pool(app: Litestar) -> AsyncGenerator[None]:
     """
     Lifespan for litestar app that creates an instance of BittensorClientPool so that endpoints may reuse
-    client instances.
+    client instances. All the clients in the pool share one chain head tracker, the block result
+    and signed block caches, the block index, the block timeline, one hotkey to uid index and the hedge delays.
+    The block index is loaded from and saved to its file, if configured. Reads of all the wallets are made
+    through the connections of the open access client. The clients of the open access and all the identities are
+    opened before the app starts serving, unless pre-warming is disabled. The head tracker is also kept in the app
+    state for the block-aligned response cache.
     """
     logger.debug("Initializing bittensor client pool.")
-    async with BittensorClientPool(
-        uri=settings.bittensor_network,
-        archive_uri=settings.bittensor_archive_network,
-        archive_blocks_cutoff=settings.bittensor_archive_blocks_cutoff,
-    ) as pool:
+    head_tracker = ChainHeadTracker(
+        TurboBtClient(wallet=None, uri=settings.bittensor_network),
+        poll_interval=head_tracker_settings.poll_interval_seconds,
+        max_age=head_tracker_settings.max_age_seconds,
+    )
+    block_index = BlockIndex(
+        max_entries=block_cache_settings.index_max_entries,
+        path=block_cache_settings.index_path,
+    )
+    block_index.load()
+    async with (
+        head_tracker,
+        BittensorClientPool(
+            shared_reads=True,
+            max_clients=client_pool_settings.max_clients,
+            idle_timeout=client_pool_settings.idle_timeout_seconds,
+            maintenance_interval=client_pool_settings.maintenance_interval_seconds,
+            uri=settings.bittensor_network,
+            archive_uri=settings.bittensor_archive_network,
+            archive_blocks_cutoff=settings.bittensor_archive_blocks_cutoff,
+            extra_uris=settings.bittensor_extra_networks,
+            extra_archive_uris=settings.bittensor_extra_archive_networks,
+            node_health_policy=NodeHealthPolicy(
+                max_error_rate=node_health_settings.max_error_rate,
+                max_head_lag_blocks=node_health_settings.max_head_lag_blocks,
+                ejection_seconds=node_health_settings.ejection_seconds,
+            ),
+            node_probe_interval=node_health_settings.probe_interval_seconds,
+            hedge_delays=HedgeDelays(
+                percentile=hedging_settings.percentile,
+                min_samples=hedging_settings.min_samples,
+                window_seconds=hedging_settings.window_seconds,
+                min_delay_seconds=hedging_settings.min_delay_seconds,
+            )
+            if hedging_settings.enabled
+            else None,
+            subclient_kwargs={
+                "columnar_neurons": settings.bittensor_columnar_neurons,
+                "uid_index": HotkeyUidIndex(head_tracker),
+                "signed_block_cache": SignedBlockCache(max_bytes=block_cache_settings.signed_blocks_max_bytes),
+                "health_check_interval": connection_health_settings.check_interval_seconds,
+                "health_check_timeout": connection_health_settings.check_timeout_seconds,
+            },
+            head_tracker=head_tracker,
+            result_cache=BlockResultCache(max_bytes=block_cache_settings.max_bytes),
+            block_index=block_index,
+            block_timeline=BlockTimeline(block_index),
+        ) as pool,
+    ):
+        if client_pool_settings.prewarm:
+            await pool.prewarm([None, *(identity.wallet for identity in identities.values())])
         app.state.bittensor_client_pool = pool
-        yield
+        app.state.chain_head_tracker = head_tracker
+        try:
+            yield
+        finally:
+            block_index.save()
 
 
 @asynccontextmanager
@@ -38,3 +109,5 @@ async def scheduler_lifespan(app: Litestar) -> AsyncGenerator[None]:
         yield
     finally:
         scheduler.shutdown()
+        if (refresher := app.state.get("recent_object_refresher")) is not None:
+            await refresher.close()
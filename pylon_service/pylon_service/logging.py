@@ -40,6 +40,8 @@ def litestar_logging_config():
         loggers={
             "pylon_service": {"level": "DEBUG", "handlers": ["console"], "propagate": False},
             "litestar": {"level": "INFO", "handlers": ["console"], "propagate": False},
+            # The recent objects job runs at the chain head cadence; logging every run would flood the output.
+            "apscheduler.executors": {"level": "WARNING", "handlers": ["console"], "propagate": False},
             "pylon_service.raw_logger": {
                 "level": "DEBUG",
                 "handlers": ["raw_console"],
@@ -6,9 +6,10 @@ from litestar.plugins.prometheus import PrometheusConfig
 from pylon_service import dependencies, lifespans
 from pylon_service.api._unstable.routers import unstable_router
 from pylon_service.api.v1.routers import v1_router
-from pylon_service.bittensor.exceptions import ArchiveFallbackException
-from pylon_service.exception_handlers import archive_fallback_handler
+from pylon_service.bittensor.exceptions import ArchiveFallbackException, SubnetNotFound
+from pylon_service.exception_handlers import archive_fallback_handler, subnet_not_found_handler
 from pylon_service.logging import litestar_logging_config
+from pylon_service.middleware.conditional_requests import ConditionalRequestMiddleware
 from pylon_service.middleware.request_id import RequestIdMiddleware
 from pylon_service.middleware.request_timeout import RequestTimeoutMiddleware
 from pylon_service.prometheus_controller import AuthenticatedPrometheusController
@@ -38,11 +39,19 @@ def create_app() -> Litestar:
             version="0.1.0",
             description="REST API for the bittensor-pylon service",
         ),
-        middleware=[RequestIdMiddleware, prometheus_config.middleware, RequestTimeoutMiddleware],
+        middleware=[
+            RequestIdMiddleware,
+            prometheus_config.middleware,
+            RequestTimeoutMiddleware,
+            ConditionalRequestMiddleware,
+        ],
         lifespan=[lifespans.bittensor_client_pool, lifespans.scheduler_lifespan],
         dependencies={"bt_client_pool": Provide(dependencies.bt_client_pool_dep, use_cache=True)},
         plugins=[PylonSchemaPlugin()],
-        exception_handlers={ArchiveFallbackException: archive_fallback_handler},
+        exception_handlers={
+            ArchiveFallbackException: archive_fallback_handler,
+            SubnetNotFound: subnet_not_found_handler,
+        },
         stores=stores,
         response_cache_config=response_cache_config,
         debug=settings.debug,
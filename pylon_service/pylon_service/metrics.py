@@ -10,7 +10,7 @@ from contextlib import asynccontextmanager
 from time import perf_counter
 from typing import Any, cast
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 from prometheus_client.metrics import MetricWrapperBase
 
 logger = logging.getLogger(__name__)
@@ -142,6 +142,213 @@ bittensor_fallback_total = Counter(
     ["reason", "operation", "hotkey"],
 )
 
+bittensor_coalesced_calls_total = Counter(
+    "pylon_bittensor_coalesced_calls_total",
+    """Total number of upstream calls that were not made because an identical call was already in flight.
+
+    Labels:
+        operation: Name of the upstream call (e.g., list_neurons, get_state).
+        uri: Bittensor network URI.
+    """,
+    ["operation", "uri"],
+)
+
+bittensor_connection_ping_seconds = Gauge(
+    "pylon_bittensor_connection_ping_seconds",
+    """Round trip of the last successful health check ping of an upstream connection in seconds.
+
+    Labels:
+        uri: Bittensor network URI.
+    """,
+    ["uri"],
+)
+
+bittensor_connection_recreations_total = Counter(
+    "pylon_bittensor_connection_recreations_total",
+    """Total number of upstream connections replaced with a fresh one.
+
+    Labels:
+        uri: Bittensor network URI.
+        reason: Reason for the recreation ("runtime_error" or "ping_failed").
+              See pylon_service.bittensor.client.RecreationReason for details.
+    """,
+    ["uri", "reason"],
+)
+
+bittensor_hedged_calls_total = Counter(
+    "pylon_bittensor_hedged_calls_total",
+    """Total number of upstream reads that were hedged, i.e. duplicated on another node after being slow.
+
+    Labels:
+        operation: Name of the operation (e.g., get_neurons, get_block).
+        winner: Call whose result was used ("primary", "hedge", or "none" when both failed).
+              See pylon_service.bittensor.hedging.HedgeWinner for details.
+    """,
+    ["operation", "winner"],
+)
+
+bittensor_node_selected_total = Counter(
+    "pylon_bittensor_node_selected_total",
+    """Total number of times an upstream node was selected to serve a request, out of a set of several nodes.
+
+    Labels:
+        uri: Bittensor network URI of the node.
+    """,
+    ["uri"],
+)
+
+bittensor_node_latency_seconds = Gauge(
+    "pylon_bittensor_node_latency_seconds",
+    """Rolling average of the health probe latency of an upstream node in seconds.
+
+    Labels:
+        uri: Bittensor network URI of the node.
+    """,
+    ["uri"],
+)
+
+bittensor_node_error_rate = Gauge(
+    "pylon_bittensor_node_error_rate",
+    """Rolling error rate (0 to 1) of the requests and health probes of an upstream node.
+
+    Labels:
+        uri: Bittensor network URI of the node.
+    """,
+    ["uri"],
+)
+
+bittensor_node_head_lag_blocks = Gauge(
+    "pylon_bittensor_node_head_lag_blocks",
+    """Number of blocks an upstream node is behind the best node of its node set.
+
+    Labels:
+        uri: Bittensor network URI of the node.
+    """,
+    ["uri"],
+)
+
+bittensor_node_ejected = Gauge(
+    "pylon_bittensor_node_ejected",
+    """Whether an upstream node is currently ejected from the request routing (1) or not (0).
+
+    Labels:
+        uri: Bittensor network URI of the node.
+    """,
+    ["uri"],
+)
+
+bittensor_node_ejections_total = Counter(
+    "pylon_bittensor_node_ejections_total",
+    """Total number of times an upstream node was ejected from the request routing.
+
+    Labels:
+        uri: Bittensor network URI of the node.
+        reason: Reason for the ejection ("error_rate" or "head_lag").
+    """,
+    ["uri", "reason"],
+)
+
+chain_head_block_number = Gauge(
+    "pylon_chain_head_block_number",
+    """Number of the chain head block known by the chain head tracker.""",
+)
+
+chain_finalized_block_number = Gauge(
+    "pylon_chain_finalized_block_number",
+    """Number of the last finalized block known by the chain head tracker.""",
+)
+
+block_cache_hits_total = Counter(
+    "pylon_block_cache_hits_total",
+    """Total number of block-scoped operation results served from the block result cache.
+
+    Labels:
+        operation: Name of the cached operation (e.g., get_neurons, get_commitments).
+    """,
+    ["operation"],
+)
+
+block_cache_misses_total = Counter(
+    "pylon_block_cache_misses_total",
+    """Total number of block result cache lookups that did not find a result.
+
+    Labels:
+        operation: Name of the cached operation (e.g., get_neurons, get_commitments).
+    """,
+    ["operation"],
+)
+
+block_cache_evictions_total = Counter(
+    "pylon_block_cache_evictions_total",
+    """Total number of results evicted from the block result cache due to the size limit.
+
+    Labels:
+        operation: Name of the operation whose result was evicted.
+    """,
+    ["operation"],
+)
+
+block_time_lookup_probes = Histogram(
+    "pylon_block_time_lookup_probes",
+    """Number of blocks probed by the upstream node to resolve a timestamp to a block.""",
+    buckets=(0, 1, 2, 4, 8, 16, 32),
+)
+
+# BittensorClientPool metrics
+bittensor_pool_acquire_duration = Histogram(
+    "pylon_bittensor_pool_acquire_duration_seconds",
+    """Time spent waiting for a client in BittensorClientPool.acquire, including opening a new client.""",
+    buckets=(0.001, 0.01, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+)
+
+bittensor_pool_client_open_duration = Histogram(
+    "pylon_bittensor_pool_client_open_duration_seconds",
+    """Duration of opening a new client of BittensorClientPool.
+
+    Labels:
+        status: Outcome of the opening ("success" or "error").
+    """,
+    ["status"],
+    buckets=(0.01, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+)
+
+bittensor_pool_clients_open = Gauge(
+    "pylon_bittensor_pool_clients_open",
+    """Number of open clients in BittensorClientPool.""",
+)
+
+bittensor_pool_clients_in_use = Gauge(
+    "pylon_bittensor_pool_clients_in_use",
+    """Number of clients currently acquired from BittensorClientPool.""",
+)
+
+bittensor_pool_evictions_total = Counter(
+    "pylon_bittensor_pool_evictions_total",
+    """Total number of clients closed and removed from BittensorClientPool.
+
+    Labels:
+        reason: Reason for the eviction ("idle" or "max_clients").
+    """,
+    ["reason"],
+)
+
+# Recent objects metrics
+recent_objects_queue_depth = Gauge(
+    "pylon_recent_objects_queue_depth",
+    """Number of recent object updates waiting to be run, including the ones delayed by the jitter.""",
+)
+
+recent_objects_refresh_lag = Histogram(
+    "pylon_recent_objects_refresh_lag_seconds",
+    """Time from a subnet becoming due for a refresh to the end of the update of its recent object.
+
+    Labels:
+        object: Name of the recent object (e.g., neurons, validators).
+    """,
+    ["object"],
+    buckets=(1.0, 5.0, 12.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0),
+)
+
 # ApplyWeights metrics
 apply_weights_job_duration = Histogram(
     "pylon_apply_weights_job_duration_seconds",
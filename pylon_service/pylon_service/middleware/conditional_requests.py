@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from litestar.datastructures import Headers, MutableScopeHeaders
+from litestar.handlers import HTTPRouteHandler
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+from litestar.types import ASGIApp, HTTPScope, Message, Receive, Scope, Send
+from pylon_commons.types import BlockNumber
+
+from pylon_service.api.caching import (
+    IMMUTABLE_CACHE_CONTROL,
+    IMMUTABLE_OPTION,
+    block_cache_key_builder,
+    etag_matches,
+    finalized_block,
+    make_etag,
+    request_chain_head,
+)
+
+_FINALIZED_VERSION = "finalized"
+
+
+class ConditionalRequestMiddleware:
+    """
+    ASGI middleware that tags the block-aligned responses with entity tags and answers the conditional requests.
+
+    Responses of the endpoints cached per chain head (see pylon_service.api.caching) are tagged with a tag derived
+    from the request and the hash of the chain head the request is served at, the same one the response is cached
+    under. Responses of the endpoints serving the data at the block given
+    by the block_number path parameter (marked with the immutable handler option) are tagged once the block is
+    finalized (not after the finalized block reported by the chain) and are marked as immutable, as they never change
+    afterwards.
+    A GET request whose If-None-Match header matches the tag gets a 304 Not Modified response, without the handler
+    being called.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or "route_handler" not in scope:
+            await self.app(scope, receive, send)
+            return
+
+        etag, cache_control = self._resolve_etag(scope)
+        if etag is None:
+            await self.app(scope, receive, send)
+            return
+
+        if etag_matches(Headers.from_scope(scope).get("if-none-match"), etag):
+            await self._send_not_modified(send, etag, cache_control)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == HTTP_200_OK:
+                headers = MutableScopeHeaders.from_message(message)
+                headers["etag"] = etag
+                if cache_control is not None:
+                    headers["cache-control"] = cache_control
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _resolve_etag(self, scope: HTTPScope) -> tuple[str | None, str | None]:
+        """
+        Returns the entity tag of the resource and the Cache-Control header value to send with it, if any.
+        """
+        route_handler = scope["route_handler"]
+        if not isinstance(route_handler, HTTPRouteHandler):
+            return None, None
+        path, query_string = scope["path"], scope["query_string"].decode()
+        if route_handler.cache_key_builder is block_cache_key_builder:
+            head = request_chain_head(scope)
+            return (make_etag(path, query_string, head.hash), None) if head is not None else (None, None)
+        # Litestar puts the parsed path parameters in the scope, but types them as strings.
+        raw_block_number = scope["path_params"].get("block_number")
+        if route_handler.opt.get(IMMUTABLE_OPTION) and raw_block_number is not None:
+            block_number = BlockNumber(int(raw_block_number))
+            finalized = finalized_block(scope["app"])
+            if finalized is not None and block_number <= finalized.number:
+                return make_etag(path, query_string, _FINALIZED_VERSION), IMMUTABLE_CACHE_CONTROL
+        return None, None
+
+    async def _send_not_modified(self, send: Send, etag: str, cache_control: str | None) -> None:
+        headers = [(b"etag", etag.encode())]
+        if cache_control is not None:
+            headers.append((b"cache-control", cache_control.encode()))
+        await send({"type": "http.response.start", "status": HTTP_304_NOT_MODIFIED, "headers": headers})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
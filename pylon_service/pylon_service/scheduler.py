@@ -12,17 +12,21 @@ import logging
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler, BaseScheduler
 from litestar import Litestar
-from pylon_commons.types import NetUid
+from pylon_commons.types import BlockNumber, NetUid, Tempo
 
+from pylon_service.api._unstable.utils import get_epoch_containing_block
 from pylon_service.bittensor.recent import (
-    AbstractContext,
+    RECENT_OBJECT_UPDATERS,
     IdentitySubnetContext,
+    RecentObjectRefresher,
     RecentObjectUpdateTaskExecutor,
+    RefreshTrigger,
     SubnetContext,
-    UpdateRecentNeurons,
+    UpdateRecentHyperparams,
+    UpdateRecentSubnetObject,
 )
 from pylon_service.identities import identities
-from pylon_service.settings import recent_objects_settings
+from pylon_service.settings import head_tracker_settings, recent_objects_settings, settings
 from pylon_service.stores import StoreName
 
 logger = logging.getLogger(__name__)
@@ -31,33 +35,82 @@ logger = logging.getLogger(__name__)
 _SCHEDULER: AsyncIOScheduler | None = None
 
 
-# this is a simple way to organize the job definition code. When we have more jobs, we can
-# move it to a separate module and think or more sophisticated way to organize them.
-def _add_recent_neurons_job(app: Litestar, scheduler: BaseScheduler):
-    contexts: list[AbstractContext] = []
-    netuids: set[NetUid] = set()
+def _recent_object_contexts() -> dict[NetUid, list[SubnetContext]]:
+    contexts: dict[NetUid, list[SubnetContext]] = {}
 
     # fetch for all identities for identity and open access.
     for identity in identities.values():
-        contexts.append(IdentitySubnetContext(identity.netuid, identity.wallet))
-        if identity.netuid not in netuids:
-            contexts.append(SubnetContext(identity.netuid))
-            netuids.add(identity.netuid)
+        netuid_contexts = contexts.setdefault(identity.netuid, [SubnetContext(identity.netuid)])
+        netuid_contexts.append(IdentitySubnetContext(identity.netuid, identity.wallet))
 
     # fetch for extra subnets specified in settings for open access.
     for netuid in recent_objects_settings.netuids:
-        if netuid not in netuids:
-            contexts.append(SubnetContext(netuid))
-
-    timeout = recent_objects_settings.update_interval_seconds
-    updater = UpdateRecentNeurons(app.stores.get(StoreName.RECENT_OBJECTS), app.state.bittensor_client_pool)
-    executor = RecentObjectUpdateTaskExecutor(updater, timeout=timeout, contexts=contexts)
+        contexts.setdefault(netuid, [SubnetContext(netuid)])
+
+    return contexts
+
+
+def _epoch_start(block_number: BlockNumber, netuid: NetUid, tempos: dict[NetUid, Tempo]) -> BlockNumber:
+    """
+    Returns the first block of the subnet's epoch containing the block, by the tempo of the subnet recorded when
+    its hyperparams were last fetched, or by the default tempo until they are.
+    """
+    return get_epoch_containing_block(block_number, netuid, tempos.get(netuid, settings.tempo)).start
+
+
+async def _subnet_exists(app: Litestar, netuid: NetUid) -> bool:
+    async with app.state.bittensor_client_pool.acquire(wallet=None) as client:
+        block = await client.get_latest_block()
+        return await client.get_hyperparams(netuid, block) is not None
+
+
+def _add_recent_objects_job(app: Litestar, scheduler: BaseScheduler) -> None:
+    """
+    Adds the job refreshing the recent objects of all the subnets. It runs at the chain head tracker cadence
+    and refreshes each subnet when its refresh trigger fires, see RefreshTrigger.
+    """
+    timeout = recent_objects_settings.update_timeout_seconds
+    store = app.stores.get(StoreName.RECENT_OBJECTS)
+    # Tempos of the subnets, recorded by the hyperparams updaters.
+    tempos: dict[NetUid, Tempo] = {}
+
+    def create_updater(updater_cls: type[UpdateRecentSubnetObject]) -> UpdateRecentSubnetObject:
+        if issubclass(updater_cls, UpdateRecentHyperparams):
+            return updater_cls(store, app.state.bittensor_client_pool, tempos=tempos)
+        return updater_cls(store, app.state.bittensor_client_pool)
+
+    def create_executors(contexts: list[SubnetContext]) -> list[RecentObjectUpdateTaskExecutor]:
+        return [
+            RecentObjectUpdateTaskExecutor(create_updater(updater_cls), timeout=timeout, contexts=list(contexts))
+            for updater_cls in RECENT_OBJECT_UPDATERS
+            if updater_cls.name in recent_objects_settings.kinds
+        ]
+
+    executors = {netuid: create_executors(contexts) for netuid, contexts in _recent_object_contexts().items()}
+    trigger = RefreshTrigger(
+        max_interval_blocks=recent_objects_settings.update_interval_blocks,
+        epoch_start=lambda block_number, netuid: _epoch_start(block_number, netuid, tempos),
+        default_policy=recent_objects_settings.refresh,
+        policies=recent_objects_settings.netuid_refresh,
+    )
+    refresher = RecentObjectRefresher(
+        executors,
+        trigger,
+        app.state.chain_head_tracker,
+        concurrency=recent_objects_settings.update_concurrency,
+        jitter_seconds=recent_objects_settings.refresh_jitter_seconds,
+        executor_factory=lambda netuid: create_executors([SubnetContext(netuid)]),
+        idle_timeout_seconds=recent_objects_settings.enrollment_idle_seconds,
+        max_enrolled_subnets=recent_objects_settings.max_enrolled_subnets,
+        subnet_exists=lambda netuid: _subnet_exists(app, netuid),
+    )
+    app.state.recent_object_refresher = refresher
 
     scheduler.add_job(
-        executor.run,
-        id="update_recent_neurons",
+        refresher.run,
+        id="refresh_recent_objects",
         trigger="interval",
-        seconds=recent_objects_settings.update_interval_seconds,
+        seconds=head_tracker_settings.poll_interval_seconds,
         next_run_time=dt.datetime.now(tz=dt.UTC),  # update immediately
     )
 
@@ -72,6 +125,6 @@ def create_scheduler(app: Litestar) -> AsyncIOScheduler:
     logger.info("Initializing scheduler.")
     _SCHEDULER = AsyncIOScheduler()
 
-    _add_recent_neurons_job(app, _SCHEDULER)
+    _add_recent_objects_job(app, _SCHEDULER)
 
     return _SCHEDULER
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Self
 
 from litestar.config.response_cache import ResponseCacheConfig
@@ -7,7 +8,8 @@ from pylon_commons.constants import BLOCK_PROCESSING_TIME
 from pylon_commons.settings import ENV_FILE, Settings
 from pylon_commons.types import NetUid
 
-from pylon_service.bittensor.recent import HardLimit, SoftLimit
+from pylon_service.api.caching import block_cache_response_filter
+from pylon_service.bittensor.recent import RECENT_OBJECT_UPDATERS, HardLimit, RefreshPolicy, SoftLimit
 
 
 class RecentObjectsSettings(BaseSettings):
@@ -19,6 +21,17 @@ class RecentObjectsSettings(BaseSettings):
     hard_limit_blocks: HardLimit = HardLimit(150)
     refresh_lead_blocks: int = 10
     netuids: list[NetUid] = Field(default_factory=list)
+    kinds: list[str] = Field(default_factory=lambda: [updater_cls.name for updater_cls in RECENT_OBJECT_UPDATERS])
+    refresh: RefreshPolicy = RefreshPolicy(epoch=True)
+    netuid_refresh: dict[NetUid, RefreshPolicy] = Field(default_factory=dict)
+    update_concurrency: int = Field(default=8, gt=0)
+    update_timeout_seconds: float = Field(default=BLOCK_PROCESSING_TIME, gt=0)
+    refresh_jitter_seconds: float = Field(default=BLOCK_PROCESSING_TIME, ge=0)
+    stale_while_revalidate: bool = False
+    stale_grace_blocks: int = Field(default=50, ge=0)
+    enroll_on_request: bool = False
+    enrollment_idle_seconds: float = Field(default=3600.0, gt=0)
+    max_enrolled_subnets: int | None = Field(default=32, gt=0)
 
     model_config = SettingsConfigDict(
         env_file=ENV_FILE,
@@ -33,19 +46,146 @@ class RecentObjectsSettings(BaseSettings):
             raise ValueError("hard_limit_blocks must be greater than soft_limit_blocks.")
         return self
 
+    @model_validator(mode="after")
+    def validate_kinds(self) -> Self:
+        known_kinds = {updater_cls.name for updater_cls in RECENT_OBJECT_UPDATERS}
+        if unknown_kinds := set(self.kinds) - known_kinds:
+            raise ValueError(
+                f"Unknown recent object kinds: {', '.join(sorted(unknown_kinds))}. "
+                f"Known kinds: {', '.join(sorted(known_kinds))}."
+            )
+        return self
+
     @property
-    def update_interval_seconds(self) -> int:
+    def update_interval_blocks(self) -> int:
         """
-        Calculate the update interval as (soft_limit - refresh_lead) blocks.
+        Calculate the maximum update interval as (soft_limit - refresh_lead) blocks.
         This ensures the cache is updated before reaching the soft limit.
         """
-        interval_blocks = max(self.soft_limit_blocks - self.refresh_lead_blocks, 1)
-        return interval_blocks * BLOCK_PROCESSING_TIME
+        return max(self.soft_limit_blocks - self.refresh_lead_blocks, 1)
+
+    @property
+    def update_interval_seconds(self) -> int:
+        return self.update_interval_blocks * BLOCK_PROCESSING_TIME
+
+
+class HeadTrackerSettings(BaseSettings):
+    """
+    Settings for the chain head tracker shared by all the bittensor clients.
+    """
+
+    # Half a block time: a new block is seen at most half a block late, with a few RPCs per poll. The recent objects
+    # refresh job runs at the same interval.
+    poll_interval_seconds: float = BLOCK_PROCESSING_TIME / 2
+    max_age_seconds: float = 2 * BLOCK_PROCESSING_TIME
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_prefix="PYLON_HEAD_TRACKER_",
+        extra="ignore",
+    )
+
+
+class BlockCacheSettings(BaseSettings):
+    """
+    Settings for the cache of the historical query results for the finalized blocks, the cache of signed blocks
+    and the block number to hash and timestamp index.
+    """
+
+    max_bytes: int = 128 * 1024 * 1024
+    signed_blocks_max_bytes: int = 64 * 1024 * 1024
+    index_max_entries: int = 100_000
+    index_path: Path | None = None
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_prefix="PYLON_BLOCK_CACHE_",
+        extra="ignore",
+    )
+
+
+class NodeHealthSettings(BaseSettings):
+    """
+    Settings for the health scoring and the ejection of the upstream nodes, used when there are several nodes.
+    """
+
+    probe_interval_seconds: float = BLOCK_PROCESSING_TIME
+    max_error_rate: float = 0.5
+    max_head_lag_blocks: int = 3
+    ejection_seconds: float = 30.0
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_prefix="PYLON_NODE_HEALTH_",
+        extra="ignore",
+    )
+
+
+class HedgingSettings(BaseSettings):
+    """
+    Settings for hedging the slow upstream reads on another node; requires extra nodes to be configured.
+    """
+
+    enabled: bool = False
+    percentile: float = Field(default=0.95, gt=0, lt=1)
+    min_samples: int = 20
+    window_seconds: float = 60.0
+    min_delay_seconds: float = 0.05
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_prefix="PYLON_HEDGING_",
+        extra="ignore",
+    )
+
+
+class ClientPoolSettings(BaseSettings):
+    """
+    Settings for the bittensor client pool: pre-warming, size bound, idle eviction and keepalive pings.
+    """
+
+    prewarm: bool = True
+    max_clients: int | None = None
+    idle_timeout_seconds: float | None = None
+    maintenance_interval_seconds: float | None = 30.0
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_prefix="PYLON_CLIENT_POOL_",
+        extra="ignore",
+    )
+
+
+class ConnectionHealthSettings(BaseSettings):
+    """
+    Settings for the background health checks of the upstream connections.
+    """
+
+    check_interval_seconds: float | None = 10.0
+    check_timeout_seconds: float = 5.0
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_prefix="PYLON_CONNECTION_HEALTH_",
+        extra="ignore",
+    )
 
 
 recent_objects_settings = RecentObjectsSettings()
+head_tracker_settings = HeadTrackerSettings()
+block_cache_settings = BlockCacheSettings()
+node_health_settings = NodeHealthSettings()
+hedging_settings = HedgingSettings()
+client_pool_settings = ClientPoolSettings()
+connection_health_settings = ConnectionHealthSettings()
 
-# Default cache config. Only used for endpoints with explicit @handler(..., cache=...)
-response_cache_config = ResponseCacheConfig()
+# Default cache config. Only used for endpoints with explicit @handler(..., cache=...) or @handler(..., block_cached=True)
+response_cache_config = ResponseCacheConfig(cache_response_filter=block_cache_response_filter)
 
 settings = Settings()  # type: ignore
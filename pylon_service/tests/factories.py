@@ -8,6 +8,7 @@ from pylon_commons.models import (
     Block,
     Extrinsic,
     Neuron,
+    SubnetState,
 )
 
 
@@ -37,3 +38,7 @@ class NeuronFactory(PylonModelFactory[Neuron]):
 class ExtrinsicFactory(PylonModelFactory[Extrinsic]):
     __check_model__ = True
     __allow_none_optionals__ = False
+
+
+class SubnetStateFactory(PylonModelFactory[SubnetState]):
+    __check_model__ = True
@@ -136,10 +136,21 @@ class MockBittensorClient(AbstractBittensorClient):
         self.calls["get_latest_block"].append(())
         return await self._execute_behavior("get_latest_block")
 
+    async def get_finalized_block(self) -> Block:
+        """
+        Get the last finalized block.
+        """
+        self.calls["get_finalized_block"].append(())
+        return await self._execute_behavior("get_finalized_block")
+
     async def get_block_timestamp(self, block: Block) -> Timestamp:
         self.calls["get_block_timestamp"].append((block,))
         return await self._execute_behavior("get_block_timestamp", block)
 
+    async def get_block_at(self, timestamp: Timestamp) -> Block | None:
+        self.calls["get_block_at"].append((timestamp,))
+        return await self._execute_behavior("get_block_at", timestamp)
+
     async def get_neurons_list(self, netuid: NetUid, block: Block) -> list[Neuron]:
         """
         Get neurons for a subnet.
@@ -245,3 +256,10 @@ class MockBittensorClient(AbstractBittensorClient):
         """
         self.calls["get_extrinsic"].append((block, extrinsic_index))
         return await self._execute_behavior("get_extrinsic", block, extrinsic_index)
+
+    async def get_extrinsics(self, block: Block) -> list[Extrinsic] | None:
+        """
+        Get all the decoded extrinsics from a block.
+        """
+        self.calls["get_extrinsics"].append((block,))
+        return await self._execute_behavior("get_extrinsics", block)
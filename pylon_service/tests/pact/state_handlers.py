@@ -131,8 +131,8 @@ class RecentNeuronsExistHandler(StateHandler):
         neurons = NeuronFactory.batch(parameters.get("neuron_count", 1))
         subnet_neurons = SubnetNeurons(block=block, neurons={n.hotkey: n for n in neurons})
 
-        cache_entry = _CacheEntry(data=subnet_neurons.model_dump_json(), timestamp=Timestamp(int(time.time())))
-        self.mock_stores[StoreName.RECENT_OBJECTS].behave.add_behavior("get", cache_entry.model_dump_json().encode())
+        cache_entry = _CacheEntry(data=subnet_neurons.model_dump_json().encode(), timestamp=Timestamp(int(time.time())))
+        self.mock_stores[StoreName.RECENT_OBJECTS].behave.add_behavior("get", cache_entry.encode())
 
 
 class ValidatorsExistHandler(StateHandler):
@@ -239,6 +239,18 @@ class ExtrinsicExistsHandler(StateHandler):
         client.add_behavior("get_extrinsic", extrinsic)
 
 
+class ExtrinsicsExistHandler(StateHandler):
+    name = "extrinsics exist"
+
+    def setup(self, parameters: dict[str, Any]) -> None:
+        block = BlockFactory.build(number=parameters["block_number"])
+        extrinsic = ExtrinsicFactory.build(block_number=parameters["block_number"])
+
+        client = self._get_client(parameters)
+        client.add_behavior("get_block", block)
+        client.add_behavior("get_extrinsics", [extrinsic])
+
+
 class WeightsCanBeSetHandler(StateHandler):
     name = "weights can be set"
 
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from litestar.stores.base import Store
 from pylon_commons.models import BittensorModel
@@ -52,11 +54,21 @@ def executor(update_task, context) -> RecentObjectUpdateTaskExecutor:
 @pytest.mark.asyncio
 async def test_executor_failed(executor, update_task, open_access_mock_bt_client, context):
     async with update_task.behave.mock(_get_object=[Exception("error"), Exception("error"), Exception("error")]):
-        await executor.run()
+        assert await executor.run() is False
 
     assert update_task.behave.calls["_get_object"] == [(context, open_access_mock_bt_client)] * 3
 
 
+@pytest.mark.asyncio
+async def test_executor_does_not_retry_by_default(update_task, open_access_mock_bt_client, context):
+    executor = RecentObjectUpdateTaskExecutor(update_task, timeout=12, contexts=[context])
+
+    async with update_task.behave.mock(_get_object=[Exception("error")]):
+        assert await executor.run() is False
+
+    assert update_task.behave.calls["_get_object"] == [(context, open_access_mock_bt_client)]
+
+
 @pytest.mark.asyncio
 async def test_executor_success_after_attempt(
     executor,
@@ -71,9 +83,28 @@ async def test_executor_success_after_attempt(
         update_task.behave.mock(_get_object=[Exception("error"), (Timestamp(123123123), object_)]),
         mock_recent_objects_store.behave.mock(set=[None]),
     ):
-        await executor.run()
+        assert await executor.run() is True
 
-    data = _CacheEntry(data=object_.model_dump_json(), timestamp=Timestamp(123123123)).model_dump_json()
+    data = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=Timestamp(123123123)).encode()
 
     assert update_task.behave.calls["_get_object"] == [(context, open_access_mock_bt_client)] * 2
     assert mock_recent_objects_store.behave.calls["set"] == [(CacheKey(AnObjectModel, NetUid(1), None), data, None)]
+
+
+@pytest.mark.asyncio
+async def test_executor_timeout_is_per_context(update_task, mock_recent_objects_store):
+    contexts: list[AbstractContext] = [SubnetContext(NetUid(1)), SubnetContext(NetUid(2))]
+    retrying = AsyncRetrying(stop=stop_after_attempt(1), reraise=True)
+    executor = RecentObjectUpdateTaskExecutor(update_task, timeout=0.05, retrying=retrying, contexts=contexts)  # type: ignore[arg-type]
+    object_ = AnObjectModel(field_1="foo", field_2=123)
+
+    async with (
+        update_task.behave.mock(
+            _get_object=[lambda context, client: asyncio.sleep(1), (Timestamp(123123123), object_)]
+        ),
+        mock_recent_objects_store.behave.mock(set=[None]),
+    ):
+        await executor.run()
+
+    data = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=Timestamp(123123123)).encode()
+    assert mock_recent_objects_store.behave.calls["set"] == [(CacheKey(AnObjectModel, NetUid(2), None), data, None)]
@@ -1,7 +1,8 @@
 import pytest
-from pylon_commons.models import SubnetNeurons
+from pylon_commons.models import SubnetNeurons, SubnetValidators
 from pylon_commons.types import NetUid, Timestamp
 
+from pylon_service.bittensor.client import AbstractBittensorClient
 from pylon_service.bittensor.recent import SubnetContext, UpdateRecentNeurons
 from pylon_service.bittensor.recent.adapter import CacheKey, _CacheEntry
 
@@ -30,13 +31,19 @@ async def test_execute(
             get_block_timestamp=[timestamp],
             get_neurons=[neurons],
         ),
-        mock_recent_objects_store.behave.mock(set=[None]),
+        mock_recent_objects_store.behave.mock(set=[None, None]),
     ):
         await update_task.execute(context)
 
-    data = _CacheEntry(data=neurons.model_dump_json(), timestamp=timestamp).model_dump_json()
+    data = _CacheEntry(data=neurons.model_dump_json().encode(), timestamp=timestamp).encode()
+    validators = AbstractBittensorClient.select_validators(neurons)
+    validators_data = _CacheEntry(data=validators.model_dump_json().encode(), timestamp=timestamp).encode()
 
     assert open_access_mock_bt_client.calls["get_latest_block"] == [()]
     assert open_access_mock_bt_client.calls["get_block_timestamp"] == [(block,)]
     assert open_access_mock_bt_client.calls["get_neurons"] == [(NetUid(1), block)]
-    assert mock_recent_objects_store.behave.calls["set"] == [(CacheKey(SubnetNeurons, NetUid(1), None), data, None)]
+    assert mock_recent_objects_store.behave.calls["set"] == [
+        (CacheKey(SubnetNeurons, NetUid(1), None), data, None),
+        (CacheKey(SubnetValidators, NetUid(1), None), validators_data, None),
+    ]
+    assert update_task.models == (SubnetNeurons, SubnetValidators)
@@ -50,5 +50,5 @@ async def test_execute(mock_recent_objects_store, update_task, object_):
     async with mock_recent_objects_store.behave.mock(set=[None]):
         await update_task.execute(context)
 
-    data = _CacheEntry(data=object_.model_dump_json(), timestamp=Timestamp(123123123)).model_dump_json()
+    data = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=Timestamp(123123123)).encode()
     assert mock_recent_objects_store.behave.calls["set"] == [(CacheKey(AnObjectModel, NetUid(1), None), data, None)]
@@ -0,0 +1,190 @@
+import pytest
+from pylon_commons.models import (
+    BlockSubnetHyperparams,
+    BlockSubnetState,
+    CertificateAlgorithm,
+    NeuronCertificate,
+    SubnetCertificates,
+    SubnetHyperparams,
+    SubnetNeurons,
+    SubnetValidators,
+)
+from pylon_commons.types import Hotkey, HotkeyName, MaxWeightsLimit, NetUid, PublicKey, Tempo, Timestamp
+
+from pylon_service.bittensor.exceptions import SubnetNotFound
+from pylon_service.bittensor.recent import (
+    RECENT_OBJECT_UPDATERS,
+    IdentitySubnetContext,
+    RecentObjectUpdateTaskExecutor,
+    SubnetContext,
+    UpdateRecentCertificates,
+    UpdateRecentHyperparams,
+    UpdateRecentNeurons,
+    UpdateRecentSubnetState,
+)
+from pylon_service.bittensor.recent.adapter import CacheKey, _CacheEntry
+from tests.factories import SubnetStateFactory
+
+TIMESTAMP = Timestamp(123123123)
+
+
+def test_recent_object_updaters_have_unique_names():
+    names = [updater_cls.name for updater_cls in RECENT_OBJECT_UPDATERS]
+    assert len(names) == len(set(names))
+
+
+@pytest.mark.asyncio
+async def test_update_recent_neurons_and_validators_once_per_subnet(
+    mock_recent_objects_store, mock_bt_client_pool, open_access_mock_bt_client, block_factory, neuron_factory, wallet
+):
+    block = block_factory.build()
+    neurons = SubnetNeurons(block=block, neurons={neuron.hotkey: neuron for neuron in neuron_factory.batch(3)})
+    updater = UpdateRecentNeurons(mock_recent_objects_store, mock_bt_client_pool)
+    contexts = [SubnetContext(NetUid(1)), IdentitySubnetContext(NetUid(1), wallet), SubnetContext(NetUid(2))]
+    executor = RecentObjectUpdateTaskExecutor(updater, contexts=contexts, timeout=12)
+
+    async with (
+        open_access_mock_bt_client.mock_behavior(
+            get_latest_block=[block, block],
+            get_block_timestamp=[TIMESTAMP, TIMESTAMP],
+            get_neurons=[neurons, neurons],
+        ),
+        mock_recent_objects_store.behave.mock(set=[None] * 6),
+    ):
+        await executor.run()
+
+    validators = SubnetValidators(
+        block=block,
+        validators=sorted(
+            (neuron for neuron in neurons.neurons.values() if neuron.validator_permit),
+            key=lambda neuron: neuron.stakes.total,
+            reverse=True,
+        ),
+    )
+    keys = [(NetUid(1), None), (NetUid(1), HotkeyName(wallet.hotkey_str)), (NetUid(2), None)]
+    expected_sets = [
+        (
+            CacheKey(model, netuid, hotkey_name),
+            _CacheEntry(data=object_.model_dump_json().encode(), timestamp=TIMESTAMP).encode(),
+            None,
+        )
+        for model, object_ in ((SubnetNeurons, neurons), (SubnetValidators, validators))
+        for netuid, hotkey_name in keys
+    ]
+    assert sorted(open_access_mock_bt_client.calls["get_neurons"]) == [(NetUid(1), block), (NetUid(2), block)]
+    assert open_access_mock_bt_client.calls["get_validators"] == []
+    assert sorted(mock_recent_objects_store.behave.calls["set"]) == sorted(expected_sets)
+
+
+@pytest.mark.asyncio
+async def test_update_recent_certificates(
+    mock_recent_objects_store, mock_bt_client_pool, open_access_mock_bt_client, block_factory
+):
+    block = block_factory.build()
+    certificates = {
+        Hotkey("hotkey1"): NeuronCertificate(algorithm=CertificateAlgorithm.ED25519, public_key=PublicKey("0xabc"))
+    }
+
+    async with (
+        open_access_mock_bt_client.mock_behavior(
+            get_latest_block=[block], get_block_timestamp=[TIMESTAMP], get_certificates=[certificates]
+        ),
+        mock_recent_objects_store.behave.mock(set=[None]),
+    ):
+        await UpdateRecentCertificates(mock_recent_objects_store, mock_bt_client_pool).execute(SubnetContext(NetUid(1)))
+
+    expected = SubnetCertificates(block=block, certificates=certificates)
+    data = _CacheEntry(data=expected.model_dump_json().encode(), timestamp=TIMESTAMP).encode()
+    assert mock_recent_objects_store.behave.calls["set"] == [
+        (CacheKey(SubnetCertificates, NetUid(1), None), data, None)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_recent_hyperparams(
+    mock_recent_objects_store, mock_bt_client_pool, open_access_mock_bt_client, block_factory
+):
+    block = block_factory.build()
+    hyperparams = SubnetHyperparams(max_weights_limit=MaxWeightsLimit(100))
+
+    async with (
+        open_access_mock_bt_client.mock_behavior(
+            get_latest_block=[block], get_block_timestamp=[TIMESTAMP], get_hyperparams=[hyperparams]
+        ),
+        mock_recent_objects_store.behave.mock(set=[None]),
+    ):
+        await UpdateRecentHyperparams(mock_recent_objects_store, mock_bt_client_pool).execute(SubnetContext(NetUid(1)))
+
+    expected = BlockSubnetHyperparams(block=block, hyperparams=hyperparams)
+    data = _CacheEntry(data=expected.model_dump_json().encode(), timestamp=TIMESTAMP).encode()
+    assert mock_recent_objects_store.behave.calls["set"] == [
+        (CacheKey(BlockSubnetHyperparams, NetUid(1), None), data, None)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_recent_hyperparams_records_tempo(
+    mock_recent_objects_store, mock_bt_client_pool, open_access_mock_bt_client, block_factory
+):
+    block = block_factory.build()
+    tempos = {NetUid(2): Tempo(99)}
+
+    async with (
+        open_access_mock_bt_client.mock_behavior(
+            get_latest_block=[block],
+            get_block_timestamp=[TIMESTAMP],
+            get_hyperparams=[SubnetHyperparams(tempo=Tempo(100))],
+        ),
+        mock_recent_objects_store.behave.mock(set=[None]),
+    ):
+        await UpdateRecentHyperparams(mock_recent_objects_store, mock_bt_client_pool, tempos=tempos).execute(
+            SubnetContext(NetUid(1))
+        )
+
+    assert tempos == {NetUid(1): Tempo(100), NetUid(2): Tempo(99)}
+
+
+@pytest.mark.asyncio
+async def test_update_recent_hyperparams_skips_missing_subnet(
+    mock_recent_objects_store, mock_bt_client_pool, open_access_mock_bt_client, block_factory
+):
+    async with open_access_mock_bt_client.mock_behavior(
+        get_latest_block=[block_factory.build()], get_block_timestamp=[TIMESTAMP], get_hyperparams=[None]
+    ):
+        await UpdateRecentHyperparams(mock_recent_objects_store, mock_bt_client_pool).execute(SubnetContext(NetUid(1)))
+
+    assert mock_recent_objects_store.behave.calls["set"] == []
+
+
+@pytest.mark.asyncio
+async def test_update_recent_subnet_state(
+    mock_recent_objects_store, mock_bt_client_pool, open_access_mock_bt_client, block_factory
+):
+    block = block_factory.build()
+    state = SubnetStateFactory.build()
+
+    async with (
+        open_access_mock_bt_client.mock_behavior(
+            get_latest_block=[block], get_block_timestamp=[TIMESTAMP], get_subnet_state=[state]
+        ),
+        mock_recent_objects_store.behave.mock(set=[None]),
+    ):
+        await UpdateRecentSubnetState(mock_recent_objects_store, mock_bt_client_pool).execute(SubnetContext(NetUid(1)))
+
+    expected = BlockSubnetState(block=block, state=state)
+    data = _CacheEntry(data=expected.model_dump_json().encode(), timestamp=TIMESTAMP).encode()
+    assert mock_recent_objects_store.behave.calls["set"] == [(CacheKey(BlockSubnetState, NetUid(1), None), data, None)]
+
+
+@pytest.mark.asyncio
+async def test_update_recent_subnet_state_skips_missing_subnet(
+    mock_recent_objects_store, mock_bt_client_pool, open_access_mock_bt_client, block_factory
+):
+    async with open_access_mock_bt_client.mock_behavior(
+        get_latest_block=[block_factory.build()],
+        get_block_timestamp=[TIMESTAMP],
+        get_subnet_state=[SubnetNotFound(detail="Subnet 1 does not exist at block 1.")],
+    ):
+        await UpdateRecentSubnetState(mock_recent_objects_store, mock_bt_client_pool).execute(SubnetContext(NetUid(1)))
+
+    assert mock_recent_objects_store.behave.calls["set"] == []
@@ -29,12 +29,12 @@ def cache_adapter(cache_key, mock_recent_objects_store) -> RecentCacheAdapter[An
 @pytest.mark.asyncio
 async def test_save(mock_recent_objects_store, cache_adapter, object_, cache_key) -> None:
     timestamp = Timestamp(123123123)
-    cache_entry = _CacheEntry(data=object_.model_dump_json(), timestamp=timestamp)
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
     async with mock_recent_objects_store.behave.mock(set=[None]):
         result = await cache_adapter.save(timestamp, object_)
         assert result is None
 
-    assert mock_recent_objects_store.behave.calls["set"] == [(cache_key, cache_entry.model_dump_json(), None)]
+    assert mock_recent_objects_store.behave.calls["set"] == [(cache_key, cache_entry.encode(), None)]
 
 
 @pytest.mark.asyncio
@@ -48,9 +48,36 @@ async def test_get_missing(mock_recent_objects_store, cache_adapter, cache_key)
 
 @pytest.mark.asyncio
 async def test_get_success(mock_recent_objects_store, cache_adapter, object_, cache_key) -> None:
-    cache_entry = _CacheEntry(data=object_.model_dump_json(), timestamp=Timestamp(123123123))
-    async with mock_recent_objects_store.behave.mock(get=[cache_entry.model_dump_json().encode()]):
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=Timestamp(123123123))
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
         result = await cache_adapter.get()
         assert result == (Timestamp(123123123), object_)
 
     assert mock_recent_objects_store.behave.calls["get"] == [(cache_key, None)]
+
+
+@pytest.mark.asyncio
+async def test_get_raw_success(mock_recent_objects_store, cache_adapter, object_, cache_key) -> None:
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=Timestamp(123123123))
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
+        result = await cache_adapter.get_raw()
+        assert result == (Timestamp(123123123), object_.model_dump_json().encode())
+
+    assert mock_recent_objects_store.behave.calls["get"] == [(cache_key, None)]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        pytest.param(b'{"field_1": "test", "field_2": 123}', id="no_timestamp"),
+        pytest.param(b'abc\n{"field_1": "test", "field_2": 123}', id="invalid_timestamp"),
+        pytest.param(b'123123123\n{"field_1": "test"}', id="invalid_object"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_invalid(mock_recent_objects_store, cache_adapter, cache_key, raw) -> None:
+    async with mock_recent_objects_store.behave.mock(get=[raw], delete=[None]):
+        result = await cache_adapter.get()
+        assert result is None
+
+    assert mock_recent_objects_store.behave.calls["delete"] == [(cache_key,)]
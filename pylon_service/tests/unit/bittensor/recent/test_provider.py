@@ -53,8 +53,8 @@ async def test_get_missing(mock_recent_objects_store, recent_object_provider, ca
 @pytest.mark.asyncio
 async def test_get_stale(mock_recent_objects_store, recent_object_provider, object_, cache_key):
     timestamp = Timestamp(int(dt.datetime.now().timestamp()) - BLOCK_PROCESSING_TIME * 5)
-    cache_entry = _CacheEntry(data=object_.model_dump_json(), timestamp=timestamp)
-    async with mock_recent_objects_store.behave.mock(get=[cache_entry.model_dump_json().encode()]):
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
         with pytest.raises(RecentObjectStale):
             await recent_object_provider.get(AnObjectModel)
 
@@ -64,9 +64,87 @@ async def test_get_stale(mock_recent_objects_store, recent_object_provider, obje
 @pytest.mark.asyncio
 async def test_get_success(mock_recent_objects_store, recent_object_provider, object_, cache_key):
     timestamp = Timestamp(int(dt.datetime.now().timestamp()))
-    cache_entry = _CacheEntry(data=object_.model_dump_json(), timestamp=timestamp)
-    async with mock_recent_objects_store.behave.mock(get=[cache_entry.model_dump_json().encode()]):
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
         result = await recent_object_provider.get(AnObjectModel)
         assert result == object_
 
     assert mock_recent_objects_store.behave.calls["get"] == [(cache_key, None)]
+
+
+@pytest.mark.asyncio
+async def test_get_raw_success(mock_recent_objects_store, recent_object_provider, object_, cache_key):
+    timestamp = Timestamp(int(dt.datetime.now().timestamp()))
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
+        result = await recent_object_provider.get_raw(AnObjectModel)
+        assert result == (timestamp, object_.model_dump_json().encode())
+
+    assert mock_recent_objects_store.behave.calls["get"] == [(cache_key, None)]
+
+
+@pytest.mark.asyncio
+async def test_get_raw_stale(mock_recent_objects_store, recent_object_provider, object_):
+    timestamp = Timestamp(int(dt.datetime.now().timestamp()) - BLOCK_PROCESSING_TIME * 5)
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
+        with pytest.raises(RecentObjectStale):
+            await recent_object_provider.get_raw(AnObjectModel)
+
+
+class Refresher:
+    def __init__(self) -> None:
+        self.requests: list[tuple] = []
+
+    def request_refresh(self, context, model) -> None:
+        self.requests.append((context, model))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "blocks_ago,refreshed",
+    [
+        pytest.param(0, False, id="fresh"),
+        pytest.param(3, True, id="older_than_soft_limit"),
+        pytest.param(6, True, id="within_grace_period"),
+    ],
+)
+async def test_get_stale_while_revalidate(mock_recent_objects_store, object_, wallet, blocks_ago, refreshed):
+    refresher = Refresher()
+    context = IdentitySubnetContext(NetUid(1), wallet)
+    provider = RecentObjectProvider(
+        soft_limit=SoftLimit(2),
+        hard_limit=HardLimit(4),
+        store=mock_recent_objects_store,
+        context=context,
+        refresher=refresher,  # type: ignore[arg-type]
+        stale_grace=2,
+    )
+    timestamp = Timestamp(int(dt.datetime.now().timestamp()) - BLOCK_PROCESSING_TIME * blocks_ago)
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
+        result = await provider.get(AnObjectModel)
+
+    assert result == object_
+    assert refresher.requests == ([(context, AnObjectModel)] if refreshed else [])
+
+
+@pytest.mark.asyncio
+async def test_get_stale_while_revalidate_after_grace_period(mock_recent_objects_store, object_, wallet):
+    refresher = Refresher()
+    context = IdentitySubnetContext(NetUid(1), wallet)
+    provider = RecentObjectProvider(
+        soft_limit=SoftLimit(2),
+        hard_limit=HardLimit(4),
+        store=mock_recent_objects_store,
+        context=context,
+        refresher=refresher,  # type: ignore[arg-type]
+        stale_grace=2,
+    )
+    timestamp = Timestamp(int(dt.datetime.now().timestamp()) - BLOCK_PROCESSING_TIME * 7)
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
+        with pytest.raises(RecentObjectStale):
+            await provider.get(AnObjectModel)
+
+    assert refresher.requests == [(context, AnObjectModel)]
@@ -0,0 +1,288 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pylon_commons.models import Block, SubnetNeurons, SubnetValidators
+from pylon_commons.types import BlockHash, BlockNumber, NetUid
+
+from pylon_service.bittensor.recent import RecentObjectRefresher, RefreshPolicy, RefreshTrigger
+from pylon_service.bittensor.recent import refresh as refresh_module
+from pylon_service.bittensor.recent.context import IDENTITY_PRIORITY, OPEN_ACCESS_PRIORITY, SubnetContext
+
+
+def epoch_start(block_number: BlockNumber, netuid: NetUid) -> BlockNumber:
+    # Epochs of 100 blocks, starting at the multiples of 100.
+    return BlockNumber(block_number - block_number % 100)
+
+
+@pytest.fixture
+def trigger() -> RefreshTrigger:
+    return RefreshTrigger(
+        max_interval_blocks=50,
+        epoch_start=epoch_start,
+        policies={
+            NetUid(1): RefreshPolicy(epoch=True),
+            NetUid(2): RefreshPolicy(every_blocks=5),
+        },
+    )
+
+
+def test_trigger_is_due_when_never_refreshed(trigger):
+    assert trigger.is_due(NetUid(1), BlockNumber(1000))
+    assert trigger.is_due(NetUid(3), None)
+
+
+@pytest.mark.parametrize(
+    "netuid,head_number,expected",
+    [
+        pytest.param(NetUid(3), 1049, False, id="default_policy_within_interval"),
+        pytest.param(NetUid(3), 1050, True, id="default_policy_max_interval"),
+        pytest.param(NetUid(1), 1099, False, id="epoch_policy_same_epoch"),
+        pytest.param(NetUid(1), 1100, True, id="epoch_policy_next_epoch"),
+        pytest.param(NetUid(2), 1004, False, id="every_blocks_policy_before"),
+        pytest.param(NetUid(2), 1005, True, id="every_blocks_policy_after"),
+    ],
+)
+def test_trigger_is_due(trigger, netuid, head_number, expected):
+    trigger.record(netuid, BlockNumber(1080 if netuid == NetUid(1) else 1000))
+
+    assert trigger.is_due(netuid, BlockNumber(head_number)) is expected
+
+
+def test_trigger_uses_wall_clock_when_head_is_unknown(trigger):
+    with patch.object(refresh_module, "monotonic", return_value=1000.0):
+        trigger.record(NetUid(1), None)
+    with patch.object(refresh_module, "monotonic", return_value=1000.0 + 49 * 12):
+        assert not trigger.is_due(NetUid(1), BlockNumber(2000))
+    with patch.object(refresh_module, "monotonic", return_value=1000.0 + 50 * 12):
+        assert trigger.is_due(NetUid(1), BlockNumber(2000))
+
+
+class Executor:
+    def __init__(
+        self,
+        name: str = "neurons",
+        priority: int = OPEN_ACCESS_PRIORITY,
+        started: list | None = None,
+        model: type = SubnetNeurons,
+    ) -> None:
+        self.name = name
+        self.models = (model,)
+        self.priority = priority
+        self.runs = 0
+        self.succeeds = True
+        self.release = asyncio.Event()
+        self._started = started if started is not None else []
+
+    async def run(self) -> bool:
+        self.runs += 1
+        self._started.append(self.name)
+        await self.release.wait()
+        return self.succeeds
+
+
+class HeadTracker:
+    def __init__(self, number: int) -> None:
+        self.head: Block | None = Block(number=BlockNumber(number), hash=BlockHash(f"0x{number}"))
+
+
+@pytest.mark.asyncio
+async def test_refresher_refreshes_due_subnets_once_at_a_time(trigger):
+    executors = {NetUid(1): [Executor(), Executor()], NetUid(2): [Executor()]}
+    head_tracker = HeadTracker(1000)
+    refresher = RecentObjectRefresher(executors, trigger, head_tracker)  # type: ignore[arg-type]
+
+    await refresher.run()
+    await asyncio.sleep(0)
+    head_tracker.head = Block(number=BlockNumber(1005), hash=BlockHash("0x1005"))
+    await refresher.run()  # netuid 2 is due, but its refresh is still in progress
+    for executor in [*executors[NetUid(1)], *executors[NetUid(2)]]:
+        executor.release.set()
+    await refresher.wait()
+
+    assert [executor.runs for executor in executors[NetUid(1)]] == [1, 1]
+    assert executors[NetUid(2)][0].runs == 1
+
+    await refresher.run()
+    await refresher.wait()
+    await refresher.close()
+
+    assert [executor.runs for executor in executors[NetUid(1)]] == [1, 1]
+    assert executors[NetUid(2)][0].runs == 2
+
+
+@pytest.mark.asyncio
+async def test_refresher_refreshes_subnet_again_at_next_run_when_update_fails(trigger):
+    failing, succeeding = Executor(), Executor(name="validators", model=SubnetValidators)
+    failing.succeeds = False
+    failing.release.set()
+    succeeding.release.set()
+    refresher = RecentObjectRefresher({NetUid(1): [failing, succeeding]}, trigger, HeadTracker(1000))  # type: ignore[arg-type]
+
+    await refresher.run()
+    await refresher.wait()
+    failing.succeeds = True
+    await refresher.run()  # same head, due again because of the failure
+    await refresher.wait()
+    await refresher.run()  # same head, refreshed already
+    await refresher.wait()
+    await refresher.close()
+
+    assert (failing.runs, succeeding.runs) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_refresher_runs_bounded_number_of_updates_by_priority(trigger):
+    started: list[str] = []
+    executors = {NetUid(netuid): [Executor(name=f"open_{netuid}", started=started)] for netuid in range(3, 6)} | {
+        NetUid(1): [Executor(name="identity_1", priority=IDENTITY_PRIORITY, started=started)]
+    }
+    refresher = RecentObjectRefresher(executors, trigger, HeadTracker(1000), concurrency=2)  # type: ignore[arg-type]
+
+    await refresher.run()
+    await asyncio.sleep(0.01)
+
+    assert started == ["identity_1", "open_3"]
+
+    for executor in [executor for subnet_executors in executors.values() for executor in subnet_executors]:
+        executor.release.set()
+    await refresher.wait()
+    await refresher.close()
+
+    assert started == ["identity_1", "open_3", "open_4", "open_5"]
+
+
+@pytest.mark.asyncio
+async def test_refresher_delays_updates_by_jitter(trigger):
+    executor = Executor()
+    executor.release.set()
+    refresher = RecentObjectRefresher(
+        {NetUid(1): [executor]},  # type: ignore[arg-type]
+        trigger,
+        HeadTracker(1000),  # type: ignore[arg-type]
+        jitter_seconds=0.05,
+    )
+
+    with patch.object(refresh_module.random, "uniform", return_value=0.05):
+        await refresher.run()
+    await asyncio.sleep(0.01)
+    assert executor.runs == 0
+
+    await refresher.wait()
+    await refresher.close()
+    assert executor.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_refresher_coalesces_requested_refreshes(trigger):
+    neurons, validators = Executor(), Executor(name="validators", model=SubnetValidators)
+    refresher = RecentObjectRefresher(
+        {NetUid(1): [neurons, validators]},  # type: ignore[arg-type]
+        trigger,
+        HeadTracker(1000),  # type: ignore[arg-type]
+        jitter_seconds=60,
+    )
+
+    with patch.object(refresh_module.random, "uniform", return_value=0.01):
+        await refresher.run()
+    await asyncio.sleep(0)
+    refresher.request_refresh(SubnetContext(NetUid(1)), SubnetNeurons)  # already enqueued by the run
+    neurons.release.set()
+    validators.release.set()
+    await refresher.wait()
+
+    assert neurons.runs == 1
+
+    neurons.release.clear()
+    for _ in range(3):
+        refresher.request_refresh(SubnetContext(NetUid(1)), SubnetNeurons)
+    refresher.request_refresh(SubnetContext(NetUid(2)), SubnetNeurons)  # no executors for the subnet
+    neurons.release.set()
+    async with asyncio.timeout(1):  # not delayed by the jitter
+        await refresher.wait()
+    await refresher.close()
+
+    assert (neurons.runs, validators.runs) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_refresher_enrolls_requested_subnets_and_drops_idle_ones(trigger):
+    configured, enrolled = Executor(), Executor()
+    enrolled.release.set()
+    configured.release.set()
+    head_tracker = HeadTracker(1000)
+    refresher = RecentObjectRefresher(
+        {NetUid(1): [configured]},  # type: ignore[arg-type]
+        trigger,
+        head_tracker,  # type: ignore[arg-type]
+        executor_factory=lambda netuid: [enrolled],  # type: ignore[list-item,return-value]
+        idle_timeout_seconds=60,
+        max_enrolled_subnets=1,
+    )
+
+    with patch.object(refresh_module, "monotonic", return_value=1000.0):
+        await refresher.enroll(NetUid(1))  # configured
+        await refresher.enroll(NetUid(3))
+        await refresher.enroll(NetUid(4))  # over the limit
+        await refresher.run()
+    await refresher.wait()
+
+    assert (configured.runs, enrolled.runs) == (1, 1)
+
+    head_tracker.head = Block(number=BlockNumber(1050), hash=BlockHash("0x1050"))
+    with patch.object(refresh_module, "monotonic", return_value=1030.0):
+        await refresher.enroll(NetUid(3))
+    with patch.object(refresh_module, "monotonic", return_value=1080.0):
+        await refresher.run()  # requested 50 seconds ago, kept
+    await refresher.wait()
+
+    assert (configured.runs, enrolled.runs) == (2, 2)
+
+    head_tracker.head = Block(number=BlockNumber(1100), hash=BlockHash("0x1100"))
+    with patch.object(refresh_module, "monotonic", return_value=2000.0):
+        await refresher.run()  # requested 970 seconds ago, dropped
+    await refresher.wait()
+    await refresher.close()
+
+    assert (configured.runs, enrolled.runs) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_refresher_enrolls_only_existing_subnets(trigger):
+    checked: list[NetUid] = []
+    check_gate = asyncio.Event()
+
+    async def subnet_exists(netuid: NetUid) -> bool:
+        checked.append(netuid)
+        await check_gate.wait()
+        if netuid == NetUid(5):
+            raise RuntimeError("node unavailable")
+        return netuid == NetUid(3)
+
+    enrolled: list[NetUid] = []
+    refresher = RecentObjectRefresher(
+        {},
+        trigger,
+        HeadTracker(1000),  # type: ignore[arg-type]
+        executor_factory=lambda netuid: enrolled.append(netuid) or [],  # type: ignore[func-returns-value]
+        idle_timeout_seconds=60,
+        subnet_exists=subnet_exists,
+    )
+
+    with patch.object(refresh_module, "monotonic", return_value=1000.0):
+        enrollments = [asyncio.create_task(refresher.enroll(NetUid(netuid))) for netuid in (3, 3, 4, 4, 5)]
+        await asyncio.sleep(0)
+        check_gate.set()
+        await asyncio.gather(*enrollments)
+        await refresher.enroll(NetUid(4))  # known to be missing
+        await refresher.enroll(NetUid(5))  # the failed check is not remembered
+
+    assert enrolled == [NetUid(3)]
+    assert checked == [NetUid(3), NetUid(4), NetUid(5), NetUid(5)]
+
+    with patch.object(refresh_module, "monotonic", return_value=1060.0):
+        await refresher.run()  # forgets that subnet 4 is missing
+        await refresher.enroll(NetUid(4))
+    await refresher.close()
+
+    assert checked == [NetUid(3), NetUid(4), NetUid(5), NetUid(5), NetUid(4)]
@@ -36,6 +36,7 @@ from pylon_commons.types import (
     Trust,
     ValidatorPermit,
     ValidatorTrust,
+    Weight,
 )
 from turbobt.substrate.exceptions import UnknownBlock
 
@@ -297,3 +298,36 @@ async def test_delegation_stale_block_unknown_on_archive_raises_archive_fallback
 
     assert main_client.calls["get_neurons_list"] == []
     assert archive_client.calls["get_neurons_list"] == [(1, stale_block)]
+
+
+@pytest.mark.asyncio
+async def test_delegation_reads_go_to_read_client(test_neuron):
+    """
+    Test that with a read client only the signing operations use the own clients, which are opened lazily.
+    """
+    recent_block = Block(number=BlockNumber(450), hash=BlockHash("0xrecent"))
+    read_client = MockBittensorClient(uri=BittensorNetwork("ws://shared"))
+    bittensor_client = BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        subclient_cls=MockBittensorClient,
+        read_client=read_client,
+    )
+    main_client = bittensor_client._main_client
+
+    async with bittensor_client:
+        async with read_client.mock_behavior(get_neurons_list=[[test_neuron]]):
+            assert await bittensor_client.get_neurons_list(netuid=NetUid(1), block=recent_block) == [test_neuron]
+        assert not main_client._is_open
+
+        async with main_client.mock_behavior(set_weights=[None]):
+            await bittensor_client.set_weights(netuid=NetUid(1), weights={Hotkey("hotkey"): Weight(0.5)})
+        assert main_client._is_open
+        assert not bittensor_client._archive_client._is_open
+
+    assert not main_client._is_open
+    assert read_client.calls["get_neurons_list"] == [(1, recent_block)]
+    assert read_client.calls["set_weights"] == []
+    assert main_client.calls["get_neurons_list"] == []
+    assert main_client.calls["set_weights"] == [(1, {Hotkey("hotkey"): 0.5})]
@@ -1,9 +1,12 @@
 import asyncio
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 import pytest_asyncio
 from bittensor_wallet import Wallet
 from pylon_commons.types import HotkeyName, WalletName
+from turbobt import Bittensor
+from turbobt.substrate.pallets.chain import Chain as TurboBtChain
 
 from pylon_service.bittensor.client import BittensorClient
 from pylon_service.bittensor.pool import (
@@ -12,6 +15,7 @@ from pylon_service.bittensor.pool import (
     WalletKey,
 )
 from tests.helpers import wait_until
+from tests.mock_bittensor_client import MockBittensorClient
 
 
 @pytest_asyncio.fixture
@@ -236,3 +240,226 @@ async def test_bittensor_client_pool_close_timeout(barrier_factory):
     client = task.result()
     assert client._main_client._raw_client is None
     assert client._archive_client._raw_client is None
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_shared_reads():
+    """
+    Test that with shared reads all the wallet-bound clients read through the client without a wallet.
+    """
+    async with BittensorClientPool(
+        shared_reads=True,
+        uri="ws://localhost:8000",
+        archive_uri="ws://localhost:8001",
+    ) as pool:
+        async with pool.acquire(wallet=Wallet()) as client_wallet:
+            assert set(pool._pool) == {None, WalletKey.from_wallet(Wallet())}
+            read_client = pool._pool[None]
+            assert client_wallet.read_client is read_client
+            assert read_client.read_client is None
+            # The wallet-bound client does not connect until a signing operation is performed.
+            assert client_wallet._main_client._raw_client is None
+            assert read_client._main_client._raw_client is not None
+        async with pool.acquire(wallet=None) as client:
+            assert client is read_client
+
+
+class GatedOpenClient(MockBittensorClient):
+    """
+    Client whose opening with a wallet waits for the gate, failing with the given errors first.
+    """
+
+    gate: asyncio.Event
+    open_errors: list[Exception]
+    opened: list[WalletKey | None]
+
+    async def open(self) -> None:
+        if self.wallet is not None:
+            await self.gate.wait()
+            if self.open_errors:
+                raise self.open_errors.pop(0)
+        self.opened.append(self.wallet and WalletKey.from_wallet(self.wallet))
+        await super().open()
+
+
+@pytest.fixture
+def gated_client_cls():
+    GatedOpenClient.gate = asyncio.Event()
+    GatedOpenClient.open_errors = []
+    GatedOpenClient.opened = []
+    return GatedOpenClient
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_opening_does_not_block_open_clients(gated_client_cls):
+    """
+    Test that a client being opened does not block acquiring the clients that are already open.
+    """
+    async with BittensorClientPool(client_cls=gated_client_cls, uri="ws://localhost:8000") as pool:
+        async with pool.acquire(wallet=None) as open_access_client:
+            pass
+        opening_tasks = [asyncio.create_task(acquire_client(pool, Wallet(), asyncio.Barrier(1))) for _ in range(3)]
+        await wait_until(lambda: len(pool._opening) == 1)
+
+        async with asyncio.timeout(1):
+            async with pool.acquire(wallet=None) as client:
+                assert client is open_access_client
+
+        gated_client_cls.gate.set()
+        clients = await asyncio.gather(*opening_tasks)
+
+    assert set(clients) == {clients[0]}
+    assert gated_client_cls.opened == [None, WalletKey.from_wallet(Wallet())]
+    assert pool._opening == {}
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_open_failure_is_retried(gated_client_cls):
+    """
+    Test that a failed opening is reported to all the waiting tasks and retried by the next acquire.
+    """
+    gated_client_cls.open_errors = [ConnectionError("Handshake failed")]
+    async with BittensorClientPool(client_cls=gated_client_cls, uri="ws://localhost:8000") as pool:
+        tasks = [asyncio.create_task(acquire_client(pool, Wallet(), asyncio.Barrier(1))) for _ in range(2)]
+        await wait_until(lambda: len(pool._opening) == 1)
+        gated_client_cls.gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert [type(result) for result in results] == [ConnectionError, ConnectionError]
+        assert pool._pool == {}
+        assert pool._acquire_counter == 0
+
+        async with pool.acquire(wallet=Wallet()) as client:
+            assert client._is_open
+
+
+class PingedClient(MockBittensorClient):
+    def __init__(self, wallet: Wallet | None = None, read_client: MockBittensorClient | None = None, **kwargs):
+        super().__init__(wallet, **kwargs)
+        self.read_client = read_client
+
+    async def ping(self) -> None:
+        self.calls["ping"].append(())
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_prewarm():
+    """
+    Test that pre-warming opens the clients before they are acquired.
+    """
+    wallets = [None, Wallet(name="first"), Wallet(name="second")]
+    async with BittensorClientPool(client_cls=MockBittensorClient, uri="ws://localhost:8000") as pool:
+        await pool.prewarm(wallets)
+        assert set(pool._pool) == {None, WalletKey.from_wallet(wallets[1]), WalletKey.from_wallet(wallets[2])}
+        assert all(client._is_open for client in pool._pool.values())
+        prewarmed_client = pool._pool[WalletKey.from_wallet(wallets[1])]
+        async with pool.acquire(wallet=wallets[1]) as client:
+            assert client is prewarmed_client
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_prewarm_connects_clients(monkeypatch):
+    """
+    Test that pre-warming sends a request through every connection the clients use, including the connection
+    for the signing operations of the wallet-bound client with shared reads.
+    """
+    bittensor_mock = create_autospec(Bittensor, instance=True)
+    bittensor_mock.__aenter__.return_value = bittensor_mock
+    bittensor_mock.subtensor = MagicMock()
+    bittensor_mock.subtensor.chain = create_autospec(TurboBtChain, instance=True)
+    bittensor_mock.subtensor.chain.getBlockHash.return_value = "0xhash"
+    monkeypatch.setattr("pylon_service.bittensor.client.Bittensor", MagicMock(return_value=bittensor_mock))
+    async with BittensorClientPool(
+        shared_reads=True,
+        uri="ws://localhost:8000",
+        archive_uri="ws://localhost:8001",
+    ) as pool:
+        await pool.prewarm([None, Wallet()])
+        wallet_client = pool._pool[WalletKey.from_wallet(Wallet())]
+        assert wallet_client._main_client._raw_client is not None
+
+    # The main and archive nodes of the read client and the main node of the wallet-bound client.
+    assert bittensor_mock.subtensor.chain.getBlockHash.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_max_clients_evicts_least_recently_used():
+    """
+    Test that exceeding max_clients evicts the least recently used client that is not in use.
+    """
+    first, second, third = Wallet(name="first"), Wallet(name="second"), Wallet(name="third")
+    async with BittensorClientPool(client_cls=MockBittensorClient, max_clients=2, uri="ws://localhost:8000") as pool:
+        async with pool.acquire(wallet=first) as first_client:
+            async with pool.acquire(wallet=second) as second_client:
+                pass
+            async with pool.acquire(wallet=third):
+                # The first client is older, but it is in use.
+                assert set(pool._pool) == {WalletKey.from_wallet(first), WalletKey.from_wallet(third)}
+        assert not second_client._is_open
+        assert first_client._is_open
+
+        # The third client was released before the first one.
+        async with pool.acquire(wallet=second):
+            pass
+        assert set(pool._pool) == {WalletKey.from_wallet(first), WalletKey.from_wallet(second)}
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_maintenance_evicts_idle_and_pings():
+    """
+    Test that the maintenance evicts the idle clients and pings the rest, keeping the shared read client.
+    """
+    async with BittensorClientPool(
+        client_cls=PingedClient,
+        shared_reads=True,
+        idle_timeout=0.2,
+        maintenance_interval=0.05,
+        uri="ws://localhost:8000",
+    ) as pool:
+        async with pool.acquire(wallet=Wallet()) as wallet_client:
+            read_client = wallet_client.read_client
+            assert read_client is not None
+            await wait_until(lambda: len(wallet_client.calls["ping"]) >= 2, sleep_interval=0.01)
+            assert set(pool._pool) == {None, WalletKey.from_wallet(Wallet())}
+
+        await wait_until(lambda: set(pool._pool) == {None}, sleep_interval=0.01)
+        assert not wallet_client._is_open
+        pings = len(read_client.calls["ping"])
+        await wait_until(lambda: len(read_client.calls["ping"]) > pings, sleep_interval=0.01)
+        assert pool._pool[None] is read_client
+
+
+class SlowClosingClient(MockBittensorClient):
+    def __init__(self, wallet: Wallet | None = None, close_gate: asyncio.Event | None = None, **kwargs):
+        super().__init__(wallet, **kwargs)
+        self.close_gate = close_gate
+
+    async def close(self) -> None:
+        if self.close_gate is not None:
+            await self.close_gate.wait()
+        await super().close()
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_maintenance_keeps_client_acquired_during_eviction():
+    """
+    Test that a client acquired while the maintenance closes another idle client is not evicted.
+    """
+    first, second = Wallet(name="first"), Wallet(name="second")
+    close_gate = asyncio.Event()
+    async with BittensorClientPool(
+        client_cls=SlowClosingClient,
+        idle_timeout=0.05,
+        maintenance_interval=0.05,
+        uri="ws://localhost:8000",
+        close_gate=close_gate,
+    ) as pool:
+        await pool.prewarm([first, second])
+        # The maintenance pops the first idle client from the pool and waits for it to close.
+        await wait_until(lambda: len(pool._pool) == 1, sleep_interval=0.01)
+        idle_key = next(iter(pool._pool))
+        idle_wallet = first if idle_key == WalletKey.from_wallet(first) else second
+        async with pool.acquire(wallet=idle_wallet) as client:
+            close_gate.set()
+            await asyncio.sleep(0.1)
+            assert client._is_open
+            assert pool._pool == {idle_key: client}
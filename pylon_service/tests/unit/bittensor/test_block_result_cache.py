@@ -0,0 +1,301 @@
+"""
+Tests for the BlockResultCache, SignedBlockCache and BlockIndex, and the use of the first and the last
+by BittensorClient.
+"""
+
+import json
+from typing import cast
+
+import pytest
+import pytest_asyncio
+from bittensor_wallet import Wallet
+from pylon_commons.models import Block, CommitReveal, Extrinsic, ExtrinsicCall, SubnetHyperparams
+from pylon_commons.types import (
+    ArchiveBlocksCutoff,
+    BittensorNetwork,
+    BlockHash,
+    BlockNumber,
+    ExtrinsicHash,
+    ExtrinsicIndex,
+    ExtrinsicLength,
+    MaxWeightsLimit,
+    NetUid,
+    Timestamp,
+)
+from turbobt.substrate.pallets.chain import SignedBlock
+
+from pylon_service.bittensor.cache import MISSING, BlockCacheKey, BlockIndex, BlockResultCache, SignedBlockCache
+from pylon_service.bittensor.client import BittensorClient
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+def key(number: int, operation: str = "get_hyperparams") -> BlockCacheKey:
+    return BlockCacheKey(operation=operation, netuid=NetUid(1), block_hash=BlockHash(f"0x{number}"))
+
+
+@pytest.fixture
+def result_cache():
+    return BlockResultCache()
+
+
+@pytest_asyncio.fixture
+async def bittensor_client(result_cache):
+    async with BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
+        subclient_cls=MockBittensorClient,
+        result_cache=result_cache,
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def hyperparams():
+    return SubnetHyperparams(max_weights_limit=MaxWeightsLimit(100), commit_reveal_weights_enabled=CommitReveal.V4)
+
+
+def test_result_cache_evicts_least_recently_used():
+    result_cache = BlockResultCache(max_bytes=2 * len('"first"'))
+    result_cache.put(key(1), "first")
+    result_cache.put(key(2), "other")
+    assert result_cache.get(key(1)) == "first"
+
+    result_cache.put(key(3), "third")
+
+    assert len(result_cache) == 2
+    assert result_cache.size == 2 * len('"first"')
+    assert result_cache.get(key(2)) is MISSING
+    assert result_cache.get(key(1)) == "first"
+    assert result_cache.get(key(3)) == "third"
+
+
+def test_result_cache_evicts_by_size(hyperparams):
+    hyperparams_size = len(hyperparams.model_dump_json())
+    result_cache = BlockResultCache(max_bytes=3 * hyperparams_size + len("[,]"))
+    result_cache.put(key(1), hyperparams)
+    result_cache.put(key(2), hyperparams)
+
+    result_cache.put(key(3, operation="get_neurons"), [hyperparams, hyperparams])
+
+    assert len(result_cache) == 2
+    assert result_cache.get(key(1)) is MISSING
+    assert result_cache.get(key(2)) == hyperparams
+
+
+def test_result_cache_skips_result_over_limit():
+    result_cache = BlockResultCache(max_bytes=10)
+    result_cache.put(key(1), "a result too big for the cache")
+    assert len(result_cache) == 0
+    assert result_cache.size == 0
+
+
+def test_result_cache_keys_by_operation(result_cache):
+    result_cache.put(key(1, operation="get_neurons"), "neurons")
+    assert result_cache.get(key(1, operation="get_validators")) is MISSING
+
+
+def test_result_cache_disabled():
+    result_cache = BlockResultCache(max_bytes=0)
+    result_cache.put(key(1), "first")
+    assert result_cache.get(key(1)) is MISSING
+
+
+@pytest.mark.parametrize(
+    ("block_number", "expected"),
+    [
+        pytest.param(97, True, id="finalized"),
+        pytest.param(98, False, id="not_finalized"),
+    ],
+)
+def test_result_cache_is_cacheable(result_cache, block_number, expected):
+    assert result_cache.is_cacheable(block_number, finalized_number=97) is expected
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_serves_finalized_block_from_cache(bittensor_client, hyperparams):
+    block = Block(number=BlockNumber(90), hash=BlockHash("0x90"))
+    latest_block = Block(number=BlockNumber(100), hash=BlockHash("0x100"))
+    finalized_block = Block(number=BlockNumber(97), hash=BlockHash("0x97"))
+    main_client = bittensor_client._main_client
+
+    async with main_client.mock_behavior(
+        get_latest_block=[latest_block, latest_block],
+        get_finalized_block=[finalized_block],
+        get_hyperparams=[hyperparams],
+    ):
+        assert await bittensor_client.get_hyperparams(netuid=NetUid(1), block=block) == hyperparams
+        assert await bittensor_client.get_hyperparams(netuid=NetUid(1), block=block) == hyperparams
+
+    assert main_client.calls["get_hyperparams"] == [(1, block)]
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_caches_none_result(bittensor_client):
+    block = Block(number=BlockNumber(90), hash=BlockHash("0x90"))
+    latest_block = Block(number=BlockNumber(100), hash=BlockHash("0x100"))
+    finalized_block = Block(number=BlockNumber(97), hash=BlockHash("0x97"))
+    main_client = bittensor_client._main_client
+
+    async with main_client.mock_behavior(
+        get_latest_block=[latest_block, latest_block],
+        get_finalized_block=[finalized_block],
+        get_hyperparams=[None],
+    ):
+        assert await bittensor_client.get_hyperparams(netuid=NetUid(1), block=block) is None
+        assert await bittensor_client.get_hyperparams(netuid=NetUid(1), block=block) is None
+
+    assert main_client.calls["get_hyperparams"] == [(1, block)]
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_does_not_cache_unfinalized_block(bittensor_client, hyperparams):
+    block = Block(number=BlockNumber(99), hash=BlockHash("0x99"))
+    latest_block = Block(number=BlockNumber(100), hash=BlockHash("0x100"))
+    finalized_block = Block(number=BlockNumber(97), hash=BlockHash("0x97"))
+    main_client = bittensor_client._main_client
+
+    async with main_client.mock_behavior(
+        get_latest_block=[latest_block] * 4,
+        get_finalized_block=[finalized_block] * 2,
+        get_hyperparams=[hyperparams, hyperparams],
+    ):
+        await bittensor_client.get_hyperparams(netuid=NetUid(1), block=block)
+        await bittensor_client.get_hyperparams(netuid=NetUid(1), block=block)
+
+    assert main_client.calls["get_hyperparams"] == [(1, block), (1, block)]
+    assert len(bittensor_client.result_cache) == 0
+
+
+def signed_block(extrinsics_count: int) -> SignedBlock:
+    return cast(
+        SignedBlock, {"block": {"header": {}, "extrinsics": ["0x00"] * extrinsics_count}, "justifications": None}
+    )
+
+
+def test_signed_block_cache_evicts_by_size():
+    block_size = len(json.dumps(signed_block(10)))
+    signed_block_cache = SignedBlockCache(max_bytes=2 * block_size)
+
+    signed_block_cache.put_block(BlockHash("0x1"), signed_block(10))
+    signed_block_cache.put_block(BlockHash("0x2"), signed_block(10))
+    assert signed_block_cache.get_block(BlockHash("0x1")) == signed_block(10)
+
+    signed_block_cache.put_block(BlockHash("0x3"), signed_block(10))
+
+    assert len(signed_block_cache) == 2
+    assert signed_block_cache.size == 2 * block_size
+    assert signed_block_cache.get_block(BlockHash("0x2")) is None
+    assert signed_block_cache.get_block(BlockHash("0x1")) is not None
+
+
+def test_signed_block_cache_skips_block_over_limit():
+    signed_block_cache = SignedBlockCache(max_bytes=10)
+    signed_block_cache.put_block(BlockHash("0x1"), signed_block(10))
+    assert len(signed_block_cache) == 0
+
+
+def test_signed_block_cache_extrinsics_are_evicted_with_block():
+    signed_block_cache = SignedBlockCache(max_bytes=len(json.dumps(signed_block(1))))
+    extrinsic = Extrinsic(
+        block_number=BlockNumber(1),
+        extrinsic_index=ExtrinsicIndex(0),
+        extrinsic_hash=ExtrinsicHash("0xextrinsic"),
+        extrinsic_length=ExtrinsicLength(1),
+        call=ExtrinsicCall(call_module="Timestamp", call_function="set", call_args=[]),
+    )
+
+    signed_block_cache.put_extrinsic(BlockHash("0x1"), extrinsic)
+    assert signed_block_cache.get_extrinsic(BlockHash("0x1"), ExtrinsicIndex(0)) is None
+
+    signed_block_cache.put_block(BlockHash("0x1"), signed_block(1))
+    signed_block_cache.put_extrinsic(BlockHash("0x1"), extrinsic)
+    assert signed_block_cache.get_extrinsic(BlockHash("0x1"), ExtrinsicIndex(0)) == extrinsic
+
+    signed_block_cache.put_block(BlockHash("0x2"), signed_block(1))
+    assert signed_block_cache.get_extrinsic(BlockHash("0x1"), ExtrinsicIndex(0)) is None
+
+
+def block(number: int) -> Block:
+    return Block(number=BlockNumber(number), hash=BlockHash(f"0x{number}"))
+
+
+def test_block_index_evicts_least_recently_used():
+    block_index = BlockIndex(max_entries=2)
+    block_index.put_block(block(1))
+    block_index.put_block(block(2))
+    assert block_index.get_block(BlockNumber(1)) == block(1)
+
+    block_index.put_block(block(3))
+
+    assert len(block_index) == 2
+    assert block_index.get_block(BlockNumber(2)) is None
+    assert block_index.get_block(BlockNumber(1)) == block(1)
+    assert block_index.get_block(BlockNumber(3)) == block(3)
+
+
+def test_block_index_persists_to_file(tmp_path):
+    path = tmp_path / "index" / "blocks.json"
+    block_index = BlockIndex(path=path)
+    block_index.put_block(block(1))
+    block_index.put_timestamp(block(1), Timestamp(1700000000))
+    block_index.save()
+
+    loaded_block_index = BlockIndex(path=path)
+    loaded_block_index.load()
+
+    assert loaded_block_index.get_block(BlockNumber(1)) == block(1)
+    assert loaded_block_index.get_timestamp(block(1)) == 1700000000
+
+
+def test_block_index_ignores_unreadable_file(tmp_path):
+    path = tmp_path / "blocks.json"
+    path.write_text("{not json")
+    block_index = BlockIndex(path=path)
+
+    block_index.load()
+
+    assert len(block_index) == 0
+
+
+@pytest_asyncio.fixture
+async def indexed_bittensor_client():
+    async with BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
+        subclient_cls=MockBittensorClient,
+        block_index=BlockIndex(),
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_serves_finalized_block_from_index(indexed_bittensor_client):
+    main_client = indexed_bittensor_client._main_client
+
+    async with main_client.mock_behavior(
+        get_block=[block(97), block(98), block(98)],
+        get_finalized_block=[block(97)] * 3,
+    ):
+        for _ in range(2):
+            assert await indexed_bittensor_client.get_block(BlockNumber(97)) == block(97)
+            assert await indexed_bittensor_client.get_block(BlockNumber(98)) == block(98)
+
+    assert main_client.calls["get_block"] == [(97,), (98,), (98,)]
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_serves_block_timestamp_from_index(indexed_bittensor_client):
+    main_client = indexed_bittensor_client._main_client
+
+    async with main_client.mock_behavior(
+        get_latest_block=[block(100)],
+        get_block_timestamp=[Timestamp(1700000000)],
+    ):
+        assert await indexed_bittensor_client.get_block_timestamp(block(100)) == 1700000000
+        assert await indexed_bittensor_client.get_block_timestamp(block(100)) == 1700000000
+
+    assert main_client.calls["get_block_timestamp"] == [(block(100),)]
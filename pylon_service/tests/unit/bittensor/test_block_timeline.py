@@ -0,0 +1,141 @@
+"""
+Tests for the BlockTimeline resolution of timestamps to blocks and its use by BittensorClient.
+"""
+
+import pytest
+import pytest_asyncio
+from bittensor_wallet import Wallet
+from pylon_commons.models import Block
+from pylon_commons.types import ArchiveBlocksCutoff, BittensorNetwork, BlockHash, BlockNumber, Timestamp
+
+from pylon_service.bittensor.cache import BlockIndex
+from pylon_service.bittensor.client import BittensorClient
+from pylon_service.bittensor.timeline import BlockTimeline
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+def block(number: int) -> Block:
+    return Block(number=BlockNumber(number), hash=BlockHash(f"0x{number}"))
+
+
+class Chain:
+    """
+    Chain of head_number + 1 blocks with a 12 second block time, slowed down to 30 seconds after a stall block.
+    """
+
+    def __init__(self, head_number: int = 10_000, stall_number: int = 6_000) -> None:
+        self.head_number = head_number
+        self.stall_number = stall_number
+        self.probed: list[int] = []
+
+    def timestamp(self, number: int) -> Timestamp:
+        if number <= self.stall_number:
+            return Timestamp(1_600_000_000 + 12 * number)
+        return Timestamp(self.timestamp(self.stall_number) + 30 * (number - self.stall_number))
+
+    async def get_latest_block(self) -> Block:
+        return block(self.head_number)
+
+    async def get_finalized_block(self) -> Block:
+        return block(self.head_number - 2)
+
+    async def get_block(self, number: BlockNumber) -> Block | None:
+        return block(number) if 0 <= number <= self.head_number else None
+
+    async def get_block_timestamp(self, block: Block) -> Timestamp:
+        self.probed.append(block.number)
+        return self.timestamp(block.number)
+
+
+@pytest.fixture
+def chain():
+    return Chain()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("number", "offset", "expected"),
+    [
+        pytest.param(0, 0, 0, id="genesis"),
+        pytest.param(1234, 0, 1234, id="exact_timestamp"),
+        pytest.param(1234, 11, 1234, id="between_blocks"),
+        pytest.param(8000, 29, 8000, id="after_stall"),
+        pytest.param(10_000, 5, 10_000, id="head"),
+    ],
+)
+async def test_block_timeline_resolves_timestamp(chain, number, offset, expected):
+    timestamp = Timestamp(chain.timestamp(number) + offset)
+
+    assert await BlockTimeline().resolve(chain, timestamp) == block(expected)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        pytest.param(Timestamp(1_500_000_000), id="before_genesis"),
+        pytest.param(Timestamp(2_000_000_000), id="future"),
+    ],
+)
+async def test_block_timeline_returns_none_outside_of_chain(chain, timestamp):
+    assert await BlockTimeline().resolve(chain, timestamp) is None
+
+
+@pytest.mark.asyncio
+async def test_block_timeline_reuses_probed_blocks(chain):
+    block_timeline = BlockTimeline()
+    assert await block_timeline.resolve(chain, chain.timestamp(7000)) == block(7000)
+    first_probes = len(chain.probed)
+    chain.probed.clear()
+
+    assert await block_timeline.resolve(chain, Timestamp(chain.timestamp(7000) + 1)) == block(7000)
+
+    assert len(chain.probed) < first_probes
+    assert len(block_timeline) > 0
+
+
+def test_block_timeline_seeds_anchors_from_block_index(chain):
+    block_index = BlockIndex()
+    for number in (10, 20):
+        block_index.put_block(block(number))
+        block_index.put_timestamp(block(number), chain.timestamp(number))
+    block_index.put_block(block(30))
+
+    assert len(BlockTimeline(block_index)) == 2
+
+
+def test_block_timeline_thins_anchors_over_limit():
+    block_timeline = BlockTimeline(max_anchors=4)
+    for number in range(5):
+        block_timeline._add_anchor(BlockNumber(number), Timestamp(number * 12))
+
+    assert block_timeline._numbers == [0, 2, 4]
+
+
+@pytest_asyncio.fixture
+async def bittensor_client():
+    async with BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
+        subclient_cls=MockBittensorClient,
+        block_timeline=BlockTimeline(),
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_resolves_timestamp_with_timeline(bittensor_client):
+    main_client = bittensor_client._main_client
+    head_timestamp = Timestamp(1_600_000_000)
+
+    async with main_client.mock_behavior(
+        get_latest_block=[block(100)] * 4,
+        get_finalized_block=[block(98)],
+        get_block_timestamp=[head_timestamp, Timestamp(head_timestamp - 24), Timestamp(head_timestamp - 12)],
+        get_block=[block(98), block(99), block(98)],
+    ):
+        assert await bittensor_client.get_block_at(Timestamp(head_timestamp - 20)) == block(98)
+
+    assert main_client.calls["get_block"] == [(98,), (99,), (98,)]
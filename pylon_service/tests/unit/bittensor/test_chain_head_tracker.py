@@ -0,0 +1,142 @@
+"""
+Tests for the ChainHeadTracker and its use by BittensorClient.
+"""
+
+import pytest
+import pytest_asyncio
+from bittensor_wallet import Wallet
+from pylon_commons.models import Block
+from pylon_commons.types import ArchiveBlocksCutoff, BittensorNetwork, BlockHash, BlockNumber, NetUid
+
+from pylon_service.bittensor.client import BittensorClient
+from pylon_service.bittensor.head import ChainHeadTracker
+from tests.helpers import wait_until
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+@pytest.fixture
+def head_client():
+    return MockBittensorClient()
+
+
+@pytest.fixture
+def head_tracker(head_client):
+    return ChainHeadTracker(head_client, poll_interval=3600, max_age=3600)
+
+
+@pytest_asyncio.fixture
+async def bittensor_client(head_tracker):
+    async with BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
+        subclient_cls=MockBittensorClient,
+        head_tracker=head_tracker,
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_head_tracker_polls_latest_and_finalized_block(head_tracker, head_client):
+    latest_block = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+    finalized_block = Block(number=BlockNumber(498), hash=BlockHash("0xfinalized"))
+
+    async with head_client.mock_behavior(get_latest_block=[latest_block], get_finalized_block=[finalized_block]):
+        async with head_tracker:
+            await wait_until(lambda: head_tracker.finalized is not None)
+            assert head_tracker.head == latest_block
+            assert head_tracker.finalized == finalized_block
+            assert head_client._is_open
+
+    assert head_tracker.head is None
+    assert head_tracker.finalized is None
+    assert not head_client._is_open
+    assert head_client.calls["get_latest_block"] == [()]
+    assert head_client.calls["get_finalized_block"] == [()]
+
+
+@pytest.mark.asyncio
+async def test_head_tracker_survives_poll_failure(head_client):
+    head_tracker = ChainHeadTracker(head_client, poll_interval=0.01, max_age=3600)
+    latest_block = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+
+    async with head_client.mock_behavior(get_latest_block=[RuntimeError("connection lost"), latest_block]):
+        async with head_tracker:
+            await wait_until(lambda: head_tracker.head is not None)
+            assert head_tracker.head == latest_block
+
+
+def test_head_tracker_ignores_older_blocks(head_tracker):
+    head_tracker.update(Block(number=BlockNumber(500), hash=BlockHash("0x500")))
+    head_tracker.update(Block(number=BlockNumber(499), hash=BlockHash("0x499")))
+    assert head_tracker.head == Block(number=BlockNumber(500), hash=BlockHash("0x500"))
+
+    head_tracker.update(Block(number=BlockNumber(501), hash=BlockHash("0x501")))
+    assert head_tracker.head == Block(number=BlockNumber(501), hash=BlockHash("0x501"))
+
+
+def test_head_tracker_outdated_head_is_unknown(head_client):
+    head_tracker = ChainHeadTracker(head_client, max_age=0)
+    head_tracker.update(Block(number=BlockNumber(500), hash=BlockHash("0x500")))
+    assert head_tracker.head is None
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_latest_block_from_head_tracker(bittensor_client, head_tracker):
+    head = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+    head_tracker.update(head)
+
+    assert await bittensor_client.get_latest_block() == head
+    assert bittensor_client._main_client.calls["get_latest_block"] == []
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_latest_block_fallback_updates_head_tracker(bittensor_client, head_tracker):
+    latest_block = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+
+    async with bittensor_client._main_client.mock_behavior(get_latest_block=[latest_block]):
+        assert await bittensor_client.get_latest_block() == latest_block
+
+    assert head_tracker.head == latest_block
+    assert bittensor_client._main_client.calls["get_latest_block"] == [()]
+
+
+@pytest.mark.asyncio
+async def test_delegation_reads_latest_block_from_head_tracker(bittensor_client, head_tracker):
+    head_tracker.update(Block(number=BlockNumber(500), hash=BlockHash("0xlatest")))
+    recent_block = Block(number=BlockNumber(450), hash=BlockHash("0xrecent"))
+    stale_block = Block(number=BlockNumber(100), hash=BlockHash("0xstale"))
+    main_client = bittensor_client._main_client
+    archive_client = bittensor_client._archive_client
+
+    async with (
+        main_client.mock_behavior(get_neurons_list=[[]]),
+        archive_client.mock_behavior(get_neurons_list=[[]]),
+    ):
+        await bittensor_client.get_neurons_list(netuid=NetUid(1), block=recent_block)
+        await bittensor_client.get_neurons_list(netuid=NetUid(1), block=stale_block)
+
+    assert main_client.calls["get_latest_block"] == []
+    assert main_client.calls["get_neurons_list"] == [(1, recent_block)]
+    assert archive_client.calls["get_neurons_list"] == [(1, stale_block)]
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_finalized_block_from_head_tracker(bittensor_client, head_tracker):
+    finalized_block = Block(number=BlockNumber(498), hash=BlockHash("0xfinalized"))
+    head_tracker.update_finalized(finalized_block)
+    head_tracker.update_finalized(Block(number=BlockNumber(497), hash=BlockHash("0xolder")))
+
+    assert await bittensor_client.get_finalized_block() == finalized_block
+    assert bittensor_client._main_client.calls["get_finalized_block"] == []
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_finalized_block_fallback_updates_head_tracker(bittensor_client, head_tracker):
+    finalized_block = Block(number=BlockNumber(498), hash=BlockHash("0xfinalized"))
+
+    async with bittensor_client._main_client.mock_behavior(get_finalized_block=[finalized_block]):
+        assert await bittensor_client.get_finalized_block() == finalized_block
+
+    assert head_tracker.finalized == finalized_block
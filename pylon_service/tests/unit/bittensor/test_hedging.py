@@ -0,0 +1,173 @@
+"""
+Tests for the hedging of the slow upstream reads and its use by BittensorClient.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from bittensor_wallet import Wallet
+from prometheus_client import CollectorRegistry, Histogram
+from pylon_commons.models import Block
+from pylon_commons.types import ArchiveBlocksCutoff, BittensorNetwork, BlockHash, BlockNumber, NetUid
+
+from pylon_service.bittensor.client import BittensorClient
+from pylon_service.bittensor.hedging import HedgeDelays, hedged
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+def block(number: int) -> Block:
+    return Block(number=BlockNumber(number), hash=BlockHash(f"0x{number}"))
+
+
+@pytest.fixture
+def histogram():
+    return Histogram(
+        "test_operation_duration_seconds",
+        "Test operation duration.",
+        ["operation", "status"],
+        buckets=(0.1, 0.5, 1.0),
+        registry=CollectorRegistry(),
+    )
+
+
+def observe(histogram: Histogram, operation: str, duration: float, count: int, status: str = "success") -> None:
+    for _ in range(count):
+        histogram.labels(operation=operation, status=status).observe(duration)
+
+
+def test_hedge_delays_estimate_percentile(histogram):
+    observe(histogram, "get_neurons", 0.05, 8)
+    observe(histogram, "get_neurons", 0.3, 2)
+    observe(histogram, "get_neurons", 5.0, 10, status="error")
+    hedge_delays = HedgeDelays(percentile=0.9, min_samples=10, min_delay_seconds=0.0, histogram=histogram)
+
+    assert hedge_delays.get("get_neurons") == pytest.approx(0.3)
+    assert hedge_delays.get("get_block") is None
+
+
+def test_hedge_delays_require_min_samples(histogram):
+    observe(histogram, "get_neurons", 0.05, 5)
+    hedge_delays = HedgeDelays(min_samples=10, window_seconds=0.0, histogram=histogram)
+
+    assert hedge_delays.get("get_neurons") is None
+
+
+def test_hedge_delays_follow_recent_latency(histogram):
+    observe(histogram, "get_neurons", 0.05, 10)
+    hedge_delays = HedgeDelays(percentile=0.5, min_samples=10, window_seconds=0.0, histogram=histogram)
+    assert hedge_delays.get("get_neurons") == pytest.approx(0.05)
+
+    observe(histogram, "get_neurons", 0.75, 5)
+    assert hedge_delays.get("get_neurons") == pytest.approx(0.05)
+
+    observe(histogram, "get_neurons", 0.75, 5)
+    assert hedge_delays.get("get_neurons") == pytest.approx(0.75)
+
+
+def test_hedge_delays_are_estimated_once_per_window(histogram):
+    observe(histogram, "get_neurons", 0.05, 10)
+    hedge_delays = HedgeDelays(percentile=0.5, min_samples=10, window_seconds=3600.0, histogram=histogram)
+    assert hedge_delays.get("get_neurons") == pytest.approx(0.05)
+
+    observe(histogram, "get_neurons", 0.75, 20)
+    assert hedge_delays.get("get_neurons") == pytest.approx(0.05)
+
+
+def test_hedge_delays_use_min_delay(histogram):
+    observe(histogram, "get_neurons", 0.001, 10)
+    hedge_delays = HedgeDelays(percentile=0.1, min_samples=10, min_delay_seconds=0.05, histogram=histogram)
+
+    assert hedge_delays.get("get_neurons") == 0.05
+
+
+async def respond[T](result: T, delay: float = 0.0) -> T:
+    await asyncio.sleep(delay)
+    return result
+
+
+async def fail(delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    raise ConnectionError("Connection refused")
+
+
+@pytest.mark.asyncio
+async def test_hedged_does_not_hedge_fast_call():
+    hedge_calls = []
+
+    async def hedge():
+        hedge_calls.append(True)
+        return "hedge"
+
+    assert await hedged("get_block", lambda: respond("primary"), hedge, delay=1.0) == "primary"
+    assert hedge_calls == []
+
+
+@pytest.mark.asyncio
+async def test_hedged_uses_faster_hedge_and_cancels_primary():
+    primary_cancelled = asyncio.Event()
+
+    async def primary():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            primary_cancelled.set()
+            raise
+
+    assert await hedged("get_block", primary, lambda: respond("hedge"), delay=0.01) == "hedge"
+    await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_hedged_waits_for_primary_when_hedge_fails():
+    assert await hedged("get_block", lambda: respond("primary", delay=0.05), fail, delay=0.01) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_hedged_raises_primary_exception_when_both_fail():
+    async def primary():
+        await asyncio.sleep(0.05)
+        raise TimeoutError("Primary timed out")
+
+    with pytest.raises(TimeoutError, match="Primary timed out"):
+        await hedged("get_block", primary, fail, delay=0.01)
+
+
+@pytest_asyncio.fixture
+async def bittensor_client(histogram):
+    observe(histogram, "get_latest_block", 0.01, 10)
+    observe(histogram, "set_weights", 0.01, 10)
+    async with BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
+        subclient_cls=MockBittensorClient,
+        extra_uris=[BittensorNetwork("ws://main-extra")],
+        node_probe_interval=3600.0,
+        hedge_delays=HedgeDelays(min_samples=10, min_delay_seconds=0.01, histogram=histogram),
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_hedges_slow_read(bittensor_client):
+    first, second = bittensor_client._main_nodes.nodes
+
+    async with first.client.mock_behavior(get_latest_block=[lambda: respond(block(100), delay=10)]):
+        async with second.client.mock_behavior(get_latest_block=[block(100)]):
+            assert await bittensor_client.get_latest_block() == block(100)
+
+    assert len(first.client.calls["get_latest_block"]) == 1
+    assert len(second.client.calls["get_latest_block"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_does_not_hedge_writes(bittensor_client):
+    first, second = bittensor_client._main_nodes.nodes
+
+    async with first.client.mock_behavior(set_weights=[lambda netuid, weights: respond(None, delay=0.05)]):
+        await bittensor_client.set_weights(netuid=NetUid(1), weights={})
+
+    assert len(first.client.calls["set_weights"]) == 1
+    assert second.client.calls["set_weights"] == []
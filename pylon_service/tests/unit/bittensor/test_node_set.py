@@ -0,0 +1,159 @@
+"""
+Tests for the NodeSet health-weighted node selection and its use by BittensorClient.
+"""
+
+import pytest
+import pytest_asyncio
+from bittensor_wallet import Wallet
+from pylon_commons.models import Block
+from pylon_commons.types import ArchiveBlocksCutoff, BittensorNetwork, BlockHash, BlockNumber
+
+from pylon_service.bittensor.client import BittensorClient
+from pylon_service.bittensor.nodes import NodeHealthPolicy, NodeSet
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+def block(number: int) -> Block:
+    return Block(number=BlockNumber(number), hash=BlockHash(f"0x{number}"))
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("pylon_service.bittensor.nodes.monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def policy():
+    return NodeHealthPolicy(min_samples=2, max_error_rate=0.3, max_head_lag_blocks=2, ejection_seconds=10.0)
+
+
+@pytest.fixture
+def node_set(policy):
+    return NodeSet(
+        [
+            MockBittensorClient(uri=BittensorNetwork("ws://first")),
+            MockBittensorClient(uri=BittensorNetwork("ws://second")),
+        ],
+        policy=policy,
+    )
+
+
+def test_node_set_requires_nodes():
+    with pytest.raises(ValueError):
+        NodeSet([])
+
+
+def test_node_set_selects_first_node_by_default(node_set):
+    assert node_set.select() is node_set.primary
+
+
+def test_node_set_selects_lowest_latency(node_set):
+    first, second = node_set.nodes
+    node_set.record_success(first, latency=0.5)
+    node_set.record_success(second, latency=0.1)
+
+    assert node_set.select() is second
+
+
+def test_node_set_ejects_node_on_error_rate(node_set, clock):
+    first, second = node_set.nodes
+
+    node_set.record_failure(first)
+    assert first.ejected_until is None
+
+    node_set.record_failure(first)
+    assert first.ejected_until == clock.now + 10.0
+    assert node_set.select() is second
+
+
+def test_node_set_reinstates_node_after_ejection(node_set, clock):
+    first, _ = node_set.nodes
+    node_set.record_failure(first)
+    node_set.record_failure(first)
+
+    clock.now += 10.0
+
+    assert node_set.select() is first
+    assert first.ejected_until is None
+    assert first.error_rate == 0.0
+    assert first.samples == 0
+
+
+def test_node_set_uses_ejected_nodes_when_all_are_ejected(node_set):
+    first, second = node_set.nodes
+    for _ in range(2):
+        node_set.record_failure(first)
+        node_set.record_failure(second)
+    node_set.record_failure(second)
+
+    assert node_set.select() is first
+
+
+@pytest.mark.asyncio
+async def test_node_set_probe_ejects_lagging_node(node_set, clock):
+    first, second = node_set.nodes
+
+    async with first.client.mock_behavior(get_latest_block=[block(97)]):
+        async with second.client.mock_behavior(get_latest_block=[block(100)]):
+            await node_set.probe()
+
+    assert (first.head_number, first.head_lag) == (97, 3)
+    assert (second.head_number, second.head_lag) == (100, 0)
+    assert first.ejected_until == clock.now + 10.0
+    assert second.ejected_until is None
+    assert first.latency is not None
+    assert node_set.select() is second
+
+
+@pytest.mark.asyncio
+async def test_node_set_probe_records_failure(node_set):
+    first, second = node_set.nodes
+
+    async with first.client.mock_behavior(get_latest_block=[ConnectionError("Connection refused")]):
+        async with second.client.mock_behavior(get_latest_block=[block(100)]):
+            await node_set.probe()
+
+    assert first.error_rate > 0
+    assert first.head_number is None
+    assert second.error_rate == 0
+
+
+@pytest_asyncio.fixture
+async def bittensor_client(policy):
+    async with BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
+        subclient_cls=MockBittensorClient,
+        extra_uris=[BittensorNetwork("ws://main-extra")],
+        node_health_policy=policy,
+        node_probe_interval=3600.0,
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_routes_around_failing_node(bittensor_client):
+    first, second = bittensor_client._main_nodes.nodes
+
+    async with first.client.mock_behavior(get_latest_block=[ConnectionError("Connection refused")]):
+        async with second.client.mock_behavior(get_latest_block=[block(100), block(101)]):
+            with pytest.raises(ConnectionError):
+                await bittensor_client.get_latest_block()
+            assert await bittensor_client.get_latest_block() == block(100)
+            assert await bittensor_client.get_latest_block() == block(101)
+
+    assert len(first.client.calls["get_latest_block"]) == 1
+    assert len(second.client.calls["get_latest_block"]) == 2
+    assert bittensor_client._archive_nodes.primary.uri == "ws://archive"
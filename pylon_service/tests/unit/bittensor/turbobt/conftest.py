@@ -20,7 +20,7 @@ Example:
         assert len(result) == 2
 """
 
-from unittest.mock import create_autospec
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 import pytest_asyncio
@@ -31,6 +31,9 @@ from turbobt.neuron import NeuronReference as TurboBtNeuronReference
 from turbobt.subnet import SubnetCommitments as TurboBtSubnetCommitments
 from turbobt.subnet import SubnetNeurons as TurboBtSubnetNeurons
 from turbobt.subnet import SubnetWeights as TurboBtSubnetWeights
+from turbobt.substrate.pallets.chain import Chain as TurboBtChain
+from turbobt.substrate.pallets.state import State as TurboBtState
+from turbobt.subtensor.pallets._types import StorageDoubleMap as TurboBtStorageDoubleMap
 
 from pylon_service.bittensor.client import TurboBtClient
 
@@ -57,12 +60,23 @@ def subnet_spec(neuron_spec):
 
 
 @pytest.fixture
-def bittensor_spec(block_spec, subnet_spec):
+def subtensor_spec():
+    # Subtensor pallets are created in the constructor, so the autospec is given to the used storages only.
+    subtensor_mock = MagicMock()
+    subtensor_mock.chain = create_autospec(TurboBtChain, instance=True)
+    subtensor_mock.state = create_autospec(TurboBtState, instance=True)
+    subtensor_mock.subtensor_module.Uids = create_autospec(TurboBtStorageDoubleMap, instance=True)
+    return subtensor_mock
+
+
+@pytest.fixture
+def bittensor_spec(block_spec, subnet_spec, subtensor_spec):
     bittensor_mock = create_autospec(Bittensor, instance=True)
     bittensor_mock.__aenter__.return_value = bittensor_mock
     # Add specs for nested objects returned by methods.
     bittensor_mock.block.return_value = block_spec
     bittensor_mock.subnet.return_value = subnet_spec
+    bittensor_mock.subtensor = subtensor_spec
     # Create a spec for a class itself.
     bittensor_class_mock = create_autospec(Bittensor)
     bittensor_class_mock.return_value = bittensor_mock
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from pylon_commons.models import Block, CommitReveal, SubnetHyperparams
+from pylon_commons.types import BlockHash, BlockNumber, MaxWeightsLimit
+
+
+@pytest.fixture
+def test_block():
+    return Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+
+
+@pytest.fixture
+def expected_hyperparams():
+    return SubnetHyperparams(max_weights_limit=MaxWeightsLimit(100), commit_reveal_weights_enabled=CommitReveal.V4)
+
+
+@pytest.fixture
+def call_gate():
+    return asyncio.Event()
+
+
+@pytest.fixture
+def subnet_spec(subnet_spec, call_gate):
+    async def slow_get_hyperparameters(block_hash):
+        await call_gate.wait()
+        if block_hash == "0xbroken":
+            raise ValueError("upstream error")
+        return {"max_weights_limit": 100, "commit_reveal_weights_enabled": True}
+
+    subnet_spec.get_hyperparameters.side_effect = slow_get_hyperparameters
+    return subnet_spec
+
+
+async def wait_for_in_flight(turbobt_client, count: int):
+    async with asyncio.timeout(1):
+        while len(turbobt_client._single_flight) != count:
+            await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_are_coalesced(
+    turbobt_client, subnet_spec, call_gate, test_block, expected_hyperparams
+):
+    tasks = [asyncio.create_task(turbobt_client.get_hyperparams(netuid=1, block=test_block)) for _ in range(5)]
+    await wait_for_in_flight(turbobt_client, 1)
+    await asyncio.sleep(0)
+
+    call_gate.set()
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+    assert results == [expected_hyperparams] * 5
+    assert subnet_spec.get_hyperparameters.call_count == 1
+    assert len(turbobt_client._single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_calls_for_different_blocks_are_not_coalesced(turbobt_client, subnet_spec, call_gate, test_block):
+    other_block = Block(number=BlockNumber(1001), hash=BlockHash("0xdef456"))
+    tasks = [
+        asyncio.create_task(turbobt_client.get_hyperparams(netuid=1, block=test_block)),
+        asyncio.create_task(turbobt_client.get_hyperparams(netuid=1, block=other_block)),
+        asyncio.create_task(turbobt_client.get_hyperparams(netuid=2, block=test_block)),
+    ]
+    await wait_for_in_flight(turbobt_client, 3)
+
+    call_gate.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+    assert subnet_spec.get_hyperparameters.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_coalesced_call(
+    turbobt_client, subnet_spec, call_gate, test_block, expected_hyperparams
+):
+    cancelled_task = asyncio.create_task(turbobt_client.get_hyperparams(netuid=1, block=test_block))
+    waiting_task = asyncio.create_task(turbobt_client.get_hyperparams(netuid=1, block=test_block))
+    await wait_for_in_flight(turbobt_client, 1)
+    await asyncio.sleep(0)
+
+    cancelled_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_task
+
+    call_gate.set()
+    assert await asyncio.wait_for(waiting_task, timeout=1) == expected_hyperparams
+    assert subnet_spec.get_hyperparameters.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesced_call_error_is_propagated_and_released(turbobt_client, subnet_spec, call_gate):
+    broken_block = Block(number=BlockNumber(1000), hash=BlockHash("0xbroken"))
+    tasks = [asyncio.create_task(turbobt_client.get_hyperparams(netuid=1, block=broken_block)) for _ in range(2)]
+    await wait_for_in_flight(turbobt_client, 1)
+    await asyncio.sleep(0)
+
+    call_gate.set()
+    results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=1)
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert len(turbobt_client._single_flight) == 0
+
+    with pytest.raises(ValueError, match="upstream error"):
+        await turbobt_client.get_hyperparams(netuid=1, block=broken_block)
+    assert subnet_spec.get_hyperparameters.call_count == 2
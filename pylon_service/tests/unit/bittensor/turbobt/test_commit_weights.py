@@ -1,12 +1,12 @@
-import ipaddress
-from unittest.mock import Mock
-
 import pytest
+import pytest_asyncio
 from pylon_commons.models import Block
-from pylon_commons.types import BlockHash, BlockNumber, Hotkey, RevealRound
-from turbobt.neuron import AxonInfo as TurboBtAxonInfo
-from turbobt.neuron import AxonProtocolEnum as TurboBtAxonProtocolEnum
-from turbobt.neuron import Neuron as TurboBtNeuron
+from pylon_commons.types import BittensorNetwork, BlockHash, BlockNumber, Hotkey, RevealRound
+
+from pylon_service.bittensor.client import TurboBtClient
+from pylon_service.bittensor.head import ChainHeadTracker
+from pylon_service.bittensor.uids import HotkeyUidIndex
+from tests.mock_bittensor_client import MockBittensorClient
 
 
 @pytest.fixture
@@ -16,58 +16,14 @@ def block_spec(block_spec):
     return block_spec
 
 
+@pytest.fixture
+def subtensor_spec(subtensor_spec):
+    subtensor_spec.subtensor_module.Uids.fetch.return_value = [((1, "hotkey1"), 1), ((1, "hotkey2"), 2)]
+    return subtensor_spec
+
+
 @pytest.fixture
 def subnet_spec(subnet_spec):
-    subnet_spec.list_neurons.return_value = [
-        TurboBtNeuron(
-            subnet=subnet_spec,
-            uid=1,
-            coldkey="coldkey1",
-            hotkey="hotkey1",
-            active=True,
-            axon_info=TurboBtAxonInfo(
-                ip=ipaddress.IPv4Address("192.168.1.1"),
-                port=8080,
-                protocol=TurboBtAxonProtocolEnum.TCP,
-            ),
-            prometheus_info=Mock(),
-            stake=100.0,
-            rank=0.5,
-            emission=10.0,
-            incentive=0.8,
-            consensus=0.9,
-            trust=0.7,
-            validator_trust=0.6,
-            dividends=0.4,
-            last_update=1000,
-            validator_permit=True,
-            pruning_score=50,
-        ),
-        TurboBtNeuron(
-            subnet=subnet_spec,
-            uid=2,
-            coldkey="coldkey2",
-            hotkey="hotkey2",
-            active=False,
-            axon_info=TurboBtAxonInfo(
-                ip=ipaddress.IPv4Address("192.168.1.2"),
-                port=8081,
-                protocol=TurboBtAxonProtocolEnum.UDP,
-            ),
-            prometheus_info=Mock(),
-            stake=200.0,
-            rank=0.6,
-            emission=20.0,
-            incentive=0.7,
-            consensus=0.8,
-            trust=0.9,
-            validator_trust=0.5,
-            dividends=0.3,
-            last_update=2000,
-            validator_permit=False,
-            pruning_score=60,
-        ),
-    ]
     subnet_spec.weights.commit.return_value = 1234
     return subnet_spec
 
@@ -82,3 +38,48 @@ async def test_turbobt_client_commit_weights(turbobt_client, subnet_spec):
     result = await turbobt_client.commit_weights(netuid=1, weights=weights)
     assert result == RevealRound(1234)
     subnet_spec.weights.commit.assert_called_once_with({1: 0.6, 2: 0.3})
+
+
+@pytest.fixture
+def head_tracker():
+    return ChainHeadTracker(MockBittensorClient())
+
+
+@pytest_asyncio.fixture
+async def indexed_turbobt_client(monkeypatch, bittensor_spec, wallet, head_tracker):
+    monkeypatch.setattr("pylon_service.bittensor.client.Bittensor", bittensor_spec)
+    uid_index = HotkeyUidIndex(head_tracker)
+    async with TurboBtClient(wallet=wallet, uri=BittensorNetwork("ws://testserver"), uid_index=uid_index) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_commit_weights_uses_uid_index_within_block(
+    indexed_turbobt_client, head_tracker, subnet_spec, subtensor_spec, block_spec
+):
+    head_tracker.update(Block(number=BlockNumber(1000), hash=BlockHash("0xabc123")))
+    weights = {Hotkey("hotkey1"): 0.6, Hotkey("hotkey2"): 0.4}
+
+    for _ in range(3):
+        await indexed_turbobt_client.commit_weights(netuid=1, weights=weights)
+
+    assert subtensor_spec.subtensor_module.Uids.fetch.await_count == 1
+    subtensor_spec.subtensor_module.Uids.fetch.assert_awaited_with(1, block_hash="0xabc123")
+    block_spec.get.assert_not_called()
+    assert subnet_spec.weights.commit.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_commit_weights_refreshes_uid_index_on_new_block(
+    indexed_turbobt_client, head_tracker, subnet_spec, subtensor_spec
+):
+    head_tracker.update(Block(number=BlockNumber(1000), hash=BlockHash("0xabc123")))
+    await indexed_turbobt_client.commit_weights(netuid=1, weights={Hotkey("hotkey1"): 1.0})
+
+    head_tracker.update(Block(number=BlockNumber(1001), hash=BlockHash("0xdef456")))
+    subtensor_spec.subtensor_module.Uids.fetch.return_value = [((1, "hotkey1"), 3)]
+    await indexed_turbobt_client.commit_weights(netuid=1, weights={Hotkey("hotkey1"): 1.0})
+
+    assert subtensor_spec.subtensor_module.Uids.fetch.await_count == 2
+    subtensor_spec.subtensor_module.Uids.fetch.assert_awaited_with(1, block_hash="0xdef456")
+    subnet_spec.weights.commit.assert_called_with({3: 1.0})
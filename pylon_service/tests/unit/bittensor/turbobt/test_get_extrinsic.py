@@ -0,0 +1,96 @@
+import pytest
+import pytest_asyncio
+from pylon_commons.models import Block
+from pylon_commons.types import BittensorNetwork, BlockHash, BlockNumber, ExtrinsicIndex
+
+from pylon_service.bittensor.cache import SignedBlockCache
+from pylon_service.bittensor.client import TurboBtClient
+
+
+@pytest.fixture
+def test_block():
+    return Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+
+
+@pytest.fixture
+def subtensor_spec(subtensor_spec):
+    subtensor_spec.chain.getBlock.return_value = {
+        "block": {
+            "header": {"number": 1000},
+            "extrinsics": [
+                {
+                    "extrinsic_hash": f"0xextrinsic{index}",
+                    "extrinsic_length": 100 + index,
+                    "address": None,
+                    "call": {"call_module": "Timestamp", "call_function": "set", "call_args": []},
+                }
+                for index in range(3)
+            ],
+        },
+        "justifications": None,
+    }
+    return subtensor_spec
+
+
+@pytest.fixture
+def signed_block_cache():
+    return SignedBlockCache()
+
+
+@pytest_asyncio.fixture
+async def cached_turbobt_client(monkeypatch, bittensor_spec, wallet, signed_block_cache):
+    monkeypatch.setattr("pylon_service.bittensor.client.Bittensor", bittensor_spec)
+    async with TurboBtClient(
+        wallet=wallet, uri=BittensorNetwork("ws://testserver"), signed_block_cache=signed_block_cache
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_extrinsic(turbobt_client, subtensor_spec, test_block):
+    result = await turbobt_client.get_extrinsic(test_block, ExtrinsicIndex(1))
+
+    assert result is not None
+    assert result.block_number == 1000
+    assert result.extrinsic_index == 1
+    assert result.extrinsic_hash == "0xextrinsic1"
+    assert result.extrinsic_length == 101
+    assert result.call.call_module == "Timestamp"
+    subtensor_spec.chain.getBlock.assert_awaited_once_with("0xabc123")
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_extrinsic_index_out_of_range(turbobt_client, subtensor_spec, test_block):
+    assert await turbobt_client.get_extrinsic(test_block, ExtrinsicIndex(3)) is None
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_walking_extrinsics_fetches_block_once(
+    cached_turbobt_client, subtensor_spec, signed_block_cache, test_block
+):
+    first_walk = [await cached_turbobt_client.get_extrinsic(test_block, ExtrinsicIndex(index)) for index in range(3)]
+    second_walk = [await cached_turbobt_client.get_extrinsic(test_block, ExtrinsicIndex(index)) for index in range(3)]
+
+    assert [extrinsic.extrinsic_hash for extrinsic in first_walk] == ["0xextrinsic0", "0xextrinsic1", "0xextrinsic2"]
+    assert second_walk == first_walk
+    assert second_walk[0] is first_walk[0]
+    subtensor_spec.chain.getBlock.assert_awaited_once_with("0xabc123")
+    assert len(signed_block_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_extrinsics(cached_turbobt_client, subtensor_spec, test_block):
+    single = await cached_turbobt_client.get_extrinsic(test_block, ExtrinsicIndex(1))
+    result = await cached_turbobt_client.get_extrinsics(test_block)
+
+    assert result is not None
+    assert [extrinsic.extrinsic_index for extrinsic in result] == [0, 1, 2]
+    assert [extrinsic.extrinsic_hash for extrinsic in result] == ["0xextrinsic0", "0xextrinsic1", "0xextrinsic2"]
+    assert result[1] is single
+    subtensor_spec.chain.getBlock.assert_awaited_once_with("0xabc123")
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_extrinsics_block_not_found(turbobt_client, subtensor_spec, test_block):
+    subtensor_spec.chain.getBlock.return_value = None
+    assert await turbobt_client.get_extrinsics(test_block) is None
@@ -0,0 +1,17 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from pylon_commons.models import Block
+from pylon_commons.types import BlockHash, BlockNumber
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_finalized_block(turbobt_client, subtensor_spec):
+    subtensor_spec.rpc = AsyncMock(return_value="0xfinalized")
+    subtensor_spec.chain.getHeader.return_value = {"number": 197}
+
+    result = await turbobt_client.get_finalized_block()
+
+    assert result == Block(hash=BlockHash("0xfinalized"), number=BlockNumber(197))
+    subtensor_spec.rpc.assert_awaited_once_with(method="chain_getFinalizedHead", params={})
+    subtensor_spec.chain.getHeader.assert_awaited_once_with("0xfinalized")
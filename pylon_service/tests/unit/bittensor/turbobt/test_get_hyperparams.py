@@ -1,6 +1,6 @@
 import pytest
 from pylon_commons.models import Block, CommitReveal, SubnetHyperparams
-from pylon_commons.types import BlockHash, BlockNumber, MaxWeightsLimit
+from pylon_commons.types import BlockHash, BlockNumber, MaxWeightsLimit, Tempo
 
 
 @pytest.fixture
@@ -13,6 +13,7 @@ def subnet_spec(subnet_spec):
     subnet_spec.get_hyperparameters.return_value = {
         "max_weights_limit": 100,
         "commit_reveal_weights_enabled": True,
+        "tempo": 360,
     }
     return subnet_spec
 
@@ -23,6 +24,7 @@ async def test_turbobt_client_get_hyperparams(turbobt_client, subnet_spec, test_
     assert result == SubnetHyperparams(
         max_weights_limit=MaxWeightsLimit(100),
         commit_reveal_weights_enabled=CommitReveal.V4,
+        tempo=Tempo(360),
     )
 
 
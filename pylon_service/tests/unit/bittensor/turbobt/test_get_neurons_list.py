@@ -1,3 +1,5 @@
+import asyncio
+import dataclasses
 import ipaddress
 from unittest.mock import Mock
 
@@ -163,3 +165,42 @@ async def test_turbobt_client_get_neurons_list(turbobt_client, subnet_spec, test
             ),
         ),
     ]
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_neurons_list_fetches_concurrently(turbobt_client, subnet_spec, test_block):
+    """
+    Neurons and subnet state of a 256-neuron subnet are fetched concurrently: each of the upstream calls waits
+    for the other one to start before returning, which would never happen if they were made one after another.
+    """
+    neurons_count = 256
+    template = subnet_spec.list_neurons.return_value[0]
+    neurons = [
+        dataclasses.replace(template, uid=uid, hotkey=f"hotkey{uid}", coldkey=f"coldkey{uid}")
+        for uid in range(neurons_count)
+    ]
+    state = {
+        key: [value[0]] * neurons_count if isinstance(value, list) else value
+        for key, value in subnet_spec.get_state.return_value.items()
+    }
+    state["hotkeys"] = [neuron.hotkey for neuron in neurons]
+    state["coldkeys"] = [neuron.coldkey for neuron in neurons]
+
+    both_started = asyncio.Barrier(2)
+
+    async def overlapping_list_neurons(block_hash):
+        await both_started.wait()
+        return neurons
+
+    async def overlapping_get_state(block_hash):
+        await both_started.wait()
+        return state
+
+    subnet_spec.list_neurons.side_effect = overlapping_list_neurons
+    subnet_spec.get_state.side_effect = overlapping_get_state
+
+    async with asyncio.timeout(5):  # the calls never meet at the barrier if they are sequential
+        result = await turbobt_client.get_neurons_list(netuid=1, block=test_block)
+
+    assert len(result) == neurons_count
+    assert [neuron.hotkey for neuron in result] == state["hotkeys"]
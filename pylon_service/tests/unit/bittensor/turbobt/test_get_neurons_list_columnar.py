@@ -0,0 +1,152 @@
+import ipaddress
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from pylon_commons.currency import Currency, Token
+from pylon_commons.models import AxonInfo, AxonProtocol, Block, Neuron, Stakes
+from pylon_commons.types import (
+    AlphaStake,
+    BittensorNetwork,
+    BlockHash,
+    BlockNumber,
+    Coldkey,
+    Consensus,
+    Dividends,
+    Emission,
+    Hotkey,
+    Incentive,
+    NeuronActive,
+    NeuronUid,
+    Port,
+    PruningScore,
+    Rank,
+    Stake,
+    TaoStake,
+    Timestamp,
+    TotalStake,
+    Trust,
+    ValidatorPermit,
+    ValidatorTrust,
+)
+
+from pylon_service.bittensor.client import TurboBtClient
+
+
+@pytest.fixture
+def test_block():
+    return Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+
+
+@pytest.fixture
+def axons_storage(monkeypatch):
+    storage = MagicMock()
+    storage.fetch = AsyncMock(
+        return_value=[
+            ((1, "hotkey1"), {"ip": int(ipaddress.IPv4Address("192.168.1.1")), "port": 8080, "protocol": 0}),
+        ]
+    )
+    storage_cls = MagicMock()
+    storage_cls.__getitem__.return_value.return_value = storage
+    monkeypatch.setattr("pylon_service.bittensor.client.StorageDoubleMap", storage_cls)
+    return storage
+
+
+@pytest.fixture
+def subtensor_spec(subtensor_spec):
+    subtensor_spec.state.getStorage.return_value = [39321, 0]
+    return subtensor_spec
+
+
+@pytest.fixture
+def subnet_spec(subnet_spec):
+    subnet_spec.get_state.return_value = {
+        "netuid": 1,
+        "hotkeys": ["hotkey1", "hotkey2"],
+        "coldkeys": ["coldkey1", "coldkey2"],
+        "active": [True, False],
+        "validator_permit": [True, False],
+        "pruning_score": [50, 60],
+        "last_update": [1000, 2000],
+        "emission": [10_000_000_000, 20_000_000_000],
+        "dividends": [65535, 0],
+        "incentives": [0, 65535],
+        "consensus": [13107, 26214],
+        "trust": [65535, 32768],
+        "rank": [0, 6553],
+        "block_at_registration": [0, 0],
+        "alpha_stake": [50_000_000_000, 100_000_000_000],
+        "tao_stake": [30_000_000_000, 60_000_000_000],
+        "total_stake": [55_400_000_000, 110_800_000_000],
+        "emission_history": [[], []],
+    }
+    return subnet_spec
+
+
+@pytest_asyncio.fixture
+async def columnar_client(monkeypatch, bittensor_spec, axons_storage, wallet):
+    monkeypatch.setattr("pylon_service.bittensor.client.Bittensor", bittensor_spec)
+    async with TurboBtClient(wallet=wallet, uri=BittensorNetwork("ws://testserver"), columnar_neurons=True) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_neurons_list_columnar(
+    columnar_client, subtensor_spec, subnet_spec, axons_storage, test_block
+):
+    result = await columnar_client.get_neurons_list(netuid=1, block=test_block)
+
+    assert result == [
+        Neuron(
+            uid=NeuronUid(0),
+            coldkey=Coldkey("coldkey1"),
+            hotkey=Hotkey("hotkey1"),
+            active=NeuronActive(True),
+            axon_info=AxonInfo(ip=ipaddress.IPv4Address("192.168.1.1"), port=Port(8080), protocol=AxonProtocol.TCP),
+            stake=Stake(55.4),
+            rank=Rank(0.0),
+            emission=Emission(Currency[Token.ALPHA](10.0)),
+            incentive=Incentive(0.0),
+            consensus=Consensus(0.2),
+            trust=Trust(1.0),
+            validator_trust=ValidatorTrust(0.6),
+            dividends=Dividends(1.0),
+            last_update=Timestamp(1000),
+            validator_permit=ValidatorPermit(True),
+            pruning_score=PruningScore(50),
+            stakes=Stakes(
+                alpha=AlphaStake(Currency[Token.ALPHA](50.0)),
+                tao=TaoStake(Currency[Token.TAO](30.0)),
+                total=TotalStake(Currency[Token.ALPHA](55.4)),
+            ),
+        ),
+        Neuron(
+            uid=NeuronUid(1),
+            coldkey=Coldkey("coldkey2"),
+            hotkey=Hotkey("hotkey2"),
+            active=NeuronActive(False),
+            axon_info=AxonInfo(ip=ipaddress.IPv4Address("0.0.0.0"), port=Port(0), protocol=AxonProtocol.TCP),
+            stake=Stake(110.8),
+            rank=Rank(6553 / 65535),
+            emission=Emission(Currency[Token.ALPHA](20.0)),
+            incentive=Incentive(1.0),
+            consensus=Consensus(0.4),
+            trust=Trust(32768 / 65535),
+            validator_trust=ValidatorTrust(0.0),
+            dividends=Dividends(0.0),
+            last_update=Timestamp(2000),
+            validator_permit=ValidatorPermit(False),
+            pruning_score=PruningScore(60),
+            stakes=Stakes(
+                alpha=AlphaStake(Currency[Token.ALPHA](100.0)),
+                tao=TaoStake(Currency[Token.TAO](60.0)),
+                total=TotalStake(Currency[Token.ALPHA](110.8)),
+            ),
+        ),
+    ]
+    subnet_spec.list_neurons.assert_not_called()
+    subnet_spec.get_state.assert_awaited_once_with(test_block.hash)
+    axons_storage.fetch.assert_awaited_once_with(1, block_hash=test_block.hash)
+    subtensor_spec.state.getStorage.assert_awaited_once_with(
+        "SubtensorModule.ValidatorTrust", 1, block_hash=test_block.hash
+    )
@@ -22,6 +22,8 @@ from pylon_commons.types import (
     ValidatorPermit,
 )
 
+from pylon_service.bittensor.exceptions import SubnetNotFound
+
 
 @pytest.fixture
 def test_block():
@@ -101,3 +103,11 @@ async def test_turbobt_client_get_subnet_state(turbobt_client, subnet_spec, test
         ],
     )
     subnet_spec.get_state.assert_called_once_with(test_block.hash)
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_get_subnet_state_missing_subnet(turbobt_client, subnet_spec, test_block):
+    subnet_spec.get_state.return_value = None
+
+    with pytest.raises(SubnetNotFound):
+        await turbobt_client.get_subnet_state(netuid=NetUid(1), block=test_block)
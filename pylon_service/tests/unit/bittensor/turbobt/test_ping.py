@@ -0,0 +1,197 @@
+import asyncio
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+from pylon_commons.types import BittensorNetwork
+from turbobt import Bittensor
+from turbobt.substrate.pallets.chain import Chain as TurboBtChain
+
+from pylon_service.bittensor.client import TurboBtClient
+from tests.helpers import wait_until
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_ping(turbobt_client, subtensor_spec):
+    subtensor_spec.chain.getBlockHash.return_value = "0xhash"
+
+    await turbobt_client.ping()
+
+    subtensor_spec.chain.getBlockHash.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_warm_up_sends_request(turbobt_client, subtensor_spec):
+    subtensor_spec.chain.getBlockHash.return_value = "0xhash"
+
+    await turbobt_client.warm_up()
+
+    subtensor_spec.chain.getBlockHash.assert_awaited_once_with()
+    assert turbobt_client.ping_latency is not None
+
+
+@pytest.fixture
+def new_bittensor_mock(bittensor_spec):
+    new_bittensor_mock = create_autospec(Bittensor, instance=True)
+    new_bittensor_mock.__aenter__.return_value = new_bittensor_mock
+    new_bittensor_mock.subtensor = MagicMock()
+    new_bittensor_mock.subtensor.chain = create_autospec(TurboBtChain, instance=True)
+    new_bittensor_mock.subtensor.chain.getBlockHash.return_value = "0xhash"
+    return new_bittensor_mock
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_ping_failure_recreates_client(
+    turbobt_client, bittensor_spec, subtensor_spec, new_bittensor_mock
+):
+    old_bittensor_mock = bittensor_spec.return_value
+    subtensor_spec.chain.getBlockHash.side_effect = ConnectionError("Connection closed")
+    bittensor_spec.return_value = new_bittensor_mock
+
+    await turbobt_client.ping()
+
+    await wait_until(lambda: old_bittensor_mock.__aexit__.called, sleep_interval=0.01)
+    old_bittensor_mock.__aexit__.assert_called_once()
+    assert turbobt_client._raw_client is new_bittensor_mock
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_ping_records_latency(turbobt_client, subtensor_spec):
+    subtensor_spec.chain.getBlockHash.return_value = "0xhash"
+
+    await turbobt_client.ping()
+
+    assert turbobt_client.ping_latency is not None
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_recreation_opens_new_client_before_swap(
+    turbobt_client, bittensor_spec, new_bittensor_mock
+):
+    old_bittensor_mock = bittensor_spec.return_value
+    enter_gate = asyncio.Event()
+
+    async def slow_aenter(*args):
+        await enter_gate.wait()
+        return new_bittensor_mock
+
+    new_bittensor_mock.__aenter__.side_effect = slow_aenter
+    bittensor_spec.return_value = new_bittensor_mock
+
+    recreate_task = asyncio.create_task(turbobt_client._recreate_bt_client())
+    await asyncio.sleep(0)
+
+    # Requests keep using the old client while the new one is being opened.
+    async with asyncio.timeout(1):
+        assert await turbobt_client._get_bt_client() is old_bittensor_mock
+    old_bittensor_mock.__aexit__.assert_not_called()
+
+    enter_gate.set()
+    await asyncio.wait_for(recreate_task, timeout=1)
+
+    assert turbobt_client._raw_client is new_bittensor_mock
+    await wait_until(lambda: old_bittensor_mock.__aexit__.called, sleep_interval=0.01)
+    old_bittensor_mock.__aexit__.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_recreation_closes_old_client_after_its_calls_finish(
+    turbobt_client, bittensor_spec, subtensor_spec, new_bittensor_mock
+):
+    old_bittensor_mock = bittensor_spec.return_value
+    call_gate = asyncio.Event()
+
+    async def slow_call():
+        await call_gate.wait()
+        return "0xhash"
+
+    subtensor_spec.chain.getBlockHash.side_effect = slow_call
+    running_call = asyncio.create_task(turbobt_client._call_turbobt(lambda c: c.subtensor.chain.getBlockHash()))
+    await asyncio.sleep(0)
+    bittensor_spec.return_value = new_bittensor_mock
+
+    await turbobt_client._recreate_bt_client()
+    await asyncio.sleep(0.05)
+
+    assert turbobt_client._raw_client is new_bittensor_mock
+    old_bittensor_mock.__aexit__.assert_not_called()
+
+    call_gate.set()
+    assert await asyncio.wait_for(running_call, timeout=1) == "0xhash"
+    await wait_until(lambda: old_bittensor_mock.__aexit__.called, sleep_interval=0.01)
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_recreation_closes_half_opened_client(turbobt_client, bittensor_spec, new_bittensor_mock):
+    old_bittensor_mock = bittensor_spec.return_value
+    new_bittensor_mock.__aenter__.side_effect = ConnectionError("Connection refused")
+    bittensor_spec.return_value = new_bittensor_mock
+
+    with pytest.raises(ConnectionError):
+        await turbobt_client._recreate_bt_client()
+
+    new_bittensor_mock.__aexit__.assert_awaited_once()
+    assert turbobt_client._raw_client is old_bittensor_mock
+    old_bittensor_mock.__aexit__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_recreation_connects_new_client_before_swap(
+    turbobt_client, bittensor_spec, new_bittensor_mock
+):
+    bittensor_spec.return_value = new_bittensor_mock
+
+    await turbobt_client._recreate_bt_client()
+
+    new_bittensor_mock.subtensor.chain.getBlockHash.assert_awaited_once_with()
+    assert turbobt_client._raw_client is new_bittensor_mock
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_recreation_keeps_old_client_when_new_one_cannot_connect(
+    turbobt_client, bittensor_spec, new_bittensor_mock
+):
+    old_bittensor_mock = bittensor_spec.return_value
+    new_bittensor_mock.subtensor.chain.getBlockHash.side_effect = ConnectionError("Connection refused")
+    bittensor_spec.return_value = new_bittensor_mock
+
+    with pytest.raises(ConnectionError):
+        await turbobt_client._recreate_bt_client()
+
+    new_bittensor_mock.__aexit__.assert_awaited_once()
+    assert turbobt_client._raw_client is old_bittensor_mock
+    old_bittensor_mock.__aexit__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_does_not_recreate_replaced_client(turbobt_client, bittensor_spec, new_bittensor_mock):
+    old_bittensor_mock = bittensor_spec.return_value
+    bittensor_spec.return_value = new_bittensor_mock
+
+    await turbobt_client._recreate_bt_client(old_bittensor_mock)
+    await turbobt_client._recreate_bt_client(old_bittensor_mock)
+
+    assert turbobt_client._raw_client is new_bittensor_mock
+    assert bittensor_spec.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_turbobt_client_health_monitor_replaces_dead_connection(
+    monkeypatch, bittensor_spec, subtensor_spec, new_bittensor_mock, wallet
+):
+    monkeypatch.setattr("pylon_service.bittensor.client.Bittensor", bittensor_spec)
+    old_bittensor_mock = bittensor_spec.return_value
+    subtensor_spec.chain.getBlockHash.side_effect = ConnectionError("Connection closed")
+
+    async with TurboBtClient(
+        wallet=wallet, uri=BittensorNetwork("ws://testserver"), health_check_interval=0.01
+    ) as client:
+        bittensor_spec.return_value = new_bittensor_mock
+        await wait_until(lambda: client.ping_latency is not None, sleep_interval=0.01)
+        # The monitor pings the connection, so the external ping does not.
+        await client.ping()
+
+        assert client._raw_client is new_bittensor_mock
+        await wait_until(lambda: old_bittensor_mock.__aexit__.called, sleep_interval=0.01)
+        old_bittensor_mock.__aexit__.assert_called_once()
+        assert new_bittensor_mock.subtensor.chain.getBlockHash.await_count >= 1
+    assert client._monitor_task is None
@@ -1,12 +1,6 @@
-import ipaddress
-from unittest.mock import Mock
-
 import pytest
 from pylon_commons.models import Block
 from pylon_commons.types import BlockHash, BlockNumber, Hotkey, Weight
-from turbobt.neuron import AxonInfo as TurboBtAxonInfo
-from turbobt.neuron import AxonProtocolEnum as TurboBtAxonProtocolEnum
-from turbobt.neuron import Neuron as TurboBtNeuron
 
 
 @pytest.fixture
@@ -17,58 +11,9 @@ def block_spec(block_spec):
 
 
 @pytest.fixture
-def subnet_spec(subnet_spec):
-    subnet_spec.list_neurons.return_value = [
-        TurboBtNeuron(
-            subnet=subnet_spec,
-            uid=1,
-            coldkey="coldkey1",
-            hotkey="hotkey1",
-            active=True,
-            axon_info=TurboBtAxonInfo(
-                ip=ipaddress.IPv4Address("192.168.1.1"),
-                port=8080,
-                protocol=TurboBtAxonProtocolEnum.TCP,
-            ),
-            prometheus_info=Mock(),
-            stake=100.0,
-            rank=0.5,
-            emission=10.0,
-            incentive=0.8,
-            consensus=0.9,
-            trust=0.7,
-            validator_trust=0.6,
-            dividends=0.4,
-            last_update=1000,
-            validator_permit=True,
-            pruning_score=50,
-        ),
-        TurboBtNeuron(
-            subnet=subnet_spec,
-            uid=2,
-            coldkey="coldkey2",
-            hotkey="hotkey2",
-            active=False,
-            axon_info=TurboBtAxonInfo(
-                ip=ipaddress.IPv4Address("192.168.1.2"),
-                port=8081,
-                protocol=TurboBtAxonProtocolEnum.UDP,
-            ),
-            prometheus_info=Mock(),
-            stake=200.0,
-            rank=0.6,
-            emission=20.0,
-            incentive=0.7,
-            consensus=0.8,
-            trust=0.9,
-            validator_trust=0.5,
-            dividends=0.3,
-            last_update=2000,
-            validator_permit=False,
-            pruning_score=60,
-        ),
-    ]
-    return subnet_spec
+def subtensor_spec(subtensor_spec):
+    subtensor_spec.subtensor_module.Uids.fetch.return_value = [((1, "hotkey1"), 1), ((1, "hotkey2"), 2)]
+    return subtensor_spec
 
 
 @pytest.mark.asyncio
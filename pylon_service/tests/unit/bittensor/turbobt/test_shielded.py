@@ -1,5 +1,5 @@
 import asyncio
-from unittest.mock import create_autospec
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 from pylon_commons.models import Block
@@ -7,8 +7,10 @@ from pylon_commons.types import BittensorNetwork, BlockHash, BlockNumber
 from turbobt import Bittensor
 from turbobt import BlockReference as TurboBtBlockReference
 from turbobt.block import Block as TurboBtBlock
+from turbobt.substrate.pallets.chain import Chain as TurboBtChain
 
 from pylon_service.bittensor.client import TurboBtClient
+from tests.helpers import wait_until
 
 
 @pytest.mark.asyncio
@@ -45,6 +47,8 @@ async def test_runtime_error_triggers_client_recreation_and_retry(turbobt_client
 
     new_bittensor_mock = create_autospec(Bittensor, instance=True)
     new_bittensor_mock.__aenter__.return_value = new_bittensor_mock
+    new_bittensor_mock.subtensor = MagicMock()
+    new_bittensor_mock.subtensor.chain = create_autospec(TurboBtChain, instance=True)
 
     new_block_spec = create_autospec(TurboBtBlockReference, instance=True)
     new_block_spec.get.return_value = TurboBtBlock("hash", 42, client=new_bittensor_mock)
@@ -57,6 +61,7 @@ async def test_runtime_error_triggers_client_recreation_and_retry(turbobt_client
     assert result == Block(number=BlockNumber(42), hash=BlockHash("hash"))
     assert block_spec.get.call_count == 1
     assert new_block_spec.get.call_count == 1
+    await wait_until(lambda: old_bittensor_mock.__aexit__.called, sleep_interval=0.01)
     old_bittensor_mock.__aexit__.assert_called_once()
     assert bittensor_spec.call_count == 2
 
@@ -95,16 +100,13 @@ async def test_get_bt_client_waits_for_event(turbobt_client):
 
 @pytest.mark.asyncio
 async def test_recreate_deduplicates_concurrent_calls(turbobt_client, bittensor_spec):
-    exit_gate = asyncio.Event()
-    exit_call_count = 0
+    enter_gate = asyncio.Event()
 
-    async def slow_first_exit(*args):
-        nonlocal exit_call_count
-        exit_call_count += 1
-        if exit_call_count == 1:
-            await exit_gate.wait()
+    async def slow_enter(*args):
+        await enter_gate.wait()
+        return bittensor_spec.return_value
 
-    bittensor_spec.return_value.__aexit__.side_effect = slow_first_exit
+    bittensor_spec.return_value.__aenter__.side_effect = slow_enter
     bittensor_spec.reset_mock()
 
     task1 = asyncio.create_task(turbobt_client._recreate_bt_client())
@@ -115,7 +117,7 @@ async def test_recreate_deduplicates_concurrent_calls(turbobt_client, bittensor_
     assert not task1.done()
     assert not task2.done()
 
-    exit_gate.set()
+    enter_gate.set()
     await asyncio.wait_for(asyncio.gather(task1, task2), timeout=1)
 
     assert bittensor_spec.call_count == 1
@@ -0,0 +1,32 @@
+"""
+Tests for the GET /identity/{identity_name}/subnet/{netuid}/time/{timestamp}/neurons endpoint.
+"""
+
+import pytest
+from litestar.status_codes import HTTP_200_OK
+from litestar.testing import AsyncTestClient
+from pylon_commons.models import Block, SubnetNeurons
+
+from tests.factories import BlockFactory, NeuronFactory
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+@pytest.fixture
+def block(block_factory: BlockFactory) -> Block:
+    return block_factory.build()
+
+
+@pytest.mark.asyncio
+async def test_get_neurons_at_time_identity(
+    test_client: AsyncTestClient,
+    sn1_mock_bt_client: MockBittensorClient,
+    block: Block,
+    neuron_factory: NeuronFactory,
+):
+    subnet_neurons = SubnetNeurons(block=block, neurons={neuron.hotkey: neuron for neuron in neuron_factory.batch(2)})
+
+    async with sn1_mock_bt_client.mock_behavior(get_block_at=[block], get_neurons=[subnet_neurons]):
+        response = await test_client.get("/api/v1/identity/sn1/subnet/1/time/1700000000/neurons")
+
+        assert response.status_code == HTTP_200_OK, response.content
+        assert response.json() == subnet_neurons.model_dump(mode="json")
@@ -0,0 +1,54 @@
+import datetime as dt
+
+import pytest
+from litestar.status_codes import HTTP_200_OK
+from pylon_commons.models import (
+    BittensorModel,
+    BlockSubnetHyperparams,
+    BlockSubnetState,
+    SubnetCertificates,
+    SubnetHyperparams,
+    SubnetValidators,
+)
+from pylon_commons.types import HotkeyName, IdentityName, MaxWeightsLimit, NetUid, Timestamp
+
+from pylon_service.bittensor.recent.adapter import CacheKey, _CacheEntry
+from pylon_service.identities import identities
+from tests.factories import BlockFactory, NeuronFactory, SubnetStateFactory
+
+_ENDPOINT = "/api/v1/identity/sn1/subnet/1/block/recent/{}"
+
+
+@pytest.fixture
+def recent_objects(block_factory: BlockFactory, neuron_factory: NeuronFactory) -> dict[str, BittensorModel]:
+    block = block_factory.build()
+    return {
+        "validators": SubnetValidators(block=block, validators=neuron_factory.batch(2)),
+        "certificates": SubnetCertificates(block=block, certificates={}),
+        "hyperparams": BlockSubnetHyperparams(
+            block=block, hyperparams=SubnetHyperparams(max_weights_limit=MaxWeightsLimit(100))
+        ),
+        "state": BlockSubnetState(block=block, state=SubnetStateFactory.build()),
+    }
+
+
+@pytest.fixture
+def wallet():
+    return identities[IdentityName("sn1")].wallet
+
+
+@pytest.mark.parametrize("path", ["validators", "certificates", "hyperparams", "state"])
+@pytest.mark.asyncio
+async def test_get_recent_object_success(test_client, mock_recent_objects_store, recent_objects, wallet, path):
+    object_ = recent_objects[path]
+    timestamp = Timestamp(int(dt.datetime.now().timestamp()))
+    cache_entry = _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
+        response = await test_client.get(_ENDPOINT.format(path))
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == object_.model_dump(mode="json")
+
+    assert mock_recent_objects_store.behave.calls["get"] == [
+        (CacheKey(type(object_), NetUid(1), HotkeyName(wallet.hotkey_str)), None)
+    ]
@@ -0,0 +1,69 @@
+"""
+Tests for the GET /subnet/{netuid}/time/{timestamp}/neurons and /validators endpoints.
+"""
+
+import pytest
+from litestar.status_codes import HTTP_200_OK, HTTP_404_NOT_FOUND
+from litestar.testing import AsyncTestClient
+from pylon_commons.models import Block, SubnetNeurons, SubnetValidators
+from pylon_commons.types import NetUid, Timestamp
+
+from tests.factories import BlockFactory, NeuronFactory
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+@pytest.fixture
+def block(block_factory: BlockFactory) -> Block:
+    return block_factory.build()
+
+
+@pytest.mark.asyncio
+async def test_get_neurons_at_time_open_access(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+    block: Block,
+    neuron_factory: NeuronFactory,
+):
+    subnet_neurons = SubnetNeurons(block=block, neurons={neuron.hotkey: neuron for neuron in neuron_factory.batch(2)})
+
+    async with open_access_mock_bt_client.mock_behavior(get_block_at=[block], get_neurons=[subnet_neurons]):
+        response = await test_client.get("/api/v1/subnet/1/time/1700000000/neurons")
+
+        assert response.status_code == HTTP_200_OK, response.content
+        assert response.json() == subnet_neurons.model_dump(mode="json")
+
+    assert open_access_mock_bt_client.calls["get_block_at"] == [(Timestamp(1700000000),)]
+    assert open_access_mock_bt_client.calls["get_neurons"] == [(NetUid(1), block)]
+
+
+@pytest.mark.asyncio
+async def test_get_validators_at_time_open_access(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+    block: Block,
+    neuron_factory: NeuronFactory,
+):
+    subnet_validators = SubnetValidators(block=block, validators=neuron_factory.batch(2))
+
+    async with open_access_mock_bt_client.mock_behavior(get_block_at=[block], get_validators=[subnet_validators]):
+        response = await test_client.get("/api/v1/subnet/1/time/1700000000/validators")
+
+        assert response.status_code == HTTP_200_OK, response.content
+        assert response.json() == subnet_validators.model_dump(mode="json")
+
+    assert open_access_mock_bt_client.calls["get_validators"] == [(NetUid(1), block)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resource", ["neurons", "validators"])
+async def test_get_at_time_open_access_block_not_found(
+    test_client: AsyncTestClient, open_access_mock_bt_client: MockBittensorClient, resource: str
+):
+    async with open_access_mock_bt_client.mock_behavior(get_block_at=[None]):
+        response = await test_client.get(f"/api/v1/subnet/1/time/1000/{resource}")
+
+        assert response.status_code == HTTP_404_NOT_FOUND, response.content
+        assert response.json() == {
+            "status_code": HTTP_404_NOT_FOUND,
+            "detail": "No block found at timestamp 1000.",
+        }
@@ -0,0 +1,207 @@
+"""
+Tests for the GET /block/{block_number}/extrinsics and
+GET /block/range/{start_block_number}/{end_block_number}/extrinsics endpoints.
+"""
+
+import json
+
+import pytest
+from litestar.status_codes import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+from litestar.testing import AsyncTestClient
+from pylon_commons.models import Block, Extrinsic, ExtrinsicCall
+from pylon_commons.types import BlockHash, BlockNumber, ExtrinsicHash, ExtrinsicIndex, ExtrinsicLength
+
+from tests.mock_bittensor_client import MockBittensorClient
+
+SIGNER = "5FHneW46xGXgs5mUiveU4sbTyGBzmstUspZC92UhjJM694ty"
+
+
+def make_block(number: int) -> Block:
+    return Block(number=BlockNumber(number), hash=BlockHash(f"0xblock{number}"))
+
+
+def make_extrinsics(block_number: int) -> list[Extrinsic]:
+    return [
+        Extrinsic(
+            block_number=BlockNumber(block_number),
+            extrinsic_index=ExtrinsicIndex(0),
+            extrinsic_hash=ExtrinsicHash(f"0x{block_number}hash0"),
+            extrinsic_length=ExtrinsicLength(10),
+            address=None,
+            call=ExtrinsicCall(call_module="Timestamp", call_function="set", call_args=[]),
+        ),
+        Extrinsic(
+            block_number=BlockNumber(block_number),
+            extrinsic_index=ExtrinsicIndex(1),
+            extrinsic_hash=ExtrinsicHash(f"0x{block_number}hash1"),
+            extrinsic_length=ExtrinsicLength(200),
+            address=SIGNER,
+            call=ExtrinsicCall(call_module="SubtensorModule", call_function="set_weights", call_args=[]),
+        ),
+        Extrinsic(
+            block_number=BlockNumber(block_number),
+            extrinsic_index=ExtrinsicIndex(2),
+            extrinsic_hash=ExtrinsicHash(f"0x{block_number}hash2"),
+            extrinsic_length=ExtrinsicLength(150),
+            address="5other",
+            call=ExtrinsicCall(call_module="SubtensorModule", call_function="add_stake", call_args=[]),
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_extrinsics(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+):
+    """
+    Test that all the extrinsics of the block are returned.
+    """
+    block = make_block(100)
+    extrinsics = make_extrinsics(100)
+    async with open_access_mock_bt_client.mock_behavior(
+        get_block=[block],
+        get_extrinsics=[extrinsics],
+    ):
+        response = await test_client.get("/api/v1/block/100/extrinsics")
+
+        assert response.status_code == HTTP_200_OK, response.content
+        assert response.json() == {
+            "block": block.model_dump(mode="json"),
+            "extrinsics": [extrinsic.model_dump(mode="json") for extrinsic in extrinsics],
+        }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "expected_indices"),
+    [
+        pytest.param("call_module=SubtensorModule", [1, 2], id="call_module"),
+        pytest.param("call_module=SubtensorModule&call_function=add_stake", [2], id="call_module_and_function"),
+        pytest.param(f"address={SIGNER}", [1], id="address"),
+        pytest.param("call_function=transfer", [], id="no_match"),
+    ],
+)
+async def test_get_extrinsics_filtered(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+    query: str,
+    expected_indices: list[int],
+):
+    """
+    Test that only the extrinsics matching all the filters are returned.
+    """
+    async with open_access_mock_bt_client.mock_behavior(
+        get_block=[make_block(100)],
+        get_extrinsics=[make_extrinsics(100)],
+    ):
+        response = await test_client.get(f"/api/v1/block/100/extrinsics?{query}")
+
+        assert response.status_code == HTTP_200_OK, response.content
+        assert [extrinsic["extrinsic_index"] for extrinsic in response.json()["extrinsics"]] == expected_indices
+
+
+@pytest.mark.asyncio
+async def test_get_extrinsics_block_not_found(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+):
+    """
+    Test that non-existent block returns 404.
+    """
+    async with open_access_mock_bt_client.mock_behavior(
+        get_block=[None],
+    ):
+        response = await test_client.get("/api/v1/block/999999999/extrinsics")
+
+        assert response.status_code == HTTP_404_NOT_FOUND, response.content
+        assert response.json() == {
+            "status_code": HTTP_404_NOT_FOUND,
+            "detail": "Block 999999999 not found.",
+        }
+
+
+@pytest.mark.asyncio
+async def test_get_extrinsics_range(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+):
+    """
+    Test that the blocks of the range are streamed as NDJSON in the block order, with the filters applied.
+    """
+    async with open_access_mock_bt_client.mock_behavior(
+        get_latest_block=[make_block(200)],
+        get_block=[make_block] * 5,
+        get_extrinsics=[lambda block: make_extrinsics(block.number)] * 5,
+    ):
+        response = await test_client.get("/api/v1/block/range/100/104/extrinsics?call_function=set_weights")
+
+        assert response.status_code == HTTP_200_OK, response.content
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["block"]["number"] for line in lines] == [100, 101, 102, 103, 104]
+        assert [[extrinsic["extrinsic_hash"] for extrinsic in line["extrinsics"]] for line in lines] == [
+            [f"0x{number}hash1"] for number in range(100, 105)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_get_extrinsics_range_skips_missing_blocks(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+):
+    """
+    Test that the blocks that could not be found are left out of the stream.
+    """
+    async with open_access_mock_bt_client.mock_behavior(
+        get_latest_block=[make_block(200)],
+        get_block=[lambda number: None if number == 101 else make_block(number)] * 3,
+        get_extrinsics=[lambda block: make_extrinsics(block.number)] * 2,
+    ):
+        response = await test_client.get("/api/v1/block/range/100/102/extrinsics")
+
+        assert response.status_code == HTTP_200_OK, response.content
+        assert [json.loads(line)["block"]["number"] for line in response.text.splitlines()] == [100, 102]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("start", "end", "detail"),
+    [
+        pytest.param(105, 100, "end_block_number must not be lower than start_block_number.", id="reversed"),
+        pytest.param(100, 1000, "The block range must not be longer than 100 blocks.", id="too_long"),
+    ],
+)
+async def test_get_extrinsics_range_invalid(
+    test_client: AsyncTestClient,
+    start: int,
+    end: int,
+    detail: str,
+):
+    """
+    Test that an invalid block range returns 400.
+    """
+    response = await test_client.get(f"/api/v1/block/range/{start}/{end}/extrinsics")
+
+    assert response.status_code == HTTP_400_BAD_REQUEST, response.content
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.asyncio
+async def test_get_extrinsics_range_past_latest_block(
+    test_client: AsyncTestClient,
+    open_access_mock_bt_client: MockBittensorClient,
+):
+    """
+    Test that a range ending past the latest block returns 404.
+    """
+    async with open_access_mock_bt_client.mock_behavior(
+        get_latest_block=[make_block(200)],
+    ):
+        response = await test_client.get("/api/v1/block/range/199/201/extrinsics")
+
+        assert response.status_code == HTTP_404_NOT_FOUND, response.content
+        assert response.json() == {
+            "status_code": HTTP_404_NOT_FOUND,
+            "detail": "Block 201 not found.",
+        }
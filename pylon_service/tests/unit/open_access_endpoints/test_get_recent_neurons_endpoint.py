@@ -46,8 +46,8 @@ async def test_get_recent_neurons_cache_missing(test_client, mock_recent_objects
 @pytest.mark.asyncio
 async def test_get_recent_neurons_cache_expired(test_client, mock_recent_objects_store, subnet_neurons):
     timestamp = Timestamp(int(dt.datetime.now().timestamp()) - BLOCK_PROCESSING_TIME * 50)  # 40 BLOCK hard limit set.
-    cache_entry = _CacheEntry(data=subnet_neurons.model_dump_json(), timestamp=timestamp)
-    async with mock_recent_objects_store.behave.mock(get=[cache_entry.model_dump_json().encode()]):
+    cache_entry = _CacheEntry(data=subnet_neurons.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
         response = await test_client.get(_ENDPOINT)
 
         assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
@@ -62,8 +62,8 @@ async def test_get_recent_neurons_cache_expired(test_client, mock_recent_objects
 @pytest.mark.asyncio
 async def test_get_recent_neurons_success(test_client, mock_recent_objects_store, subnet_neurons):
     timestamp = Timestamp(int(dt.datetime.now().timestamp()))
-    cache_entry = _CacheEntry(data=subnet_neurons.model_dump_json(), timestamp=timestamp)
-    async with mock_recent_objects_store.behave.mock(get=[cache_entry.model_dump_json().encode()]):
+    cache_entry = _CacheEntry(data=subnet_neurons.model_dump_json().encode(), timestamp=timestamp)
+    async with mock_recent_objects_store.behave.mock(get=[cache_entry.encode()]):
         response = await test_client.get(_ENDPOINT)
 
         assert response.status_code == HTTP_200_OK
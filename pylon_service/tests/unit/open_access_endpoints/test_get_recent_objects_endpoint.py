@@ -0,0 +1,144 @@
+import datetime as dt
+
+import pytest
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED, HTTP_503_SERVICE_UNAVAILABLE
+from pylon_commons.constants import AGE_BLOCKS_HEADER, BLOCK_PROCESSING_TIME
+from pylon_commons.models import (
+    BittensorModel,
+    BlockSubnetHyperparams,
+    BlockSubnetState,
+    CertificateAlgorithm,
+    Commitment,
+    NeuronCertificate,
+    SubnetCertificates,
+    SubnetCommitments,
+    SubnetHyperparams,
+    SubnetValidators,
+)
+from pylon_commons.types import BlockNumber, CommitmentDataHex, Hotkey, MaxWeightsLimit, NetUid, PublicKey, Timestamp
+
+from pylon_service.bittensor.recent.adapter import CacheKey, _CacheEntry
+from tests.factories import BlockFactory, NeuronFactory, SubnetStateFactory
+
+_ENDPOINT = "/api/v1/subnet/1/block/recent/{}"
+
+
+@pytest.fixture
+def recent_objects(block_factory: BlockFactory, neuron_factory: NeuronFactory) -> dict[str, BittensorModel]:
+    block = block_factory.build()
+    hotkey = Hotkey("hotkey1")
+    return {
+        "validators": SubnetValidators(block=block, validators=neuron_factory.batch(2)),
+        "certificates": SubnetCertificates(
+            block=block,
+            certificates={
+                hotkey: NeuronCertificate(algorithm=CertificateAlgorithm.ED25519, public_key=PublicKey("0xabc"))
+            },
+        ),
+        "hyperparams": BlockSubnetHyperparams(
+            block=block, hyperparams=SubnetHyperparams(max_weights_limit=MaxWeightsLimit(100))
+        ),
+        "state": BlockSubnetState(block=block, state=SubnetStateFactory.build()),
+        "commitments": SubnetCommitments(
+            block=block,
+            commitments={
+                hotkey: Commitment(
+                    commitment_block_number=BlockNumber(1), hotkey=hotkey, commitment=CommitmentDataHex("0x01")
+                )
+            },
+        ),
+    }
+
+
+def cached(object_: BittensorModel, blocks_ago: int = 0) -> bytes:
+    timestamp = Timestamp(int(dt.datetime.now().timestamp()) - BLOCK_PROCESSING_TIME * blocks_ago)
+    return _CacheEntry(data=object_.model_dump_json().encode(), timestamp=timestamp).encode()
+
+
+@pytest.mark.parametrize(
+    "path,name",
+    [
+        pytest.param("validators", "validators", id="validators"),
+        pytest.param("certificates", "certificates", id="certificates"),
+        pytest.param("hyperparams", "hyperparams", id="hyperparams"),
+        pytest.param("state", "subnet state", id="state"),
+        pytest.param("commitments", "commitments", id="commitments"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_recent_object_cache_missing(test_client, mock_recent_objects_store, path, name):
+    async with mock_recent_objects_store.behave.mock(get=[None]):
+        response = await test_client.get(_ENDPOINT.format(path))
+
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json() == {
+            "status_code": HTTP_503_SERVICE_UNAVAILABLE,
+            "detail": f"Recent {name} data is not available. Cache update may not have finished "
+            "yet or subnet may not be configured for caching recent objects.",
+        }
+
+
+@pytest.mark.parametrize("path", ["validators", "certificates", "hyperparams", "state"])
+@pytest.mark.asyncio
+async def test_get_recent_object_cache_expired(test_client, mock_recent_objects_store, recent_objects, path):
+    async with mock_recent_objects_store.behave.mock(get=[cached(recent_objects[path], blocks_ago=50)]):
+        response = await test_client.get(_ENDPOINT.format(path))
+
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+
+
+@pytest.mark.parametrize("path", ["validators", "certificates", "hyperparams", "state"])
+@pytest.mark.asyncio
+async def test_get_recent_object_success(test_client, mock_recent_objects_store, recent_objects, path):
+    object_ = recent_objects[path]
+    async with mock_recent_objects_store.behave.mock(get=[cached(object_)]):
+        response = await test_client.get(_ENDPOINT.format(path))
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == object_.model_dump(mode="json")
+
+    assert mock_recent_objects_store.behave.calls["get"] == [(CacheKey(type(object_), NetUid(1), None), None)]
+
+
+@pytest.mark.asyncio
+async def test_get_recent_object_not_modified(test_client, mock_recent_objects_store, recent_objects):
+    validators = recent_objects["validators"]
+    async with mock_recent_objects_store.behave.mock(
+        get=[cached(validators), cached(validators), cached(validators, blocks_ago=-1)]
+    ):
+        response = await test_client.get(_ENDPOINT.format("validators"))
+        etag = response.headers["etag"]
+        not_modified = await test_client.get(_ENDPOINT.format("validators"), headers={"If-None-Match": etag})
+        updated = await test_client.get(_ENDPOINT.format("validators"), headers={"If-None-Match": etag})
+
+    assert not_modified.status_code == HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    assert updated.status_code == HTTP_200_OK
+    assert updated.headers["etag"] != etag
+    assert updated.json() == validators.model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_get_recent_object_age_headers(test_client, mock_recent_objects_store, recent_objects):
+    async with mock_recent_objects_store.behave.mock(get=[cached(recent_objects["validators"], blocks_ago=3)]):
+        response = await test_client.get(_ENDPOINT.format("validators"))
+
+    assert response.status_code == HTTP_200_OK
+    assert response.headers[AGE_BLOCKS_HEADER] == "3"
+    assert int(response.headers["age"]) >= 3 * BLOCK_PROCESSING_TIME
+
+
+@pytest.mark.asyncio
+async def test_get_recent_commitments_success(test_client, mock_recent_objects_store, recent_objects):
+    commitments = recent_objects["commitments"]
+    async with mock_recent_objects_store.behave.mock(get=[cached(commitments)]):
+        response = await test_client.get(_ENDPOINT.format("commitments"))
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {
+            "block": commitments.block.model_dump(mode="json"),
+            "commitments": {"hotkey1": "0x01"},
+        }
+
+    assert mock_recent_objects_store.behave.calls["get"] == [(CacheKey(SubnetCommitments, NetUid(1), None), None)]
@@ -0,0 +1,103 @@
+"""
+Tests for the response cache aligned to the chain head.
+"""
+
+import pytest
+from litestar import Litestar
+from litestar.config.response_cache import ResponseCacheConfig
+from litestar.testing import AsyncTestClient
+from pylon_commons._unstable.endpoints import Endpoint
+from pylon_commons.models import Block
+from pylon_commons.types import BlockHash, BlockNumber
+
+from pylon_service.api.caching import block_cache_response_filter, make_etag
+from pylon_service.api.utils import handler
+from pylon_service.middleware.conditional_requests import ConditionalRequestMiddleware
+
+
+class HeadTracker:
+    def __init__(self) -> None:
+        self.head: Block | None = Block(number=BlockNumber(100), hash=BlockHash("0x100"))
+
+
+@pytest.fixture
+def head_tracker():
+    return HeadTracker()
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def app(head_tracker, calls):
+    @handler(Endpoint.LATEST_BLOCK_INFO, block_cached=True)
+    async def latest(netuid: int | None = None) -> dict:
+        calls.append(netuid)
+        return {"call": len(calls)}
+
+    app = Litestar(
+        route_handlers=[latest],
+        response_cache_config=ResponseCacheConfig(cache_response_filter=block_cache_response_filter),
+    )
+    app.state.chain_head_tracker = head_tracker
+    return app
+
+
+@pytest.mark.asyncio
+async def test_block_cache_serves_responses_within_block(app, calls):
+    async with AsyncTestClient(app=app) as client:
+        first = await client.get("/block/latest")
+        second = await client.get("/block/latest")
+        other_query = await client.get("/block/latest", params={"netuid": 1})
+
+    assert first.json() == second.json() == {"call": 1}
+    assert other_query.json() == {"call": 2}
+    assert calls == [None, 1]
+
+
+@pytest.mark.asyncio
+async def test_block_cache_is_invalidated_when_head_advances(app, head_tracker, calls):
+    async with AsyncTestClient(app=app) as client:
+        first = await client.get("/block/latest")
+        head_tracker.head = Block(number=BlockNumber(101), hash=BlockHash("0x101"))
+        second = await client.get("/block/latest")
+
+    assert first.json() == {"call": 1}
+    assert second.json() == {"call": 2}
+
+
+@pytest.mark.asyncio
+async def test_block_cache_does_not_cache_when_head_is_unknown(app, head_tracker, calls):
+    head_tracker.head = None
+    async with AsyncTestClient(app=app) as client:
+        first = await client.get("/block/latest")
+        second = await client.get("/block/latest")
+
+    assert first.json() == {"call": 1}
+    assert second.json() == {"call": 2}
+
+
+@pytest.mark.asyncio
+async def test_block_cache_stores_response_under_head_it_was_served_at(head_tracker, calls):
+    @handler(Endpoint.LATEST_BLOCK_INFO, block_cached=True)
+    async def latest() -> dict:
+        calls.append(head_tracker.head)
+        head_tracker.head = Block(number=BlockNumber(101), hash=BlockHash("0x101"))
+        return {"call": len(calls)}
+
+    app = Litestar(
+        route_handlers=[latest],
+        middleware=[ConditionalRequestMiddleware],
+        response_cache_config=ResponseCacheConfig(cache_response_filter=block_cache_response_filter),
+    )
+    app.state.chain_head_tracker = head_tracker
+    async with AsyncTestClient(app=app) as client:
+        first = await client.get("/block/latest")
+        second = await client.get("/block/latest")
+
+    assert first.json() == {"call": 1}
+    assert first.headers["etag"] == make_etag("/block/latest", "", "0x100")
+    assert second.json() == {"call": 2}
+    assert second.headers["etag"] == make_etag("/block/latest", "", "0x101")
@@ -0,0 +1,132 @@
+"""
+Tests for the entity tags and the conditional requests of the block-aligned endpoints.
+"""
+
+import pytest
+from litestar import Litestar
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+from litestar.testing import AsyncTestClient
+from pylon_commons._unstable.endpoints import Endpoint
+from pylon_commons.models import Block
+from pylon_commons.types import BlockHash, BlockNumber
+
+from pylon_service.api.caching import IMMUTABLE_CACHE_CONTROL, etag_matches
+from pylon_service.api.utils import handler
+from pylon_service.middleware.conditional_requests import ConditionalRequestMiddleware
+
+
+class HeadTracker:
+    def __init__(self) -> None:
+        self.head: Block | None = Block(number=BlockNumber(100), hash=BlockHash("0x100"))
+        self.finalized: Block | None = Block(number=BlockNumber(97), hash=BlockHash("0x97"))
+
+
+@pytest.fixture
+def head_tracker():
+    return HeadTracker()
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def app(head_tracker, calls):
+    @handler(Endpoint.LATEST_BLOCK_INFO, block_cached=True, cache=False)
+    async def latest() -> dict:
+        calls.append("latest")
+        return {"call": len(calls)}
+
+    @handler(Endpoint.EXTRINSICS, immutable=True)
+    async def extrinsics(block_number: int, call_module: str | None = None) -> dict:
+        calls.append(block_number)
+        return {"block_number": block_number}
+
+    app = Litestar(route_handlers=[latest, extrinsics], middleware=[ConditionalRequestMiddleware])
+    app.state.chain_head_tracker = head_tracker
+    return app
+
+
+@pytest.mark.asyncio
+async def test_latest_block_response_is_not_modified_within_block(app, calls):
+    async with AsyncTestClient(app=app) as client:
+        first = await client.get("/block/latest")
+        second = await client.get("/block/latest", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == HTTP_200_OK
+    assert "cache-control" not in first.headers
+    assert second.status_code == HTTP_304_NOT_MODIFIED
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.content == b""
+    assert calls == ["latest"]
+
+
+@pytest.mark.asyncio
+async def test_latest_block_response_is_modified_when_head_advances(app, head_tracker, calls):
+    async with AsyncTestClient(app=app) as client:
+        first = await client.get("/block/latest")
+        head_tracker.head = Block(number=BlockNumber(101), hash=BlockHash("0x101"))
+        second = await client.get("/block/latest", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == HTTP_200_OK
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json() == {"call": 2}
+
+
+@pytest.mark.asyncio
+async def test_finalized_block_response_is_immutable(app, calls):
+    async with AsyncTestClient(app=app) as client:
+        first = await client.get("/block/90/extrinsics")
+        second = await client.get("/block/90/extrinsics", headers={"If-None-Match": first.headers["etag"]})
+        other_query = await client.get(
+            "/block/90/extrinsics",
+            params={"call_module": "SubtensorModule"},
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+    assert first.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert second.status_code == HTTP_304_NOT_MODIFIED
+    assert second.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert other_query.status_code == HTTP_200_OK
+    assert other_query.headers["etag"] != first.headers["etag"]
+    assert calls == [90, 90]
+
+
+@pytest.mark.asyncio
+async def test_unfinalized_block_response_is_not_tagged(app):
+    async with AsyncTestClient(app=app) as client:
+        response = await client.get("/block/98/extrinsics")
+
+    assert response.status_code == HTTP_200_OK
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_responses_are_not_tagged_when_head_is_unknown(app, head_tracker, calls):
+    head_tracker.head = None
+    head_tracker.finalized = None
+    async with AsyncTestClient(app=app) as client:
+        latest = await client.get("/block/latest", headers={"If-None-Match": "*"})
+        historical = await client.get("/block/90/extrinsics")
+
+    assert latest.status_code == HTTP_200_OK
+    assert "etag" not in latest.headers
+    assert "etag" not in historical.headers
+    assert calls == ["latest", 90]
+
+
+@pytest.mark.parametrize(
+    "if_none_match,expected",
+    [
+        pytest.param(None, False, id="missing"),
+        pytest.param('"abc"', True, id="exact"),
+        pytest.param('W/"abc"', True, id="weak"),
+        pytest.param('"xyz", "abc"', True, id="list"),
+        pytest.param("*", True, id="any"),
+        pytest.param('"xyz"', False, id="other"),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') is expected
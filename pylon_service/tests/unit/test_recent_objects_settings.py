@@ -0,0 +1,21 @@
+import pytest
+from pydantic import ValidationError
+
+from pylon_service.settings import RecentObjectsSettings
+
+
+def test_recent_objects_settings_kinds_default_to_all_updaters():
+    settings = RecentObjectsSettings()
+    assert settings.kinds == ["neurons", "commitments", "certificates", "hyperparams", "subnet_state"]
+
+
+def test_recent_objects_settings_kinds(monkeypatch):
+    monkeypatch.setenv("PYLON_RECENT_OBJECTS_KINDS", '["neurons", "hyperparams"]')
+    settings = RecentObjectsSettings()
+    assert settings.kinds == ["neurons", "hyperparams"]
+
+
+def test_recent_objects_settings_unknown_kinds(monkeypatch):
+    monkeypatch.setenv("PYLON_RECENT_OBJECTS_KINDS", '["neurons", "validators"]')
+    with pytest.raises(ValidationError, match="Unknown recent object kinds: validators"):
+        RecentObjectsSettings()
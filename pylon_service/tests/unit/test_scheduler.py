@@ -0,0 +1,16 @@
+from pylon_commons.types import BlockNumber, NetUid, Tempo
+
+from pylon_service.api._unstable.utils import get_epoch_containing_block
+from pylon_service.scheduler import _epoch_start
+from pylon_service.settings import settings
+
+
+def test_epoch_start_uses_subnet_tempo():
+    tempos = {NetUid(1): Tempo(100)}
+    assert _epoch_start(BlockNumber(1000), NetUid(1), tempos) == BlockNumber(906)
+
+
+def test_epoch_start_falls_back_to_default_tempo():
+    tempos = {NetUid(1): Tempo(100)}
+    expected = get_epoch_containing_block(BlockNumber(1000), NetUid(2), settings.tempo).start
+    assert _epoch_start(BlockNumber(1000), NetUid(2), tempos) == expected